@@ -0,0 +1,64 @@
+"""
+Benchmark the streaming data check on a large CSV file.
+
+The penguin example file is repeated to the requested number of rows, each
+copy with its own privacy units, then checked against the partition-level
+metadata with ``check_data``. Reports the throughput and the peak memory of
+the process, which should not grow with the number of rows.
+
+Usage: python benchmarks/bench_check_data.py --rows 5000000 --chunk_size 1000000
+"""
+
+import argparse
+import json
+import os
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from csvw_eo.check_data import check_data
+
+ROOT = Path(__file__).resolve().parents[1]
+CSV = ROOT / "examples" / "penguin_plus.csv"
+METADATA = ROOT / "examples" / "metadata" / "penguin_metadata_partition_level.json-ld"
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--chunk_size", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    metadata = json.loads(METADATA.read_text())
+    sample = pd.read_csv(CSV, dtype=str, keep_default_na=False)
+    copies = -(-args.rows // len(sample))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "penguins.csv")
+        for copy in range(copies):
+            part = sample.copy()
+            part["penguin_id"] = (part["penguin_id"].astype(np.int64) + copy * 1000).astype(str)
+            part.iloc[: args.rows - copy * len(sample)].to_csv(path, mode="a", header=copy == 0, index=False)
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+        print(
+            f"rows: {args.rows}, file: {os.path.getsize(path) / 2**20:.0f}MB, peak memory before: {rss:.0f}MB"
+        )  # noqa: T201
+
+        start = time.perf_counter()
+        report = check_data(path, metadata, chunk_size=args.chunk_size, workers=args.workers)
+        elapsed = time.perf_counter() - start
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+        print(
+            f"check_data: {elapsed:.2f}s, {args.rows / elapsed / 1e6:.2f}M rows/s, peak memory: {rss:.0f}MB"
+        )  # noqa: T201
+        print(f"{len(report)} violations of {len(report.counts)} rules")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark the native constraint checker against the SHACL validation.
+
+Both check the same metadata, with one column of many interval partitions.
+The SHACL validation runs offline, with the JSON-LD contexts bundled with
+the package.
+
+Usage: python benchmarks/bench_constraints.py --partitions 10000
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from csvw_eo.check_constraints import check_constraints
+from csvw_eo.datatypes import DataTypes
+from csvw_eo.metadata_structure import (
+    ColumnMetadata,
+    ContinuousPredicate,
+    SingleColumnPartition,
+    TableMetadata,
+)
+from csvw_eo.validate_metadata_shacl import validate_metadata_shacl
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def make_table(nb_partitions: int) -> TableMetadata:
+    """Build table metadata with one column of nb_partitions interval partitions."""
+    partitions = [
+        SingleColumnPartition(
+            predicate=ContinuousPredicate(lower_bound=float(i), upper_bound=float(i + 1)),
+            max_length=10,
+            max_groups_per_unit=2,
+            max_contributions=1,
+        )
+        for i in range(nb_partitions)
+    ]
+    columns = [
+        ColumnMetadata(
+            name="id", datatype=DataTypes.INTEGER, required=True, privacy_id=True, nullable_proportion=0.0
+        ),
+        ColumnMetadata(
+            name="value",
+            datatype=DataTypes.DOUBLE,
+            required=True,
+            privacy_id=False,
+            nullable_proportion=0.0,
+            minimum=0.0,
+            maximum=float(nb_partitions),
+            partitions=partitions,
+            max_num_partitions=nb_partitions,
+        ),
+    ]
+    return TableMetadata(
+        privacy_unit="id",
+        max_contributions=2,
+        max_length=10 * nb_partitions,
+        public_length=10 * nb_partitions,
+        columns=columns,
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--partitions", type=int, default=10_000)
+    parser.add_argument("--no_shacl", action="store_true", help="Only time the native checker")
+    args = parser.parse_args()
+
+    metadata = make_table(args.partitions).to_dict()
+
+    start = time.perf_counter()
+    report = check_constraints(metadata)
+    native_time = time.perf_counter() - start
+
+    print(f"partitions: {args.partitions}")  # noqa: T201
+    print(f"check_constraints:       {native_time:.2f}s (conforms: {report.conforms})")  # noqa: T201
+
+    if not args.no_shacl:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "metadata.json-ld")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(metadata, f)
+            start = time.perf_counter()
+            conforms, _ = validate_metadata_shacl(Path(path), ROOT / "csvw-eo-constraints.ttl")
+            shacl_time = time.perf_counter() - start
+        print(f"validate_metadata_shacl: {shacl_time:.2f}s (conforms: {conforms})")  # noqa: T201
+        print(f"speed-up: {shacl_time / native_time:.0f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
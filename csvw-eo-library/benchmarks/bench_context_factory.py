@@ -0,0 +1,70 @@
+"""
+Benchmark the creation of OpenDP contexts for repeated requests on the same metadata.
+
+Each request creates a context on a fresh LazyFrame of the penguin example,
+with ``csvw_to_opendp_context`` and with an ``OpenDPContextFactory`` (keyed by
+the content hash of the metadata, or by its file path and modification
+time), then releases one count. Reports the mean context-creation and query
+latencies, and the hit rates of the factory caches.
+
+Usage: python benchmarks/bench_context_factory.py --requests 200
+"""
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+
+import opendp.prelude as dp
+
+from csvw_eo.csvw_to_opendp_context import csvw_to_opendp_context
+from csvw_eo.opendp_context_factory import OpenDPContextFactory
+from csvw_eo.read_with_metadata import scan_with_metadata
+
+ROOT = Path(__file__).resolve().parents[1]
+CSV = ROOT / "examples" / "penguin_plus.csv"
+METADATA = ROOT / "examples" / "metadata" / "penguin_metadata_column_level_column_group.json-ld"
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    metadata = json.loads(METADATA.read_text())
+    key = (str(METADATA), os.stat(METADATA).st_mtime_ns)
+    factory = OpenDPContextFactory()
+    keyed = OpenDPContextFactory()
+    creators = {
+        "csvw_to_opendp_context": lambda data: csvw_to_opendp_context(
+            metadata, data, epsilon=1.0, split_evenly_over=1
+        ),
+        "OpenDPContextFactory": lambda data: factory.create(metadata, data, epsilon=1.0, split_evenly_over=1),
+        "OpenDPContextFactory (key)": lambda data: keyed.create(
+            metadata, data, key=key, epsilon=1.0, split_evenly_over=1
+        ),
+    }
+    for name, create in creators.items():
+        creation = query = 0.0
+        for _ in range(args.requests):
+            data = scan_with_metadata(CSV, metadata)
+            start = time.perf_counter()
+            context = create(data)
+            creation += time.perf_counter() - start
+
+            start = time.perf_counter()
+            context.query().select(dp.len()).release().collect()
+            query += time.perf_counter() - start
+        print(  # noqa: T201
+            f"{name}: context {creation / args.requests * 1000:.2f}ms, "
+            f"query {query / args.requests * 1000:.2f}ms"
+        )
+
+    for cache, info in factory.cache_info().items():
+        print(f"{cache} cache: {info.hits} hits, {info.misses} misses, hit rate {info.hit_rate:.1%}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark the enforcement of metadata bounds on a large dataset.
+
+The penguin example file is repeated to the requested number of rows, each
+copy with its own privacy units, and every ``--duplicate``-th unit
+contributes its rows twice, so that its contributions must be sampled. The
+bounded dataset is streamed from the CSV file to a CSV or Parquet file.
+
+Usage: python benchmarks/bench_enforce_bounds.py --rows 3000000 --output parquet
+"""
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+import polars as pl
+
+from csvw_eo.enforce_bounds import enforce_bounds, scan_data, sink_data
+from csvw_eo.sidecar import read_metadata
+
+ROOT = Path(__file__).resolve().parents[1]
+CSV = ROOT / "examples" / "penguin_plus.csv"
+METADATA = ROOT / "examples" / "metadata" / "penguin_metadata_fine_levels_column_group_continuous.json-ld"
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=3_000_000)
+    parser.add_argument("--duplicate", type=int, default=10)
+    parser.add_argument("--output", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    sample = pl.read_csv(CSV, infer_schema=False)
+    copies = -(-args.rows // len(sample))
+    units = sample["penguin_id"].cast(pl.Int64).max() + 1
+    data = pl.concat(
+        sample.with_columns((pl.col("penguin_id").cast(pl.Int64) + copy * units).cast(pl.String))
+        for copy in range(copies)
+    ).head(args.rows)
+    duplicated = data.filter(pl.col("penguin_id").cast(pl.Int64) % args.duplicate == 0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "penguins.csv")
+        pl.concat([data, duplicated]).write_csv(path)
+        del data, duplicated
+        output = os.path.join(tmp, f"bounded.{args.output}")
+        metadata = read_metadata(METADATA)
+        print(f"rows: {args.rows}, file: {os.path.getsize(path) / 2**20:.0f}MB")  # noqa: T201
+
+        start = time.perf_counter()
+        sink_data(enforce_bounds(scan_data(path, metadata), metadata, args.seed), output)
+        elapsed = time.perf_counter() - start
+        rows = pl.scan_parquet(output) if args.output == "parquet" else pl.scan_csv(output)
+        kept = rows.select(pl.len()).collect().item()
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+        print(f"kept: {kept} rows, {elapsed:.2f}s, peak memory: {rss:.0f}MB")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark the cold-start import time of the package and its entry points.
+
+Each module is imported in a fresh interpreter, ``--repeat`` times; reports
+the best time and the heavy dependencies (OpenDP, pySHACL, rdflib, Polars,
+pandas) that the import loaded.
+
+Usage: python benchmarks/bench_import_time.py --repeat 5
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+MODULES = [
+    "csvw_eo",
+    "csvw_eo.__main__",
+    "csvw_eo.csvw_to_smartnoise_sql",
+    "csvw_eo.make_dummy_from_metadata",
+    "csvw_eo.make_metadata_from_data",
+    "csvw_eo.validate_metadata",
+    "csvw_eo.validate_metadata_shacl",
+    "csvw_eo.csvw_to_opendp_context",
+]
+HEAVY = ("opendp", "pyshacl", "rdflib", "polars", "pandas")
+
+
+def cold_import(module: str) -> tuple[float, list[str]]:
+    """Import a module in a fresh interpreter, returning its time and the heavy modules loaded."""
+    code = (
+        "import json, sys, time; start = time.perf_counter(); "
+        f"import {module}; seconds = time.perf_counter() - start; "
+        f"print(json.dumps([seconds, [m for m in {HEAVY!r} if m in sys.modules]]))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    seconds, loaded = json.loads(output)
+    return seconds, loaded
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for module in MODULES:
+        runs = [cold_import(module) for _ in range(args.repeat)]
+        seconds = min(run[0] for run in runs)
+        print(f"{module}: {seconds * 1000:.0f}ms, loads {', '.join(runs[0][1]) or 'none'}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark the metadata-typed CSV loaders against default type inference.
+
+The penguin example file is repeated to the requested number of rows, then
+read with pandas and Polars, with inferred types and with the types of the
+metadata (``read_with_metadata``). Reports times and in-memory sizes.
+
+Usage: python benchmarks/bench_loaders.py --rows 1000000
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+import polars as pl
+
+from csvw_eo.read_with_metadata import read_with_metadata
+
+ROOT = Path(__file__).resolve().parents[1]
+CSV = ROOT / "examples" / "penguin_plus.csv"
+METADATA = ROOT / "examples" / "metadata" / "penguin_metadata_table_with_keys_level.json-ld"
+
+
+def size_mb(df: pd.DataFrame | pl.DataFrame) -> float:
+    """Return the in-memory size of a frame, in MB."""
+    if isinstance(df, pl.DataFrame):
+        return df.estimated_size("mb")
+    return float(df.memory_usage(deep=True).sum()) / 2**20
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    metadata = json.loads(METADATA.read_text())
+    sample = pd.read_csv(CSV, dtype=str, keep_default_na=False)
+    repeated = sample.iloc[[i % len(sample) for i in range(args.rows)]]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "penguins.csv")
+        repeated.to_csv(path, index=False)
+        print(f"rows: {args.rows}, file: {os.path.getsize(path) / 2**20:.0f}MB")  # noqa: T201
+
+        readers = {
+            "pandas, inferred": lambda: pd.read_csv(path),
+            "pandas, metadata": lambda: read_with_metadata(path, metadata),
+            "polars, inferred": lambda: pl.read_csv(path),
+            "polars, metadata": lambda: read_with_metadata(path, metadata, engine="polars"),
+        }
+        for name, read in readers.items():
+            start = time.perf_counter()
+            df = read()
+            elapsed = time.perf_counter() - start
+            print(f"{name}: {elapsed:.2f}s, {size_mb(df):.0f}MB")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
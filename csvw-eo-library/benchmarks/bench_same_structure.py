@@ -0,0 +1,74 @@
+"""
+Benchmark the structural comparison of a large original CSV and its dummy.
+
+The penguin example file is repeated to the requested number of rows and
+compared with a dummy generated from the partition-level metadata, either
+loaded whole with pandas (``assert_same_structure``), streamed chunk by chunk
+or sampled (``assert_same_structure_files``). Run one mode per process: the
+peak memory is that of the process.
+
+Usage: python benchmarks/bench_same_structure.py --rows 5000000 --mode files
+"""
+
+import argparse
+import json
+import os
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from csvw_eo.assert_same_structure import assert_same_structure, assert_same_structure_files
+from csvw_eo.make_dummy_from_metadata import make_dummy_from_metadata
+
+ROOT = Path(__file__).resolve().parents[1]
+CSV = ROOT / "examples" / "penguin_plus.csv"
+METADATA = ROOT / "examples" / "metadata" / "penguin_metadata_partition_level.json-ld"
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--dummy_rows", type=int, default=1_000_000)
+    parser.add_argument("--mode", choices=["pandas", "files", "sample"], default="files")
+    parser.add_argument("--sample", type=int, default=100_000)
+    args = parser.parse_args()
+
+    sample = pd.read_csv(CSV, dtype=str, keep_default_na=False)
+    copies = -(-args.rows // len(sample))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        original = os.path.join(tmp, "penguins.csv")
+        for copy in range(copies):
+            sample.iloc[: args.rows - copy * len(sample)].to_csv(
+                original, mode="a", header=copy == 0, index=False
+            )
+        dummy = os.path.join(tmp, "dummy.csv")
+        metadata = json.loads(METADATA.read_text())
+        make_dummy_from_metadata(metadata, nb_rows=args.dummy_rows, seed=0).to_csv(dummy, index=False)
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+        print(  # noqa: T201
+            f"rows: {args.rows}, file: {os.path.getsize(original) / 2**20:.0f}MB, "
+            f"peak memory before: {rss:.0f}MB"
+        )
+
+        start = time.perf_counter()
+        if args.mode == "pandas":
+            assert_same_structure(
+                pd.read_csv(original, parse_dates=True), pd.read_csv(dummy, parse_dates=True)
+            )
+        else:
+            report = assert_same_structure_files(
+                original, dummy, sample=args.sample if args.mode == "sample" else None
+            )
+            print(report.text)  # noqa: T201
+        elapsed = time.perf_counter() - start
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+        print(f"{args.mode}: {elapsed:.2f}s, peak memory: {rss:.0f}MB")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark CSVW-EO metadata serialization on large partition lists.
+
+Compares the dictionary path (``to_dict`` + ``sanitize`` + ``json.dump``)
+with the one-pass streaming serializer (``dump_table_metadata``).
+
+Usage: python benchmarks/bench_serialization.py --partitions 1000000
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from csvw_eo.datatypes import DataTypes
+from csvw_eo.metadata_structure import (
+    ColumnMetadata,
+    ContinuousPredicate,
+    SingleColumnPartition,
+    TableMetadata,
+)
+from csvw_eo.serialization import dump_table_metadata
+from csvw_eo.utils import sanitize
+
+
+def make_table(nb_partitions: int) -> TableMetadata:
+    """Build table metadata with one column of nb_partitions interval partitions."""
+    partitions = [
+        SingleColumnPartition(
+            predicate=ContinuousPredicate(lower_bound=float(i), upper_bound=float(i + 1)),
+            max_length=10,
+            max_groups_per_unit=2,
+            max_contributions=1,
+        )
+        for i in range(nb_partitions)
+    ]
+    column = ColumnMetadata(
+        name="value",
+        datatype=DataTypes.DOUBLE,
+        minimum=0.0,
+        maximum=float(nb_partitions),
+        partitions=partitions,
+        max_num_partitions=nb_partitions,
+    )
+    return TableMetadata(privacy_unit="id", max_contributions=2, max_length=10, columns=[column])
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--partitions", type=int, default=100_000)
+    parser.add_argument("--indent", type=int, default=2)
+    parser.add_argument("--compact", action="store_true", help="No indentation")
+    args = parser.parse_args()
+    if args.compact:
+        args.indent = None
+
+    table = make_table(args.partitions)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dict_path = os.path.join(tmp, "dict.json")
+        stream_path = os.path.join(tmp, "stream.json")
+
+        start = time.perf_counter()
+        with open(dict_path, "w", encoding="utf-8") as f:
+            json.dump(sanitize(table.to_dict()), f, indent=args.indent)
+        dict_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with open(stream_path, "w", encoding="utf-8") as f:
+            dump_table_metadata(table, f, indent=args.indent)
+        stream_time = time.perf_counter() - start
+
+        with open(dict_path, encoding="utf-8") as f1, open(stream_path, encoding="utf-8") as f2:
+            identical = f1.read() == f2.read()
+
+    print(f"partitions: {args.partitions}, indent: {args.indent}")  # noqa: T201
+    print(f"to_dict + sanitize + json.dump: {dict_time:.2f}s")  # noqa: T201
+    print(f"dump_table_metadata:            {stream_time:.2f}s")  # noqa: T201
+    print(f"identical output: {identical}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark a batch of small jobs run as separate CLI launches or by one worker.
+
+Runs ``--jobs`` dummy generations (and as many validations) from the example
+metadata, first with one ``python -m csvw_eo`` process per job, then as
+NDJSON requests to a single ``csvw-eo serve`` process.
+
+Usage: python benchmarks/bench_serve.py --jobs 20 --rows 1000
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+METADATA = "examples/metadata/penguin_metadata_column_level.json-ld"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        for i in range(args.jobs):
+            output = str(Path(tmp) / f"cli_{i}.csv")
+            cli = [sys.executable, "-m", "csvw_eo"]
+            subprocess.run(
+                [*cli, "dummy", METADATA, "--rows", str(args.rows), "--output", output], check=True
+            )
+            subprocess.run([*cli, "validate", METADATA], check=True, capture_output=True)
+        cli_seconds = time.perf_counter() - start
+
+        requests = []
+        for i in range(args.jobs):
+            output = str(Path(tmp) / f"serve_{i}.csv")
+            dummy = {"metadata": METADATA, "output": output, "rows": args.rows, "seed": i}
+            requests.append({"id": 2 * i, "job": "dummy", "args": dummy})
+            requests.append({"id": 2 * i + 1, "job": "validate", "args": {"metadata": METADATA}})
+        command = [sys.executable, "-m", "csvw_eo", "serve"]
+        if args.workers:
+            command += ["--workers", str(args.workers)]
+        stdin = "".join(json.dumps(request) + "\n" for request in requests)
+        start = time.perf_counter()
+        result = subprocess.run(command, input=stdin, capture_output=True, text=True, check=True)
+        serve_seconds = time.perf_counter() - start
+
+    responses = [json.loads(line) for line in result.stdout.splitlines()]
+    failed = [response for response in responses if not response["ok"]]
+    print(f"{2 * args.jobs} jobs, {args.rows} dummy rows")  # noqa: T201
+    print(f"CLI launches: {cli_seconds:.2f}s ({cli_seconds / (2 * args.jobs) * 1000:.0f}ms per job)")  # noqa: T201
+    print(f"Worker:       {serve_seconds:.2f}s ({serve_seconds / (2 * args.jobs) * 1000:.0f}ms per job)")  # noqa: T201
+    print(f"Speed-up:     {cli_seconds / serve_seconds:.1f}x, {len(failed)} failed")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark the batch conversion of a catalogue of CSVW-EO documents to SmartNoise SQL.
+
+Writes ``--tables`` copies of the penguin metadata to a temporary directory,
+then times:
+
+- one CLI launch per table (on ``--cli-sample`` tables, extrapolated), which
+  pays the interpreter start and imports each time;
+- one ``csvw_to_smartnoise_sql_batch`` call for the whole directory, plus
+  the YAML write, with the pure Python and the libyaml emitters.
+
+Usage: python benchmarks/bench_smartnoise_batch.py --tables 4000 --workers 4
+"""
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from csvw_eo.csvw_to_smartnoise_sql import csvw_to_smartnoise_sql_batch, directory_tables
+
+ROOT = Path(__file__).resolve().parents[1]
+METADATA = ROOT / "examples" / "metadata" / "penguin_metadata_column_level.json-ld"
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tables", type=int, default=4000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cli-sample", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp) / "catalogue"
+        directory.mkdir()
+        for i in range(args.tables):
+            shutil.copy(METADATA, directory / f"table_{i:05d}.json-ld")
+        tables = directory_tables(directory, schema="Catalogue")
+
+        start = time.perf_counter()
+        for table in tables[: args.cli_sample]:
+            command = [sys.executable, "-m", "csvw_eo.csvw_to_smartnoise_sql", "--input", str(table.path)]
+            subprocess.run(
+                [*command, "--output", f"{tmp}/{table.table}.yaml"], check=True, capture_output=True
+            )
+        per_table = (time.perf_counter() - start) / args.cli_sample
+        print(f"CLI per table: {per_table:.2f}s per table, {per_table * args.tables:.0f}s in total")  # noqa: T201
+
+        start = time.perf_counter()
+        snsql_meta = csvw_to_smartnoise_sql_batch(tables, workers=args.workers)
+        print(f"batch conversion: {time.perf_counter() - start:.2f}s")  # noqa: T201
+
+        for name, dumper in [("SafeDumper", yaml.SafeDumper), ("CSafeDumper", yaml.CSafeDumper)]:
+            start = time.perf_counter()
+            with open(f"{tmp}/catalogue.yaml", "w", encoding="utf-8") as f:
+                yaml.dump(snsql_meta, f, Dumper=dumper)
+            print(f"YAML write ({name}): {time.perf_counter() - start:.2f}s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark the incremental validation of a metadata edit.
+
+Compares a full validation (``validate_metadata`` and ``check_constraints``)
+with a ``ValidationSession`` re-validating the document after the bounds of
+one column changed. The table has many columns, each with many interval
+partitions.
+
+Usage: python benchmarks/bench_validation_session.py --columns 50 --partitions 2000
+"""
+
+import argparse
+import time
+
+from csvw_eo.check_constraints import check_constraints
+from csvw_eo.datatypes import DataTypes
+from csvw_eo.metadata_structure import (
+    ColumnMetadata,
+    ContinuousPredicate,
+    SingleColumnPartition,
+    TableMetadata,
+)
+from csvw_eo.validate_metadata import validate_metadata
+from csvw_eo.validation_session import ValidationSession
+
+
+def make_column(name: str, nb_partitions: int) -> ColumnMetadata:
+    """Build a column of nb_partitions interval partitions."""
+    partitions = [
+        SingleColumnPartition(
+            predicate=ContinuousPredicate(lower_bound=float(i), upper_bound=float(i + 1)),
+            max_length=10,
+            max_groups_per_unit=2,
+            max_contributions=1,
+        )
+        for i in range(nb_partitions)
+    ]
+    return ColumnMetadata(
+        name=name,
+        datatype=DataTypes.DOUBLE,
+        required=True,
+        privacy_id=False,
+        nullable_proportion=0.0,
+        minimum=0.0,
+        maximum=float(nb_partitions),
+        partitions=partitions,
+        max_num_partitions=nb_partitions,
+    )
+
+
+def make_table(nb_columns: int, nb_partitions: int) -> TableMetadata:
+    """Build table metadata with nb_columns columns of nb_partitions partitions."""
+    columns = [
+        ColumnMetadata(
+            name="id", datatype=DataTypes.INTEGER, required=True, privacy_id=True, nullable_proportion=0.0
+        ),
+        *(make_column(f"value_{i}", nb_partitions) for i in range(nb_columns)),
+    ]
+    return TableMetadata(
+        privacy_unit="id",
+        max_contributions=2,
+        max_length=10 * nb_partitions,
+        public_length=10 * nb_partitions,
+        columns=columns,
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--columns", type=int, default=50)
+    parser.add_argument("--partitions", type=int, default=2_000)
+    args = parser.parse_args()
+
+    metadata = make_table(args.columns, args.partitions).to_dict()
+    session = ValidationSession()
+
+    start = time.perf_counter()
+    session.validate(metadata)
+    first_time = time.perf_counter() - start
+
+    # Edit the bounds of one column
+    metadata["tableSchema"]["columns"][1]["maximum"] = float(args.partitions + 1)
+
+    start = time.perf_counter()
+    validate_metadata(metadata, columnar=True)
+    full_report = check_constraints(metadata)
+    full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    report = session.validate(metadata)
+    session_time = time.perf_counter() - start
+    assert report.violations == full_report.violations  # noqa: S101
+
+    # The same edit again, declaring the edited column
+    metadata["tableSchema"]["columns"][1]["maximum"] = float(args.partitions + 2)
+    start = time.perf_counter()
+    session.validate(metadata, changed_columns=["value_0"])
+    hinted_time = time.perf_counter() - start
+
+    print(f"columns: {args.columns}, partitions per column: {args.partitions}")  # noqa: T201
+    print(f"session, first validation: {first_time:.2f}s")  # noqa: T201
+    print(f"full validation:           {full_time:.2f}s (conforms: {full_report.conforms})")  # noqa: T201
+    print(f"session, one column edit:  {session_time:.3f}s (conforms: {report.conforms})")  # noqa: T201
+    print(f"session, declared edit:    {hinted_time:.3f}s")  # noqa: T201
+    print(f"speed-up: {full_time / session_time:.0f}x, {full_time / hinted_time:.0f}x declared")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -8,35 +8,113 @@ It includes utilities to:
 
 - Generate metadata from datasets
 - Generate dummy datasets from metadata
-- Validate metadata (standard and SHACL-based validation)
+- Validate metadata (standard, constraint and SHACL-based validation)
+- Check datasets against their metadata
+- Clamp, filter and sample datasets to the bounds of their metadata
 - Convert metadata to OpenDP and SmartNoise SQL contexts
 - Assert structural equivalence between datasets
 - Work with metadata models and datatypes
+
+Apart from the constants, the names are loaded on first access (PEP 562
+module ``__getattr__``): ``import csvw_eo`` and the command line entry
+points do not import OpenDP, pySHACL, rdflib, Polars or pandas unless the
+functions using them are accessed.
 """
 
-from .assert_same_structure import assert_same_structure
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING, Any
+
 from .constants import COL_LIST, COL_NAME, MAXIMUM, MINIMUM, TABLE_SCHEMA
-from .csvw_to_opendp_context import csvw_to_opendp_context
-from .csvw_to_smartnoise_sql import csvw_to_smartnoise_sql
-from .datatypes import XSD_GROUP_MAP, DataTypesGroups, to_pandas_dtype
-from .make_dummy_from_metadata import make_dummy_from_metadata
-from .make_metadata_from_data import make_metadata_from_data
-from .metadata_structure import ColumnMetadata, TableMetadata
-from .validate_metadata import validate_metadata
-from .validate_metadata_shacl import validate_metadata_shacl
+
+if TYPE_CHECKING:
+    from .assert_same_structure import assert_same_structure, assert_same_structure_files
+    from .check_constraints import check_constraints
+    from .check_data import check_data
+    from .csvw_to_opendp_context import csvw_to_opendp_context
+    from .csvw_to_opendp_keys import csvw_to_opendp_keys
+    from .csvw_to_smartnoise_sql import csvw_to_smartnoise_sql, csvw_to_smartnoise_sql_batch
+    from .datatypes import XSD_GROUP_MAP, DataTypesGroups, to_pandas_dtype
+    from .dummy_lazyframe import dummy_lazyframe
+    from .enforce_bounds import enforce_bounds
+    from .make_dummy_from_metadata import compile_generation_plan, make_dummy_from_metadata
+    from .make_metadata_from_data import make_metadata_from_data
+    from .metadata_structure import ColumnMetadata, TableMetadata
+    from .opendp_context_factory import OpenDPContextFactory
+    from .partition_index import PartitionIndex
+    from .partition_table import PartitionTable
+    from .polars_schema import cast_to_schema, to_polars_schema
+    from .read_with_metadata import read_with_metadata, scan_with_metadata
+    from .sidecar import read_metadata, write_metadata
+    from .validate_metadata import validate_metadata
+    from .validate_metadata_shacl import validate_metadata_shacl
+    from .validation_session import ValidationSession
+
+# Module of each lazily loaded name
+_LAZY_NAMES = {
+    "assert_same_structure": "assert_same_structure",
+    "assert_same_structure_files": "assert_same_structure",
+    "check_constraints": "check_constraints",
+    "check_data": "check_data",
+    "csvw_to_opendp_context": "csvw_to_opendp_context",
+    "csvw_to_opendp_keys": "csvw_to_opendp_keys",
+    "csvw_to_smartnoise_sql": "csvw_to_smartnoise_sql",
+    "csvw_to_smartnoise_sql_batch": "csvw_to_smartnoise_sql",
+    "XSD_GROUP_MAP": "datatypes",
+    "DataTypesGroups": "datatypes",
+    "to_pandas_dtype": "datatypes",
+    "dummy_lazyframe": "dummy_lazyframe",
+    "enforce_bounds": "enforce_bounds",
+    "compile_generation_plan": "make_dummy_from_metadata",
+    "make_dummy_from_metadata": "make_dummy_from_metadata",
+    "make_metadata_from_data": "make_metadata_from_data",
+    "ColumnMetadata": "metadata_structure",
+    "TableMetadata": "metadata_structure",
+    "OpenDPContextFactory": "opendp_context_factory",
+    "PartitionIndex": "partition_index",
+    "PartitionTable": "partition_table",
+    "cast_to_schema": "polars_schema",
+    "to_polars_schema": "polars_schema",
+    "read_with_metadata": "read_with_metadata",
+    "scan_with_metadata": "read_with_metadata",
+    "read_metadata": "sidecar",
+    "write_metadata": "sidecar",
+    "validate_metadata": "validate_metadata",
+    "validate_metadata_shacl": "validate_metadata_shacl",
+    "ValidationSession": "validation_session",
+}
 
 __all__ = [  # noqa: RUF022
     # Core functionality
     "assert_same_structure",
+    "assert_same_structure_files",
     "csvw_to_opendp_context",
+    "csvw_to_opendp_keys",
+    "OpenDPContextFactory",
     "csvw_to_smartnoise_sql",
+    "csvw_to_smartnoise_sql_batch",
     "make_dummy_from_metadata",
+    "compile_generation_plan",
+    "dummy_lazyframe",
     "make_metadata_from_data",
     "validate_metadata",
     "validate_metadata_shacl",
+    "check_constraints",
+    "check_data",
+    "enforce_bounds",
+    "ValidationSession",
+    "read_metadata",
+    "read_with_metadata",
+    "scan_with_metadata",
+    "to_polars_schema",
+    "cast_to_schema",
+    "write_metadata",
     # Metadata models
     "TableMetadata",
     "ColumnMetadata",
+    "PartitionTable",
+    "PartitionIndex",
     # Constants
     "COL_LIST",
     "COL_NAME",
@@ -48,3 +126,31 @@ __all__ = [  # noqa: RUF022
     "DataTypesGroups",
     "to_pandas_dtype",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the module of a public name on first access (PEP 562)."""
+    if name not in _LAZY_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_LAZY_NAMES[name]}", __name__), name)
+    globals()[name] = value  # later accesses skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public names, loaded or not."""
+    return sorted({*globals(), *__all__})
+
+
+class _Package(types.ModuleType):
+    """Package module keeping its public functions over the submodules of the same name."""
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        # Importing csvw_eo.validate_metadata binds the submodule on the package,
+        # which would shadow the lazily loaded function validate_metadata
+        if name in _LAZY_NAMES and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
@@ -0,0 +1,81 @@
+"""
+``csvw-eo`` command line entry point.
+
+``csvw-eo serve`` starts a long-running worker (see :mod:`csvw_eo.serve`)
+reading NDJSON job requests from stdin, or from a Unix socket with
+``--socket``. The other commands run the command line interface of a
+module, with its own arguments::
+
+    csvw-eo serve --workers 4 --socket /tmp/csvw-eo.sock
+    csvw-eo dummy metadata.json --rows 1000 --output dummy.csv
+"""
+
+import argparse
+import importlib
+import sys
+from pathlib import Path
+
+# Command of the command line interface of each module
+COMMANDS = {
+    "profile": "csvw_eo.make_metadata_from_data",
+    "dummy": "csvw_eo.make_dummy_from_metadata",
+    "validate": "csvw_eo.validate_metadata",
+    "check-constraints": "csvw_eo.check_constraints",
+    "check-data": "csvw_eo.check_data",
+    "enforce-bounds": "csvw_eo.enforce_bounds",
+    "validate-shacl": "csvw_eo.validate_metadata_shacl",
+    "smartnoise": "csvw_eo.csvw_to_smartnoise_sql",
+    "assert-structure": "csvw_eo.assert_same_structure",
+}
+
+
+def write_stdout(response: str) -> None:
+    """Write a response line to stdout, unbuffered."""
+    sys.stdout.write(response)
+    sys.stdout.flush()
+
+
+def serve(argv: list[str]) -> None:
+    """Run the ``serve`` command."""
+    parser = argparse.ArgumentParser(prog="csvw-eo serve", description="Run NDJSON job requests")
+    parser.add_argument("--socket", default=None, help="Unix socket to listen on, instead of stdin")
+    parser.add_argument("--workers", type=int, default=None, help="Threads running jobs (default: CPUs)")
+    parser.add_argument("--max_pending", type=int, default=None, help="Jobs queued before reading blocks")
+    args = parser.parse_args(argv)
+
+    # Imported here: the worker loads every tool, which the other commands do not need
+    from csvw_eo.serve import Worker  # noqa: PLC0415
+
+    worker = Worker(args.workers, args.max_pending)
+    try:
+        if args.socket is None:
+            worker.serve(sys.stdin, write_stdout)
+            return
+        with worker.socket_server(args.socket) as server:
+            print(f"csvw-eo worker listening on {args.socket}", file=sys.stderr)  # noqa: T201
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                Path(args.socket).unlink(missing_ok=True)
+    finally:
+        worker.close()
+
+
+def main() -> None:
+    """Dispatch ``csvw-eo <command> [arguments]``."""
+    parser = argparse.ArgumentParser(prog="csvw-eo", description=__doc__.split("\n\n")[1])
+    parser.add_argument("command", choices=["serve", *COMMANDS])
+    parser.add_argument("arguments", nargs=argparse.REMAINDER, help="Arguments of the command")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args.arguments)
+        return
+    sys.argv = [f"csvw-eo {args.command}", *args.arguments]
+    importlib.import_module(COMMANDS[args.command]).main()
+
+
+if __name__ == "__main__":
+    main()
@@ -10,20 +10,76 @@ The script checks:
 - optional categorical value compatibility
 
 It does NOT check statistical similarity, only structural compatibility.
+
+``assert_same_structure`` compares two DataFrames in memory.
+``assert_same_structure_files`` compares two CSV files chunk by chunk, with
+bounded memory: each column keeps an incremental state (null count, the
+flags deciding its datatype and its distinct values, up to a cap), and the
+dummy file fails fast on its first null in a required column or its first
+value outside the categories of the original. With ``sample``, only a random
+sample of rows of each file is read and the result comes with a confidence
+report.
 """
 
 import argparse
+import io
+import math
 import sys
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import polars as pl
 
+from csvw_eo.constants import DATE_LENGTH
 from csvw_eo.datatypes import (
     XSD_GROUP_MAP,
+    DataTypes,
     DataTypesGroups,
     infer_xmlschema_datatype,
     is_categorical,
 )
+from csvw_eo.metadata_bounds import csv_header
+
+# Maximum number of unique values of a categorical numeric column (see is_categorical)
+MAX_CATEGORICAL_UNIQUE = 20
+
+# Tokens read as missing values by pandas.read_csv
+PANDAS_NA_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+# Tokens read as booleans by pandas.read_csv
+BOOLEAN_TOKENS = ["True", "TRUE", "true", "False", "FALSE", "false"]
+
+# Flags of ColumnState refining numeric columns
+NUMERIC_FLAGS = {"all_integral", "all_positive", "all_negative"}
+
+# ISO 8601 datetimes accepted by datetime.fromisoformat (see is_datetime)
+ISO_DATETIME_PATTERN = r"^\d{4}-\d{2}-\d{2}([T ]\d{2}(:\d{2}(:\d{2}([.,]\d{1,6})?)?)?)?(Z|[+-]\d{2}:?\d{2})?$"
+
+# Number of row blocks read at random positions of a file in sampled mode
+SAMPLE_BLOCKS = 100
 
 
 def assert_same_structure(
@@ -98,6 +154,379 @@ def assert_same_structure(
                 )
 
 
+@dataclass
+class ColumnState:
+    """
+    Incremental structural state of a column read chunk by chunk.
+
+    The flags hold for all the non-null values read so far; they decide the
+    datatype as ``infer_xmlschema_datatype`` does on the whole column read
+    by ``pandas.read_csv``. ``values`` holds the distinct values read so far,
+    or None once there are more than the cap (or when they are not tracked).
+    """
+
+    rows: int = 0
+    nulls: int = 0
+    all_boolean: bool = True
+    all_numeric: bool = True
+    all_integral: bool = True
+    all_positive: bool = True
+    all_negative: bool = True
+    all_date: bool = True
+    all_datetime: bool = True
+    values: set[str] | None = field(default_factory=set)
+
+    @property
+    def required(self) -> bool:
+        """Whether the column has no missing values."""
+        return self.nulls == 0
+
+    @property
+    def datatype(self) -> DataTypes:  # noqa: PLR0911
+        """Datatype inferred from the values read so far."""
+        if self.rows == self.nulls:
+            return DataTypes.STRING
+        if self.all_boolean:
+            return DataTypes.BOOLEAN
+        if self.all_numeric:
+            if not self.all_integral:
+                return DataTypes.DOUBLE
+            if self.all_positive:
+                return DataTypes.POSITIVE_INTEGER
+            if self.all_negative:
+                return DataTypes.NEGATIVE_INTEGER
+            return DataTypes.INTEGER
+        if self.all_date:
+            return DataTypes.DATE
+        if self.all_datetime:
+            return DataTypes.DATETIME
+        return DataTypes.STRING
+
+    def update(self, chunk: pl.Series, max_distinct: int) -> None:
+        """
+        Add a chunk of the column, read as strings.
+
+        Only the flags still true are evaluated on the chunk, so most flags
+        of a column are dropped after its first chunks.
+        """
+        self.rows += chunk.len()
+        self.nulls += chunk.null_count()
+        col = pl.col(chunk.name)
+        number = col.str.strip_chars().cast(pl.Float64, strict=False)
+        date = col.str.slice(0, DATE_LENGTH).str.to_date("%Y-%m-%d", strict=False).is_not_null()
+        flags = {
+            "all_boolean": col.is_in(BOOLEAN_TOKENS),
+            "all_numeric": number.is_not_null(),
+            "all_integral": number.is_null() | (number % 1 == 0),
+            "all_positive": number.is_null() | (number > 0),
+            "all_negative": number.is_null() | (number < 0),
+            "all_date": date & (col.str.len_chars() <= DATE_LENGTH),
+            "all_datetime": date & col.str.contains(ISO_DATETIME_PATTERN),
+        }
+        # The sign and integrality of the values matter only while they are all numbers
+        evaluated = [name for name in flags if getattr(self, name)]
+        if not self.all_numeric:
+            evaluated = [name for name in evaluated if name not in NUMERIC_FLAGS]
+        exprs = [(col.is_null() | flags[name]).all().alias(name) for name in evaluated]
+        if exprs:
+            for name, value in chunk.to_frame().select(exprs).row(0, named=True).items():
+                setattr(self, name, bool(value))
+        if self.values is not None:
+            self.values.update(chunk.drop_nulls().unique().to_list())
+            if len(self.values) > max_distinct:
+                self.values = None
+
+
+def _normalize(values: pl.Series, group: DataTypesGroups | None) -> pl.Series:
+    """Return comparable values of a column: numbers as floats, booleans in lower case."""
+    if group in {DataTypesGroups.INTEGER, DataTypesGroups.FLOAT}:
+        return values.str.strip_chars().cast(pl.Float64, strict=False)
+    if group == DataTypesGroups.BOOLEAN:
+        return values.str.to_lowercase()
+    return values
+
+
+@dataclass
+class StructureReport:
+    """
+    Summary of a structural comparison of two files.
+
+    Attributes
+    ----------
+    original_rows : int
+        Number of rows of the original file read.
+    dummy_rows : int
+        Number of rows of the dummy file read.
+    sampled : bool
+        Whether the rows were a random sample of the files.
+    confidence : float
+        Confidence level of the bounds of a sampled comparison.
+    original_blocks : int, optional
+        Number of blocks of lines sampled from the original file, None if it
+        was read whole.
+    dummy_blocks : int, optional
+        Number of blocks of lines sampled from the dummy file, None if it
+        was read whole.
+    unchecked_categories : list of str
+        Categorical columns of the original with more distinct values than
+        the cap, whose dummy values were not checked.
+
+    """
+
+    original_rows: int
+    dummy_rows: int
+    sampled: bool = False
+    confidence: float = 0.95
+    original_blocks: int | None = None
+    dummy_blocks: int | None = None
+    unchecked_categories: list[str] = field(default_factory=list)
+
+    def missed_proportion(self, blocks: int | None) -> float:
+        """
+        Return the largest proportion of rows a sample of ``blocks`` blocks may miss.
+
+        The lines of a block are contiguous, so only the blocks are
+        independent draws. The first line of a block holds a property (a
+        null, a non-integer, a value outside the categories) of a proportion
+        ``p`` of the rows with probability ``p``: the property is absent from
+        ``n`` blocks with probability at most ``(1 - p) ** n``, and at the
+        report confidence level, properties missed by the sample hold for
+        less than ``1 - (1 - confidence) ** (1 / n)`` of the rows. The blocks
+        start at random byte offsets, so ``p`` counts the rows that follow
+        long lines more than the others. Zero for a file read whole (None).
+        """
+        if blocks is None:
+            return 0.0
+        if blocks == 0:
+            return 1.0
+        return float(1 - (1 - self.confidence) ** (1 / blocks))
+
+    @property
+    def text(self) -> str:
+        """Human readable summary of the comparison."""
+        lines = [f"Rows read: original={self.original_rows}, dummy={self.dummy_rows}"]
+        if self.sampled:
+            lines.append(
+                f"Sampled comparison: with confidence {self.confidence:.0%}, a property missed by the "
+                f"samples holds for less than {self.missed_proportion(self.original_blocks):.4%} of the "
+                f"original rows and {self.missed_proportion(self.dummy_blocks):.4%} of the dummy rows "
+                f"(blocks sampled: original={self.original_blocks}, dummy={self.dummy_blocks}). The "
+                "blocks start at random byte offsets, which favours the rows that follow long lines"
+            )
+        if self.unchecked_categories:
+            lines.append(f"Categories not checked (too many distinct values): {self.unchecked_categories}")
+        return "\n".join(lines)
+
+
+def _read_chunks(path: Path, *, separator: str, chunk_size: int) -> Iterator[pl.DataFrame]:
+    """Yield the rows of a CSV file as string DataFrames of about ``chunk_size`` rows."""
+    reader = pl.read_csv_batched(
+        path,
+        separator=separator,
+        infer_schema_length=0,
+        null_values=PANDAS_NA_VALUES,
+        batch_size=chunk_size,
+    )
+    while batches := reader.next_batches(1):
+        yield from batches
+
+
+def _sample_rows(path: Path, *, separator: str, sample: int, seed: int) -> tuple[pl.DataFrame, int] | None:
+    """
+    Read about ``sample`` rows of a CSV file, in blocks of lines at random positions.
+
+    Return the rows and the number of blocks read, or None when the file is
+    not much larger than the sample, to be read whole. Fields must not
+    contain line breaks.
+    """
+    size = path.stat().st_size
+    with open(path, "rb") as f:
+        header = f.readline()
+        start = f.tell()
+        probe = f.read(2**20)
+        line_length = len(probe) / max(probe.count(b"\n"), 1)
+        if size - start <= 2 * sample * line_length:
+            return None
+        rng = np.random.default_rng(seed)
+        per_block = math.ceil(sample / SAMPLE_BLOCKS)
+        lines: list[bytes] = []
+        blocks = 0
+        end = start
+        for offset in np.sort(rng.integers(start, size, SAMPLE_BLOCKS)):
+            if offset < end:
+                continue
+            f.seek(int(offset))
+            f.readline()  # partial line
+            block = [line for line in (f.readline() for _ in range(per_block)) if line]
+            if block:
+                blocks += 1
+                lines.extend(block)
+            end = f.tell()
+    rows = pl.read_csv(
+        io.BytesIO(header + b"".join(line if line.endswith(b"\n") else line + b"\n" for line in lines)),
+        separator=separator,
+        infer_schema_length=0,
+        null_values=PANDAS_NA_VALUES,
+    )
+    return rows, blocks
+
+
+def _file_chunks(
+    path: Path, *, separator: str, chunk_size: int, sample: int | None, seed: int
+) -> tuple[Iterator[pl.DataFrame], int | None]:
+    """Return the chunks of a file to compare, and the number of blocks sampled (None if read whole)."""
+    if sample is not None:
+        sampled = _sample_rows(path, separator=separator, sample=sample, seed=seed)
+        if sampled is not None:
+            rows, blocks = sampled
+            return iter([rows]), blocks
+    return _read_chunks(path, separator=separator, chunk_size=chunk_size), None
+
+
+def assert_same_structure_files(  # noqa: PLR0912, PLR0913
+    original: str | Path,
+    dummy: str | Path,
+    *,
+    check_categories: bool = True,
+    chunk_size: int = 1_000_000,
+    max_distinct: int = 100_000,
+    sample: int | None = None,
+    confidence: float = 0.95,
+    seed: int = 0,
+    separator: str = ",",
+) -> StructureReport:
+    """
+    Verify that two CSV files share the same structural schema, chunk by chunk.
+
+    The checks are those of ``assert_same_structure`` on the files read with
+    ``pandas.read_csv``, with memory bounded by the chunk size and the
+    distinct values kept per column. The original is read first; the dummy
+    then fails fast on the first chunk with a null in a required column or
+    a value outside the categories of the original.
+
+    Parameters
+    ----------
+    original : str or Path
+        Original CSV file.
+    dummy : str or Path
+        Dummy CSV file.
+    check_categories : bool, default=True
+        Whether to verify that categorical values in the dummy data
+        are subsets of those in the original data.
+    chunk_size : int, default=1_000_000
+        Number of rows read at once.
+    max_distinct : int, default=100_000
+        Maximum number of distinct values kept per column of the original.
+        The values of categorical columns with more are not checked (see
+        ``StructureReport.unchecked_categories``).
+    sample : int, optional
+        Number of rows to sample from each file, in blocks of lines read at
+        random positions, instead of reading them whole. Files not much
+        larger than the sample are read whole.
+    confidence : float, default=0.95
+        Confidence level of the bounds reported for a sampled comparison.
+    seed : int, default=0
+        Seed of the sampled positions.
+    separator : str, default=","
+        Field separator of the files.
+
+    Returns
+    -------
+    StructureReport
+        Rows read and, for a sampled comparison, the proportion of rows its
+        checks may have missed, bounded by the number of blocks read.
+
+    Raises
+    ------
+    AssertionError
+        If any structural mismatch is detected.
+    ValueError
+        If ``max_distinct`` is below the number of unique values of a
+        categorical numeric column, or ``confidence`` is not in (0, 1).
+
+    """
+    if max_distinct < MAX_CATEGORICAL_UNIQUE:
+        raise ValueError(f"max_distinct must be at least {MAX_CATEGORICAL_UNIQUE}, got {max_distinct}")
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be in (0, 1), got {confidence}")
+    original, dummy = Path(original), Path(dummy)
+
+    # Columns: order and names
+    columns1, columns2 = csv_header(original, separator), csv_header(dummy, separator)
+    if columns1 != columns2:
+        raise AssertionError(f"Column names/order differ:\nOriginal: {columns1}\nDummy:{columns2}")
+
+    chunks, blocks1 = _file_chunks(
+        original, separator=separator, chunk_size=chunk_size, sample=sample, seed=seed
+    )
+    states1 = {col: ColumnState() for col in columns1}
+    for chunk in chunks:
+        for col in columns1:
+            states1[col].update(chunk[col], max_distinct)
+
+    # Categories of the original, as in is_categorical
+    categories: dict[str, pl.Series] = {}
+    unchecked = []
+    for col, state in states1.items() if check_categories else ():
+        group = XSD_GROUP_MAP[state.datatype]
+        if state.values is None:
+            if group in {DataTypesGroups.STRING, DataTypesGroups.BOOLEAN}:
+                unchecked.append(col)
+            continue
+        values = _normalize(pl.Series(sorted(state.values), dtype=pl.String), group)
+        if (
+            group in {DataTypesGroups.STRING, DataTypesGroups.BOOLEAN}
+            or values.n_unique() <= MAX_CATEGORICAL_UNIQUE
+        ):
+            categories[col] = values.unique()
+
+    chunks, blocks2 = _file_chunks(
+        dummy, separator=separator, chunk_size=chunk_size, sample=sample, seed=seed
+    )
+    states2 = {col: ColumnState(values=None) for col in columns2}
+    for chunk in chunks:
+        for col in columns2:
+            states2[col].update(chunk[col], max_distinct)
+            if states1[col].required and chunk[col].null_count():
+                raise AssertionError(
+                    f"Column '{col}' nullability mismatch: original required=True, dummy required=False"
+                )
+            if col in categories:
+                values = _normalize(chunk[col].drop_nulls(), XSD_GROUP_MAP[states1[col].datatype])
+                outside = chunk[col].drop_nulls().filter(~values.is_in(categories[col].implode()))
+                if outside.len():
+                    raise AssertionError(
+                        f"Column '{col}' dummy values {set(outside.unique().to_list())} "
+                        f"are not subset of original {set(states1[col].values or ())}"
+                    )
+
+    # Data types
+    for col in columns1:
+        dtype1, dtype2 = states1[col].datatype, states2[col].datatype
+        if XSD_GROUP_MAP[dtype1] == DataTypesGroups.INTEGER == XSD_GROUP_MAP[dtype2]:
+            continue
+        if dtype1 != dtype2:
+            raise AssertionError(f"Column '{col}' dtype mismatch: original={dtype1}, dummy={dtype2}")
+
+    # Nullability (nulls in the dummy of a required column were reported while reading)
+    for col in columns1:
+        if states1[col].required != states2[col].required:
+            raise AssertionError(
+                f"Column '{col}' nullability mismatch: original required={states1[col].required}, "
+                f"dummy required={states2[col].required}"
+            )
+
+    return StructureReport(
+        original_rows=states1[columns1[0]].rows if columns1 else 0,
+        dummy_rows=states2[columns2[0]].rows if columns2 else 0,
+        sampled=blocks1 is not None or blocks2 is not None,
+        confidence=confidence,
+        original_blocks=blocks1,
+        dummy_blocks=blocks2,
+        unchecked_categories=unchecked,
+    )
+
+
 def main() -> None:
     """Command-line entry point for the CSV structure validator."""
     parser = argparse.ArgumentParser(
@@ -110,17 +539,36 @@ def main() -> None:
         action="store_true",
         help="Skip categorical subset validation",
     )
+    parser.add_argument("--chunk_size", type=int, default=1_000_000, help="Rows read at once")
+    parser.add_argument(
+        "--max_distinct",
+        type=int,
+        default=100_000,
+        help="Maximum number of distinct values kept per column of the original",
+    )
+    parser.add_argument(
+        "--sample", type=int, default=None, help="Compare a random sample of rows of each file"
+    )
+    parser.add_argument(
+        "--confidence", type=float, default=0.95, help="Confidence level of a sampled comparison"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the sampled rows")
 
     args = parser.parse_args()
 
-    df1 = pd.read_csv(Path(args.original_csv), parse_dates=True)
-    df2 = pd.read_csv(Path(args.dummy_csv), parse_dates=True)
     try:
-        assert_same_structure(
-            df1,
-            df2,
+        report = assert_same_structure_files(
+            Path(args.original_csv),
+            Path(args.dummy_csv),
             check_categories=not args.no_categories,
+            chunk_size=args.chunk_size,
+            max_distinct=args.max_distinct,
+            sample=args.sample,
+            confidence=args.confidence,
+            seed=args.seed,
         )
+        if report.sampled or report.unchecked_categories:
+            print(report.text)  # noqa: T201
     except AssertionError as e:
         print(f"Structure mismatch: {e}")  # noqa: T201
         sys.exit(1)
@@ -0,0 +1,585 @@
+"""
+Native checker of the CSVW-EO constraints.
+
+``validate_metadata_shacl`` converts the metadata to an RDF graph and runs
+pySHACL on it, which takes seconds to minutes on documents with many
+partitions. This module checks the rules of ``csvw-eo-constraints.md``
+(including the shapes of ``csvw-eo-constraints.ttl``) directly on a
+``TableMetadata``: partitions and keys are checked in their columnar form
+(see :mod:`csvw_eo.partition_table`), with one vectorized comparison per rule.
+
+The result is a :class:`ConstraintReport`, listing the focus node, the result
+path, the severity and a message of each failed constraint, as a SHACL
+validation report.
+
+Rules that the metadata model cannot express (the ``Contribution`` objects of
+section 4.5, or whether a column is used in an aggregation) are not checked;
+missing ``minimum`` and ``maximum`` of numeric columns are reported as
+warnings.
+"""
+
+import argparse
+import math
+import sys
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from csvw_eo.constants import (
+    COLUMNS_IN_GROUP,
+    KEY_VALUES,
+    LOWER_BOUND,
+    MAX_CONTRIB,
+    MAX_GROUPS,
+    MAX_LENGTH,
+    MAX_NUM_PARTITIONS,
+    MAXIMUM,
+    MINIMUM,
+    NULL_PROP,
+    PARTITION_VALUE,
+    PRIVACY_ID,
+    PRIVACY_UNIT,
+    PUBLIC_LENGTH,
+    PUBLIC_PARTITIONS,
+    REQUIRED,
+    UPPER_BOUND,
+)
+from csvw_eo.datatypes import XSD_GROUP_MAP, DataTypesGroups
+from csvw_eo.metadata_structure import ColumnGroupMetadata, ColumnMetadata, TableMetadata
+from csvw_eo.partition_table import BOUND_FIELDS, PartitionTable, PredicateColumn
+from csvw_eo.sidecar import read_metadata
+
+CATEGORICAL_GROUPS = {DataTypesGroups.STRING, DataTypesGroups.BOOLEAN}
+
+
+class Severity(StrEnum):
+    """Severity of a failed constraint, as in SHACL."""
+
+    VIOLATION = "Violation"
+    WARNING = "Warning"
+
+
+@dataclass(frozen=True)
+class ConstraintViolation:
+    """One failed constraint."""
+
+    rule: str  # section of csvw-eo-constraints.md
+    focus: str  # table, column, column group or partition
+    path: str  # checked property
+    message: str
+    severity: Severity = Severity.VIOLATION
+
+    def __str__(self) -> str:
+        """Format the violation as an entry of a pySHACL report."""
+        return (
+            f"Constraint {self.severity} (rule {self.rule}):\n"
+            f"\tSeverity: {self.severity}\n"
+            f"\tFocus Node: {self.focus}\n"
+            f"\tResult Path: {self.path}\n"
+            f"\tMessage: {self.message}"
+        )
+
+
+@dataclass
+class ConstraintReport:
+    """Failed constraints found by :func:`check_constraints`."""
+
+    violations: list[ConstraintViolation] = field(default_factory=list)
+
+    @property
+    def conforms(self) -> bool:
+        """Return True if no constraint is violated (warnings are allowed)."""
+        return all(v.severity != Severity.VIOLATION for v in self.violations)
+
+    @property
+    def text(self) -> str:
+        """Return the report as text, laid out as a pySHACL report."""
+        lines = ["Validation Report", f"Conforms: {self.conforms}", f"Results ({len(self.violations)}):"]
+        return "\n".join(lines + [str(v) for v in self.violations])
+
+    def __len__(self) -> int:
+        """Return the number of violations and warnings."""
+        return len(self.violations)
+
+    def __iter__(self) -> Iterator[ConstraintViolation]:
+        """Iterate over the violations and warnings."""
+        return iter(self.violations)
+
+    def add(
+        self, rule: str, focus: str, path: str, message: str, severity: Severity = Severity.VIOLATION
+    ) -> None:
+        """Record a failed constraint."""
+        self.violations.append(ConstraintViolation(rule, focus, path, message, severity))
+
+    def add_each(  # noqa: PLR0913
+        self,
+        rule: str,
+        focus: str,
+        path: str,
+        offending: np.ndarray,
+        message: str,
+        *,
+        severity: Severity = Severity.VIOLATION,
+    ) -> None:
+        """
+        Record a failed constraint for each offending partition.
+
+        ``focus`` is formatted with the position ``i`` of each True entry of
+        the ``offending`` mask.
+        """
+        for i in np.flatnonzero(offending).tolist():
+            self.add(rule, focus.format(i=i), path, message, severity)
+
+
+# ------------------------------------------------------------
+# Helpers
+# ------------------------------------------------------------
+def _comparable_array(array: np.ndarray) -> np.ndarray:
+    """
+    Order-preserving floats of values or bounds.
+
+    Numbers are kept, ISO datetime strings become nanoseconds since the epoch,
+    and anything else (missing bounds, text) becomes NaN, so that every
+    comparison with it is False.
+    """
+    if array.dtype.kind in "iuf":
+        return array.astype(np.float64)
+    series = pd.Series(array, dtype=object)
+    result = np.full(len(series), np.nan)
+
+    is_number = series.map(lambda v: isinstance(v, int | float) and not isinstance(v, bool)).to_numpy(bool)
+    result[is_number] = series[is_number].astype(float).to_numpy()
+
+    is_text = series.map(lambda v: isinstance(v, str)).to_numpy(bool)
+    if is_text.any():
+        dates = pd.to_datetime(series[is_text], errors="coerce", utc=True, format="ISO8601")
+        nanoseconds = dates.dt.tz_convert(None).to_numpy("datetime64[ns]").astype(np.int64).astype(float)
+        nanoseconds[dates.isna().to_numpy()] = np.nan
+        result[is_text] = nanoseconds
+    return result
+
+
+def _comparable(value: Any) -> float:  # noqa: ANN401
+    """Order-preserving float of a single value (see :func:`_comparable_array`)."""
+    array = np.empty(1, dtype=object)
+    array[0] = value
+    return float(_comparable_array(array)[0])
+
+
+def _predicate_keys(predicates: PredicateColumn) -> pd.Index:
+    """Hashable index of the predicates of one column: values, or (lower, upper) pairs."""
+    if predicates.values is not None:
+        return pd.Index(predicates.values, dtype=object)
+    return pd.MultiIndex.from_arrays([predicates.lower, predicates.upper])
+
+
+def _product(values: list[int | None]) -> int | None:
+    """Product of per-column values, None if one of them is not declared."""
+    if any(v is None for v in values):
+        return None
+    return math.prod(v for v in values if v is not None)
+
+
+class _Checker:
+    """Check the scopes of a TableMetadata, recording failures in a report."""
+
+    def __init__(self, table: TableMetadata) -> None:
+        self.table = table
+        self.report = ConstraintReport()
+        self.columns = {col.name: col for col in table.columns}
+        self.partition_tables: dict[str, PartitionTable | None] = {}
+
+    def run(self) -> ConstraintReport:
+        self.check_table()
+        for column in self.table.columns:
+            self.check_column(column)
+        for i, group in enumerate(self.table.column_groups or []):
+            self.check_group(group, f"ColumnGroup[{i}] {group.columns}")
+        return self.report
+
+    # ------------------------------------------------------------
+    # Shared rules
+    # ------------------------------------------------------------
+    def required(self, rule: str, focus: str, values: dict[str, Any]) -> None:
+        """Properties that must be declared (sh:minCount 1)."""
+        for path, value in values.items():
+            if value is None:
+                self.report.add(rule, focus, path, f"Less than 1 values on {focus}->{path}")
+
+    def at_most(  # noqa: PLR0913
+        self,
+        rule: str,
+        focus: str,
+        path: str,
+        value: float | None,
+        limit: float | None,
+        *,
+        limit_name: str,
+    ) -> None:
+        """Check that a declared value does not exceed a declared limit."""
+        if value is not None and limit is not None and value > limit:
+            self.report.add(rule, focus, path, f"{path} {value} > {limit_name} {limit}")
+
+    def as_table(self, focus: str, path: str, items: Any) -> PartitionTable | None:  # noqa: ANN401
+        """Columnar view of a partition or key list, None if empty or inconsistent."""
+        if not items:
+            return None
+        if isinstance(items, PartitionTable):
+            return items
+        try:
+            return PartitionTable.from_models(items)
+        except (KeyError, ValueError) as e:
+            self.report.add("4.4.1", focus, path, f"Predicates must constrain the same columns alike: {e}")
+            return None
+
+    def scope_bounds(self, entry: ColumnMetadata | ColumnGroupMetadata) -> dict[str, tuple[int | None, str]]:
+        """Bounds of a column or column group, inheriting the table bounds if omitted (4.6)."""
+        scope = "column" if isinstance(entry, ColumnMetadata) else "group"
+        bounds = {}
+        for path, own, inherited in (
+            (MAX_LENGTH, entry.max_length, self.table.max_length),
+            (MAX_CONTRIB, entry.max_contributions, self.table.max_contributions),
+        ):
+            bounds[path] = (own, f"{scope} {path}") if own is not None else (inherited, f"table {path}")
+        return bounds
+
+    def check_partition_bounds(
+        self, focus: str, partitions: PartitionTable, entry: ColumnMetadata | ColumnGroupMetadata
+    ) -> None:
+        """Partition bounds must not exceed the bounds of their scope (4.2.2, 4.3.3, 4.4.2)."""
+        if partitions.bounds is None:
+            return
+        bounds = dict(zip(BOUND_FIELDS, partitions.bounds))
+        for path, (limit, limit_name) in self.scope_bounds(entry).items():
+            if limit is not None:
+                self.report.add_each(
+                    "4.4.2", focus, path, bounds[path] > limit, f"{path} > {limit_name} {limit}"
+                )
+
+    def check_exhaustive(self, rule: str, focus: str, entry: ColumnMetadata | ColumnGroupMetadata) -> None:
+        """Exhaustive partitions must all be listed."""
+        if (
+            entry.exhaustive_partitions
+            and entry.partitions
+            and entry.max_num_partitions is not None
+            and len(entry.partitions) != entry.max_num_partitions
+        ):
+            self.report.add(
+                rule,
+                focus,
+                MAX_NUM_PARTITIONS,
+                f"{len(entry.partitions)} exhaustive partitions, but {MAX_NUM_PARTITIONS} is "
+                f"{entry.max_num_partitions}",
+            )
+
+    def check_predicates(
+        self,
+        focus: str,
+        predicates: PredicateColumn,
+        column: ColumnMetadata,
+        *,
+        distinct: bool,
+        exhaustive: bool,
+    ) -> None:
+        """
+        Predicates of one column: datatype, bounds, column range and overlaps (4.2.1, 4.4.1, 4.8).
+
+        ``distinct`` is False for the components of column group predicates,
+        which repeat across partitions.
+        """
+        report = self.report
+        group = XSD_GROUP_MAP.get(column.datatype)
+        overlap_rule, overlap = ("4.8", Severity.VIOLATION) if exhaustive else ("4.4.1", Severity.WARNING)
+
+        if predicates.values is not None:
+            if group not in CATEGORICAL_GROUPS:
+                values = _comparable_array(predicates.values)
+                outside = (values < _comparable(column.minimum)) | (values > _comparable(column.maximum))
+                report.add_each(
+                    "4.2.1", focus, PARTITION_VALUE, outside, "Partition value outside column range"
+                )
+            if distinct:
+                duplicated = pd.Series(predicates.values, dtype=object).duplicated().to_numpy()
+                report.add_each(
+                    overlap_rule, focus, PARTITION_VALUE, duplicated, "Duplicated value", severity=overlap
+                )
+            return
+
+        if group in CATEGORICAL_GROUPS:
+            report.add(
+                "4.2.1", focus.format(i="*"), PARTITION_VALUE, f"{group} partitions must use partitionValue"
+            )
+            return
+
+        lower = _comparable_array(predicates.lower)  # type: ignore[arg-type]
+        upper = _comparable_array(predicates.upper)  # type: ignore[arg-type]
+        for path, array in ((LOWER_BOUND, predicates.lower), (UPPER_BOUND, predicates.upper)):
+            missing = pd.isna(pd.Series(array, dtype=object)).to_numpy()
+            report.add_each("4.2.1", focus, path, missing, "Numeric partitions must declare both bounds")
+        report.add_each("4.4.1", focus, LOWER_BOUND, lower > upper, "lowerBound > upperBound")
+        disjoint = (lower > _comparable(column.maximum)) | (upper < _comparable(column.minimum))
+        report.add_each("4.2.1", focus, LOWER_BOUND, disjoint, "Partition interval outside column range")
+
+        if distinct and len(lower) > 1:
+            # Sorted by lower bound, an interval overlaps the next one if it ends after its start
+            order = np.argsort(np.nan_to_num(lower, nan=-np.inf), kind="stable")
+            ends = np.nan_to_num(upper[order[:-1]], nan=np.inf)
+            starts = np.nan_to_num(lower[order[1:]], nan=-np.inf)
+            overlapping = np.zeros(len(lower), dtype=bool)
+            overlapping[order[:-1][ends > starts]] = True
+            report.add_each(
+                overlap_rule, focus, UPPER_BOUND, overlapping, "Overlapping intervals", severity=overlap
+            )
+
+    # ------------------------------------------------------------
+    # Scopes
+    # ------------------------------------------------------------
+    def check_table(self) -> None:
+        """Table-level constraints (4.1)."""
+        table, focus = self.table, "Table"
+        self.required(
+            "4.1.1",
+            focus,
+            {
+                PRIVACY_UNIT: table.privacy_unit,
+                MAX_CONTRIB: table.max_contributions,
+                MAX_LENGTH: table.max_length,
+                PUBLIC_LENGTH: table.public_length,
+            },
+        )
+        if table.privacy_unit is not None and table.privacy_unit not in self.columns:
+            self.report.add(
+                "4.1.1", focus, PRIVACY_UNIT, f"Privacy unit '{table.privacy_unit}' is not a column"
+            )
+        self.at_most(
+            "4.1.1", focus, MAX_CONTRIB, table.max_contributions, table.max_length, limit_name=MAX_LENGTH
+        )
+        self.at_most(
+            "4.1.2", focus, PUBLIC_LENGTH, table.public_length, table.max_length, limit_name=MAX_LENGTH
+        )
+
+    def check_column(self, column: ColumnMetadata) -> None:
+        """Column-level constraints (4.2), and those of its partitions and keys (4.4)."""
+        focus = f"Column '{column.name}'"
+        self.required(
+            "4.2.1",
+            focus,
+            {REQUIRED: column.required, PRIVACY_ID: column.privacy_id, NULL_PROP: column.nullable_proportion},
+        )
+        if XSD_GROUP_MAP.get(column.datatype) not in CATEGORICAL_GROUPS and not column.privacy_id:
+            for path, value in ((MINIMUM, column.minimum), (MAXIMUM, column.maximum)):
+                if value is None:
+                    self.report.add("4.7", focus, path, "Numeric column without bounds", Severity.WARNING)
+
+        table = self.table
+        self.at_most(
+            "4.6", focus, MAX_LENGTH, column.max_length, table.max_length, limit_name=f"table {MAX_LENGTH}"
+        )
+        self.at_most(
+            "4.6",
+            focus,
+            MAX_CONTRIB,
+            column.max_contributions,
+            table.max_contributions,
+            limit_name=f"table {MAX_CONTRIB}",
+        )
+        # make_metadata_from_data declares the rows per unit and partition as maxGroupsPerUnit
+        if (
+            column.max_groups_per_unit is not None
+            and column.max_num_partitions is not None
+            and column.max_groups_per_unit > column.max_num_partitions
+        ):
+            self.report.add(
+                "4.2.2",
+                focus,
+                MAX_GROUPS,
+                f"{MAX_GROUPS} {column.max_groups_per_unit} > "
+                f"{MAX_NUM_PARTITIONS} {column.max_num_partitions}",
+                Severity.WARNING,
+            )
+        self.check_exhaustive("4.2.1", focus, column)
+
+        partitions = self.as_table(focus, PUBLIC_PARTITIONS, column.partitions)
+        self.partition_tables[column.name] = partitions
+        if partitions is not None:
+            partition_focus = focus + " partition[{i}]"
+            self.check_predicates(
+                partition_focus,
+                partitions.predicates[0],
+                column,
+                distinct=True,
+                exhaustive=bool(column.exhaustive_partitions),
+            )
+            self.check_partition_bounds(partition_focus, partitions, column)
+
+        keys = self.as_table(focus, KEY_VALUES, column.public_keys_values)
+        if keys is not None:
+            self.check_predicates(
+                focus + " key[{i}]",
+                keys.predicates[0],
+                column,
+                distinct=True,
+                exhaustive=bool(column.exhaustive_keys),
+            )
+
+    def check_group(self, group: ColumnGroupMetadata, focus: str) -> None:
+        """Column group constraints (4.3), and those of its partitions and keys (4.4)."""
+        report, table = self.report, self.table
+        unknown = [col for col in group.columns if col not in self.columns]
+        for col in unknown:
+            report.add("4.3.1", focus, COLUMNS_IN_GROUP, f"Column '{col}' does not exist")
+        if len(set(group.columns)) < 2:  # noqa: PLR2004
+            report.add("4.3.1", focus, COLUMNS_IN_GROUP, "A column group needs at least two distinct columns")
+        if unknown:
+            return
+        columns = [self.columns[col] for col in group.columns]
+
+        if group.max_num_partitions is not None:
+            missing = [col.name for col in columns if col.max_num_partitions is None]
+            if missing:
+                report.add("4.3.2", focus, MAX_NUM_PARTITIONS, f"Columns {missing} do not declare it")
+            product = _product([col.max_num_partitions for col in columns])
+            self.at_most(
+                "4.3.2",
+                focus,
+                MAX_NUM_PARTITIONS,
+                group.max_num_partitions,
+                product,
+                limit_name="column product",
+            )
+        self.at_most(
+            "4.3.3", focus, MAX_LENGTH, group.max_length, table.max_length, limit_name=f"table {MAX_LENGTH}"
+        )
+        self.at_most(
+            "4.3.3",
+            focus,
+            MAX_CONTRIB,
+            group.max_contributions,
+            table.max_contributions,
+            limit_name=f"table {MAX_CONTRIB}",
+        )
+        product = _product([col.max_groups_per_unit for col in columns])
+        self.at_most(
+            "4.3.3", focus, MAX_GROUPS, group.max_groups_per_unit, product, limit_name="column product"
+        )
+        self.check_exhaustive("4.3.2", focus, group)
+
+        partitions = self.as_table(focus, PUBLIC_PARTITIONS, group.partitions)
+        if partitions is not None:
+            partition_focus = focus + " partition[{i}]"
+            missing = [col.name for col in columns if self.partition_tables.get(col.name) is None]
+            if missing:
+                report.add("4.3.2", focus, PUBLIC_PARTITIONS, f"Columns {missing} do not declare partitions")
+            if self.check_components(partition_focus, partitions, columns, group.exhaustive_partitions):
+                self.check_cartesian_subset(partition_focus, partitions, columns)
+            self.check_partition_bounds(partition_focus, partitions, group)
+
+        keys = self.as_table(focus, KEY_VALUES, group.public_keys_values)
+        if keys is not None:
+            self.check_components(focus + " key[{i}]", keys, columns, group.exhaustive_keys)
+
+    def check_components(
+        self, focus: str, partitions: PartitionTable, columns: list[ColumnMetadata], exhaustive: bool | None
+    ) -> bool:
+        """Components of group predicates (4.3.1, 4.8); return False if they do not match the columns."""
+        names = [col.name for col in columns]
+        components = list(partitions.columns or ())
+        if components != names:
+            self.report.add(
+                "4.3.1",
+                focus.format(i="*"),
+                COLUMNS_IN_GROUP,
+                f"Predicate components {components} do not match group columns {names}",
+            )
+            return False
+        for column, predicates in zip(columns, partitions.predicates):
+            self.check_predicates(focus, predicates, column, distinct=False, exhaustive=bool(exhaustive))
+
+        rows = pd.DataFrame({name: list(_predicate_keys(p)) for name, p in zip(names, partitions.predicates)})
+        rule, severity = ("4.8", Severity.VIOLATION) if exhaustive else ("4.4.1", Severity.WARNING)
+        self.report.add_each(
+            rule,
+            focus,
+            PUBLIC_PARTITIONS,
+            rows.duplicated().to_numpy(),
+            "Duplicated predicate",
+            severity=severity,
+        )
+        return True
+
+    def check_cartesian_subset(
+        self, focus: str, partitions: PartitionTable, columns: list[ColumnMetadata]
+    ) -> None:
+        """Each component of a group partition must be a partition of its column (4.3.2)."""
+        for column, predicates in zip(columns, partitions.predicates):
+            column_partitions = self.partition_tables.get(column.name)
+            if column_partitions is None:
+                continue
+            known = _predicate_keys(column_partitions.predicates[0])
+            unknown = ~_predicate_keys(predicates).isin(known)
+            self.report.add_each(
+                "4.3.2",
+                focus,
+                PUBLIC_PARTITIONS,
+                unknown,
+                f"'{column.name}' component is not a column partition",
+            )
+
+
+def check_constraints(metadata: TableMetadata | dict[str, Any]) -> ConstraintReport:
+    """
+    Check the CSVW-EO constraints of table metadata.
+
+    Parameters
+    ----------
+    metadata : TableMetadata or dict
+        Table metadata, or CSVW-EO JSON metadata (parsed with columnar
+        partitions).
+
+    Returns
+    -------
+    ConstraintReport
+        Failed constraints; ``report.conforms`` is False if one of them is a
+        violation rather than a warning.
+
+    """
+    if not isinstance(metadata, TableMetadata):
+        metadata = TableMetadata.from_dict(metadata, columnar=True)
+    return _Checker(metadata).run()
+
+
+def main() -> None:
+    """
+    Command-line interface for the native constraint checker.
+
+    Prints a success message, or the report and exits with a non-zero status
+    code if a constraint is violated.
+    """
+    parser = argparse.ArgumentParser(description="Check the CSVW-EO constraints of a metadata file")
+    parser.add_argument("metadata_file", type=str)
+    parser.add_argument("--warnings", action="store_true", help="Also print the warnings")
+    args = parser.parse_args()
+
+    metadata_path = Path(args.metadata_file)
+    if not metadata_path.exists():
+        print(f"Metadata file not found: {metadata_path}")  # noqa: T201
+        sys.exit(1)
+
+    report = check_constraints(read_metadata(metadata_path))
+    if report.conforms:
+        print("Constraint check SUCCESSFUL")  # noqa: T201
+        if args.warnings and len(report):
+            print(report.text)  # noqa: T201
+    else:
+        print("Constraint check FAILED")  # noqa: T201
+        print(report.text)  # noqa: T201
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
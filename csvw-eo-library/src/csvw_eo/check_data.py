@@ -0,0 +1,694 @@
+"""
+Streaming check of a dataset against its CSVW-EO metadata.
+
+:func:`csvw_eo.check_constraints.check_constraints` checks the metadata on its
+own; :func:`check_data` checks that a dataset (CSV or Parquet file) conforms
+to its metadata:
+
+- each value parses as the datatype of its column, and lies within its
+  ``minimum`` and ``maximum``;
+- required columns have no missing value, and the proportion of missing
+  values is at most ``nullableProportion``;
+- the values of columns and column groups with exhaustive ``keyValues`` or
+  ``partitions`` belong to one of them;
+- partitions hold at most ``maxLength`` rows; each privacy unit contributes
+  at most ``maxGroupsPerUnit`` rows to a partition and rows to at most
+  ``maxContributions`` partitions (the bounds written by
+  ``make_metadata_from_data``), and at most the table ``maxContributions``
+  rows to the table.
+
+The file is read in chunks of ``chunk_size`` rows (Arrow record batches),
+checked by a thread pool: rows are parsed with the casts of
+:mod:`csvw_eo.polars_schema` and assigned to their partition with a
+:class:`csvw_eo.partition_index.PartitionIndex`. The memory used does not
+grow with the file: the counters of the partitions are kept in memory, while
+the per-unit counts of each chunk are spilled to ``buckets`` files on disk,
+hashed by privacy unit, and aggregated one bucket at a time at the end.
+
+The :class:`DataReport` counts the offending rows (or partitions, or units)
+of each rule and keeps the first ``max_examples`` of them.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.ipc as pa_ipc
+import pyarrow.parquet as pq
+
+from csvw_eo.constants import (
+    COL_NAME,
+    DATATYPE,
+    MAX_CONTRIB,
+    MAX_GROUPS,
+    MAX_LENGTH,
+    MAXIMUM,
+    MINIMUM,
+    NULL_PROP,
+    PUBLIC_LENGTH,
+    REQUIRED,
+)
+from csvw_eo.metadata_bounds import PARQUET_SUFFIX, csv_header, entry_partitions, parse_bound, parse_expr
+from csvw_eo.metadata_structure import ColumnGroupMetadata, ColumnMetadata, TableMetadata
+from csvw_eo.partition_index import IntervalClosed, PartitionIndex
+from csvw_eo.partition_table import PartitionTable
+from csvw_eo.polars_schema import to_polars_dtype
+from csvw_eo.sidecar import read_metadata
+
+
+@dataclass(frozen=True)
+class DataViolation:
+    """One row, partition or privacy unit of the data violating the metadata."""
+
+    path: str  # checked property
+    focus: str  # table, column, column group or partition
+    message: str
+
+    def __str__(self) -> str:
+        """Format the violation as an entry of a pySHACL report."""
+        return (
+            f"Data Violation:\n"
+            f"\tFocus Node: {self.focus}\n"
+            f"\tResult Path: {self.path}\n"
+            f"\tMessage: {self.message}"
+        )
+
+
+@dataclass
+class DataReport:
+    """Violations found by :func:`check_data`: a count per rule and the first examples."""
+
+    rows: int = 0
+    max_examples: int = 10
+    counts: dict[tuple[str, str], int] = field(default_factory=dict)  # (focus, path) -> violations
+    violations: list[DataViolation] = field(default_factory=list)
+
+    @property
+    def conforms(self) -> bool:
+        """Return True if the data does not violate the metadata."""
+        return not self.counts
+
+    @property
+    def text(self) -> str:
+        """Return the report as text, with the number of violations of each rule."""
+        lines = ["Data Check Report", f"Rows: {self.rows}", f"Conforms: {self.conforms}"]
+        lines += [f"{focus} {path}: {count} violation(s)" for (focus, path), count in self.counts.items()]
+        lines.append(f"First violations ({len(self.violations)}):")
+        return "\n".join(lines + [str(v) for v in self.violations])
+
+    def __len__(self) -> int:
+        """Return the total number of violations, examples or not."""
+        return sum(self.counts.values())
+
+    def __iter__(self) -> Iterator[DataViolation]:
+        """Iterate over the kept violations."""
+        return iter(self.violations)
+
+    def add(self, path: str, focus: str, count: int, messages: Iterable[str]) -> None:
+        """Record ``count`` violations of a rule, keeping the first messages up to ``max_examples``."""
+        if count <= 0:
+            return
+        key = (focus, path)
+        kept = sum(1 for v in self.violations if (v.focus, v.path) == key) if key in self.counts else 0
+        self.counts[key] = self.counts.get(key, 0) + count
+        for message in messages:
+            if kept >= self.max_examples:
+                break
+            self.violations.append(DataViolation(path, focus, message))
+            kept += 1
+
+    def merge(self, other: "DataReport") -> None:
+        """Add the violations of the report of a later chunk."""
+        for (focus, path), count in other.counts.items():
+            messages = (v.message for v in other.violations if (v.focus, v.path) == (focus, path))
+            self.add(path, focus, count, messages)
+
+
+# ------------------------------------------------------------
+# Compiled checks
+# ------------------------------------------------------------
+@dataclass
+class _ColumnCheck:
+    """Checks of the values of one column."""
+
+    name: str
+    dtype: pl.DataType
+    focus: str
+    required: bool
+    nullable_proportion: float | None
+    minimum: Any
+    maximum: Any
+    nulls: int = 0
+
+
+@dataclass
+class _EntryCheck:
+    """Membership and contribution checks of a column or a column group."""
+
+    focus: str
+    columns: list[str]
+    exhaustive: list[tuple[str, PartitionIndex]]  # (property, index) of exhaustive keys and partitions
+    index: PartitionIndex | None  # partitions (or keys) the contribution bounds apply to
+    bounds: tuple[np.ndarray, ...] | None  # maxLength, maxGroupsPerUnit, maxContributions per partition
+    max_length: int | None
+    max_groups_per_unit: int | None
+    max_contributions: int | None
+    components: np.ndarray | None  # code of each column predicate of each partition (column groups)
+    lengths: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+
+    @property
+    def has_unit_bounds(self) -> bool:
+        """Return True if the entry bounds the contributions of each privacy unit."""
+        return self.index is not None and (
+            self.bounds is not None
+            or self.max_groups_per_unit is not None
+            or self.max_contributions is not None
+        )
+
+
+def _components(partitions: PartitionTable) -> np.ndarray | None:
+    """Code of the predicate of each column of each partition of a column group."""
+    if not partitions.is_multi_column:
+        return None
+    codes = [
+        pd.factorize(pd.Series([repr(sorted(p.items())) for p in predicates.iter_dicts()]))[0]
+        for predicates in partitions.predicates
+    ]
+    return np.column_stack(codes)
+
+
+def _entry_check(
+    entry: ColumnMetadata | ColumnGroupMetadata, focus: str, closed: IntervalClosed
+) -> _EntryCheck | None:
+    indexed = entry_partitions(entry, closed)
+    grouping = indexed.grouping
+    check = _EntryCheck(
+        focus=focus,
+        columns=indexed.columns,
+        exhaustive=indexed.exhaustive,
+        index=indexed.index,
+        bounds=indexed.bounds,
+        max_length=entry.max_length,
+        max_groups_per_unit=entry.max_groups_per_unit,
+        max_contributions=entry.max_contributions,
+        components=_components(grouping) if grouping else None,
+    )
+    if check.index is not None:
+        check.lengths = np.zeros(len(check.index), dtype=np.int64)
+    if not check.exhaustive and not check.has_unit_bounds and check.max_length is None:
+        return None
+    return check
+
+
+@dataclass
+class _ChunkResult:
+    """Counts of a chunk, merged into the state of the checker in file order."""
+
+    report: DataReport
+    nulls: list[int]  # missing values of each column
+    lengths: list[np.ndarray | None]  # rows of each partition of each entry
+    spill: pl.DataFrame | None  # rows of each unit in each combination of partitions
+
+
+class _Checker:
+    """Checks of the chunks of one dataset, and the state carried between them."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        table: TableMetadata,
+        schema: pa.Schema,
+        *,
+        max_examples: int,
+        buckets: int,
+        spill_dir: Path,
+        closed: IntervalClosed,
+    ) -> None:
+        self.table = table
+        self.max_examples = max_examples
+        self.report = DataReport(max_examples=max_examples)
+        self.source = pl.Schema(pl.from_arrow(schema.empty_table()).schema)  # type: ignore[union-attr]
+
+        self.columns = []
+        for column in table.columns:
+            if column.name not in self.source:
+                continue
+            dtype = to_polars_dtype(column.datatype)
+            ordered = dtype.is_numeric() or dtype.is_temporal()  # bounds of strings and booleans are ignored
+            self.columns.append(
+                _ColumnCheck(
+                    name=column.name,
+                    dtype=dtype,
+                    focus=f"Column '{column.name}'",
+                    required=bool(column.required),
+                    nullable_proportion=column.nullable_proportion,
+                    minimum=parse_bound(column.minimum, dtype) if ordered else None,
+                    maximum=parse_bound(column.maximum, dtype) if ordered else None,
+                )
+            )
+
+        parsed = {check.name for check in self.columns}
+        entries: list[tuple[ColumnMetadata | ColumnGroupMetadata, str]] = [
+            (column, f"Column '{column.name}'") for column in table.columns
+        ]
+        entries += [(g, f"ColumnGroup[{i}] {g.columns}") for i, g in enumerate(table.column_groups or [])]
+        self.entries = [
+            check
+            for entry, focus in entries
+            if (check := _entry_check(entry, focus, closed)) is not None
+            and all(col in parsed for col in check.columns)
+        ]
+
+        # Per-unit counts, spilled to disk when the table has a privacy unit: the rows of
+        # each unit in each combination of the partitions of the entries with unit bounds
+        self.unit = table.privacy_unit or ""
+        self.unit_entries = {i: f"partition_{i}" for i, e in enumerate(self.entries) if e.has_unit_bounds}
+        unit_bounds = table.max_contributions is not None or bool(self.unit_entries)
+        self.buckets = buckets if self.unit in self.source and unit_bounds else 0
+        self.spill_schema = pa.schema(
+            [
+                ("unit", pa.string()),
+                *((name, pa.int64()) for name in self.unit_entries.values()),
+                ("rows", pa.int64()),
+            ]
+        )
+        self.spill_paths = [spill_dir / f"bucket_{i}.arrow" for i in range(self.buckets)]
+        self.writers = [pa_ipc.new_stream(str(path), self.spill_schema) for path in self.spill_paths]
+
+    # ------------------------------------------------------------
+    # Chunks (run by the thread pool)
+    # ------------------------------------------------------------
+    def check_chunk(self, chunk: pl.DataFrame, offset: int) -> _ChunkResult:
+        """Check the rows of a chunk, starting at row ``offset`` of the file."""
+        report = DataReport(max_examples=self.max_examples)
+        typed = chunk.select(
+            [parse_expr(check.name, self.source[check.name], check.dtype) for check in self.columns]
+        )
+        nulls = [
+            self.check_values(report, check, chunk[check.name], typed[check.name], offset)
+            for check in self.columns
+        ]
+
+        lengths: list[np.ndarray | None] = []
+        units = {"unit": chunk[self.unit].cast(pl.String)} if self.buckets else {}
+        entry_columns = list(dict.fromkeys(col for entry in self.entries for col in entry.columns))
+        typed_pd = typed.select(entry_columns).to_pandas()
+        for i, entry in enumerate(self.entries):
+            present = ~typed.select(pl.any_horizontal(pl.col(entry.columns).is_null())).to_series().to_numpy()
+            rows = typed_pd[entry.columns]
+            assigned = {id(index): index.assign(rows) for _, index in entry.exhaustive}
+            for path, index in entry.exhaustive:
+                outside = present & (assigned[id(index)] < 0)
+                positions = np.flatnonzero(outside)[: self.max_examples]
+                report.add(
+                    path,
+                    entry.focus,
+                    int(outside.sum()),
+                    (f"Row {offset + p}: {rows.iloc[p].to_dict()} is not in the {path}" for p in positions),
+                )
+            if entry.index is None:
+                lengths.append(None)
+                continue
+            ids = assigned[id(entry.index)] if id(entry.index) in assigned else entry.index.assign(rows)
+            ids = np.where(present, ids, -1)
+            lengths.append(np.bincount(ids[ids >= 0], minlength=len(entry.index)))
+            if self.buckets and i in self.unit_entries:
+                units[self.unit_entries[i]] = pl.Series(ids)
+        spill = None
+        if self.buckets:
+            spill = pl.DataFrame(units).group_by(list(units)).len("rows")
+        return _ChunkResult(report, nulls, lengths, spill)
+
+    def check_values(
+        self, report: DataReport, check: _ColumnCheck, raw: pl.Series, typed: pl.Series, offset: int
+    ) -> int:
+        """Check the values of a column in a chunk; return its number of missing values."""
+        missing = raw.is_null().to_numpy()
+        invalid = ~missing & typed.is_null().to_numpy()
+        rules = [(DATATYPE, invalid, f"does not parse as {check.dtype}")]
+        if check.required:
+            rules.append((REQUIRED, missing, "is missing in a required column"))
+        for path, bound, outside in (
+            (MINIMUM, check.minimum, typed < check.minimum if check.minimum is not None else None),
+            (MAXIMUM, check.maximum, typed > check.maximum if check.maximum is not None else None),
+        ):
+            if outside is not None:
+                rules.append((path, outside.fill_null(False).to_numpy(), f"is outside the {path} {bound}"))
+        for path, mask, message in rules:
+            positions = np.flatnonzero(mask)[: self.max_examples]
+            report.add(
+                path,
+                check.focus,
+                int(mask.sum()),
+                (f"Row {offset + p}: {raw[int(p)]!r} {message}" for p in positions),
+            )
+        return int(missing.sum())
+
+    # ------------------------------------------------------------
+    # Merge and final checks (run by the reading thread)
+    # ------------------------------------------------------------
+    def merge(self, result: _ChunkResult) -> None:
+        """Merge the counts of a chunk, in file order, and spill its per-unit counts."""
+        self.report.merge(result.report)
+        for check, count in zip(self.columns, result.nulls):
+            check.nulls += count
+        for entry, lengths in zip(self.entries, result.lengths):
+            if lengths is not None:
+                entry.lengths += lengths
+        spill = result.spill
+        if spill is None or spill.is_empty():
+            return
+        buckets = spill.with_columns(bucket=(pl.col("unit").hash() % self.buckets).cast(pl.Int64))
+        for (bucket,), part in buckets.partition_by("bucket", as_dict=True).items():
+            self.writers[int(bucket)].write_table(  # type: ignore[call-overload]
+                part.drop("bucket").to_arrow().cast(self.spill_schema)
+            )
+
+    def finish(self, rows: int) -> DataReport:
+        """Run the checks of the whole dataset and return the report."""
+        report, table = self.report, self.table
+        report.rows = rows
+        for writer in self.writers:
+            writer.close()
+
+        for check in self.columns:
+            if (
+                check.nullable_proportion is not None
+                and rows
+                and check.nulls / rows > check.nullable_proportion
+            ):
+                report.add(
+                    NULL_PROP,
+                    check.focus,
+                    1,
+                    [f"{check.nulls / rows:.4f} missing > {NULL_PROP} {check.nullable_proportion}"],
+                )
+        if table.max_length is not None and rows > table.max_length:
+            report.add(MAX_LENGTH, "Table", 1, [f"{rows} rows > {MAX_LENGTH} {table.max_length}"])
+        if table.public_length is not None and rows != table.public_length:
+            report.add(PUBLIC_LENGTH, "Table", 1, [f"{rows} rows != {PUBLIC_LENGTH} {table.public_length}"])
+
+        for entry in self.entries:
+            self.check_lengths(entry)
+        for path in self.spill_paths:
+            self.check_units(pl.read_ipc_stream(path))
+        return report
+
+    def check_lengths(self, entry: _EntryCheck) -> None:
+        """Rows of each partition against ``maxLength``."""
+        limits = [(entry.focus + " partition[*]", entry.bounds[0])] if entry.bounds is not None else []
+        if entry.max_length is not None:
+            limits.append((entry.focus, np.full(len(entry.lengths), entry.max_length)))
+        for focus, limit in limits:
+            offending = np.flatnonzero(entry.lengths > limit)
+            self.report.add(
+                MAX_LENGTH,
+                focus,
+                len(offending),
+                (
+                    f"Partition {i} has {entry.lengths[i]} rows > {MAX_LENGTH} {limit[i]}"
+                    for i in offending[: self.max_examples].tolist()
+                ),
+            )
+
+    def check_units(self, spilled: pl.DataFrame) -> None:
+        """Contributions of the privacy units of one bucket."""
+        if self.table.max_contributions is not None:
+            table = spilled.group_by("unit").agg(pl.col("rows").sum())
+            self.check_unit_limit(
+                "Table",
+                MAX_CONTRIB,
+                table,
+                table["rows"].to_numpy(),
+                limit=self.table.max_contributions,
+                message="Privacy unit {unit!r} contributes {value} rows > {path} {limit}",
+            )
+
+        for i, column in self.unit_entries.items():
+            entry = self.entries[i]
+            units = (
+                spilled.filter(pl.col(column) >= 0)
+                .group_by("unit", partition=column)
+                .agg(pl.col("rows").sum())
+            )
+            partitions = units["partition"].to_numpy()
+            per_unit = self.contributions(entry, units)
+
+            # Rows of each unit in each partition
+            rows = units["rows"].to_numpy()
+            message = (
+                "Privacy unit {unit!r} contributes {value} rows to partition {partition} > {path} {limit}"
+            )
+            if entry.bounds is not None:
+                focus = entry.focus + " partition[*]"
+                limits = entry.bounds[1][partitions]
+                self.check_unit_limit(focus, MAX_GROUPS, units, rows, limit=limits, message=message)
+            if entry.max_groups_per_unit is not None:
+                limit = entry.max_groups_per_unit
+                self.check_unit_limit(entry.focus, MAX_GROUPS, units, rows, limit=limit, message=message)
+
+            # Partitions of each unit
+            message = "Privacy unit {unit!r} contributes to {value} partitions > {path} {limit}"
+            if entry.bounds is not None:
+                focus = entry.focus + " partition[*]"
+                values = units.join(per_unit, on="unit", how="left", maintain_order="left")["n"].to_numpy()
+                limits = entry.bounds[2][partitions]
+                message_partition = message.replace("{unit!r}", "{unit!r} of partition {partition}")
+                self.check_unit_limit(
+                    focus, MAX_CONTRIB, units, values, limit=limits, message=message_partition
+                )
+            if entry.max_contributions is not None:
+                values, limit = per_unit["n"].to_numpy(), entry.max_contributions
+                self.check_unit_limit(
+                    entry.focus, MAX_CONTRIB, per_unit, values, limit=limit, message=message
+                )
+
+    @staticmethod
+    def contributions(entry: _EntryCheck, units: pl.DataFrame) -> pl.DataFrame:
+        """
+        Return the number of partitions each unit contributes to.
+
+        As in ``make_metadata_from_data``, a unit of a column group contributes
+        to as many partitions as the most distinct predicates it has in one of
+        the columns.
+        """
+        if entry.components is None:
+            return units.group_by("unit").agg(pl.col("partition").n_unique().alias("n"))
+        names = [f"column_{j}" for j in range(entry.components.shape[1])]
+        codes = pl.DataFrame(entry.components, schema=names).with_row_index("partition")
+        codes = codes.with_columns(pl.col("partition").cast(pl.Int64))
+        return (
+            units.join(codes, on="partition")
+            .group_by("unit")
+            .agg(pl.max_horizontal(pl.col(names).n_unique()).alias("n"))
+        )
+
+    def check_unit_limit(  # noqa: PLR0913
+        self,
+        focus: str,
+        path: str,
+        units: pl.DataFrame,
+        values: np.ndarray,
+        *,
+        limit: int | np.ndarray,
+        message: str,
+    ) -> None:
+        """Record the units of a bucket over a limit, ``message`` being formatted for each one."""
+        offending = values > limit
+        limits = np.broadcast_to(limit, values.shape)
+        unit = units["unit"].to_numpy()
+        partition = units["partition"].to_numpy() if "partition" in units.columns else None
+        # Examples in unit order, whatever the order of the aggregation
+        positions = np.flatnonzero(offending)
+        order = np.lexsort((positions if partition is None else partition[positions], unit[positions]))
+        self.report.add(
+            path,
+            focus,
+            int(offending.sum()),
+            (
+                message.format(
+                    unit=unit[p],
+                    value=values[p],
+                    partition=None if partition is None else partition[p],
+                    path=path,
+                    limit=limits[p],
+                )
+                for p in positions[order[: self.max_examples]]
+            ),
+        )
+
+
+# ------------------------------------------------------------
+# Reading
+# ------------------------------------------------------------
+def _open_batches(
+    path: Path, columns: list[str], *, separator: str, chunk_size: int
+) -> tuple[pa.Schema, Iterator[pa.RecordBatch]]:
+    """Return the schema of the described columns of a file, and their record batches."""
+    if path.suffix == PARQUET_SUFFIX:
+        parquet = pq.ParquetFile(path)
+        present = [name for name in columns if name in parquet.schema_arrow.names]
+        schema = pa.schema([parquet.schema_arrow.field(name) for name in present])
+        return schema, parquet.iter_batches(batch_size=chunk_size, columns=present)
+    present = [name for name in columns if name in csv_header(path, separator)]
+    reader = pa_csv.open_csv(
+        path,
+        read_options=pa_csv.ReadOptions(block_size=16 * 2**20),
+        parse_options=pa_csv.ParseOptions(delimiter=separator),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in present},
+            include_columns=present,
+            strings_can_be_null=True,
+        ),
+    )
+    return reader.schema, iter(reader)
+
+
+def _chunks(batches: Iterator[pa.RecordBatch], chunk_size: int) -> Iterator[pl.DataFrame]:
+    """Regroup record batches into DataFrames of ``chunk_size`` rows."""
+    pending: list[pa.RecordBatch] = []
+    size = 0
+    for batch in batches:
+        pending.append(batch)
+        size += batch.num_rows
+        while size >= chunk_size:
+            table = pa.Table.from_batches(pending)
+            yield pl.from_arrow(table.slice(0, chunk_size))  # type: ignore[misc]
+            rest = table.slice(chunk_size)
+            pending, size = rest.to_batches(), rest.num_rows
+    if size:
+        yield pl.from_arrow(pa.Table.from_batches(pending))  # type: ignore[misc]
+
+
+def check_data(  # noqa: PLR0913
+    data: str | Path,
+    metadata: TableMetadata | dict[str, Any],
+    *,
+    chunk_size: int = 1_000_000,
+    workers: int | None = None,
+    max_examples: int = 10,
+    buckets: int = 64,
+    separator: str = ",",
+    closed: IntervalClosed = IntervalClosed.LEFT,
+) -> DataReport:
+    """
+    Check that a dataset conforms to its CSVW-EO metadata, reading it in chunks.
+
+    Parameters
+    ----------
+    data : str or Path
+        CSV file, or Parquet file (``.parquet`` suffix).
+    metadata : TableMetadata or dict
+        Table metadata, or CSVW-EO JSON metadata (parsed with columnar
+        partitions).
+    chunk_size : int, default=1_000_000
+        Rows checked at once.
+    workers : int, optional
+        Threads checking chunks. Defaults to the number of CPUs.
+    max_examples : int, default=10
+        Violations kept in the report for each rule of each column (the
+        others are only counted).
+    buckets : int, default=64
+        Files the per-unit counts are spilled to; each one is aggregated in
+        memory at the end.
+    separator : str, default=","
+        Separator of the CSV file.
+    closed : IntervalClosed, default="left"
+        Whether the partition intervals include their upper bound.
+
+    Returns
+    -------
+    DataReport
+        ``report.conforms`` is False if a value, partition or privacy unit
+        violates the metadata.
+
+    """
+    if not isinstance(metadata, TableMetadata):
+        metadata = TableMetadata.from_dict(metadata, columnar=True)
+    data = Path(data)
+    described = [column.name for column in metadata.columns]
+    if metadata.privacy_unit and metadata.privacy_unit not in described:
+        described.append(metadata.privacy_unit)
+    schema, batches = _open_batches(data, described, separator=separator, chunk_size=chunk_size)
+
+    workers = workers or os.cpu_count() or 1
+    with (
+        tempfile.TemporaryDirectory(prefix="csvw-eo-check-") as spill_dir,
+        ThreadPoolExecutor(workers) as pool,
+    ):
+        checker = _Checker(
+            metadata,
+            schema,
+            max_examples=max_examples,
+            buckets=buckets,
+            spill_dir=Path(spill_dir),
+            closed=closed,
+        )
+        missing = [name for name in described if name not in schema.names]
+        checker.report.add(
+            COL_NAME, "Table", len(missing), (f"Column '{name}' is not in the data" for name in missing)
+        )
+
+        # At most two chunks per thread in memory; results are merged in file order
+        pending: deque[Future[_ChunkResult]] = deque()
+        rows = 0
+        for chunk in _chunks(batches, chunk_size):
+            if len(pending) >= 2 * workers:
+                checker.merge(pending.popleft().result())
+            pending.append(pool.submit(checker.check_chunk, chunk, rows))
+            rows += len(chunk)
+        while pending:
+            checker.merge(pending.popleft().result())
+        return checker.finish(rows)
+
+
+def main() -> None:
+    """
+    Command-line interface for the data check.
+
+    Prints a success message, or the report and exits with a non-zero status
+    code if the data violates its metadata.
+    """
+    parser = argparse.ArgumentParser(description="Check that a CSV or Parquet file conforms to its metadata")
+    parser.add_argument("data_file", type=str)
+    parser.add_argument("metadata_file", type=str)
+    parser.add_argument("--chunk_size", type=int, default=1_000_000, help="Rows checked at once")
+    parser.add_argument("--workers", type=int, default=None, help="Threads checking chunks (default: CPUs)")
+    parser.add_argument("--max_examples", type=int, default=10, help="Violations printed per rule")
+    parser.add_argument("--buckets", type=int, default=64, help="Spill files of the per-unit counts")
+    args = parser.parse_args()
+
+    for path in (Path(args.data_file), Path(args.metadata_file)):
+        if not path.exists():
+            print(f"File not found: {path}")  # noqa: T201
+            sys.exit(1)
+
+    report = check_data(
+        args.data_file,
+        read_metadata(Path(args.metadata_file)),
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        max_examples=args.max_examples,
+        buckets=args.buckets,
+    )
+    if report.conforms:
+        print(f"Data check SUCCESSFUL ({report.rows} rows)")  # noqa: T201
+    else:
+        print("Data check FAILED")  # noqa: T201
+        print(report.text)  # noqa: T201
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -21,7 +21,8 @@ TABLE_TYPE = "Table"
 # ============================================================
 # CSVW_SAFE Namespaces
 # ============================================================
-CSVW_SAFE_CONTEXT = str((Path(__file__).resolve().parents[2] / "csvw-eo-context.jsonld").resolve())  # tmp
+# Bundled with the package (see jsonld_context), until the context is published
+CSVW_SAFE_CONTEXT = str(Path(__file__).resolve().parent / "contexts" / "csvw-eo-context.jsonld")
 
 # Column groups / partitions
 COLUMN_GROUP = "ColumnGroup"
@@ -38,6 +39,10 @@ PRIVACY_UNIT = "privacyUnit"
 PRIVACY_ID = "privacyId"
 ADD_INFO = "additionalInformation"
 
+# Partitions and keys stored in a binary sidecar file (Arrow IPC or Parquet)
+SIDECAR_TYPE = "PartitionTable"
+SIDECAR_URL = "url"
+
 # Differential privacy bounds
 MAX_LENGTH = "maxLength"
 MAX_GROUPS = "maxGroupsPerUnit"
@@ -70,6 +75,14 @@ class DependencyType(StrEnum):
     FIXED = "fixedPerEntity"
 
 
+class DatetimeResolution(StrEnum):
+    """Resolution of generated dummy datetime values."""
+
+    DAY = "day"
+    SECOND = "second"
+    MICROSECOND = "microsecond"
+
+
 # ============================================================
 # Default Values
 # ============================================================
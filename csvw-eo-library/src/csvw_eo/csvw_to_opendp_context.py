@@ -5,6 +5,8 @@ This module:
 - Converts CSVW-EO metadata into OpenDP margins
 - Builds an OpenDP Context using a provided dataset
 - Supports epsilon-based (Laplace) and rho-based (Gaussian) DP
+- Returns the public key frames of the metadata for grouped queries, from
+  ``get_public_keys`` (or ``OpenDPContextFactory.public_keys``)
 - Exposes both a Python API and CLI
 
 The resulting context can be used for differentially private queries.
@@ -19,10 +21,20 @@ from opendp.extras.polars import Bound
 from opendp.mod import Measure, Metric, enable_features
 
 from csvw_eo.constants import MAX_CONTRIB  # , PRIVACY_UNIT
+from csvw_eo.csvw_to_opendp_keys import csvw_to_opendp_keys
 from csvw_eo.csvw_to_opendp_margins import csvw_to_opendp_margins
+from csvw_eo.polars_schema import cast_to_schema, to_polars_schema
 
 enable_features("contrib")
 
+# Polars dtypes that OpenDP does not support, and the narrowest supported dtype holding their values
+OPENDP_WIDER_DTYPES: dict[pl.DataType, pl.DataType] = {
+    pl.Int8(): pl.Int32(),
+    pl.Int16(): pl.Int32(),
+    pl.UInt8(): pl.UInt32(),
+    pl.UInt16(): pl.UInt32(),
+}
+
 
 def get_privacy_loss(
     epsilon: float | None = None,
@@ -111,6 +123,83 @@ def get_privacy_unit(
     return dp.unit_of(**kwargs)
 
 
+def get_opendp_schema(csvw_meta: dict[str, Any]) -> pl.Schema:
+    """
+    Return the Polars schema of the metadata columns, with dtypes supported by OpenDP.
+
+    Parameters
+    ----------
+    csvw_meta : Dict[str, Any]
+        CSVW-EO metadata dictionary.
+
+    Returns
+    -------
+    pl.Schema
+        ``to_polars_schema(csvw_meta)``, with the dtypes of
+        ``OPENDP_WIDER_DTYPES`` widened.
+
+    """
+    schema = to_polars_schema(csvw_meta)
+    return pl.Schema({name: OPENDP_WIDER_DTYPES.get(dtype, dtype) for name, dtype in schema.items()})
+
+
+def get_public_keys(
+    csvw_meta: dict[str, Any], data: pl.LazyFrame, *, cast_data: bool = False
+) -> dict[tuple[str, ...], pl.DataFrame]:
+    """
+    Return the public key frames of the metadata, typed as the dataset.
+
+    Parameters
+    ----------
+    csvw_meta : Dict[str, Any]
+        CSVW-EO metadata dictionary.
+    data : pl.LazyFrame
+        Dataset the keys are joined with.
+    cast_data: bool, default=False
+        If True, the keys are typed as the dataset cast to the schema of the
+        metadata, as by ``csvw_to_opendp_context(..., cast_data=True)``.
+
+    Returns
+    -------
+    Dict[tuple[str, ...], pl.DataFrame]
+        Key frame of each column and column group with public keys whose
+        columns are all in the dataset (see ``csvw_to_opendp_keys``), cast to
+        the dtypes of the dataset so that they can be joined with it.
+
+    """
+    schema = data.collect_schema()
+    if cast_data:
+        opendp_schema = get_opendp_schema(csvw_meta)
+        schema = pl.Schema({name: opendp_schema.get(name, dtype) for name, dtype in schema.items()})
+    return cast_public_keys(csvw_to_opendp_keys(csvw_meta), schema)
+
+
+def cast_public_keys(
+    key_frames: dict[tuple[str, ...], pl.DataFrame], schema: pl.Schema
+) -> dict[tuple[str, ...], pl.DataFrame]:
+    """
+    Cast public key frames to the dtypes of a dataset schema.
+
+    Parameters
+    ----------
+    key_frames : Dict[tuple[str, ...], pl.DataFrame]
+        Key frames, as returned by ``csvw_to_opendp_keys``.
+    schema : pl.Schema
+        Schema of the dataset.
+
+    Returns
+    -------
+    Dict[tuple[str, ...], pl.DataFrame]
+        The key frames whose columns are all in the schema, cast to its dtypes.
+
+    """
+    public_keys = {}
+    for by, keys in key_frames.items():
+        if all(name in schema for name in by):
+            public_keys[by] = keys.cast({name: schema[name] for name in by})
+    return public_keys
+
+
 def csvw_to_opendp_context(  # noqa: PLR0913
     csvw_meta: dict[str, Any],
     data: pl.LazyFrame,
@@ -120,6 +209,8 @@ def csvw_to_opendp_context(  # noqa: PLR0913
     split_evenly_over: int | None = None,
     split_by_weights: list[float] | None = None,
     distance: str = "contributions",
+    *,
+    cast_data: bool = False,
 ) -> dp.Context:
     """
     Create an OpenDP Context from CSVW-EO metadata and a dataset.
@@ -143,11 +234,18 @@ def csvw_to_opendp_context(  # noqa: PLR0913
         List of privacy budget weight by query.
     distance: str, default='contributions'
         Distance metric for privacy unit.
+    cast_data: bool, default=False
+        If True, the dataset is cast once to the schema of the metadata
+        (see ``get_opendp_schema``) before the context is built, so that
+        queries run on compact, correctly typed columns. String columns are
+        parsed; values that cannot be converted raise an error on collection.
 
     Returns
     -------
     Context
-        OpenDP Context object ready for queries.
+        OpenDP Context object ready for queries. The public key frames of
+        the metadata, for grouped queries, are returned by
+        ``get_public_keys`` with the same arguments.
 
     Raises
     ------
@@ -159,6 +257,9 @@ def csvw_to_opendp_context(  # noqa: PLR0913
     if split_evenly_over is not None and split_by_weights is not None:
         raise ValueError("Specify only one of split_evenly_over or split_by_weights")
 
+    if cast_data:
+        data = cast_to_schema(data, get_opendp_schema(csvw_meta))
+
     kwargs: dict[str, Any] = {
         "data": data,
         "privacy_unit": get_privacy_unit(csvw_meta, distance),
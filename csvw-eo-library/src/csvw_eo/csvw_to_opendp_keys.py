@@ -0,0 +1,138 @@
+"""
+Build the public key sets of CSVW-EO metadata as Polars frames, for OpenDP.
+
+The margins of :mod:`csvw_eo.csvw_to_opendp_margins` only tell OpenDP that
+the keys of a column are public (``invariant="keys"``). Grouped queries that
+release every known key, including the empty ones, must join a key set:
+
+    context.query().group_by("species").agg(dp.len()).with_keys(keys)
+
+:func:`csvw_to_opendp_keys` builds those key sets from the ``keyValues`` (or
+categorical ``partitions``) of each column and column group: one
+``pl.DataFrame`` per column or group, typed with the Polars schema of the
+metadata (Enums for string columns with exhaustive keys). The frames are
+built from the columnar partition tables, without a loop over the keys, and
+cached per metadata fingerprint, or per the ``key`` given by the caller (such
+as the file path and modification time of the metadata), which spares the
+serialization of the whole document on each call.
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+import polars as pl
+
+from csvw_eo.constants import ADD_INFO, COL_LIST, KEY_VALUES, PUBLIC_PARTITIONS, TABLE_SCHEMA
+from csvw_eo.metadata_structure import ColumnGroupMetadata, ColumnMetadata, TableMetadata
+from csvw_eo.partition_table import PartitionTable
+from csvw_eo.polars_schema import cast_expr, to_polars_schema
+from csvw_eo.utils import metadata_fingerprint
+
+# Number of metadata whose key frames are kept in memory
+KEYS_CACHE_SIZE = 16
+
+_keys_cache: "OrderedDict[Hashable, dict[tuple[str, ...], pl.DataFrame]]" = OrderedDict()
+
+
+def get_key_values(entry: ColumnMetadata | ColumnGroupMetadata) -> dict[str, Any] | None:
+    """
+    Return the public key values of a column or column group, column by column.
+
+    Parameters
+    ----------
+    entry : ColumnMetadata or ColumnGroupMetadata
+        Column or column group metadata.
+
+    Returns
+    -------
+    dict or None
+        Array of key values of each column, aligned; None if the entry has
+        neither ``keyValues`` nor categorical ``partitions``.
+
+    """
+    items = entry.public_keys_values or entry.partitions
+    if not items:
+        return None
+    table = items if isinstance(items, PartitionTable) else PartitionTable.from_models(items)
+    columns = entry.columns if isinstance(entry, ColumnGroupMetadata) else [entry.name]
+    if any(predicate.values is None for predicate in table.predicates):
+        return None  # continuous partitions have no enumerable keys
+    return {column: predicate.values for column, predicate in zip(columns, table.predicates)}
+
+
+def build_key_frames(metadata: TableMetadata | dict[str, Any]) -> dict[tuple[str, ...], pl.DataFrame]:
+    """
+    Build the public key frame of each column and column group.
+
+    Parameters
+    ----------
+    metadata : TableMetadata or dict
+        Table metadata, or CSVW-EO JSON metadata.
+
+    Returns
+    -------
+    dict of tuple of str to polars.DataFrame
+        Key frame of each column (``("col",)``) and column group
+        (``("col_1", "col_2")``) with public keys, typed as
+        ``to_polars_schema(metadata)``.
+
+    """
+    if not isinstance(metadata, TableMetadata):
+        metadata = TableMetadata.from_dict(metadata, columnar=True, lazy=True)
+    schema = to_polars_schema(metadata)
+
+    frames = {}
+    entries: list[ColumnMetadata | ColumnGroupMetadata] = [*metadata.columns, *(metadata.column_groups or [])]
+    for entry in entries:
+        values = get_key_values(entry)
+        if values is None:
+            continue
+        frame = pl.DataFrame({column: pl.Series(column, array) for column, array in values.items()})
+        frame = frame.with_columns(
+            cast_expr(column, frame.schema[column], schema[column])
+            for column in frame.columns
+            if frame.schema[column] != schema[column]
+        )
+        frames[tuple(frame.columns)] = frame
+    return frames
+
+
+def csvw_to_opendp_keys(
+    csvw_meta: dict[str, Any], key: Hashable | None = None
+) -> dict[tuple[str, ...], pl.DataFrame]:
+    """
+    Return the public key frames of CSVW-EO metadata, cached per fingerprint.
+
+    Parameters
+    ----------
+    csvw_meta : Dict[str, Any]
+        CSVW-EO metadata dictionary.
+    key : Hashable, optional
+        Key of the metadata in the cache, for instance its file path and
+        modification time, which must change with the document. By default,
+        the fingerprint of the document, computed on each call.
+
+    Returns
+    -------
+    dict of tuple of str to polars.DataFrame
+        Key frame of each column and column group with public keys (see
+        :func:`build_key_frames`), keyed by the ``by`` columns of their
+        margin. The frames are shared between calls: do not modify them.
+
+    """
+    entries = [*csvw_meta[TABLE_SCHEMA][COL_LIST], *csvw_meta.get(ADD_INFO, [])]
+    if not any(KEY_VALUES in entry or PUBLIC_PARTITIONS in entry for entry in entries):
+        return {}
+
+    if key is None:
+        key = metadata_fingerprint(csvw_meta)
+    if key in _keys_cache:
+        _keys_cache.move_to_end(key)
+        return _keys_cache[key]
+
+    frames = build_key_frames(csvw_meta)
+    _keys_cache[key] = frames
+    if len(_keys_cache) > KEYS_CACHE_SIZE:
+        _keys_cache.popitem(last=False)
+    return frames
@@ -2,10 +2,20 @@
 Convert CSVW-EO JSON metadata to SmartNoise SQL metadata format.
 
 See smarntoise-sql documentation: https://docs.smartnoise.org/sql/metadata.html
+
+A catalogue of many tables is converted in one process launch with
+:func:`csvw_to_smartnoise_sql_batch`: the documents (a directory, or a
+manifest naming the schema and table of each) are converted in a process
+pool and merged into a single SmartNoise metadata dict, written by
+:func:`write_smartnoise_yaml` with the libyaml emitter when available.
 """
 
 import argparse
-import json
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 import yaml
@@ -24,6 +34,10 @@ from csvw_eo.constants import (
     TABLE_SCHEMA,
 )
 from csvw_eo.datatypes import XSD_GROUP_MAP, DataTypesGroups, to_snsql_datatype
+from csvw_eo.metadata_stream import metadata_files, read_metadata_headers
+
+# libyaml emitter, several times faster than the pure Python one
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 
 def csvw_to_snsql_column(col_meta: dict[str, Any]) -> dict[str, Any]:
@@ -178,6 +192,191 @@ def csvw_to_smartnoise_sql(  # noqa: PLR0913
     return {"": {schema_name: {table_name: table_meta}}}
 
 
+@dataclass(frozen=True)
+class SmartNoiseTable:
+    """
+    CSVW-EO document of a table of a SmartNoise SQL catalogue.
+
+    Parameters
+    ----------
+    path : Path
+        CSVW-EO JSON metadata file.
+    schema : str, default=""
+        SmartNoise schema of the table.
+    table : str, optional
+        SmartNoise table name. The name of the file without its extension
+        by default.
+
+    """
+
+    path: Path
+    schema: str = ""
+    table: str = ""
+
+    def __post_init__(self) -> None:
+        """Default the table name to the file name."""
+        object.__setattr__(self, "path", Path(self.path))
+        if not self.table:
+            object.__setattr__(self, "table", self.path.name.split(".")[0])
+
+
+def directory_tables(directory: str | Path, schema: str = "") -> list[SmartNoiseTable]:
+    """
+    Return the tables of the metadata documents of a directory, named after their files.
+
+    Parameters
+    ----------
+    directory : str or Path
+        Directory of CSVW-EO JSON metadata files.
+    schema : str, default=""
+        SmartNoise schema of the tables.
+
+    Returns
+    -------
+    list of SmartNoiseTable
+
+    """
+    return [SmartNoiseTable(path, schema) for path in metadata_files(directory)]
+
+
+def read_manifest(path: str | Path) -> list[SmartNoiseTable]:
+    """
+    Read a manifest of the tables of a SmartNoise SQL catalogue.
+
+    The manifest is a YAML (or JSON) list of entries with an ``input``
+    metadata file, and optionally a ``schema`` and a ``table`` name. Relative
+    paths are relative to the manifest.
+
+    .. code-block:: yaml
+
+        - input: penguins.json
+          schema: Zoo
+          table: Penguins
+        - input: otters.json
+          schema: Zoo
+
+    Parameters
+    ----------
+    path : str or Path
+        Manifest file.
+
+    Returns
+    -------
+    list of SmartNoiseTable
+
+    Raises
+    ------
+    ValueError
+        If the manifest is not a list of entries with an ``input``.
+
+    """
+    path = Path(path)
+    with open(path, encoding="utf-8") as f:
+        entries = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))  # noqa: S506
+    if not isinstance(entries, list) or not all(isinstance(e, dict) and "input" in e for e in entries):
+        raise ValueError(f"Manifest {path} must be a list of entries with an 'input' file")
+    return [
+        SmartNoiseTable(path.parent / entry["input"], entry.get("schema", ""), entry.get("table", ""))
+        for entry in entries
+    ]
+
+
+def _convert_table(task: tuple[SmartNoiseTable, dict[str, Any]]) -> tuple[dict[str, Any] | None, str | None]:
+    """Convert one table, returning its SmartNoise metadata or the error."""
+    table, options = task
+    try:
+        csvw_meta = read_metadata_headers(table.path)
+        snsql_meta = csvw_to_smartnoise_sql(csvw_meta, table.schema, table.table, **options)
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+    return snsql_meta[""][table.schema][table.table], None
+
+
+def csvw_to_smartnoise_sql_batch(  # noqa: PLR0913
+    tables: Iterable[SmartNoiseTable],
+    *,
+    workers: int | None = None,
+    sample_max_ids: bool | None = None,
+    censor_dims: bool | None = None,
+    clamp_counts: bool | None = None,
+    clamp_columns: bool | None = None,
+    use_dpsu: bool | None = None,
+) -> dict[str, Any]:
+    """
+    Convert the CSVW-EO documents of many tables into one SmartNoise SQL metadata dict.
+
+    Parameters
+    ----------
+    tables : iterable of SmartNoiseTable
+        Tables to convert, from :func:`directory_tables` or :func:`read_manifest`.
+    workers : int, optional
+        Number of worker processes. Defaults to the number of CPUs; with 1,
+        the tables are converted in this process.
+    sample_max_ids, censor_dims, clamp_counts, clamp_columns, use_dpsu : bool, optional
+        Table options applied to every table, see :func:`csvw_to_smartnoise_sql`.
+
+    Returns
+    -------
+    Dict[str, Any]
+        SmartNoise SQL metadata ``{"": {schema: {table: ...}}}`` of all the
+        tables, in the order of ``tables``.
+
+    Raises
+    ------
+    ValueError
+        If two tables have the same schema and name, or if some documents
+        cannot be converted (all the failures are reported).
+
+    """
+    tables = list(tables)
+    seen: set[tuple[str, str]] = set()
+    for table in tables:
+        if (table.schema, table.table) in seen:
+            raise ValueError(f"Duplicate SmartNoise table {table.schema}.{table.table} ({table.path})")
+        seen.add((table.schema, table.table))
+
+    options = {
+        "sample_max_ids": sample_max_ids,
+        "censor_dims": censor_dims,
+        "clamp_counts": clamp_counts,
+        "clamp_columns": clamp_columns,
+        "use_dpsu": use_dpsu,
+    }
+    tasks = [(table, options) for table in tables]
+    workers = min(workers or os.cpu_count() or 1, max(len(tasks), 1))
+    if workers == 1:
+        results = [_convert_table(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(tasks) // (4 * workers))
+            results = list(executor.map(_convert_table, tasks, chunksize=chunksize))
+
+    failures = [f"{table.path}: {error}" for table, (_, error) in zip(tables, results) if error]
+    if failures:
+        raise ValueError(f"{len(failures)} tables could not be converted:\n" + "\n".join(failures))
+
+    catalogue: dict[str, dict[str, Any]] = {}
+    for table, (table_meta, _) in zip(tables, results):
+        catalogue.setdefault(table.schema, {})[table.table] = table_meta
+    return {"": catalogue}
+
+
+def write_smartnoise_yaml(snsql_meta: dict[str, Any], path: str | Path) -> None:
+    """
+    Write SmartNoise SQL metadata to a YAML file, with the fastest available emitter.
+
+    Parameters
+    ----------
+    snsql_meta : Dict[str, Any]
+        SmartNoise SQL metadata.
+    path : str or Path
+        Output YAML file.
+
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.dump(snsql_meta, f, Dumper=YAML_DUMPER)
+
+
 def main() -> None:
     """
     CLI for converting CSVW-EO JSON metadata to SmartNoise SQL YAML metadata.
@@ -188,16 +387,24 @@ def main() -> None:
     be present in the CSVW metadata (as 'max_contributions').
     Defaults and meaning are taken directly from https://docs.smartnoise.org/sql/metadata.html.
 
+    With a directory as ``--input``, or a ``--manifest``, all the tables are converted
+    in a process pool and written to a single YAML file.
+
     Command-line arguments
     ----------------------
-    --input : str (required)
-        Path to input CSVW-EO JSON metadata file.
+    --input : str
+        Path to input CSVW-EO JSON metadata file, or to a directory of metadata
+        files (one table per file, named after the file, in the ``--schema`` schema).
+    --manifest : str
+        Path to a manifest of tables (see ``read_manifest``), instead of ``--input``.
     --output : str (required)
         Path to output SmartNoise YAML metadata file.
     --schema : str (default="MySchema")
         SmartNoise schema name.
     --table : str (default="MyTable")
-        SmartNoise table name.
+        SmartNoise table name (single file only).
+    --workers : int (default: number of CPUs)
+        Number of worker processes for a directory or a manifest.
     --sample_max_ids : bool (default=True)
         Skip reservoir sampling if users appear at most max_ids times.
     --censor_dims : bool (default=True)
@@ -212,10 +419,13 @@ def main() -> None:
     parser = argparse.ArgumentParser(
         description="Convert CSVW-EO JSON metadata to SmartNoise SQL YAML metadata."
     )
-    parser.add_argument("--input", required=True, help="Input CSVW-EO JSON metadata file")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", help="Input CSVW-EO JSON metadata file, or directory of files")
+    source.add_argument("--manifest", help="Manifest of the tables to convert")
     parser.add_argument("--output", required=True, help="Output SmartNoise YAML metadata file")
     parser.add_argument("--schema", default="MySchema", help="SmartNoise SQL schema name")
     parser.add_argument("--table", default="MyTable", help="SmartNoise SQL table name")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for many tables")
     parser.add_argument(
         "--sample_max_ids",
         type=bool,
@@ -233,26 +443,34 @@ def main() -> None:
     parser.add_argument("--use_dpsu", type=bool, default=None, help="Use Differential Private Set Union")
 
     args = parser.parse_args()
+    options = {
+        "sample_max_ids": args.sample_max_ids,
+        "censor_dims": args.censor_dims,
+        "clamp_counts": args.clamp_counts,
+        "clamp_columns": args.clamp_columns,
+        "use_dpsu": args.use_dpsu,
+    }
+
+    if args.manifest or Path(args.input).is_dir():
+        tables = read_manifest(args.manifest) if args.manifest else directory_tables(args.input, args.schema)
+        snsql_meta = csvw_to_smartnoise_sql_batch(tables, workers=args.workers, **options)
+        write_smartnoise_yaml(snsql_meta, args.output)
+        print(f"SmartNoise SQL metadata of {len(tables)} tables written to {args.output}")  # noqa: T201
+        return
 
-    # Load CSVW metadata
-    with open(args.input, encoding="utf-8") as f:
-        csvw_meta = json.load(f)
+    # Load CSVW metadata, streamed without partitions (not used by SmartNoise SQL)
+    csvw_meta = read_metadata_headers(args.input)
 
     # Call conversion function
     snsql_meta = csvw_to_smartnoise_sql(
         csvw_meta=csvw_meta,
         schema_name=args.schema,
         table_name=args.table,
-        sample_max_ids=args.sample_max_ids,
-        censor_dims=args.censor_dims,
-        clamp_counts=args.clamp_counts,
-        clamp_columns=args.clamp_columns,
-        use_dpsu=args.use_dpsu,
+        **options,
     )
 
     # Write YAML
-    with open(args.output, "w", encoding="utf-8") as f:
-        yaml.safe_dump(snsql_meta, f)
+    write_smartnoise_yaml(snsql_meta, args.output)
 
     print(f"SmartNoise SQL metadata written to {args.output}")  # noqa: T201
 
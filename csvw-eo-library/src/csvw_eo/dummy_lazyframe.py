@@ -0,0 +1,140 @@
+"""
+Lazy Polars dummy dataset from CSVW-EO metadata.
+
+This module exposes dummy data generated from CSVW-EO metadata as a
+``polars.LazyFrame`` backed by a Polars IO source. Batches are generated on
+demand by :meth:`GenerationPlan.iter_chunks`, so pipelines (for instance an
+OpenDP context built with ``csvw_to_opendp_context``) can be built and
+queried on dummies of any size without holding the full dataset in memory.
+Only the value of each entity of fixedPerEntity columns is kept from one
+batch to the next, so that the dummy respects these dependencies as a whole.
+
+Projection, predicate and row-limit pushdowns are applied batch per batch.
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+import pandas as pd
+import polars as pl
+from polars.io.plugins import register_io_source
+
+from csvw_eo.constants import DatetimeResolution
+from csvw_eo.make_dummy_from_metadata import GenerationPlan, compile_generation_plan
+
+
+def plan_schema(plan: GenerationPlan) -> pl.Schema:
+    """
+    Return the Polars schema of the dummy data generated by a plan.
+
+    Parameters
+    ----------
+    plan : GenerationPlan
+        Compiled generation plan.
+
+    Returns
+    -------
+    polars.Schema
+        Column names (in metadata order) and Polars dtypes.
+
+    """
+    dtypes = {step.name: step.sampler.pandas_dtype for step in plan.steps}
+    empty = pd.DataFrame({col: pd.Series([], dtype=dtypes[col]) for col in plan.column_order})
+    return pl.from_pandas(empty).schema
+
+
+def plan_lazyframe(
+    plan: GenerationPlan,
+    nb_rows: int,
+    seed: int = 0,
+    chunk_size: int = 100_000,
+) -> pl.LazyFrame:
+    """
+    Expose the dummy data generated by a plan as a lazy Polars source.
+
+    Parameters
+    ----------
+    plan : GenerationPlan
+        Compiled generation plan.
+    nb_rows : int
+        Total number of rows of the dummy dataset.
+    seed : int, default=0
+        Random seed. Every collection of the frame yields the same rows.
+    chunk_size : int, default=100_000
+        Number of rows generated per batch.
+
+    Returns
+    -------
+    polars.LazyFrame
+        Lazy frame generating its batches on demand.
+
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    schema = plan_schema(plan)
+
+    def source(
+        with_columns: list[str] | None,
+        predicate: pl.Expr | None,
+        n_rows: int | None,
+        batch_size: int | None,  # noqa: ARG001
+    ) -> Iterator[pl.DataFrame]:
+        remaining = n_rows
+        for chunk in plan.iter_chunks(nb_rows, chunk_size=chunk_size, seed=seed):
+            if remaining is not None and remaining <= 0:
+                break
+
+            df = pl.from_pandas(chunk).select(pl.col(col).cast(dtype) for col, dtype in schema.items())
+            if with_columns is not None:
+                df = df.select(with_columns)
+            if predicate is not None:
+                df = df.filter(predicate)
+            if remaining is not None:
+                df = df.head(remaining)
+                remaining -= len(df)
+
+            yield df
+
+    return register_io_source(source, schema=schema)
+
+
+def dummy_lazyframe(  # noqa: PLR0913
+    metadata: dict[str, Any],
+    nb_rows: int = 100,
+    seed: int = 0,
+    *,
+    chunk_size: int = 100_000,
+    datetime_resolution: DatetimeResolution = DatetimeResolution.DAY,
+    categorical: bool = False,
+) -> pl.LazyFrame:
+    """
+    Create a lazy Polars dummy dataset from CSVW-EO metadata.
+
+    The rows are the ones of :meth:`GenerationPlan.iter_chunks` with the same
+    seed and chunk size: collecting the frame is equivalent to concatenating
+    the chunks, but only one chunk is materialized at a time.
+
+    Parameters
+    ----------
+    metadata : dict
+        CSVW-EO metadata structure.
+    nb_rows : int, default=100
+        Total number of rows of the dummy dataset.
+    seed : int, default=0
+        Random seed.
+    chunk_size : int, default=100_000
+        Number of rows generated per batch.
+    datetime_resolution : DatetimeResolution, default="day"
+        Resolution of generated datetime values.
+    categorical : bool, default=False
+        If True, string columns are Polars Categoricals.
+
+    Returns
+    -------
+    polars.LazyFrame
+        Lazy dummy dataset.
+
+    """
+    plan = compile_generation_plan(metadata, datetime_resolution=datetime_resolution, categorical=categorical)
+    return plan_lazyframe(plan, nb_rows, seed=seed, chunk_size=chunk_size)
@@ -0,0 +1,318 @@
+"""
+Enforcement of the bounds of CSVW-EO metadata on a dataset.
+
+Before a differentially private release, the data must respect the bounds
+its metadata declares. :func:`enforce_bounds` returns the lazy Polars query
+that:
+
+1. clamps the values of numeric and temporal columns (except the privacy unit)
+   to their ``minimum`` and ``maximum``;
+2. drops the rows outside the exhaustive ``keyValues`` or ``partitions`` of
+   a column or a column group (rows with a missing value in its columns are
+   kept);
+3. samples the rows of each privacy unit down to its contribution bounds.
+   For each column and column group with partitions (or keys), the
+   partitions a unit contributes to are sampled down to its
+   ``maxContributions`` and to the ``maxContributions`` of each kept
+   partition, then the rows of the unit in each partition down to
+   ``maxGroupsPerUnit``. Finally, the rows of each unit are sampled down to
+   the table ``maxContributions``.
+
+The samples are uniform, as a reservoir sample of each unit would be: each
+row, and each partition of each unit, gets a pseudo-random key hashed from
+its position and the seed, and the smallest keys of each group are kept.
+Rows are assigned to partitions with a
+:class:`csvw_eo.partition_index.PartitionIndex`, and the samples are window
+functions, run by Polars on all its threads. A LazyFrame input
+(``pl.scan_csv``, ``pl.scan_parquet``, :func:`scan_data`) is only read when
+the result is collected or sunk to a file.
+
+The query is not streaming in memory: the windows over the privacy unit
+rank all the rows of a unit together, so Polars holds the whole clamped and
+filtered dataset in memory, even when :func:`sink_data` sinks it with the
+streaming engine. Only the reading and the writing stream. As every bound is
+enforced per privacy unit, a dataset larger than memory can be split on a
+hash of its privacy unit column and each part bounded on its own.
+
+The result satisfies the bounds checked by
+:func:`csvw_eo.check_data.check_data` on values, keys and contributions;
+``maxLength``, ``publicLength`` and ``nullableProportion`` are not enforced.
+"""
+
+import argparse
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from csvw_eo.metadata_bounds import PARQUET_SUFFIX, entry_partitions, parse_bound, parse_expr
+from csvw_eo.metadata_structure import ColumnGroupMetadata, ColumnMetadata, TableMetadata
+from csvw_eo.partition_index import IntervalClosed, PartitionIndex
+from csvw_eo.polars_schema import to_polars_dtype
+from csvw_eo.sidecar import read_metadata
+
+# Helper columns of the query, dropped from its result
+ROW_KEY = "__csvw_eo_row_key"
+ROW_RANK = "__csvw_eo_row_rank"
+PARTITION_KEY = "__csvw_eo_partition_key"
+PARTITION_LIMIT = "__csvw_eo_partition_limit"
+PARTITION_PREFIX = "__csvw_eo_partition_"
+
+# Bound of the partitions without a bound of their own
+UNBOUNDED = np.iinfo(np.int64).max
+
+
+@dataclass
+class _EntryBounds:
+    """Partitions and contribution bounds of a column or a column group."""
+
+    columns: list[str]
+    exhaustive: list[PartitionIndex]  # exhaustive keys and partitions
+    index: PartitionIndex | None  # partitions (or keys) the contribution bounds apply to
+    max_groups_per_unit: np.ndarray | None  # per partition
+    max_contributions: np.ndarray | None  # per partition
+
+
+def _limits(entry_limit: int | None, partition_limits: np.ndarray | None, size: int) -> np.ndarray | None:
+    """Bound of each partition: the smallest of its own and of its column (or column group)."""
+    if entry_limit is None and partition_limits is None:
+        return None
+    limits = np.full(size, UNBOUNDED if entry_limit is None else entry_limit, dtype=np.int64)
+    return limits if partition_limits is None else np.minimum(limits, partition_limits)
+
+
+def _entry_bounds(entry: ColumnMetadata | ColumnGroupMetadata, closed: IntervalClosed) -> _EntryBounds:
+    indexed = entry_partitions(entry, closed)
+    bounds = indexed.bounds
+    size = len(indexed.index) if indexed.index is not None else 0
+    return _EntryBounds(
+        columns=indexed.columns,
+        exhaustive=[index for _, index in indexed.exhaustive],
+        index=indexed.index,
+        max_groups_per_unit=_limits(entry.max_groups_per_unit, bounds[1] if bounds else None, size),
+        max_contributions=_limits(entry.max_contributions, bounds[2] if bounds else None, size),
+    )
+
+
+def _assign_expr(index: PartitionIndex, columns: list[str]) -> pl.Expr:
+    """Return the expression of the partition of each row (-1 outside every partition)."""
+
+    def assign(rows: pl.Series) -> pl.Series:
+        return pl.Series(index.assign(rows.struct.unnest().to_pandas()), dtype=pl.Int64)
+
+    return pl.struct(columns).map_batches(assign, return_dtype=pl.Int64, is_elementwise=True)
+
+
+def _partition_lookup(name: str, limits: np.ndarray) -> pl.Expr:
+    """Return the expression of the bound of the partition of each row."""
+    return pl.col(name).replace_strict(
+        pl.Series(np.arange(len(limits))), pl.Series(limits), default=None, return_dtype=pl.Int64
+    )
+
+
+def _bound_entry(lf: pl.LazyFrame, entry: _EntryBounds, unit: str, name: str, seed: int) -> pl.LazyFrame:
+    """
+    Sample the partitions of each unit, then its rows in each partition, down to their bounds.
+
+    The partitions of each unit are ranked by their key, and the first ``k``
+    are kept, for the largest ``k`` not above the bounds of the first ``k``
+    partitions. A partition of rank ``r`` and bound ``L`` rules out every
+    ``k >= max(r, L + 1)``, so ``k`` is the smallest ``max(r, L + 1)`` of the
+    unit, minus one: two window functions, without joining the partitions of
+    the units back to the rows. A partition is kept or dropped whole, so the
+    rank of the rows in their partition is computed in the same pass.
+    """
+    partition = pl.col(name)
+    inside = partition >= 0
+    ranks, kept = [], []
+    if entry.max_contributions is not None:
+        rank = pl.when(inside).then(pl.struct(unit, name).hash(seed)).rank("dense").over(unit)
+        ranks.append(rank.alias(PARTITION_KEY))
+        kept.append(pl.col(PARTITION_KEY) < pl.col(PARTITION_LIMIT))
+    if entry.max_groups_per_unit is not None:
+        ranks.append(pl.col(ROW_KEY).rank("ordinal").over(unit, name).alias(ROW_RANK))
+        kept.append(pl.col(ROW_RANK) <= _partition_lookup(name, entry.max_groups_per_unit))
+    if not ranks:
+        return lf
+    lf = lf.with_columns(ranks)
+    if entry.max_contributions is not None:
+        limit = pl.max_horizontal(pl.col(PARTITION_KEY), _partition_lookup(name, entry.max_contributions) + 1)
+        lf = lf.with_columns(pl.when(inside).then(limit).min().over(unit).alias(PARTITION_LIMIT))
+    return lf.filter(~inside | pl.all_horizontal(kept)).drop(
+        PARTITION_KEY, PARTITION_LIMIT, ROW_RANK, strict=False
+    )
+
+
+def _clamps(metadata: TableMetadata, schema: pl.Schema) -> list[pl.Expr]:
+    """
+    Return the clamps of the columns to their bounds.
+
+    The bounds of strings and booleans are ignored, and so are those of the
+    privacy unit: clamping identifiers would merge units.
+    """
+    clamps = []
+    for column in metadata.columns:
+        dtype = schema.get(column.name)
+        if (
+            column.name == metadata.privacy_unit
+            or dtype is None
+            or not (dtype.is_numeric() or dtype.is_temporal())
+        ):
+            continue
+        lower, upper = parse_bound(column.minimum, dtype), parse_bound(column.maximum, dtype)
+        if lower is not None or upper is not None:
+            clamps.append(pl.col(column.name).clip(lower, upper))
+    return clamps
+
+
+def enforce_bounds(
+    data: pl.LazyFrame | pl.DataFrame | pd.DataFrame,
+    metadata: TableMetadata | dict[str, Any],
+    seed: int = 0,
+    *,
+    closed: IntervalClosed = IntervalClosed.LEFT,
+) -> pl.LazyFrame:
+    """
+    Clamp, filter and sample a dataset to the bounds of its CSVW-EO metadata.
+
+    Parameters
+    ----------
+    data : polars.LazyFrame, polars.DataFrame or pandas.DataFrame
+        Dataset, with the columns typed as their datatype (see
+        :func:`scan_data`). Columns of the metadata missing from the data
+        are ignored.
+    metadata : TableMetadata or dict
+        Table metadata, or CSVW-EO JSON metadata (parsed with columnar
+        partitions).
+    seed : int, default=0
+        Seed of the samples. The same data, in the same order, with the same
+        seed gives the same result.
+    closed : IntervalClosed, default="left"
+        Whether the partition intervals include their upper bound.
+
+    Returns
+    -------
+    polars.LazyFrame
+        The bounded rows, in their input order, with the columns of the data.
+        Collect it, or sink it to a file (``sink_parquet``).
+
+    Raises
+    ------
+    ValueError
+        If the metadata declares a privacy unit that is not a column of the data.
+
+    """
+    if not isinstance(metadata, TableMetadata):
+        metadata = TableMetadata.from_dict(metadata, columnar=True)
+    if isinstance(data, pd.DataFrame):
+        data = pl.from_pandas(data)
+    lf = data.lazy()
+    schema = lf.collect_schema()
+    unit = metadata.privacy_unit
+    if unit is not None and unit not in schema:
+        raise ValueError(f"Privacy unit column '{unit}' is not in the data")
+    lf = lf.with_row_index(ROW_KEY).with_columns(pl.col(ROW_KEY).hash(seed), *_clamps(metadata, schema))
+
+    # Partition of each row, once per index
+    described: list[ColumnMetadata | ColumnGroupMetadata] = [
+        *metadata.columns,
+        *(metadata.column_groups or []),
+    ]
+    entries = [_entry_bounds(entry, closed) for entry in described]
+    entries = [entry for entry in entries if all(col in schema for col in entry.columns)]
+    names: dict[int, str] = {}
+    assigns = []
+    for entry in entries:
+        used = entry.exhaustive + ([entry.index] if unit is not None and entry.index is not None else [])
+        for index in used:
+            if id(index) not in names:
+                names[id(index)] = f"{PARTITION_PREFIX}{len(names)}"
+                assigns.append(_assign_expr(index, entry.columns).alias(names[id(index)]))
+    lf = lf.with_columns(assigns)
+
+    # Rows outside exhaustive keys or partitions
+    inside = [
+        pl.any_horizontal(pl.col(entry.columns).is_null()) | (pl.col(names[id(index)]) >= 0)
+        for entry in entries
+        for index in entry.exhaustive
+    ]
+    if inside:
+        lf = lf.filter(pl.all_horizontal(inside))
+
+    # Contributions of each privacy unit
+    if unit is not None:
+        for entry in entries:
+            if entry.index is not None:
+                lf = _bound_entry(lf, entry, unit, names[id(entry.index)], seed)
+        if metadata.max_contributions is not None:
+            lf = lf.filter(pl.col(ROW_KEY).rank("ordinal").over(unit) <= metadata.max_contributions)
+
+    return lf.drop(ROW_KEY, *names.values())
+
+
+def scan_data(
+    path: str | Path, metadata: TableMetadata | dict[str, Any], *, separator: str = ","
+) -> pl.LazyFrame:
+    """
+    Lazily read a CSV or Parquet file, with the columns of the metadata parsed as their datatype.
+
+    Unlike :func:`csvw_eo.read_with_metadata.scan_with_metadata`, values that
+    do not parse (or are not public keys) do not raise an error: they become
+    missing values, and string columns stay strings.
+    """
+    if not isinstance(metadata, TableMetadata):
+        metadata = TableMetadata.from_dict(metadata, columnar=True)
+    path = Path(path)
+    if path.suffix == PARQUET_SUFFIX:
+        return pl.scan_parquet(path)
+    lf = pl.scan_csv(path, infer_schema=False, separator=separator)
+    present = lf.collect_schema()
+    return lf.with_columns(
+        parse_expr(column.name, pl.String(), to_polars_dtype(column.datatype))
+        for column in metadata.columns
+        if column.name in present
+    )
+
+
+def sink_data(lf: pl.LazyFrame, path: str | Path) -> None:
+    """
+    Write a LazyFrame to a CSV or Parquet (``.parquet`` suffix) file, with the streaming engine.
+
+    The file is read and written in batches, but the per-unit windows of
+    :func:`enforce_bounds` still hold the whole dataset in memory.
+    """
+    if Path(path).suffix == PARQUET_SUFFIX:
+        lf.sink_parquet(path, engine="streaming")
+    else:
+        lf.sink_csv(path, engine="streaming")
+
+
+def main() -> None:
+    """Command-line interface writing the bounded dataset to a file."""
+    parser = argparse.ArgumentParser(
+        description="Clamp, filter and sample a dataset to the bounds of its CSVW-EO metadata"
+    )
+    parser.add_argument("data_file", type=str, help="CSV or Parquet dataset")
+    parser.add_argument("metadata_file", type=str, help="CSVW-EO metadata")
+    parser.add_argument("output_file", type=str, help="Bounded CSV or Parquet (.parquet) dataset")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the samples")
+    parser.add_argument("--separator", type=str, default=",", help="Separator of the CSV file")
+    args = parser.parse_args()
+
+    for path in (Path(args.data_file), Path(args.metadata_file)):
+        if not path.exists():
+            print(f"File not found: {path}")  # noqa: T201
+            sys.exit(1)
+
+    metadata = read_metadata(Path(args.metadata_file))
+    data = scan_data(args.data_file, metadata, separator=args.separator)
+    sink_data(enforce_bounds(data, metadata, args.seed), args.output_file)
+    print(f"Bounded dataset written to {args.output_file}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,8 @@ The resulting dataset respects the structural information contained in
 CSVW-EO metadata but does not guarantee semantic correctness.
 """
 
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
@@ -32,12 +34,12 @@ from csvw_eo.constants import (
     MAX_NUM_PARTITIONS,
     MAXIMUM,
     MINIMUM,
-    NULL_PROP,
     PARTITION_VALUE,
     PREDICATE,
     PUBLIC_PARTITIONS,
     RANDOM_STRINGS,
     VALUE_MAP,
+    DatetimeResolution,
     DependencyType,
 )
 from csvw_eo.datatypes import (
@@ -60,118 +62,336 @@ def get_bounds(col_meta: dict[str, Any]) -> tuple[T, T]:
     return col_meta[MINIMUM], col_meta[MAXIMUM]
 
 
-def generate_datetime_column(col_meta: dict[str, Any], nb_rows: int, rng: np.random.Generator) -> pd.Series:
-    """Generate datetime column between min and max values."""
-    lower, upper = get_bounds(col_meta)
-    dates = pd.date_range(start=lower, end=upper)
-    return pd.Series(rng.choice(dates, size=nb_rows))
+def string_keys(col_meta: dict[str, Any]) -> list[Any]:
+    """
+    Resolve the values a string column can take.
 
+    Keys are taken from keyValues, then from partitions, and completed with random
+    strings when they are not exhaustive. The metadata is never modified.
+    """
+    if KEY_VALUES in col_meta:
+        keys = list(col_meta[KEY_VALUES])
 
-def generate_duration_column(col_meta: dict[str, Any], nb_rows: int, rng: np.random.Generator) -> pd.Series:
-    """Generate duration column between min and max values."""
-    lower, upper = get_bounds(col_meta)
+        if EXHAUSTIVE_KEYS in col_meta and not col_meta[EXHAUSTIVE_KEYS]:
+            diff = col_meta[MAX_NUM_PARTITIONS] - len(col_meta[KEY_VALUES])
+            keys.extend(RANDOM_STRINGS[0:diff])
+        return keys
 
-    # assume bounds in seconds (simplest robust approach)
-    values = rng.uniform(float(lower), float(upper), size=nb_rows)
+    if PUBLIC_PARTITIONS in col_meta:
+        keys = [partition[PREDICATE][PARTITION_VALUE] for partition in col_meta[PUBLIC_PARTITIONS]]
 
-    return pd.to_timedelta(values, unit="s")
+        if EXHAUSTIVE_PARTITIONS in col_meta and not col_meta[EXHAUSTIVE_PARTITIONS]:
+            diff = col_meta[MAX_NUM_PARTITIONS] - len(col_meta[PUBLIC_PARTITIONS])
+            keys.extend(RANDOM_STRINGS[0:diff])
+        return keys
 
+    if col_meta.get(MAX_NUM_PARTITIONS):
+        return RANDOM_STRINGS[0 : col_meta[MAX_NUM_PARTITIONS]]
+    return RANDOM_STRINGS[0:DEFAULT_NUMBER_PARTITIONS]
 
-def generate_integer_column(col_meta: dict[str, Any], nb_rows: int, rng: np.random.Generator) -> pd.Series:
-    """Generate numeric column integer between min and max values respecting XSD subtype."""
-    lower, upper = get_bounds(col_meta)
-    datatype: DataTypes = col_meta[DATATYPE]
 
-    low = int(lower)
-    high = int(upper)
+@dataclass(frozen=True)
+class ColumnSampler(ABC):
+    """
+    Base class for pre-resolved column samplers.
 
-    # Force inclusion of zero for if needed
-    if datatype == DataTypes.POSITIVE_INTEGER:
-        low = max(0, low)
-    elif datatype == DataTypes.NEGATIVE_INTEGER:
-        high = min(0, high)
+    A sampler holds everything needed to draw values for one column (bounds,
+    keys, target dtype) so that repeated generations skip metadata lookups.
+    Samplers are immutable and picklable. Subclasses must implement
+    ``from_metadata`` and ``draw``.
+    """
 
-    values = rng.integers(low, high + 1, size=nb_rows)
+    pandas_dtype: str | pd.CategoricalDtype
 
-    # Ensure at least one zero if allowed
-    if low <= 0 <= high and nb_rows > 0:
-        values[0] = 0
+    @classmethod
+    @abstractmethod
+    def from_metadata(cls, col_meta: dict[str, Any]) -> "ColumnSampler":
+        """Build the sampler from column metadata."""
 
-    return pd.Series(values, dtype="Int64")
+    @abstractmethod
+    def draw(self, nb_rows: int, rng: np.random.Generator) -> pd.Series:
+        """Draw raw values (before dtype conversion)."""
 
+    def sample(self, nb_rows: int, rng: np.random.Generator) -> pd.Series:
+        """Draw values converted to the column pandas dtype."""
+        return self.draw(nb_rows, rng).astype(self.pandas_dtype)
 
-def generate_double_column(col_meta: dict[str, Any], nb_rows: int, rng: np.random.Generator) -> pd.Series:
-    """Generate numeric column double between min and max values."""
-    lower, upper = get_bounds(col_meta)
-    return pd.Series(rng.uniform(float(lower), float(upper), size=nb_rows))
 
+DATETIME_STEPS: dict[DatetimeResolution, np.timedelta64] = {
+    DatetimeResolution.DAY: np.timedelta64(1, "D"),
+    DatetimeResolution.SECOND: np.timedelta64(1, "s"),
+    DatetimeResolution.MICROSECOND: np.timedelta64(1, "us"),
+}
 
-def generate_boolean_column(nb_rows: int, rng: np.random.Generator) -> pd.Series:
-    """Generate boolean column."""
-    return pd.Series(rng.choice([True, False], size=nb_rows), dtype="boolean")
 
+@dataclass(frozen=True)
+class DatetimeSampler(ColumnSampler):
+    """
+    Sampler for datetime columns.
 
-def generate_string_column(col_meta: dict[str, Any], nb_rows: int, rng: np.random.Generator) -> pd.Series:
-    """Generate string column depending on available information."""
-    public_keys_values = []
-    if KEY_VALUES in col_meta:
-        public_keys_values = col_meta[KEY_VALUES]
+    Values are drawn as integer offsets from the lower bound at a fixed
+    resolution and converted in a single vectorized operation, so memory
+    does not depend on the width of the date range.
+    """
 
-        if EXHAUSTIVE_KEYS in col_meta and not col_meta[EXHAUSTIVE_KEYS]:
-            diff = col_meta[MAX_NUM_PARTITIONS] - len(col_meta[KEY_VALUES])
-            public_keys_values.extend(RANDOM_STRINGS[0:diff])
+    start: np.datetime64
+    step: np.timedelta64
+    nb_steps: int
+
+    @classmethod
+    def from_metadata(
+        cls,
+        col_meta: dict[str, Any],
+        resolution: DatetimeResolution = DatetimeResolution.DAY,
+    ) -> "DatetimeSampler":
+        """
+        Build the sampler from column metadata.
+
+        Columns of datatype ``date`` are always drawn at day resolution.
+        """
+        lower, upper = get_bounds(col_meta)
+        if col_meta[DATATYPE] == DataTypes.DATE:
+            resolution = DatetimeResolution.DAY
+
+        start = _to_naive_timestamp(lower).to_datetime64()
+        end = _to_naive_timestamp(upper).to_datetime64()
+        step = DATETIME_STEPS[DatetimeResolution(resolution)]
+
+        if end < start:
+            raise ValueError(f"{MINIMUM} is after {MAXIMUM} in column {col_meta.get(COL_NAME)}")
+
+        return cls(
+            pandas_dtype=to_pandas_dtype(col_meta[DATATYPE]),
+            start=start,
+            step=step,
+            nb_steps=int((end - start) // step),
+        )
 
-    elif PUBLIC_PARTITIONS in col_meta:
-        for partition in col_meta[PUBLIC_PARTITIONS]:
-            public_keys_values.append(partition[PREDICATE][PARTITION_VALUE])
+    def draw(self, nb_rows: int, rng: np.random.Generator) -> pd.Series:
+        """Draw raw values (before dtype conversion)."""
+        offsets = rng.integers(0, self.nb_steps + 1, size=nb_rows)
+        return pd.Series(self.start + offsets * self.step)
 
-        if EXHAUSTIVE_PARTITIONS in col_meta and not col_meta[EXHAUSTIVE_PARTITIONS]:
-            diff = col_meta[MAX_NUM_PARTITIONS] - len(col_meta[PUBLIC_PARTITIONS])
-            public_keys_values.extend(RANDOM_STRINGS[0:diff])
 
-    elif col_meta.get(MAX_NUM_PARTITIONS):
-        public_keys_values = RANDOM_STRINGS[0 : col_meta[MAX_NUM_PARTITIONS]]
-    else:
-        public_keys_values = RANDOM_STRINGS[0:DEFAULT_NUMBER_PARTITIONS]
+def _to_naive_timestamp(value: Any) -> pd.Timestamp:  # noqa: ANN401
+    """Parse a datetime bound, converting timezone-aware values to naive UTC."""
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert(None)
+    return timestamp.as_unit("ns")
 
-    return pd.Series(rng.choice(public_keys_values, size=nb_rows))
 
+@dataclass(frozen=True)
+class DurationSampler(ColumnSampler):
+    """Sampler for duration columns, bounds expressed in seconds."""
 
-def generate_column_series(
-    col_meta: dict[str, Any],
-    nb_rows: int,
-    rng: np.random.Generator,
-) -> pd.Series:
+    lower: float
+    upper: float
+
+    @classmethod
+    def from_metadata(cls, col_meta: dict[str, Any]) -> "DurationSampler":
+        """Build the sampler from column metadata."""
+        lower, upper = get_bounds(col_meta)
+        return cls(
+            pandas_dtype=to_pandas_dtype(col_meta[DATATYPE]),
+            lower=float(lower),
+            upper=float(upper),
+        )
+
+    def draw(self, nb_rows: int, rng: np.random.Generator) -> pd.Series:
+        """Draw raw values (before dtype conversion)."""
+        # assume bounds in seconds (simplest robust approach)
+        values = rng.uniform(self.lower, self.upper, size=nb_rows)
+        return pd.Series(pd.to_timedelta(values, unit="s"))
+
+
+@dataclass(frozen=True)
+class IntegerSampler(ColumnSampler):
+    """Sampler for integer columns respecting the XSD subtype."""
+
+    low: int
+    high: int
+
+    @classmethod
+    def from_metadata(cls, col_meta: dict[str, Any]) -> "IntegerSampler":
+        """Build the sampler from column metadata."""
+        lower, upper = get_bounds(col_meta)
+        datatype: DataTypes = col_meta[DATATYPE]
+
+        low = int(lower)
+        high = int(upper)
+
+        # Force inclusion of zero for if needed
+        if datatype == DataTypes.POSITIVE_INTEGER:
+            low = max(0, low)
+        elif datatype == DataTypes.NEGATIVE_INTEGER:
+            high = min(0, high)
+
+        return cls(pandas_dtype=to_pandas_dtype(datatype), low=low, high=high)
+
+    def draw(self, nb_rows: int, rng: np.random.Generator) -> pd.Series:
+        """Draw raw values (before dtype conversion)."""
+        values = rng.integers(self.low, self.high + 1, size=nb_rows)
+
+        # Ensure at least one zero if allowed
+        if self.low <= 0 <= self.high and nb_rows > 0:
+            values[0] = 0
+
+        return pd.Series(values, dtype="Int64")
+
+
+@dataclass(frozen=True)
+class FloatSampler(ColumnSampler):
+    """Sampler for floating point columns."""
+
+    lower: float
+    upper: float
+
+    @classmethod
+    def from_metadata(cls, col_meta: dict[str, Any]) -> "FloatSampler":
+        """Build the sampler from column metadata."""
+        lower, upper = get_bounds(col_meta)
+        return cls(
+            pandas_dtype=to_pandas_dtype(col_meta[DATATYPE]),
+            lower=float(lower),
+            upper=float(upper),
+        )
+
+    def draw(self, nb_rows: int, rng: np.random.Generator) -> pd.Series:
+        """Draw raw values (before dtype conversion)."""
+        return pd.Series(rng.uniform(self.lower, self.upper, size=nb_rows))
+
+
+@dataclass(frozen=True)
+class BooleanSampler(ColumnSampler):
+    """Sampler for boolean columns."""
+
+    @classmethod
+    def from_metadata(cls, col_meta: dict[str, Any]) -> "BooleanSampler":
+        """Build the sampler from column metadata."""
+        return cls(pandas_dtype=to_pandas_dtype(col_meta[DATATYPE]))
+
+    def draw(self, nb_rows: int, rng: np.random.Generator) -> pd.Series:
+        """Draw raw values (before dtype conversion)."""
+        return pd.Series(rng.choice([True, False], size=nb_rows), dtype="boolean")
+
+
+@dataclass(frozen=True)
+class StringSampler(ColumnSampler):
     """
-    Generate a single column series based on metadata.
+    Sampler for string columns drawing from a pre-built key array.
 
-    Handles datetime, numeric, and partitioned columns, applying nulls.
+    With ``categorical=True`` values are drawn as integer codes into the keys
+    and returned as a pandas Categorical, which converts to an Arrow
+    dictionary-encoded column (and stays dictionary-encoded in Parquet).
     """
+
+    keys: np.ndarray
+    categorical: bool = False
+
+    @classmethod
+    def from_metadata(cls, col_meta: dict[str, Any], categorical: bool = False) -> "StringSampler":
+        """Build the sampler from column metadata."""
+        keys = string_keys(col_meta)
+        if categorical:
+            keys = list(dict.fromkeys(keys))  # categories must be unique
+            return cls(
+                pandas_dtype=pd.CategoricalDtype(categories=keys),
+                keys=np.asarray(keys, dtype=object),
+                categorical=True,
+            )
+
+        return cls(
+            pandas_dtype=to_pandas_dtype(col_meta[DATATYPE]),
+            keys=np.asarray(keys, dtype=object),
+        )
+
+    def draw(self, nb_rows: int, rng: np.random.Generator) -> pd.Series:
+        """Draw raw values (before dtype conversion)."""
+        if self.categorical:
+            codes = rng.integers(0, len(self.keys), size=nb_rows)
+            return pd.Series(pd.Categorical.from_codes(codes, dtype=self.pandas_dtype))
+
+        return pd.Series(rng.choice(self.keys, size=nb_rows))
+
+
+SAMPLERS: dict[DataTypesGroups, type[ColumnSampler]] = {
+    DataTypesGroups.DATETIME: DatetimeSampler,
+    DataTypesGroups.INTEGER: IntegerSampler,
+    DataTypesGroups.FLOAT: FloatSampler,
+    DataTypesGroups.BOOLEAN: BooleanSampler,
+    DataTypesGroups.STRING: StringSampler,
+    DataTypesGroups.DURATION: DurationSampler,
+}
+
+
+def make_sampler(
+    col_meta: dict[str, Any],
+    datetime_resolution: DatetimeResolution = DatetimeResolution.DAY,
+    categorical: bool = False,
+) -> ColumnSampler:
+    """Build the typed sampler matching the column datatype."""
     datatype: DataTypes = col_meta[DATATYPE]
     group = XSD_GROUP_MAP.get(datatype)
 
     if group == DataTypesGroups.DATETIME:
-        series = generate_datetime_column(col_meta, nb_rows, rng)
+        return DatetimeSampler.from_metadata(col_meta, datetime_resolution)
 
-    elif group == DataTypesGroups.INTEGER:
-        series = generate_integer_column(col_meta, nb_rows, rng)
+    if group == DataTypesGroups.STRING:
+        return StringSampler.from_metadata(col_meta, categorical)
 
-    elif group == DataTypesGroups.FLOAT:
-        series = generate_double_column(col_meta, nb_rows, rng)
+    if group not in SAMPLERS:
+        raise ValueError(f"Unknown datatype {datatype}")
 
-    elif group == DataTypesGroups.BOOLEAN:
-        series = generate_boolean_column(nb_rows, rng)
+    return SAMPLERS[group].from_metadata(col_meta)
 
-    elif group == DataTypesGroups.STRING:
-        series = generate_string_column(col_meta, nb_rows, rng)
 
-    elif group == DataTypesGroups.DURATION:
-        series = generate_duration_column(col_meta, nb_rows, rng)
+def generate_datetime_column(
+    col_meta: dict[str, Any],
+    nb_rows: int,
+    rng: np.random.Generator,
+    resolution: DatetimeResolution = DatetimeResolution.DAY,
+) -> pd.Series:
+    """Generate datetime column between min and max values at the given resolution."""
+    return DatetimeSampler.from_metadata(col_meta, resolution).draw(nb_rows, rng)
 
-    else:
-        raise ValueError(f"Unknown datatype {datatype}")
 
-    return series.astype(to_pandas_dtype(datatype))
+def generate_duration_column(col_meta: dict[str, Any], nb_rows: int, rng: np.random.Generator) -> pd.Series:
+    """Generate duration column between min and max values."""
+    return DurationSampler.from_metadata(col_meta).draw(nb_rows, rng)
+
+
+def generate_integer_column(col_meta: dict[str, Any], nb_rows: int, rng: np.random.Generator) -> pd.Series:
+    """Generate numeric column integer between min and max values respecting XSD subtype."""
+    return IntegerSampler.from_metadata(col_meta).draw(nb_rows, rng)
+
+
+def generate_double_column(col_meta: dict[str, Any], nb_rows: int, rng: np.random.Generator) -> pd.Series:
+    """Generate numeric column double between min and max values."""
+    return FloatSampler.from_metadata(col_meta).draw(nb_rows, rng)
+
+
+def generate_boolean_column(nb_rows: int, rng: np.random.Generator) -> pd.Series:
+    """Generate boolean column."""
+    return BooleanSampler(pandas_dtype="boolean").draw(nb_rows, rng)
+
+
+def generate_string_column(col_meta: dict[str, Any], nb_rows: int, rng: np.random.Generator) -> pd.Series:
+    """Generate string column depending on available information."""
+    return StringSampler.from_metadata(col_meta).draw(nb_rows, rng)
+
+
+def generate_column_series(
+    col_meta: dict[str, Any],
+    nb_rows: int,
+    rng: np.random.Generator,
+) -> pd.Series:
+    """
+    Generate a single column series based on metadata.
+
+    Handles datetime, numeric, and partitioned columns, applying nulls.
+    """
+    return make_sampler(col_meta).sample(nb_rows, rng)
 
 
 def bigger_series(
@@ -262,6 +482,7 @@ def mapping_series(
     value_map: dict[Any, Any],
     col_meta: dict[str, Any],
     rng: np.random.Generator,
+    pandas_dtype: str | pd.CategoricalDtype | None = None,
 ) -> pd.Series:
     """
     Generate a series based on a valueMap dependency.
@@ -279,6 +500,10 @@ def mapping_series(
         Column metadata, must include VALUE_MAP and DATATYPE.
     rng : np.random.Generator
         Random number generator for choosing among multiple mapping values.
+    pandas_dtype : str or pd.CategoricalDtype, optional
+        Dtype of the series, usually that of the column sampler. Defaults to
+        the dtype of the column datatype. Mapped values missing from the
+        categories of a categorical dtype are added to them.
 
     Returns
     -------
@@ -297,13 +522,23 @@ def mapping_series(
         else:
             mapped.append(pd.NA)
 
-    return pd.Series(mapped, dtype=to_pandas_dtype(col_meta[DATATYPE]))
+    if pandas_dtype is None:
+        pandas_dtype = to_pandas_dtype(col_meta[DATATYPE])
+    if isinstance(pandas_dtype, pd.CategoricalDtype):
+        categories = list(pandas_dtype.categories)
+        extra = [value for value in dict.fromkeys(mapped) if value is not pd.NA and value not in categories]
+        if extra:
+            pandas_dtype = pd.CategoricalDtype(categories=categories + extra)
+
+    return pd.Series(mapped, dtype=pandas_dtype)
 
 
 def fixed_series(
     depend_serie: pd.Series,
     col_meta: dict[str, Any],
     rng: np.random.Generator,
+    sampler: ColumnSampler | None = None,
+    known: dict[Any, Any] | None = None,
 ) -> pd.Series:
     """
     Generate a series where each unique entity in depend_serie has a fixed value.
@@ -318,6 +553,12 @@ def fixed_series(
         Column metadata, must include DATATYPE.
     rng : np.random.Generator
         Random number generator for value generation.
+    sampler : ColumnSampler, optional
+        Pre-built sampler for the column. Built from ``col_meta`` if not given.
+    known : dict, optional
+        Values already drawn for entities of earlier batches, reused for them.
+        The values drawn for new entities are added to it, so that batches
+        sharing the dict keep one value per entity.
 
     Returns
     -------
@@ -325,14 +566,21 @@ def fixed_series(
         Series satisfying FIXED dependency.
 
     """
-    value_for_entity = {}
-    entity_meta = col_meta.copy()
-    entity_meta[NULL_PROP] = 0  # avoid nulls for the entity value
+    if sampler is None:
+        sampler = make_sampler(col_meta)
 
-    for ent in depend_serie.unique():
-        value_for_entity[ent] = generate_column_series(entity_meta, 1, rng).iloc[0]
+    # One draw per entity, then broadcast to rows
+    codes, entities = pd.factorize(depend_serie, use_na_sentinel=False)
+    if known is None:
+        entity_values = sampler.sample(len(entities), rng)
+    else:
+        new = [entity for entity in entities if entity not in known]
+        known.update(zip(new, sampler.sample(len(new), rng), strict=True))
+        entity_values = pd.Series([known[entity] for entity in entities], dtype=sampler.pandas_dtype)
+    values = entity_values.iloc[codes]
+    values.index = depend_serie.index
 
-    return pd.Series(depend_serie.map(value_for_entity), dtype=to_pandas_dtype(col_meta[DATATYPE]))
+    return values
 
 
 def generate_dataframe(
@@ -0,0 +1,184 @@
+"""
+Offline JSON-LD contexts for CSVW-EO metadata.
+
+The ``@context`` of CSVW-EO metadata references the CSVW namespace
+(``http://www.w3.org/ns/csvw``) and the CSVW-EO context. rdflib fetches
+remote contexts over the network on every parse, which is slow and fails on
+hosts without network access.
+
+This module serves both contexts from files bundled with the package, and
+never fetches anything:
+
+- the CSVW namespace context is served from ``contexts/csvw.jsonld``, a
+  partial copy of the W3C context holding only the CSVW terms used by
+  CSVW-EO metadata (other CSVW terms are not expanded);
+- any reference to a ``csvw-eo-context.jsonld`` file (whatever its
+  directory) is served from ``contexts/csvw-eo-context.jsonld``, a copy of
+  the ``csvw-eo-context.jsonld`` at the root of the repository;
+- other references must be local files.
+
+Context documents and processed rdflib contexts are cached in-process, so
+repeated parses of metadata with the same ``@context`` reuse them.
+"""
+
+import json
+from collections.abc import Sequence
+from functools import cache, lru_cache
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from rdflib import Graph
+from rdflib.plugins.parsers.jsonld import Parser
+from rdflib.plugins.shared.jsonld.context import Context
+
+from csvw_eo.constants import CSVW_CONTEXT
+
+JSONLD_CONTEXT = "@context"
+
+CONTEXTS_DIR = Path(__file__).resolve().parent / "contexts"
+CSVW_CONTEXT_FILE = CONTEXTS_DIR / "csvw.jsonld"
+CSVW_EO_CONTEXT_FILE = CONTEXTS_DIR / "csvw-eo-context.jsonld"
+
+# Remote context references served from the bundled files
+BUNDLED_CONTEXTS: dict[str, Path] = {
+    CSVW_CONTEXT: CSVW_CONTEXT_FILE,
+    "https://www.w3.org/ns/csvw": CSVW_CONTEXT_FILE,
+    "http://www.w3.org/ns/csvw.jsonld": CSVW_CONTEXT_FILE,
+    "https://www.w3.org/ns/csvw.jsonld": CSVW_CONTEXT_FILE,
+}
+
+REMOTE_SCHEMES = {"http", "https"}
+
+
+def context_file(reference: str, base: str | Path | None = None) -> Path:
+    """
+    Return the local file serving a context reference.
+
+    Parameters
+    ----------
+    reference : str
+        Context reference, as found in ``@context``.
+    base : str or Path, optional
+        Directory against which relative file references are resolved
+        (usually the directory of the metadata file).
+
+    Returns
+    -------
+    Path
+
+    Raises
+    ------
+    ValueError
+        If the reference is neither bundled nor an existing local file.
+
+    """
+    if reference in BUNDLED_CONTEXTS:
+        return BUNDLED_CONTEXTS[reference]
+    parts = urlsplit(reference)
+    if Path(parts.path).name == CSVW_EO_CONTEXT_FILE.name:
+        return CSVW_EO_CONTEXT_FILE
+    if parts.scheme in REMOTE_SCHEMES:
+        raise ValueError(f"JSON-LD context '{reference}' is not available offline")
+
+    path = Path(parts.path if parts.scheme == "file" else reference)
+    if base is not None and not path.is_absolute():
+        path = Path(base) / path
+    if not path.is_file():
+        raise ValueError(f"JSON-LD context file not found: {path}")
+    return path.resolve()
+
+
+@cache
+def _load_context_file(path: Path) -> dict[str, Any]:
+    with path.open("r", encoding="utf-8") as f:
+        document = json.load(f)
+    if not isinstance(document, dict) or JSONLD_CONTEXT not in document:
+        raise ValueError(f"No {JSONLD_CONTEXT} in JSON-LD context file {path}")
+    return document
+
+
+def load_context(reference: str, base: str | Path | None = None) -> dict[str, Any]:
+    """
+    Load a context document, from the bundled files or a local file.
+
+    Documents are read once per process and cached; they must not be modified.
+
+    Parameters
+    ----------
+    reference : str
+        Context reference, as found in ``@context``.
+    base : str or Path, optional
+        Directory against which relative file references are resolved.
+
+    Returns
+    -------
+    dict
+        JSON-LD context document (with its ``@context`` entry).
+
+    """
+    return _load_context_file(context_file(reference, base))
+
+
+@lru_cache(maxsize=64)
+def _processed_context(paths: tuple[Path, ...]) -> Context:
+    return Context([_load_context_file(path) for path in paths])
+
+
+def jsonld_context(context: Any, base: str | Path | None = None) -> Context:  # noqa: ANN401
+    """
+    Process the ``@context`` of a metadata document, offline.
+
+    Contexts made only of references are processed once per process and
+    cached; inline context objects are processed on each call.
+
+    Parameters
+    ----------
+    context : str, dict or list
+        Value of the ``@context`` entry.
+    base : str or Path, optional
+        Directory against which relative file references are resolved.
+
+    Returns
+    -------
+    rdflib.plugins.shared.jsonld.context.Context
+        Processed context. Shared between calls: it must not be modified.
+
+    """
+    items: Sequence[Any] = context if isinstance(context, list) else [context] if context else []
+    if all(isinstance(item, str) for item in items):
+        return _processed_context(tuple(context_file(item, base) for item in items))
+    return Context([load_context(item, base) if isinstance(item, str) else item for item in items])
+
+
+def metadata_graph(metadata: dict[str, Any] | str | Path, graph: Graph | None = None) -> Graph:
+    """
+    Parse CSVW-EO JSON-LD metadata into an RDF graph, without network access.
+
+    Parameters
+    ----------
+    metadata : dict, str or Path
+        JSON-LD metadata, or path of a JSON-LD metadata file. Relative context
+        references of a file are resolved against its directory.
+    graph : rdflib.Graph, optional
+        Graph to add the triples to. A new graph by default.
+
+    Returns
+    -------
+    rdflib.Graph
+
+    """
+    base: Path | None = None
+    if isinstance(metadata, dict):
+        data = metadata
+    else:
+        path = Path(metadata)
+        base = path.parent
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+
+    context = jsonld_context(data.get(JSONLD_CONTEXT), base)
+    document = {key: value for key, value in data.items() if key != JSONLD_CONTEXT}
+    graph = Graph() if graph is None else graph
+    Parser().parse(document, context, graph)
+    return graph
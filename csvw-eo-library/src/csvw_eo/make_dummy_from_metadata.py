@@ -16,8 +16,11 @@ CSVW-EO metadata but does not guarantee semantic correctness.
 """
 
 import argparse
-import json
+import copy
 import string
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -29,6 +32,7 @@ from csvw_eo.constants import (
     COL_LIST,
     COL_NAME,
     DATATYPE,
+    DEPENDENCY_TYPE,
     DEPENDS_ON,
     EXHAUSTIVE_KEYS,
     EXHAUSTIVE_PARTITIONS,
@@ -41,22 +45,57 @@ from csvw_eo.constants import (
     ROW_DEP,
     TABLE_SCHEMA,
     UPPER_BOUND,
+    VALUE_MAP,
+    DatetimeResolution,
+    DependencyType,
 )
-from csvw_eo.datatypes import XSD_GROUP_MAP, DataTypes, DataTypesGroups
-from csvw_eo.generate_series import generate_dataframe
+from csvw_eo.datatypes import DataTypes
+from csvw_eo.generate_series import (
+    ColumnSampler,
+    bigger_series,
+    fixed_series,
+    make_sampler,
+    mapping_series,
+)
+from csvw_eo.partition_index import IntervalClosed, PartitionIndex
+from csvw_eo.sidecar import read_metadata
 
 RANDOM_STRINGS = list(string.ascii_lowercase + string.ascii_uppercase + string.digits)
 
 
+def null_count(nb_rows: int, nullable_prop: float) -> int:
+    """Return the exact number of nulls to inject in a column of nb_rows."""
+    if nullable_prop <= 0 or nb_rows == 0:
+        return 0
+    return min(nb_rows, max(1, int(nb_rows * nullable_prop)))
+
+
+def null_mask(nb_rows: int, n_null: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Build a boolean mask with exactly ``n_null`` positions set, drawn uniformly.
+
+    Positions are sampled without replacement on ``range(nb_rows)`` (numpy uses
+    Floyd's algorithm or a partial shuffle), so neither the index nor a full
+    permutation is materialized.
+    """
+    mask = np.zeros(nb_rows, dtype=bool)
+    if n_null > 0:
+        mask[rng.choice(nb_rows, size=n_null, replace=False, shuffle=False)] = True
+    return mask
+
+
 def apply_nulls_serie(
     series: pd.Series,
     nullable_prop: float,
-    datatype: DataTypes,
+    datatype: DataTypes,  # noqa: ARG001
     rng: np.random.Generator,
 ) -> pd.Series:
     """
     Inject null values into a column according to metadata.
 
+    The null mask is applied positionally, the missing value marker follows
+    the column dtype (``pd.NA``, ``NaN`` or ``NaT``).
+
     Parameters
     ----------
     series : pd.Series
@@ -64,7 +103,7 @@ def apply_nulls_serie(
     nullable_prop : float
         Proportion of null values.
     datatype : DataTypes
-        Column datatype.
+        Column datatype (the marker is derived from the series dtype).
     rng : numpy.random.Generator
         Random number generator.
 
@@ -74,19 +113,11 @@ def apply_nulls_serie(
         Column with nulls applied.
 
     """
-    if nullable_prop <= 0:
+    n_null = null_count(len(series), nullable_prop)
+    if n_null == 0:
         return series
 
-    n_null = max(1, int(len(series) * nullable_prop))
-    idx = rng.choice(series.index, size=n_null, replace=False)
-
-    group = XSD_GROUP_MAP[datatype]
-    if group == DataTypesGroups.DATETIME:
-        series.loc[idx] = pd.NaT
-    else:
-        series.loc[idx] = pd.NA
-
-    return series
+    return series.mask(null_mask(len(series), n_null, rng))
 
 
 def _apply_value_mask(series: pd.Series, value: Any) -> pd.Series:  # noqa: ANN401
@@ -114,36 +145,77 @@ def _predicate_mask(df: pd.DataFrame, predicate: dict[str, Any]) -> pd.Series:
     return mask
 
 
-def column_group_partitions(
-    df: pd.DataFrame,
+def compile_group_filters(
     columns_group_meta: list[dict[str, Any]],
-) -> pd.DataFrame:
-    """Keep only rows belonging to allowed column-group partitions."""
-    global_mask = pd.Series(True, index=df.index)
+) -> list[list[dict[str, Any]]]:
+    """
+    Extract the allowed predicates of each exhaustive column group.
 
+    Partitions take precedence over keys. Groups that are neither exhaustive
+    in partitions nor in keys do not constrain the rows and are skipped.
+    """
+    group_filters = []
     for col_group in columns_group_meta:
-        group_mask = pd.Series(False, index=df.index)
-
         if col_group.get(EXHAUSTIVE_PARTITIONS, False):
-            # Partitions take precedence over keys
             partitions = col_group.get(PUBLIC_PARTITIONS, [])
-            for p in partitions:
-                predicate = p.get(PREDICATE, p)
-                group_mask |= _predicate_mask(df, predicate)
+            group_filters.append([p.get(PREDICATE, p) for p in partitions])
 
         elif col_group.get(EXHAUSTIVE_KEYS, False):
-            key_values = col_group.get(KEY_VALUES, [])
-            for key in key_values:
-                group_mask |= _predicate_mask(df, key)
+            group_filters.append(list(col_group.get(KEY_VALUES, [])))
+
+    return group_filters
 
-        else:
-            continue  # nothing to apply
 
-        global_mask &= group_mask
+def compile_group_index(predicates: list[dict[str, Any]]) -> PartitionIndex | list[dict[str, Any]]:
+    """
+    Build the lookup index of the allowed predicates of a column group.
+
+    Intervals are closed on both sides, as in :func:`_predicate_mask`. The
+    predicates are returned as they are if they cannot be indexed (for
+    instance overlapping intervals): they are then tested one by one.
+    """
+    try:
+        return PartitionIndex(predicates, closed=IntervalClosed.BOTH)
+    except ValueError:
+        return predicates
+
+
+def filter_group_partitions(
+    df: pd.DataFrame, group_filters: Sequence[Sequence[dict[str, Any]] | PartitionIndex]
+) -> pd.DataFrame:
+    """
+    Keep only rows matching at least one predicate of every group filter.
+
+    Each group filter is a list of predicates, or its index (see
+    :func:`compile_group_index`).
+    """
+    global_mask = np.ones(len(df), dtype=bool)
+
+    for group_filter in group_filters:
+        index = (
+            group_filter
+            if isinstance(group_filter, PartitionIndex)
+            else compile_group_index(list(group_filter))
+        )
+        if isinstance(index, PartitionIndex):
+            global_mask &= index.contains(df)
+            continue
+        group_mask = pd.Series(False, index=df.index)
+        for predicate in index:
+            group_mask |= _predicate_mask(df, predicate)
+        global_mask &= group_mask.to_numpy()
 
     return df[global_mask].reset_index(drop=True)
 
 
+def column_group_partitions(
+    df: pd.DataFrame,
+    columns_group_meta: list[dict[str, Any]],
+) -> pd.DataFrame:
+    """Keep only rows belonging to allowed column-group partitions."""
+    return filter_group_partitions(df, compile_group_filters(columns_group_meta))
+
+
 def apply_nulls_dataframe(
     df: pd.DataFrame, columns_meta: list[dict[str, Any]], rng: np.random.Generator
 ) -> pd.DataFrame:
@@ -232,33 +304,219 @@ def build_generation_order(depends_map: dict[str, list[dict[str, Any]]]) -> list
     return order
 
 
-def make_dummy_from_metadata(
+@dataclass(frozen=True)
+class ColumnStep:
+    """Generation step of a single column in a GenerationPlan."""
+
+    name: str
+    col_meta: dict[str, Any]
+    sampler: ColumnSampler
+    dependency: dict[str, Any] | None = None
+
+
+@dataclass(frozen=True)
+class GenerationPlan:
+    """
+    Compiled, reusable plan for dummy generation from one metadata document.
+
+    The plan holds the pre-resolved generation order, the typed per-column
+    samplers, the allowed column-group predicates and the null proportions.
+    It is immutable and picklable, so it can be compiled once and shipped to
+    worker processes. Build it with :func:`compile_generation_plan`.
+    """
+
+    steps: tuple[ColumnStep, ...]
+    column_order: tuple[str, ...]
+    group_filters: tuple[tuple[dict[str, Any], ...], ...]
+    nullable_proportions: tuple[tuple[str, float], ...]
+
+    def _generate_candidates(
+        self, nb_rows: int, rng: np.random.Generator, fixed: dict[str, dict[Any, Any]]
+    ) -> pd.DataFrame:
+        """Generate one batch of rows, following dependencies, with the ``fixed`` values of each entity."""
+        data: dict[str, pd.Series] = {}
+
+        for step in self.steps:
+            dep = step.dependency
+            if dep is None:
+                data[step.name] = step.sampler.sample(nb_rows, rng)
+                continue
+
+            mode = dep.get(DEPENDENCY_TYPE, DependencyType.NO_DEP)
+            dep_col = dep[DEPENDS_ON]
+
+            if mode == DependencyType.MAPPING:
+                data[step.name] = mapping_series(
+                    data[dep_col], dep.get(VALUE_MAP, {}), step.col_meta, rng, step.sampler.pandas_dtype
+                )
+
+            elif mode == DependencyType.BIGGER:
+                data[step.name] = bigger_series(data[dep_col], step.col_meta, nb_rows, rng)
+
+            elif mode == DependencyType.FIXED:
+                data[step.name] = fixed_series(
+                    data[dep_col], step.col_meta, rng, step.sampler, fixed.setdefault(step.name, {})
+                )
+
+            else:
+                data[step.name] = step.sampler.sample(nb_rows, rng)
+
+        return pd.DataFrame(data)
+
+    @cached_property
+    def group_indexes(self) -> tuple[PartitionIndex | list[dict[str, Any]], ...]:
+        """Lookup indexes of the group filters, built on first use."""
+        return tuple(compile_group_index(list(predicates)) for predicates in self.group_filters)
+
+    def _generate_rows(
+        self, nb_rows: int, rng: np.random.Generator, fixed: dict[str, dict[Any, Any]]
+    ) -> pd.DataFrame:
+        """
+        Generate nb_rows rows in existing partitions, without nulls.
+
+        ``fixed`` maps each fixedPerEntity column to the values of the
+        entities drawn so far; it is shared by the batches of one dataset.
+        """
+        group_filters = self.group_indexes
+
+        # Generate dataframes until enough rows of existing partitions
+        generated: list[pd.DataFrame] = []
+        while sum(len(df) for df in generated) < nb_rows:
+            df = self._generate_candidates(nb_rows, rng, fixed)
+
+            # Remove partition that do ont exist
+            if group_filters:
+                df = filter_group_partitions(df, group_filters)
+
+            generated.append(df)
+
+        # Format in one dataframe with nb_rows
+        output_df = pd.concat(generated, ignore_index=True)
+        output_df = output_df.sample(n=nb_rows, random_state=rng)
+
+        # Metadata column order
+        output_df = output_df.reindex(columns=list(self.column_order))
+
+        return output_df.reset_index(drop=True)
+
+    def generate(self, nb_rows: int = 100, seed: int = 0) -> pd.DataFrame:
+        """
+        Generate a dummy dataset.
+
+        Parameters
+        ----------
+        nb_rows : int, default=100
+            Number of rows to generate.
+        seed : int, default=0
+            Random seed.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Generated dataset
+
+        """
+        rng = np.random.default_rng(seed)
+        output_df = self._generate_rows(nb_rows, rng, fixed={})
+
+        # Add nulls where required
+        for col, nullable_prop in self.nullable_proportions:
+            n_null = null_count(nb_rows, nullable_prop)
+            if n_null:
+                output_df[col] = output_df[col].mask(null_mask(nb_rows, n_null, rng))
+
+        return output_df
+
+    def iter_chunks(
+        self,
+        nb_rows: int,
+        chunk_size: int = 100_000,
+        seed: int = 0,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Generate a dummy dataset as a stream of chunks.
+
+        Null counts are exact over the whole stream: the number of nulls of
+        each chunk is drawn from a hypergeometric distribution on the nulls
+        remaining, so the stream holds the same number of nulls as
+        :meth:`generate` and their positions remain uniformly distributed.
+        The values of fixedPerEntity columns are kept for the whole stream:
+        the value of each entity is stored, so memory grows with the
+        number of entities (not of rows).
+
+        Parameters
+        ----------
+        nb_rows : int
+            Total number of rows to generate.
+        chunk_size : int, default=100_000
+            Maximum number of rows per chunk.
+        seed : int, default=0
+            Random seed.
+
+        Yields
+        ------
+        pandas.DataFrame
+            Chunks of at most chunk_size rows.
+
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        rng = np.random.default_rng(seed)
+        fixed: dict[str, dict[Any, Any]] = {}
+        remaining_nulls = {
+            col: null_count(nb_rows, nullable_prop) for col, nullable_prop in self.nullable_proportions
+        }
+        remaining_rows = nb_rows
+
+        while remaining_rows > 0:
+            size = min(chunk_size, remaining_rows)
+            chunk = self._generate_rows(size, rng, fixed)
+
+            for col, n_left in remaining_nulls.items():
+                if n_left == 0:
+                    continue
+                n_null = int(rng.hypergeometric(n_left, remaining_rows - n_left, size))
+                remaining_nulls[col] = n_left - n_null
+                if n_null:
+                    chunk[col] = chunk[col].mask(null_mask(size, n_null, rng))
+
+            remaining_rows -= size
+            yield chunk
+
+
+def compile_generation_plan(
     metadata: dict[str, Any],
-    nb_rows: int = 100,
-    seed: int = 0,
-) -> pd.DataFrame:
+    datetime_resolution: DatetimeResolution = DatetimeResolution.DAY,
+    categorical: bool = False,
+) -> GenerationPlan:
     """
-    Generate a dummy dataset from CSVW-EO metadata, respecting exhaustive column group partitions.
+    Compile CSVW-EO metadata into a reusable GenerationPlan.
+
+    All per-call setup of :func:`make_dummy_from_metadata` (dependency order,
+    samplers, key arrays and column-group predicates) is done once here.
 
     Parameters
     ----------
     metadata : dict
-        CSVW-EO metadata structure.
-    nb_rows : int, default=100
-        Number of rows to generate.
-    seed : int, default=0
-        Random seed.
+        CSVW-EO metadata structure. It is copied, later changes to it do not
+        affect the plan.
+    datetime_resolution : DatetimeResolution, default="day"
+        Resolution of generated datetime values ("day", "second" or
+        "microsecond"). Columns of datatype ``date`` always use days.
+    categorical : bool, default=False
+        If True, string columns are generated as pandas Categoricals whose
+        categories are the column keys (Arrow/Parquet dictionary-encoded).
 
     Returns
     -------
-    pandas.DataFrame
-        Generated dataset
+    GenerationPlan
+        Immutable plan, see :meth:`GenerationPlan.generate`.
 
     """
-    rng = np.random.default_rng(seed)
-
+    metadata = copy.deepcopy(metadata)
     columns_meta = metadata[TABLE_SCHEMA][COL_LIST]
-    columns_group_meta = metadata.get(ADD_INFO, [])
+    meta_map = {c[COL_NAME]: c for c in columns_meta}
 
     # Based on dependency, create ordered plan for dummy generation
     depends_map: dict[str, list[dict[str, Any]]] = {
@@ -266,34 +524,66 @@ def make_dummy_from_metadata(
     }
     order = build_generation_order(depends_map)
 
-    # Generate dataframes until enough rows of existing partitions
-    generated: list[pd.DataFrame] = []
-    while sum(len(df) for df in generated) < nb_rows:
-        df = generate_dataframe(
-            depends_map,
-            order,
-            {c[COL_NAME]: c for c in columns_meta},
-            nb_rows,
-            rng,
+    steps = []
+    for position, col in enumerate(order):
+        # The dependency used is the first one on an already generated column
+        previous = set(order[:position])
+        dependency = next((d for d in depends_map[col] if d.get(DEPENDS_ON) in previous), None)
+        steps.append(
+            ColumnStep(
+                name=col,
+                col_meta=meta_map[col],
+                sampler=make_sampler(meta_map[col], datetime_resolution, categorical),
+                dependency=dependency,
+            )
         )
 
-        # Remove partition that do ont exist
-        if columns_group_meta:
-            df = column_group_partitions(df, columns_group_meta)
+    return GenerationPlan(
+        steps=tuple(steps),
+        column_order=tuple(meta_map),
+        group_filters=tuple(
+            tuple(predicates) for predicates in compile_group_filters(metadata.get(ADD_INFO, []))
+        ),
+        nullable_proportions=tuple((c[COL_NAME], c.get(NULL_PROP, 0)) for c in columns_meta),
+    )
 
-        generated.append(df)
 
-    # Format in one dataframe with nb_rows
-    output_df = pd.concat(generated, ignore_index=True)
-    output_df = output_df.sample(n=nb_rows, random_state=seed)
+def make_dummy_from_metadata(
+    metadata: dict[str, Any],
+    nb_rows: int = 100,
+    seed: int = 0,
+    datetime_resolution: DatetimeResolution = DatetimeResolution.DAY,
+    categorical: bool = False,
+) -> pd.DataFrame:
+    """
+    Generate a dummy dataset from CSVW-EO metadata, respecting exhaustive column group partitions.
 
-    # Add nulls where required
-    output_df = apply_nulls_dataframe(output_df, columns_meta, rng)
+    To generate many datasets from the same metadata, compile it once with
+    :func:`compile_generation_plan` and call :meth:`GenerationPlan.generate`.
 
-    # Metadata column order
-    output_df = output_df.reindex(columns=[c[COL_NAME] for c in columns_meta])
+    Parameters
+    ----------
+    metadata : dict
+        CSVW-EO metadata structure.
+    nb_rows : int, default=100
+        Number of rows to generate.
+    seed : int, default=0
+        Random seed.
+    datetime_resolution : DatetimeResolution, default="day"
+        Resolution of generated datetime values ("day", "second" or
+        "microsecond").
+    categorical : bool, default=False
+        If True, string columns are returned as pandas Categoricals drawn as
+        integer codes into the column keys. They convert to Arrow dictionary
+        arrays and stay dictionary-encoded when written to Parquet.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Generated dataset
 
-    return output_df.reset_index(drop=True)
+    """
+    return compile_generation_plan(metadata, datetime_resolution, categorical).generate(nb_rows, seed)
 
 
 def main() -> None:
@@ -304,6 +594,18 @@ def main() -> None:
     parser.add_argument("--rows", type=int, default=100)
     parser.add_argument("--output", type=str, default="dummy.csv")
     parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--datetime_resolution",
+        type=str,
+        default=DatetimeResolution.DAY,
+        choices=list(DatetimeResolution),
+        help="Resolution of generated datetime values",
+    )
+    parser.add_argument(
+        "--categorical",
+        action="store_true",
+        help="Generate string columns as dictionary-encoded categoricals",
+    )
 
     args = parser.parse_args()
 
@@ -312,16 +614,20 @@ def main() -> None:
     if not metadata_path.exists():
         raise FileNotFoundError(f"Metadata file not found: {metadata_path}")
 
-    with metadata_path.open("r", encoding="utf-8") as f:
-        metadata = json.load(f)
+    metadata = read_metadata(metadata_path)
 
     df_dummy = make_dummy_from_metadata(
         metadata,
         nb_rows=args.rows,
         seed=args.seed,
+        datetime_resolution=DatetimeResolution(args.datetime_resolution),
+        categorical=args.categorical,
     )
 
-    df_dummy.to_csv(args.output, index=False)
+    if Path(args.output).suffix == ".parquet":
+        df_dummy.to_parquet(args.output, index=False)
+    else:
+        df_dummy.to_csv(args.output, index=False)
 
     print(  # noqa: T201
         f"Dummy dataset written to {args.output} ({len(df_dummy)} rows,{len(df_dummy.columns)} columns)."
@@ -41,12 +41,13 @@ from csvw_eo.metadata_structure import (
     full_partition_to_key_multi,
     full_partition_to_key_single,
 )
+from csvw_eo.serialization import dump_table_metadata
+from csvw_eo.sidecar import DEFAULT_SIDECAR_MIN_ROWS, SidecarFormat, write_metadata
 from csvw_eo.utils import (
     ContributionLevel,
     get_effective_contrib_level,
     get_group_contribution_level,
     prepare_metadata_inputs,
-    sanitize,
 )
 
 
@@ -597,19 +598,19 @@ def build_column_metadata(  # noqa: PLR0913
     # Column by itself (mainly CSVW)
     series = df[column_name]
     datatype = infer_xmlschema_datatype(series)
+
+    # Bounds are given at construction to be coerced to native types
+    minimum, maximum = get_continuous_bounds(series) if datatype != DataTypes.STRING else (None, None)
     column_meta = ColumnMetadata(
         name=column_name,
         datatype=datatype,
         required=series.isna().sum() == 0,
         privacy_id=(column_name == privacy_unit),
         nullable_proportion=np.ceil(series.isna().mean() * 1000) / 1000,
+        minimum=minimum,
+        maximum=maximum,
     )
 
-    if datatype != DataTypes.STRING:
-        minimum, maximum = get_continuous_bounds(series)
-        column_meta.minimum = minimum
-        column_meta.maximum = maximum
-
     # Privacy unit contributions (DP)
     col_contrib_level = get_effective_contrib_level(
         column_name, fine_contributions_level, default_contributions_level
@@ -631,7 +632,7 @@ def build_column_metadata(  # noqa: PLR0913
     return column_meta
 
 
-def make_metadata_from_data(  # noqa: PLR0913
+def build_table_metadata(  # noqa: PLR0913
     df: pd.DataFrame,
     privacy_unit: str,
     with_dependencies: bool = True,
@@ -639,9 +640,12 @@ def make_metadata_from_data(  # noqa: PLR0913
     column_groups: list[list[str]] | None = None,
     default_contributions_level: str = "table",
     fine_contributions_level: dict[str, str] | None = None,
-) -> dict[str, Any]:
+) -> TableMetadata:
     """
-    Generate CSVW-EO metadata from a dataset and return JSON-serializable dictionary.
+    Generate the CSVW-EO metadata model of a dataset.
+
+    Use :func:`csvw_eo.serialization.dump_table_metadata` to stream it to a
+    file, or :func:`make_metadata_from_data` to get it as a dictionary.
 
     Parameters
     ----------
@@ -663,7 +667,7 @@ def make_metadata_from_data(  # noqa: PLR0913
     Returns
     -------
     TableMetadata
-        CSVW-EO metadata structure as a dataclass.
+        CSVW-EO metadata model.
 
     """
     default_level, fine_level, continuous_partitions, column_groups = prepare_metadata_inputs(
@@ -712,7 +716,7 @@ def make_metadata_from_data(  # noqa: PLR0913
             privacy_unit,
         )
 
-    table_metadata = TableMetadata(
+    return TableMetadata(
         privacy_unit=privacy_unit,
         max_contributions=df.groupby(privacy_unit).size().max(),
         max_length=len(df),
@@ -721,7 +725,38 @@ def make_metadata_from_data(  # noqa: PLR0913
         column_groups=groups_meta,
     )
 
-    return sanitize(table_metadata.to_dict())
+
+def make_metadata_from_data(  # noqa: PLR0913
+    df: pd.DataFrame,
+    privacy_unit: str,
+    *,
+    with_dependencies: bool = True,
+    continuous_partitions: dict[str, list[Any]] | None = None,
+    column_groups: list[list[str]] | None = None,
+    default_contributions_level: str = "table",
+    fine_contributions_level: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """
+    Generate CSVW-EO metadata from a dataset and return JSON-serializable dictionary.
+
+    See :func:`build_table_metadata` for the parameters.
+
+    Returns
+    -------
+    dict
+        CSVW-EO metadata structure.
+
+    """
+    table_metadata = build_table_metadata(
+        df,
+        privacy_unit,
+        with_dependencies=with_dependencies,
+        continuous_partitions=continuous_partitions,
+        column_groups=column_groups,
+        default_contributions_level=default_contributions_level,
+        fine_contributions_level=fine_contributions_level,
+    )
+    return table_metadata.to_dict()
 
 
 # ============================================================
@@ -764,6 +799,13 @@ def main() -> None:
     --fine_contributions_level : str, optional
         JSON string specifying column-specific contribution levels.
 
+    --sidecar_format : {"arrow", "parquet"}, optional
+        Write large partition and key lists to binary sidecar files next to
+        the metadata file. By default, everything stays inline.
+
+    --sidecar_min_rows : int, optional
+        Lists shorter than this stay inline. Default is 1000.
+
     Notes
     -----
     Datetime inference is attempted automatically for all columns by
@@ -809,6 +851,19 @@ def main() -> None:
         default=None,
         help="JSON string with column and expected contribution level ('column' or 'partition')",
     )
+    parser.add_argument(
+        "--sidecar_format",
+        type=str,
+        default=None,
+        choices=[f.value for f in SidecarFormat],
+        help="Store large partition lists in Arrow IPC or Parquet sidecar files",
+    )
+    parser.add_argument(
+        "--sidecar_min_rows",
+        type=int,
+        default=DEFAULT_SIDECAR_MIN_ROWS,
+        help="Partition lists shorter than this stay inline",
+    )
     args = parser.parse_args()
 
     df = pd.read_csv(args.csv_file)
@@ -816,7 +871,7 @@ def main() -> None:
     continuous_partitions = json.loads(args.continuous_partitions) if args.continuous_partitions else {}
     column_groups = json.loads(args.column_groups) if args.column_groups else []
 
-    metadata = make_metadata_from_data(
+    table_metadata = build_table_metadata(
         df=df,
         with_dependencies=args.with_dependencies,
         privacy_unit=args.privacy_unit,
@@ -825,8 +880,11 @@ def main() -> None:
         column_groups=column_groups,
     )
 
-    with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, indent=2)
+    if args.sidecar_format is None:
+        with open(args.output, "w", encoding="utf-8") as f:
+            dump_table_metadata(table_metadata, f, indent=2)
+    else:
+        write_metadata(table_metadata, args.output, args.sidecar_format, args.sidecar_min_rows)
 
     print(f"CSVW-EO metadata written to {args.output}")  # noqa: T201
 
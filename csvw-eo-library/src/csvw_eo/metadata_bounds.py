@@ -0,0 +1,150 @@
+"""
+Partitions, public keys, values and file headers, as read by the data-side tools.
+
+:mod:`csvw_eo.check_data` checks a dataset against the bounds of its
+metadata, :mod:`csvw_eo.enforce_bounds` enforces them and
+:mod:`csvw_eo.assert_same_structure` compares two files. They share the
+helpers of this module: :func:`entry_partitions` indexes the partitions and
+public keys of a column or a column group once, :func:`parse_expr` and
+:func:`parse_bound` parse values and bounds into the dtype of their column,
+and :func:`csv_header` reads the column names of a CSV file.
+"""
+
+import csv
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from csvw_eo.constants import KEY_VALUES, PUBLIC_PARTITIONS
+from csvw_eo.metadata_structure import ColumnGroupMetadata, ColumnMetadata
+from csvw_eo.partition_index import IntervalClosed, PartitionIndex
+from csvw_eo.partition_table import PartitionTable
+from csvw_eo.polars_schema import cast_expr
+
+PARQUET_SUFFIX = ".parquet"
+
+
+def csv_header(path: str | Path, separator: str = ",") -> list[str]:
+    """Return the column names of a CSV file (empty for an empty file)."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return next(csv.reader(f, delimiter=separator), [])
+
+
+def _parse_durations(series: pl.Series) -> pl.Series:
+    """Parse durations with pandas, invalid ones becoming null."""
+    return pl.Series(series.name, pd.to_timedelta(series.to_pandas(), errors="coerce")).cast(
+        pl.Duration("us")
+    )
+
+
+def parse_expr(name: str, source: pl.DataType, target: pl.DataType) -> pl.Expr:
+    """
+    Return the expression parsing a column into its datatype, invalid values becoming null.
+
+    Integers must be integral and within the range of their datatype (an
+    ``unsignedByte`` of 300 is invalid); strings are parsed exactly, without
+    going through floats.
+    """
+    column = pl.col(name)
+    if target.is_integer() and source.is_float():
+        return pl.when(column == column.floor()).then(column.cast(target, strict=False)).alias(name)
+    if source == pl.String and isinstance(target, pl.Duration):
+        return column.map_batches(_parse_durations, return_dtype=pl.Duration("us")).cast(target).alias(name)
+    return cast_expr(name, source, target, strict=False).alias(name)
+
+
+def parse_bound(value: Any, target: pl.DataType) -> Any:  # noqa: ANN401
+    """Parse a ``minimum`` or ``maximum`` into the dtype of its column, None if it does not parse."""
+    if value is None:
+        return None
+    bound = pl.DataFrame({"bound": [value]})
+    return bound.select(parse_expr("bound", bound.schema["bound"], target)).item()
+
+
+def as_partition_table(items: Any) -> PartitionTable | None:  # noqa: ANN401
+    """Return partitions or public keys as a PartitionTable, None if there are none."""
+    if not items:
+        return None
+    return items if isinstance(items, PartitionTable) else PartitionTable.from_models(items)
+
+
+@dataclass
+class EntryPartitions:
+    """
+    Indexed partitions and public keys of a column or a column group.
+
+    Attributes
+    ----------
+    columns : list of str
+        Columns of the entry.
+    partitions : PartitionTable, optional
+        Partitions of the entry.
+    keys : PartitionTable, optional
+        Public keys of the entry.
+    exhaustive : list of (str, PartitionIndex)
+        Property (``keyValues`` or ``partitions``) and index of the
+        exhaustive keys and partitions, which every row must belong to.
+    index : PartitionIndex, optional
+        Index of the partitions, or of the keys of an entry without
+        partitions: the groups the contribution bounds apply to.
+
+    """
+
+    columns: list[str]
+    partitions: PartitionTable | None
+    keys: PartitionTable | None
+    exhaustive: list[tuple[str, PartitionIndex]]
+    index: PartitionIndex | None
+
+    @property
+    def grouping(self) -> PartitionTable | None:
+        """Return the partitions (or keys) indexed by ``index``."""
+        return self.partitions if self.partitions is not None else self.keys
+
+    @property
+    def bounds(self) -> tuple[np.ndarray, ...] | None:
+        """Return maxLength, maxGroupsPerUnit and maxContributions of each partition."""
+        return self.partitions.bounds if self.partitions is not None else None
+
+
+def entry_partitions(
+    entry: ColumnMetadata | ColumnGroupMetadata, closed: IntervalClosed = IntervalClosed.LEFT
+) -> EntryPartitions:
+    """
+    Index the partitions and public keys of a column or a column group.
+
+    Parameters
+    ----------
+    entry : ColumnMetadata or ColumnGroupMetadata
+        Column or column group.
+    closed : IntervalClosed, default="left"
+        Whether the partition intervals include their upper bound.
+
+    Returns
+    -------
+    EntryPartitions
+
+    """
+    columns = [entry.name] if isinstance(entry, ColumnMetadata) else list(entry.columns)
+    column = entry.name if isinstance(entry, ColumnMetadata) else None
+    partitions = as_partition_table(entry.partitions)
+    keys = as_partition_table(entry.public_keys_values)
+    partitions_index = PartitionIndex.from_partitions(partitions, column, closed) if partitions else None
+    keys_index = PartitionIndex.from_partitions(keys, column, closed) if keys else None
+
+    exhaustive = []
+    if keys_index is not None and entry.exhaustive_keys:
+        exhaustive.append((KEY_VALUES, keys_index))
+    if partitions_index is not None and entry.exhaustive_partitions:
+        exhaustive.append((PUBLIC_PARTITIONS, partitions_index))
+    return EntryPartitions(
+        columns=columns,
+        partitions=partitions,
+        keys=keys,
+        exhaustive=exhaustive,
+        index=partitions_index if partitions_index is not None else keys_index,
+    )
@@ -0,0 +1,257 @@
+"""
+Incremental reader of CSVW-EO metadata documents.
+
+``json.load`` builds the whole document before any work can start. For very
+large documents, this module walks ``tableSchema.columns`` and
+``additionalInformation`` as an event stream instead: table-level fields,
+columns and column groups are decoded and yielded one at a time, so that at
+most one column (or column group) is held in memory.
+
+Each element is decoded with the C accelerated ``json`` decoder, from a
+buffer refilled by chunks of the file.
+"""
+
+import json
+import re
+from collections.abc import Iterator
+from enum import StrEnum
+from pathlib import Path
+from typing import IO, Any
+
+from csvw_eo.constants import ADD_INFO, COL_LIST, KEY_VALUES, PUBLIC_PARTITIONS, TABLE_SCHEMA
+from csvw_eo.sidecar import resolve_entry_sidecars
+
+# File extensions of the metadata documents of a batch directory
+METADATA_SUFFIXES = (".json", ".jsonld", ".json-ld")
+
+# Number of characters read from the file at a time
+READ_CHUNK_SIZE = 1 << 20
+
+# A value that does not fit in the buffer is decoded again from its start
+# after each read: reading GROWTH_FACTOR times the pending data each time
+# bounds the wasted work to about 1 / (GROWTH_FACTOR - 1) of the value.
+GROWTH_FACTOR = 4
+
+# A token cut by the end of the buffer ("-Infinity", a "\uXXXX" escape, a
+# number exponent) makes the decoder fail at most this many characters before
+# the end. An error further from the end is a syntax error.
+TRUNCATED_TOKEN_LENGTH = 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class MetadataEvent(StrEnum):
+    """Kind of the elements yielded by :func:`iter_metadata_events`."""
+
+    FIELD = "field"  # (key, value) of a table-level entry
+    SCHEMA_FIELD = "schemaField"  # (key, value) of a tableSchema entry other than columns
+    COLUMN = "column"  # column description
+    COLUMN_GROUP = "columnGroup"  # column group description
+
+
+class _JsonStream:
+    """Buffered reader decoding one JSON value at a time from a text file."""
+
+    def __init__(self, fp: IO[str], chunk_size: int) -> None:
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def fill(self) -> None:
+        """Read more of the file, growing with the pending (undecoded) data."""
+        data = self.fp.read(max(self.chunk_size, GROWTH_FACTOR * (len(self.buffer) - self.pos)))
+        self.buffer = self.buffer[self.pos :] + data
+        self.pos = 0
+        self.eof = not data
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ("" at the end of the file)."""
+        while True:
+            match = _WHITESPACE.match(self.buffer, self.pos)
+            self.pos = match.end() if match else self.pos
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos : self.pos + 1]
+            self.fill()
+
+    def expect(self, char: str) -> None:
+        """Consume the next character, which must be char."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in metadata document, found {found or 'end of file'!r}")
+        self.pos += 1
+
+    def truncated(self, error: json.JSONDecodeError) -> bool:
+        """Return True if a decoding error may come from a value cut by the end of the buffer."""
+        # An unterminated string is reported at its start
+        return (
+            error.msg.startswith("Unterminated string")
+            or error.pos >= len(self.buffer) - TRUNCATED_TOKEN_LENGTH
+        )
+
+    def value(self) -> Any:  # noqa: ANN401
+        """Decode the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if self.eof or not self.truncated(e):
+                    raise
+                self.fill()
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and not self.eof and type(obj) in {int, float}:
+                self.fill()
+                continue
+            self.pos = end
+            return obj
+
+    def _iter_container(self, opening: str, closing: str) -> Iterator[None]:
+        self.expect(opening)
+        if self.peek() == closing:
+            self.pos += 1
+            return
+        while True:
+            yield
+            separator = self.peek()
+            self.pos += 1
+            if separator == closing:
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or {closing!r} in metadata document, found {separator!r}")
+
+    def iter_object(self) -> Iterator[str]:
+        """Yield the keys of an object; the caller consumes each value."""
+        for _ in self._iter_container("{", "}"):
+            key = self.value()
+            if not isinstance(key, str):
+                raise ValueError(f"Expected an object key in metadata document, found {key!r}")
+            self.expect(":")
+            yield key
+
+    def iter_array(self) -> Iterator[None]:
+        """Yield once per array element; the caller consumes each element."""
+        return self._iter_container("[", "]")
+
+
+def iter_metadata_events(
+    fp: IO[str], chunk_size: int = READ_CHUNK_SIZE
+) -> Iterator[tuple[MetadataEvent, Any]]:
+    """
+    Decode a CSVW-EO document as a stream of events, in document order.
+
+    Parameters
+    ----------
+    fp : file-like
+        Text file handle of the JSON metadata document.
+    chunk_size : int, default=1048576
+        Number of characters read at a time.
+
+    Yields
+    ------
+    tuple[MetadataEvent, Any]
+        ``(FIELD, (key, value))`` for table-level entries,
+        ``(SCHEMA_FIELD, (key, value))`` for other entries of ``tableSchema``,
+        ``(COLUMN, dict)`` for each column and ``(COLUMN_GROUP, dict)`` for
+        each entry of ``additionalInformation``.
+
+    Raises
+    ------
+    ValueError
+        If the document is not valid JSON or not a JSON object.
+
+    """
+    stream = _JsonStream(fp, chunk_size)
+    for key in stream.iter_object():
+        if key == TABLE_SCHEMA:
+            for schema_key in stream.iter_object():
+                if schema_key == COL_LIST:
+                    for _ in stream.iter_array():
+                        yield MetadataEvent.COLUMN, stream.value()
+                else:
+                    yield MetadataEvent.SCHEMA_FIELD, (schema_key, stream.value())
+        elif key == ADD_INFO:
+            for _ in stream.iter_array():
+                yield MetadataEvent.COLUMN_GROUP, stream.value()
+        else:
+            yield MetadataEvent.FIELD, (key, stream.value())
+
+    if stream.peek():
+        raise ValueError("Extra data after the metadata document")
+
+
+def iter_metadata(path: str | Path, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[tuple[MetadataEvent, Any]]:
+    """
+    Stream the events of a CSVW-EO metadata file.
+
+    Same as :func:`iter_metadata_events`, with the sidecar references of
+    columns and column groups resolved as in :func:`csvw_eo.sidecar.read_metadata`.
+
+    Parameters
+    ----------
+    path : str or Path
+        JSON metadata file.
+    chunk_size : int, default=1048576
+        Number of characters read at a time.
+
+    Yields
+    ------
+    tuple[MetadataEvent, Any]
+
+    """
+    path = Path(path)
+    with path.open("r", encoding="utf-8") as f:
+        for event, value in iter_metadata_events(f, chunk_size):
+            if event in {MetadataEvent.COLUMN, MetadataEvent.COLUMN_GROUP}:
+                resolve_entry_sidecars(value, path.parent)
+            yield event, value
+
+
+def read_metadata_headers(path: str | Path, chunk_size: int = READ_CHUNK_SIZE) -> dict[str, Any]:
+    """
+    Read a CSVW-EO metadata file without its partition and key lists.
+
+    Partitions and keys are dropped as each column or column group is
+    decoded, so memory use is bounded by the largest column, not by the
+    document. The result suits consumers of table and column level fields,
+    such as the SmartNoise SQL converter.
+
+    Parameters
+    ----------
+    path : str or Path
+        JSON metadata file.
+    chunk_size : int, default=1048576
+        Number of characters read at a time.
+
+    Returns
+    -------
+    dict
+        CSVW-EO metadata structure, without ``partitions`` and ``keyValues``.
+
+    """
+    metadata: dict[str, Any] = {}
+    schema: dict[str, Any] = {COL_LIST: []}
+    for event, value in iter_metadata(path, chunk_size):
+        if event == MetadataEvent.FIELD:
+            metadata[value[0]] = value[1]
+        elif event == MetadataEvent.SCHEMA_FIELD:
+            schema[value[0]] = value[1]
+        else:
+            value.pop(PUBLIC_PARTITIONS, None)
+            value.pop(KEY_VALUES, None)
+            if event == MetadataEvent.COLUMN:
+                schema[COL_LIST].append(value)
+            else:
+                metadata.setdefault(ADD_INFO, []).append(value)
+    metadata[TABLE_SCHEMA] = schema
+    return metadata
+
+
+def metadata_files(directory: str | Path) -> list[Path]:
+    """Return the metadata documents of a directory (see ``METADATA_SUFFIXES``), sorted."""
+    return sorted(
+        path for path in Path(directory).iterdir() if path.is_file() and path.suffix in METADATA_SUFFIXES
+    )
@@ -1,11 +1,90 @@
 """Pydantic models for CSVW-EO metadata structure."""
 
-from typing import Any, Union
+from collections.abc import Callable, Iterator, Sequence
+from functools import partial
+from typing import Annotated, Any, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, BeforeValidator, Field, NonNegativeInt
 
 from csvw_eo import constants as c
 from csvw_eo.datatypes import DataTypes
+from csvw_eo.partition_index import IntervalClosed, PartitionIndex
+from csvw_eo.partition_table import LazyPartitionTable, PartitionSidecar, PartitionTable
+from csvw_eo.utils import to_native
+
+# Free-typed values are coerced to native Python types at construction, so
+# that serialization does not need a second pass over the structure.
+NativeValue = Annotated[Any, BeforeValidator(to_native)]
+
+# Builds the lists of to_dict outputs. ``list`` by default; a lazy collector
+# lets a streaming serializer encode large partition lists element by element.
+Collector = Callable[[Iterator[Any]], Any]
+
+
+def iter_partition_dicts(items: Sequence[Any]) -> Iterator[Any]:
+    """Yield the CSVW-EO JSON of partitions or keys, stored as models or as a PartitionTable."""
+    if isinstance(items, PartitionTable):
+        return items.iter_dicts()
+    return (item.to_dict() for item in items)
+
+
+def parse_partition_list(  # noqa: PLR0913
+    raw: Any,  # noqa: ANN401
+    parse_item: Callable[[Any], Any],
+    *,
+    multi_column: bool,
+    with_bounds: bool,
+    columnar: bool,
+    lazy: bool,
+) -> list[Any] | PartitionTable | None:
+    """
+    Parse the ``partitions`` or ``keyValues`` list of a column or a column group.
+
+    Parameters
+    ----------
+    raw : list or PartitionSidecar, optional
+        Content of the list in the CSVW-EO JSON.
+    parse_item : callable
+        ``from_dict`` of the partition or key model.
+    multi_column : bool
+        True for the partitions or keys of a column group.
+    with_bounds : bool
+        True for partitions, False for public keys.
+    columnar : bool
+        If True, the list is stored in a PartitionTable.
+    lazy : bool
+        If True, the list is stored in a PartitionTable parsed on first access.
+
+    Returns
+    -------
+    list, PartitionTable or None
+
+    """
+    if isinstance(raw, PartitionSidecar):
+        return raw.table
+    if not raw:
+        return None
+    if lazy:
+        return LazyPartitionTable(
+            partial(PartitionTable.from_dicts, raw, multi_column=multi_column, with_bounds=with_bounds)
+        )
+    if columnar:
+        return PartitionTable.from_dicts(raw, multi_column=multi_column, with_bounds=with_bounds)
+    return [parse_item(item) for item in raw]
+
+
+def validate_partition_list(items: Sequence[Any] | None, deep: bool) -> None:
+    """
+    Parse the partitions or keys of a lazy PartitionTable.
+
+    Lists of models are already validated. A PartitionTable is loaded, which
+    checks its structure; with deep, every partition or key model is also
+    built, which validates each field.
+    """
+    if isinstance(items, LazyPartitionTable):
+        items.load()
+    if deep and isinstance(items, PartitionTable):
+        items.check_models()
 
 
 class Dependency(BaseModel):
@@ -18,7 +97,7 @@ class Dependency(BaseModel):
 
     depends_on: str
     dependency_type: c.DependencyType
-    value_map: dict[Any, Any] | None = None
+    value_map: Annotated[dict[Any, Any] | None, BeforeValidator(to_native)] = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert the dependency to a CSVW-EO compliant dictionary."""
@@ -45,7 +124,7 @@ class Dependency(BaseModel):
 class CategoricalPredicate(BaseModel):
     """Predicate describing how a categorical partition is defined."""
 
-    partition_value: Any | None
+    partition_value: NativeValue
 
     def to_dict(self) -> dict[str, Any]:
         """Convert the predicate into CSVW-EO JSON format."""
@@ -60,8 +139,8 @@ class CategoricalPredicate(BaseModel):
 class ContinuousPredicate(BaseModel):
     """Predicate describing how a continuous partition is defined."""
 
-    lower_bound: float | str | None  # TODO type
-    upper_bound: float | str | None
+    lower_bound: Annotated[float | str | None, BeforeValidator(to_native)]  # TODO type
+    upper_bound: Annotated[float | str | None, BeforeValidator(to_native)]
 
     def to_dict(self) -> dict[str, Any]:
         """Convert the predicate into CSVW-EO JSON format."""
@@ -96,9 +175,9 @@ class Partition(BaseModel):
     Partitions define how data is grouped when enforcing privacy constraints.
     """
 
-    max_length: int
-    max_groups_per_unit: int
-    max_contributions: int
+    max_length: NonNegativeInt
+    max_groups_per_unit: NonNegativeInt
+    max_contributions: NonNegativeInt
 
     def _predicate_to_dict(self) -> dict[str, Any]:
         """Serialize the predicate component."""
@@ -221,24 +300,28 @@ class MultiColumnKeys(BaseModel):
 
 
 def full_partition_to_key_single(
-    partitions: list[SingleColumnPartition],
-) -> list[SingleColumnKey]:
+    partitions: list[SingleColumnPartition] | PartitionTable,
+) -> list[SingleColumnKey] | PartitionTable:
     """
     Convert a list of SingleColumnPartition to SingleColumnKey,.
 
     keeping only predicate information.
     """
+    if isinstance(partitions, PartitionTable):
+        return partitions.keys()
     return [SingleColumnKey(predicate=p.predicate) for p in partitions]
 
 
 def full_partition_to_key_multi(
-    partitions: list[MultiColumnPartition],
-) -> list[MultiColumnKeys]:
+    partitions: list[MultiColumnPartition] | PartitionTable,
+) -> list[MultiColumnKeys] | PartitionTable:
     """
     Convert a list of MultiColumnPartition to MultiColumnKeys,.
 
     keeping only predicate information.
     """
+    if isinstance(partitions, PartitionTable):
+        return partitions.keys()
     return [MultiColumnKeys(predicate=p.predicate) for p in partitions]
 
 
@@ -254,24 +337,37 @@ class ColumnMetadata(BaseModel):
 
     dependencies: list[Dependency] = Field(default_factory=list)
 
-    minimum: Any | None = None
-    maximum: Any | None = None
+    minimum: NativeValue = None
+    maximum: NativeValue = None
 
     max_length: int | None = None
     max_groups_per_unit: int | None = None
     max_contributions: int | None = None
 
-    partitions: list[SingleColumnPartition] | None = None
+    partitions: list[SingleColumnPartition] | PartitionTable | None = None
     exhaustive_partitions: bool | None = None
 
-    public_keys_values: list[SingleColumnKey] | None = None
+    public_keys_values: list[SingleColumnKey] | PartitionTable | None = None
     exhaustive_keys: bool | None = None
     invariant_public_keys: bool | None = None
 
     max_num_partitions: int | None = None
 
-    def to_dict(self) -> dict[str, Any]:  # noqa: PLR0912
-        """Convert the column metadata to CSVW-EO JSON format."""
+    def to_dict(self, collect: Collector = list) -> dict[str, Any]:  # noqa: PLR0912
+        """
+        Convert the column metadata to CSVW-EO JSON format.
+
+        Parameters
+        ----------
+        collect : callable, default=list
+            Applied to the generators of partitions and public keys.
+
+        Returns
+        -------
+        dict
+            CSVW-EO column description.
+
+        """
         d: dict[str, Any] = {
             "@type": c.COL_TYPE,
             c.COL_NAME: self.name,
@@ -299,13 +395,13 @@ class ColumnMetadata(BaseModel):
             d[c.MAXIMUM] = self.maximum
 
         if self.partitions is not None:
-            d[c.PUBLIC_PARTITIONS] = [p.to_dict() for p in self.partitions]
+            d[c.PUBLIC_PARTITIONS] = collect(iter_partition_dicts(self.partitions))
 
         if self.exhaustive_partitions is not None:
             d[c.EXHAUSTIVE_PARTITIONS] = self.exhaustive_partitions
 
         if self.public_keys_values is not None:
-            d[c.KEY_VALUES] = [p.to_dict() for p in self.public_keys_values]
+            d[c.KEY_VALUES] = collect(iter_partition_dicts(self.public_keys_values))
 
         if self.invariant_public_keys is not None:
             d[c.INVARIANT_PUBLIC_KEYS] = self.invariant_public_keys
@@ -328,7 +424,7 @@ class ColumnMetadata(BaseModel):
         return d
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "ColumnMetadata":
+    def from_dict(cls, data: dict[str, Any], columnar: bool = False, lazy: bool = False) -> "ColumnMetadata":
         """
         Parse column metadata from CSVW-EO JSON.
 
@@ -336,6 +432,10 @@ class ColumnMetadata(BaseModel):
         ----------
         data : dict
             Dictionary containing the serialized column metadata.
+        columnar : bool, default=False
+            If True, partitions and public keys are stored in PartitionTables.
+        lazy : bool, default=False
+            If True, partitions and public keys are parsed on first access.
 
         Returns
         -------
@@ -362,13 +462,22 @@ class ColumnMetadata(BaseModel):
             invariant_public_keys=data.get(c.INVARIANT_PUBLIC_KEYS),
         )
 
-        raw_partitions = data.get(c.PUBLIC_PARTITIONS)
-        raw_public_keys_values = data.get(c.KEY_VALUES)
-
-        if raw_partitions:
-            col_metadata.partitions = [SingleColumnPartition.from_dict(p) for p in raw_partitions]
-        if raw_public_keys_values:
-            col_metadata.public_keys_values = [SingleColumnKey.from_dict(p) for p in raw_public_keys_values]
+        col_metadata.partitions = parse_partition_list(
+            data.get(c.PUBLIC_PARTITIONS),
+            SingleColumnPartition.from_dict,
+            multi_column=False,
+            with_bounds=True,
+            columnar=columnar,
+            lazy=lazy,
+        )
+        col_metadata.public_keys_values = parse_partition_list(
+            data.get(c.KEY_VALUES),
+            SingleColumnKey.from_dict,
+            multi_column=False,
+            with_bounds=False,
+            columnar=columnar,
+            lazy=lazy,
+        )
 
         return col_metadata
 
@@ -379,10 +488,10 @@ class ColumnGroupMetadata(BaseModel):
     columns: list[str]
 
     # one of the two is necessary
-    partitions: list[MultiColumnPartition] | None = None
+    partitions: list[MultiColumnPartition] | PartitionTable | None = None
     exhaustive_partitions: bool | None = None
 
-    public_keys_values: list[MultiColumnKeys] | None = None
+    public_keys_values: list[MultiColumnKeys] | PartitionTable | None = None
     exhaustive_keys: bool | None = None
     invariant_public_keys: bool | None = None
 
@@ -393,21 +502,34 @@ class ColumnGroupMetadata(BaseModel):
     max_groups_per_unit: int | None = None
     max_contributions: int | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        """Serialize the column group metadata."""
+    def to_dict(self, collect: Collector = list) -> dict[str, Any]:
+        """
+        Serialize the column group metadata.
+
+        Parameters
+        ----------
+        collect : callable, default=list
+            Applied to the generators of partitions and public keys.
+
+        Returns
+        -------
+        dict
+            CSVW-EO column group description.
+
+        """
         result: dict[str, Any] = {
             "@type": c.COLUMN_GROUP,
             c.COLUMNS_IN_GROUP: self.columns,
         }
 
         if self.partitions is not None:
-            result[c.PUBLIC_PARTITIONS] = [p.to_dict() for p in self.partitions]
+            result[c.PUBLIC_PARTITIONS] = collect(iter_partition_dicts(self.partitions))
 
         if self.exhaustive_partitions is not None:
             result[c.EXHAUSTIVE_PARTITIONS] = self.exhaustive_partitions
 
         if self.public_keys_values is not None:
-            result[c.KEY_VALUES] = [k.to_dict() for k in self.public_keys_values]
+            result[c.KEY_VALUES] = collect(iter_partition_dicts(self.public_keys_values))
 
         if self.invariant_public_keys is not None:
             result[c.INVARIANT_PUBLIC_KEYS] = self.invariant_public_keys
@@ -430,8 +552,15 @@ class ColumnGroupMetadata(BaseModel):
         return result
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "ColumnGroupMetadata":
-        """Parse grouped column metadata from JSON."""
+    def from_dict(
+        cls, data: dict[str, Any], columnar: bool = False, lazy: bool = False
+    ) -> "ColumnGroupMetadata":
+        """
+        Parse grouped column metadata from JSON.
+
+        If columnar is True, partitions and public keys are stored in PartitionTables.
+        If lazy is True, they are parsed on first access.
+        """
         col_group_metadata = ColumnGroupMetadata(
             columns=data[c.COLUMNS_IN_GROUP],
             max_num_partitions=data.get(c.MAX_NUM_PARTITIONS),
@@ -442,15 +571,22 @@ class ColumnGroupMetadata(BaseModel):
             exhaustive_partitions=data.get(c.EXHAUSTIVE_PARTITIONS),
             invariant_public_keys=data.get(c.INVARIANT_PUBLIC_KEYS),
         )
-        raw_partitions = data.get(c.PUBLIC_PARTITIONS)
-        raw_public_keys_values = data.get(c.KEY_VALUES)
-
-        if raw_partitions:
-            col_group_metadata.partitions = [MultiColumnPartition.from_dict(p) for p in raw_partitions]
-        if raw_public_keys_values:
-            col_group_metadata.public_keys_values = [
-                MultiColumnKeys.from_dict(p) for p in raw_public_keys_values
-            ]
+        col_group_metadata.partitions = parse_partition_list(
+            data.get(c.PUBLIC_PARTITIONS),
+            MultiColumnPartition.from_dict,
+            multi_column=True,
+            with_bounds=True,
+            columnar=columnar,
+            lazy=lazy,
+        )
+        col_group_metadata.public_keys_values = parse_partition_list(
+            data.get(c.KEY_VALUES),
+            MultiColumnKeys.from_dict,
+            multi_column=True,
+            with_bounds=False,
+            columnar=columnar,
+            lazy=lazy,
+        )
 
         return col_group_metadata
 
@@ -470,8 +606,22 @@ class TableMetadata(BaseModel):
 
     table_type: str = c.TABLE_TYPE
 
-    def to_dict(self) -> dict[str, Any]:
-        """Serialize the full metadata object to CSVW-EO JSON."""
+    def to_dict(self, collect: Collector = list) -> dict[str, Any]:
+        """
+        Serialize the full metadata object to CSVW-EO JSON.
+
+        Parameters
+        ----------
+        collect : callable, default=list
+            Applied to the generators of columns, column groups, partitions
+            and public keys. The default builds plain lists.
+
+        Returns
+        -------
+        dict
+            CSVW-EO metadata document.
+
+        """
         d: dict[str, Any] = {
             "@context": self.context,
             "@type": self.table_type,
@@ -479,16 +629,16 @@ class TableMetadata(BaseModel):
             c.MAX_CONTRIB: self.max_contributions,
             c.MAX_LENGTH: self.max_length,
             c.PUBLIC_LENGTH: self.public_length,
-            c.TABLE_SCHEMA: {c.COL_LIST: [col.to_dict() for col in self.columns]},
+            c.TABLE_SCHEMA: {c.COL_LIST: collect(col.to_dict(collect) for col in self.columns)},
         }
 
         if self.column_groups is not None:
-            d[c.ADD_INFO] = [group.to_dict() for group in self.column_groups]
+            d[c.ADD_INFO] = collect(group.to_dict(collect) for group in self.column_groups)
 
         return d
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "TableMetadata":
+    def from_dict(cls, data: dict[str, Any], columnar: bool = False, lazy: bool = False) -> "TableMetadata":
         """
         Parse a CSVW-EO metadata document.
 
@@ -496,6 +646,18 @@ class TableMetadata(BaseModel):
         ----------
         data : dict
             JSON metadata structure.
+        columnar : bool, default=False
+            If True, partitions and public keys are stored in PartitionTables
+            (see :mod:`csvw_eo.partition_table`) instead of lists of models.
+            Partitions and keys stored in sidecar files (``PartitionSidecar``,
+            see :func:`csvw_eo.sidecar.read_metadata`) are always kept in lazy
+            PartitionTables, read only when first accessed.
+        lazy : bool, default=False
+            If True, only table-level fields and column headers are parsed.
+            Each partition or key list is kept in a lazy PartitionTable, parsed
+            on first access and then cached, so that opening a large document
+            does not depend on its number of partitions. ``data`` must not be
+            modified afterwards. Use :meth:`validate` for a full check.
 
         Returns
         -------
@@ -504,11 +666,11 @@ class TableMetadata(BaseModel):
         """
         schema = data[c.TABLE_SCHEMA]
 
-        columns = [ColumnMetadata.from_dict(c) for c in schema[c.COL_LIST]]
+        columns = [ColumnMetadata.from_dict(col, columnar, lazy) for col in schema[c.COL_LIST]]
 
         column_groups = None
         if c.ADD_INFO in data:
-            column_groups = [ColumnGroupMetadata.from_dict(g) for g in data[c.ADD_INFO]]
+            column_groups = [ColumnGroupMetadata.from_dict(g, columnar, lazy) for g in data[c.ADD_INFO]]
 
         return cls(
             privacy_unit=data.get(c.PRIVACY_UNIT),
@@ -520,3 +682,70 @@ class TableMetadata(BaseModel):
             context=data.get("@context", []),
             table_type=data.get("@type", c.TABLE_TYPE),
         )
+
+    def partition_index(
+        self,
+        columns: str | Sequence[str],
+        keys: bool = False,
+        closed: IntervalClosed = IntervalClosed.LEFT,
+    ) -> PartitionIndex:
+        """
+        Build the partition lookup index of a column or a column group.
+
+        Parameters
+        ----------
+        columns : str or sequence of str
+            Column name, or columns of a column group.
+        keys : bool, default=False
+            If True, index the public keys instead of the partitions.
+        closed : IntervalClosed, default="left"
+            Whether intervals include their upper bound. ``"left"`` matches
+            the bins of ``make_metadata_from_data``.
+
+        Returns
+        -------
+        PartitionIndex
+            Index whose ``assign(df)`` returns the partition of each row.
+
+        Raises
+        ------
+        ValueError
+            If no such column or column group exists.
+
+        """
+        entry: ColumnMetadata | ColumnGroupMetadata | None
+        if isinstance(columns, str):
+            entry = next((col for col in self.columns if col.name == columns), None)
+        else:
+            entry = next((g for g in self.column_groups or [] if list(g.columns) == list(columns)), None)
+        if entry is None:
+            raise ValueError(f"No column or column group {columns!r} in the metadata")
+        return PartitionIndex.from_metadata(entry, keys=keys, closed=closed)
+
+    def validate_partitions(self, deep: bool = True) -> "TableMetadata":
+        """
+        Parse the partitions and keys left lazy by ``from_dict(lazy=True)``.
+
+        Parameters
+        ----------
+        deep : bool, default=True
+            If True, every partition and key model is built, which validates
+            each of their fields. Otherwise, the lists are only loaded, which
+            checks their structure and bounds.
+
+        Returns
+        -------
+        TableMetadata
+            The metadata itself.
+
+        Raises
+        ------
+        ValueError
+            If a partition or a key is invalid.
+
+        """
+        entries: list[ColumnMetadata | ColumnGroupMetadata] = [*self.columns, *(self.column_groups or [])]
+        for entry in entries:
+            validate_partition_list(entry.partitions, deep)
+            validate_partition_list(entry.public_keys_values, deep)
+        return self
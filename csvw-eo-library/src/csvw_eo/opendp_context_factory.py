@@ -0,0 +1,311 @@
+"""
+Create OpenDP contexts for the same metadata repeatedly, at a fraction of the cost.
+
+:func:`csvw_eo.csvw_to_opendp_context.csvw_to_opendp_context` rebuilds everything for each context: the
+margins and privacy unit from the metadata dict, the public key frames, the
+data domain with its margins and, by far the most expensive step, the OpenDP
+compositor measurement (tens of milliseconds).
+
+An :class:`OpenDPContextFactory` compiles the margins, privacy unit and
+public keys once per metadata document. The document is identified by the
+``key`` given by the caller, for instance the path and modification time of
+the metadata file, so that a cache hit costs no pass over the document; by
+default, by its content hash (see :func:`csvw_eo.utils.metadata_fingerprint`),
+computed on each call. The factory also keeps the compositor built for each
+dataset schema and budget: new contexts bind it to a fresh LazyFrame, which
+gives them their own queryable and their own privacy budget. Both caches are
+LRU caches with hit and miss counters.
+
+Examples
+--------
+>>> factory = OpenDPContextFactory(maxsize=64)
+>>> key = ("metadata.json", os.stat("metadata.json").st_mtime_ns)
+>>> data = pl.scan_csv("data.csv")
+>>> context = factory.create(metadata, data, key=key, epsilon=1.0, split_evenly_over=2)
+>>> public_keys = factory.public_keys(metadata, data, key=key)
+>>> factory.cache_info()
+
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+import opendp.prelude as dp
+import polars as pl
+from opendp.extras.polars import Margin
+
+from csvw_eo.csvw_to_opendp_context import (
+    cast_public_keys,
+    get_opendp_schema,
+    get_privacy_loss,
+    get_privacy_unit,
+)
+from csvw_eo.csvw_to_opendp_keys import csvw_to_opendp_keys
+from csvw_eo.csvw_to_opendp_margins import csvw_to_opendp_margins
+from csvw_eo.polars_schema import cast_to_schema
+from csvw_eo.utils import metadata_fingerprint
+
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Counters of an LRU cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the proportion of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(Generic[V]):
+    """Thread-safe LRU cache with hit, miss and eviction counters."""
+
+    def __init__(self, maxsize: int) -> None:
+        """Create an empty cache holding at most ``maxsize`` entries."""
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, V] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get_or_create(self, key: Hashable, create: Callable[[], V]) -> V:
+        """Return the entry of a key, created (and inserted) on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self.misses += 1
+
+        # Created outside the lock: concurrent misses on the same key build it twice
+        value = create()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Return the counters of the cache."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, len(self._entries), self.maxsize)
+
+
+@dataclass(frozen=True)
+class CompiledMetadata:
+    """Parts of an OpenDP context that only depend on the metadata."""
+
+    margins: list[Margin]
+    privacy_unit: tuple[Any, Any]
+    key_frames: dict[tuple[str, ...], pl.DataFrame]
+
+
+@dataclass(frozen=True)
+class CompiledCompositor:
+    """Compositor of a context, for one dataset schema and privacy budget."""
+
+    accountant: Any
+    d_mids: list[Any] | None
+    d_out: Any
+
+
+class OpenDPContextFactory:
+    """
+    Create OpenDP contexts from CSVW-EO metadata, with compiled parts cached.
+
+    Parameters
+    ----------
+    maxsize : int, default=32
+        Number of metadata documents, and of compositors, kept in memory.
+
+    """
+
+    def __init__(self, maxsize: int = 32) -> None:
+        """Create a factory with empty caches."""
+        self.metadata_cache: LRUCache[CompiledMetadata] = LRUCache(maxsize)
+        self.compositor_cache: LRUCache[CompiledCompositor] = LRUCache(maxsize)
+
+    def __repr__(self) -> str:
+        """Return a short description of the factory."""
+        return f"OpenDPContextFactory(maxsize={self.metadata_cache.maxsize})"
+
+    def compile(
+        self, csvw_meta: dict[str, Any], distance: str = "contributions", *, key: Hashable | None = None
+    ) -> CompiledMetadata:
+        """
+        Return the margins, privacy unit and public keys of metadata, compiled once.
+
+        Parameters
+        ----------
+        csvw_meta : Dict[str, Any]
+            CSVW-EO metadata dictionary.
+        distance : str, default='contributions'
+            Distance metric for privacy unit.
+        key : Hashable, optional
+            Key of the metadata in the cache, for instance the path and
+            modification time of its file, which must change with the
+            document. By default, the fingerprint of the document, computed
+            on each call.
+
+        Returns
+        -------
+        CompiledMetadata
+
+        Raises
+        ------
+        ValueError
+            If required metadata (max_contributions) is missing.
+
+        """
+        return self._compile(self._key(csvw_meta, key), csvw_meta, distance)
+
+    @staticmethod
+    def _key(csvw_meta: dict[str, Any], key: Hashable | None) -> Hashable:
+        return metadata_fingerprint(csvw_meta) if key is None else ("key", key)
+
+    def _compile(self, key: Hashable, csvw_meta: dict[str, Any], distance: str) -> CompiledMetadata:
+        return self.metadata_cache.get_or_create(
+            (key, distance),
+            lambda: CompiledMetadata(
+                margins=csvw_to_opendp_margins(csvw_meta),
+                privacy_unit=get_privacy_unit(csvw_meta, distance),
+                key_frames=csvw_to_opendp_keys(csvw_meta),
+            ),
+        )
+
+    def public_keys(
+        self,
+        csvw_meta: dict[str, Any],
+        data: pl.LazyFrame,
+        *,
+        key: Hashable | None = None,
+        cast_data: bool = False,
+    ) -> dict[tuple[str, ...], pl.DataFrame]:
+        """
+        Return the public key frames of metadata, as ``get_public_keys`` does.
+
+        The key frames are compiled once per metadata document, then cast to
+        the dtypes of the dataset. The parameters are those of ``create``.
+
+        Returns
+        -------
+        Dict[tuple[str, ...], pl.DataFrame]
+
+        """
+        compiled = self._compile(self._key(csvw_meta, key), csvw_meta, "contributions")
+        schema = data.collect_schema()
+        if cast_data:
+            schema = cast_to_schema(data, get_opendp_schema(csvw_meta)).collect_schema()
+        return cast_public_keys(compiled.key_frames, schema)
+
+    def create(  # noqa: PLR0913
+        self,
+        csvw_meta: dict[str, Any],
+        data: pl.LazyFrame,
+        *,
+        key: Hashable | None = None,
+        epsilon: float | None = None,
+        rho: float | None = None,
+        delta: float | None = None,
+        split_evenly_over: int | None = None,
+        split_by_weights: list[float] | None = None,
+        distance: str = "contributions",
+        cast_data: bool = False,
+    ) -> dp.Context:
+        """
+        Create an OpenDP Context, as ``csvw_to_opendp_context`` does.
+
+        The parameters are those of ``csvw_to_opendp_context``, by keyword
+        after ``data``, and the ``key`` of the metadata in the cache (see
+        ``compile``). Each context has its own queryable and privacy budget,
+        even when its compositor comes from the cache. The public keys are
+        returned by ``public_keys``.
+
+        Returns
+        -------
+        Context
+            OpenDP Context object ready for queries.
+
+        Raises
+        ------
+        ValueError
+            If required metadata (max_contributions) is missing.
+            If neither epsilon nor rho is provided.
+
+        """
+        if split_evenly_over is not None and split_by_weights is not None:
+            raise ValueError("Specify only one of split_evenly_over or split_by_weights")
+
+        metadata_key = self._key(csvw_meta, key)
+        compiled = self._compile(metadata_key, csvw_meta, distance)
+        if cast_data:
+            data = cast_to_schema(data, get_opendp_schema(csvw_meta))
+        schema = data.collect_schema()
+
+        def build() -> CompiledCompositor:
+            kwargs: dict[str, Any] = {
+                "data": data,
+                "privacy_unit": compiled.privacy_unit,
+                "privacy_loss": get_privacy_loss(epsilon, rho, delta),
+                "margins": compiled.margins,
+            }
+            if split_by_weights is not None:
+                kwargs["split_by_weights"] = split_by_weights
+            else:
+                kwargs["split_evenly_over"] = split_evenly_over
+            context = dp.Context.compositor(**kwargs)
+            return CompiledCompositor(
+                accountant=context.accountant,
+                d_mids=None if context.d_mids is None else list(context.d_mids),
+                d_out=context.d_out,
+            )
+
+        weights = None if split_by_weights is None else tuple(split_by_weights)
+        compositor_key = (
+            metadata_key,
+            distance,
+            tuple(schema.items()),
+            epsilon,
+            rho,
+            delta,
+            split_evenly_over,
+            weights,
+        )
+        compositor = self.compositor_cache.get_or_create(compositor_key, build)
+
+        return dp.Context(
+            accountant=compositor.accountant,
+            queryable=compositor.accountant(data),
+            d_in=compiled.privacy_unit[1],
+            d_mids=None if compositor.d_mids is None else list(compositor.d_mids),
+            d_out=compositor.d_out,
+        )
+
+    def cache_info(self) -> dict[str, CacheInfo]:
+        """Return the counters of the metadata and compositor caches."""
+        return {"metadata": self.metadata_cache.info(), "compositor": self.compositor_cache.info()}
+
+    def clear(self) -> None:
+        """Empty both caches."""
+        self.metadata_cache.clear()
+        self.compositor_cache.clear()
@@ -0,0 +1,350 @@
+"""
+Lookup of the partition a value or a row belongs to.
+
+A ``PartitionIndex`` is built once from the partitions (or public keys) of a
+column or a column group, and assigns whole DataFrames to partitions in a few
+vectorized passes, instead of testing each predicate in turn:
+
+- ``partitionValue`` predicates are looked up in a hash index;
+- ``lowerBound`` / ``upperBound`` intervals are located by binary search in
+  their sorted lower edges;
+- for column groups, the per-column codes are combined into a composite key,
+  looked up by binary search in the sorted keys of the partitions.
+
+The intervals of one column must not overlap (as the bins produced by
+``make_metadata_from_data``); they may share an edge. With intervals closed
+on both sides, a value on a shared edge is in both intervals: it is assigned
+to the upper one, or to the lower one if the upper one leaves its row outside
+every partition (for column groups).
+"""
+
+from collections.abc import Sequence
+from enum import StrEnum
+from itertools import product
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from csvw_eo.constants import LOWER_BOUND, PARTITION_VALUE, PREDICATE, UPPER_BOUND
+from csvw_eo.partition_table import PartitionTable
+
+if TYPE_CHECKING:
+    from csvw_eo.metadata_structure import ColumnGroupMetadata, ColumnMetadata
+
+# Partition id of the values and rows outside every partition
+NO_PARTITION = -1
+
+
+class IntervalClosed(StrEnum):
+    """Side(s) on which the intervals of continuous predicates are closed."""
+
+    LEFT = "left"  # [lower, upper), the bins of make_metadata_from_data
+    BOTH = "both"  # [lower, upper]
+
+
+def _lookup(sorted_keys: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Position of each value in sorted_keys, NO_PARTITION if absent."""
+    positions = np.searchsorted(sorted_keys, values)
+    positions[positions == len(sorted_keys)] = 0
+    found = (sorted_keys[positions] == values) if len(sorted_keys) else np.zeros(len(values), dtype=bool)
+    return np.where(found, positions, NO_PARTITION)
+
+
+def _is_datetime(series: pd.Series) -> bool:
+    return bool(pd.api.types.is_datetime64_any_dtype(series.dtype))
+
+
+class _CategoricalColumn:
+    """Hash index of the partition values of one column."""
+
+    def __init__(self, values: list[Any]) -> None:
+        self.codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=False)
+        self.values = pd.Index(uniques, dtype=object)
+        self.size = len(self.values)
+
+    def encode(self, series: pd.Series) -> np.ndarray:
+        index = self.values
+        if _is_datetime(series):
+            index = pd.Index(pd.to_datetime(index, errors="coerce"))
+            index = index.tz_localize(series.dt.tz) if series.dt.tz is not None else index
+        series = series.astype(object) if isinstance(series.dtype, pd.CategoricalDtype) else series
+        return np.asarray(index.get_indexer(series), dtype=np.int64)
+
+
+class _IntervalColumn:
+    """Sorted, disjoint intervals of one column."""
+
+    def __init__(self, lower: list[Any], upper: list[Any], closed: IntervalClosed, column: str) -> None:
+        pairs = pd.Series(list(zip(lower, upper)), dtype=object)
+        codes, uniques = pd.factorize(pairs)
+        bounds = pd.DataFrame(list(uniques), columns=["lower", "upper"], dtype=object)
+        order = np.argsort(self._numeric(bounds["lower"], -np.inf), kind="stable")
+
+        # Codes follow the lower edges, so that a binary search returns them
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        self.codes = rank[codes]
+        self.lower = bounds["lower"].to_numpy()[order]
+        self.upper = bounds["upper"].to_numpy()[order]
+        self.closed = closed
+        self.size = len(order)
+
+        lower_num = self._numeric(pd.Series(self.lower), -np.inf)
+        upper_num = self._numeric(pd.Series(self.upper), np.inf)
+        if np.any(upper_num[:-1] > lower_num[1:]):
+            raise ValueError(f"Overlapping intervals in the partitions of column '{column}'")
+        # Closed intervals sharing an edge both contain it
+        self.shared_edges = closed == IntervalClosed.BOTH and bool(np.any(upper_num[:-1] == lower_num[1:]))
+
+    @staticmethod
+    def _numeric(bounds: pd.Series, fill: float) -> np.ndarray:
+        """Order-preserving float version of the bounds (datetimes as nanoseconds)."""
+        if bounds.map(lambda v: isinstance(v, str)).any():
+            dates = pd.to_datetime(bounds)
+            numeric = dates.to_numpy("datetime64[ns]").astype(np.int64).astype(float)
+            numeric[dates.isna().to_numpy()] = fill
+            return np.asarray(numeric, dtype=float)
+        return np.asarray(pd.to_numeric(bounds).astype(float).fillna(fill), dtype=float)
+
+    def _edges(self, series: pd.Series) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Values and edges in a common comparable representation."""
+        if _is_datetime(series):
+            values = series.dt.tz_localize(None) if series.dt.tz is not None else series
+            return (
+                values.to_numpy(dtype="datetime64[ns]"),
+                pd.to_datetime(pd.Series(self.lower)).fillna(pd.Timestamp.min).to_numpy("datetime64[ns]"),
+                pd.to_datetime(pd.Series(self.upper)).fillna(pd.Timestamp.max).to_numpy("datetime64[ns]"),
+            )
+        return (
+            series.to_numpy(dtype=float, na_value=np.nan),
+            self._numeric(pd.Series(self.lower), -np.inf),
+            self._numeric(pd.Series(self.upper), np.inf),
+        )
+
+    def encode(self, series: pd.Series) -> np.ndarray:
+        values, lower, upper = self._edges(series)
+        positions = np.searchsorted(lower, values, side="right") - 1
+        candidate = np.maximum(positions, 0)
+        if self.closed == IntervalClosed.LEFT:
+            inside = values < upper[candidate]
+        else:
+            inside = values <= upper[candidate]
+        return np.where((positions >= 0) & inside, positions, NO_PARTITION).astype(np.int64)
+
+    def encode_lower(self, series: pd.Series) -> np.ndarray:
+        """Interval ending at each value, for values on the edge of the next interval (else NO_PARTITION)."""
+        values, lower, upper = self._edges(series)
+        positions = np.searchsorted(lower, values, side="right") - 1
+        candidate = np.maximum(positions - 1, 0)
+        shared = (positions >= 1) & (values == lower[np.maximum(positions, 0)]) & (values == upper[candidate])
+        return np.where(shared, positions - 1, NO_PARTITION).astype(np.int64)
+
+
+def _is_interval(predicate: Any) -> bool:  # noqa: ANN401
+    return isinstance(predicate, dict) and PARTITION_VALUE not in predicate
+
+
+def _partition_value(predicate: Any) -> Any:  # noqa: ANN401
+    return predicate[PARTITION_VALUE] if isinstance(predicate, dict) else predicate
+
+
+class PartitionIndex:
+    """
+    Vectorized assignment of rows to the partitions of a column or a column group.
+
+    Parameters
+    ----------
+    predicates : sequence of dict
+        One predicate per partition, in CSVW-EO JSON format, mapping each
+        column name to ``{"partitionValue": ...}``, to
+        ``{"lowerBound": ..., "upperBound": ...}`` or to a bare value.
+    closed : IntervalClosed, default="left"
+        Whether intervals include their upper bound.
+
+    Raises
+    ------
+    ValueError
+        If the partitions do not all constrain the same columns, if a column
+        mixes values and intervals, or if the intervals of a column overlap.
+
+    """
+
+    def __init__(
+        self, predicates: Sequence[dict[str, Any]], closed: IntervalClosed = IntervalClosed.LEFT
+    ) -> None:
+        """Build the per-column indexes and the composite keys of the partitions."""
+        self.closed = IntervalClosed(closed)
+        self.columns: tuple[str, ...] = tuple(predicates[0]) if predicates else ()
+        self._length = len(predicates)
+        if any(len(p) != len(self.columns) or any(col not in p for col in self.columns) for p in predicates):
+            raise ValueError(f"All partitions of the index must constrain the columns {list(self.columns)}")
+
+        self._encoders: list[_CategoricalColumn | _IntervalColumn] = []
+        for col in self.columns:
+            column_predicates = [p[col] for p in predicates]
+            interval = [_is_interval(p) for p in column_predicates]
+            if all(interval):
+                self._encoders.append(
+                    _IntervalColumn(
+                        [p.get(LOWER_BOUND) for p in column_predicates],
+                        [p.get(UPPER_BOUND) for p in column_predicates],
+                        self.closed,
+                        col,
+                    )
+                )
+            elif not any(interval):
+                self._encoders.append(_CategoricalColumn([_partition_value(p) for p in column_predicates]))
+            else:
+                raise ValueError(f"Column '{col}' mixes partition values and intervals")
+
+        # Composite keys, narrowed after each column to the combinations of the partitions
+        self._prefixes: list[np.ndarray] = []
+        keys = np.zeros(self._length, dtype=np.int64)
+        for encoder in self._encoders:
+            prefixes = np.unique(keys)
+            self._prefixes.append(prefixes)
+            keys = np.searchsorted(prefixes, keys) * encoder.size + encoder.codes
+        # First declared partition of each key
+        self._keys, self._partition_ids = np.unique(keys, return_index=True)
+
+    @classmethod
+    def from_partitions(
+        cls,
+        items: Sequence[Any],
+        column: str | None = None,
+        closed: IntervalClosed = IntervalClosed.LEFT,
+    ) -> "PartitionIndex":
+        """
+        Build the index of a ``partitions`` or ``keyValues`` list.
+
+        Parameters
+        ----------
+        items : sequence
+            Partitions or public keys, as pydantic models, as a PartitionTable
+            or in CSVW-EO JSON format.
+        column : str, optional
+            Column name, required for the partitions or keys of a single column.
+        closed : IntervalClosed, default="left"
+            Whether intervals include their upper bound.
+
+        Returns
+        -------
+        PartitionIndex
+
+        """
+        if isinstance(items, PartitionTable):
+            dicts: Sequence[Any] = items.to_dicts()
+        else:
+            # Pydantic models, or already CSVW-EO JSON
+            dicts = [item.to_dict() if hasattr(item, "to_dict") else item for item in items]
+        predicates = [d[PREDICATE] if isinstance(d, dict) and PREDICATE in d else d for d in dicts]
+        if column is not None:
+            predicates = [{column: p} for p in predicates]
+        return cls(predicates, closed=closed)
+
+    @classmethod
+    def from_metadata(
+        cls,
+        metadata: "ColumnMetadata | ColumnGroupMetadata",
+        keys: bool = False,
+        closed: IntervalClosed = IntervalClosed.LEFT,
+    ) -> "PartitionIndex":
+        """
+        Build the index of the partitions (or public keys) of a column or a column group.
+
+        Parameters
+        ----------
+        metadata : ColumnMetadata or ColumnGroupMetadata
+            Column or column group.
+        keys : bool, default=False
+            If True, index the public keys instead of the partitions.
+        closed : IntervalClosed, default="left"
+            Whether intervals include their upper bound.
+
+        Returns
+        -------
+        PartitionIndex
+
+        """
+        items = metadata.public_keys_values if keys else metadata.partitions
+        column = getattr(metadata, "name", None)
+        return cls.from_partitions(items or [], column=column, closed=closed)
+
+    def __len__(self) -> int:
+        """Return the number of indexed partitions."""
+        return self._length
+
+    def __repr__(self) -> str:
+        """Return a short description of the index."""
+        return f"PartitionIndex({self._length} partitions, columns={list(self.columns)})"
+
+    def assign(self, data: pd.DataFrame | pd.Series) -> np.ndarray:
+        """
+        Return the partition of each row.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame or pandas.Series
+            Rows with the indexed columns (a Series for a single column).
+
+        Returns
+        -------
+        numpy.ndarray
+            Position in the partition list of the partition of each row
+            (the first one for duplicated partitions), ``NO_PARTITION`` (-1)
+            for rows outside every partition.
+
+        """
+        if isinstance(data, pd.Series):
+            data = data.to_frame(self.columns[0] if self.columns else data.name)
+        if not self._length:
+            return np.full(len(data), NO_PARTITION, dtype=np.int64)
+
+        codes = [encoder.encode(data[col]) for col, encoder in zip(self.columns, self._encoders)]
+        partitions = self._lookup_codes(codes)
+
+        lower_codes = {
+            i: encoder.encode_lower(data[col])
+            for i, (col, encoder) in enumerate(zip(self.columns, self._encoders))
+            if isinstance(encoder, _IntervalColumn) and encoder.shared_edges
+        }
+        if lower_codes:
+            self._assign_shared_edges(partitions, codes, lower_codes)
+        return partitions
+
+    def _assign_shared_edges(
+        self, partitions: np.ndarray, codes: list[np.ndarray], lower_codes: dict[int, np.ndarray]
+    ) -> None:
+        """
+        Look up again the unassigned rows with values on an edge shared by two closed intervals.
+
+        A value on a shared edge is first assigned to the upper interval. The
+        rows it leaves outside every partition are tried with each
+        combination of upper and lower intervals of these columns, in place.
+        """
+        shared = np.any([c >= 0 for c in lower_codes.values()], axis=0)
+        rows = np.flatnonzero(shared & (partitions < 0))
+        for choice in product((False, True), repeat=len(lower_codes)):
+            swapped = {i for i, use in zip(lower_codes, choice) if use}
+            if not swapped or not len(rows):
+                continue
+            combination = [lower_codes[i] if i in swapped else c for i, c in enumerate(codes)]
+            partitions[rows] = self._lookup_codes([c[rows] for c in combination])
+            rows = rows[partitions[rows] < 0]
+
+    def _lookup_codes(self, codes: list[np.ndarray]) -> np.ndarray:
+        """Return the partition of each combination of per-column codes."""
+        keys = np.zeros(len(codes[0]), dtype=np.int64)
+        for encoder, prefixes, column_codes in zip(self._encoders, self._prefixes, codes):
+            prefix = _lookup(prefixes, keys)
+            keys = np.where(
+                (prefix >= 0) & (column_codes >= 0), prefix * encoder.size + column_codes, NO_PARTITION
+            )
+
+        positions = _lookup(self._keys, keys)
+        return np.where(positions >= 0, self._partition_ids[np.maximum(positions, 0)], NO_PARTITION)
+
+    def contains(self, data: pd.DataFrame | pd.Series) -> np.ndarray:
+        """Return a boolean mask of the rows inside one of the partitions."""
+        return self.assign(data) >= 0
@@ -0,0 +1,706 @@
+"""
+Columnar (struct-of-arrays) representation of partitions and public keys.
+
+``ColumnMetadata`` and ``ColumnGroupMetadata`` store their partitions and
+public keys as lists of pydantic objects, one per partition, each holding a
+nested predicate model. For millions of keys this takes gigabytes of memory
+and seconds to build. A ``PartitionTable`` stores the same information as
+NumPy arrays: one array per predicate field of each column, plus one array
+per contribution bound (``max_length``, ``max_groups_per_unit`` and
+``max_contributions``) for partitions.
+
+A ``PartitionTable`` can be used wherever a list of partitions or keys is
+accepted by the metadata models. It behaves as a read-only sequence of the
+corresponding models (``SingleColumnPartition``, ``MultiColumnPartition``,
+``SingleColumnKey`` or ``MultiColumnKeys``), built on access, and serializes
+to the same CSVW-EO JSON. It converts to and from Arrow tables.
+
+Partition tables can be stored in Arrow IPC or Parquet sidecar files, which
+are read memory-mapped. ``LazyPartitionTable`` and ``PartitionSidecar`` defer
+the read until the partitions are first accessed.
+"""
+
+import json
+import math
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, overload
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pydantic import GetCoreSchemaHandler, NonNegativeInt, TypeAdapter
+from pydantic_core import core_schema
+
+from csvw_eo import constants as c
+
+if TYPE_CHECKING:
+    from csvw_eo.metadata_structure import (
+        MultiColumnKeys,
+        MultiColumnPartition,
+        Predicate,
+        SingleColumnKey,
+        SingleColumnPartition,
+    )
+
+BOUND_FIELDS = (c.MAX_LENGTH, c.MAX_GROUPS, c.MAX_CONTRIB)
+
+# Validates the contribution bounds that are not numbers, as the partition models do
+_COUNTS_ADAPTER: TypeAdapter[list[int]] = TypeAdapter(list[NonNegativeInt])
+
+# Arrow schema metadata key holding the group columns of a multi-column table
+ARROW_COLUMNS_KEY = b"csvw_eo.columns"
+
+
+def _check_finite(array: np.ndarray) -> np.ndarray:
+    if not np.isfinite(array).all():
+        raise ValueError("Value in Nan or infinite")
+    return array
+
+
+def value_array(values: Sequence[Any]) -> np.ndarray:
+    """
+    Store categorical partition values in the most compact NumPy array.
+
+    Integers, floats and booleans get a typed array, everything else (strings,
+    None, mixed types) an object array, so that values round-trip unchanged.
+    """
+    kind = pd.api.types.infer_dtype(values, skipna=False)
+    if kind == "integer":
+        try:
+            return np.asarray(values, dtype=np.int64)
+        except OverflowError:
+            return np.asarray(values, dtype=object)
+    if kind == "floating":
+        return _check_finite(np.asarray(values, dtype=np.float64))
+    if kind == "boolean":
+        return np.asarray(values, dtype=np.bool_)
+    array = np.empty(len(values), dtype=object)
+    array[:] = list(values)
+    return array
+
+
+def bound_array(values: Sequence[Any]) -> np.ndarray:
+    """
+    Store interval bounds in a NumPy array.
+
+    Numeric bounds are floats (as in ``ContinuousPredicate``), datetime bounds
+    (ISO strings) or missing bounds use an object array.
+    """
+    kind = pd.api.types.infer_dtype(values, skipna=False)
+    if kind in {"integer", "floating", "mixed-integer-float"}:
+        return _check_finite(np.asarray(values, dtype=np.float64))
+    array = np.empty(len(values), dtype=object)
+    array[:] = [float(v) if isinstance(v, int) and not isinstance(v, bool) else v for v in values]
+    if any(isinstance(v, float) and not math.isfinite(v) for v in array):
+        raise ValueError("Value in Nan or infinite")
+    return array
+
+
+def count_array(values: Sequence[Any], field: str) -> np.ndarray:
+    """
+    Store contribution bounds in an int64 NumPy array.
+
+    As in the partition models, bounds must be non-negative integers; floats
+    are accepted only without a fractional part (``3.0``).
+    """
+    kind = pd.api.types.infer_dtype(values, skipna=False)
+    if kind == "integer":
+        array = np.asarray(values, dtype=np.int64)
+    elif kind in {"floating", "mixed-integer-float", "boolean"}:
+        floats = np.asarray(values, dtype=np.float64)
+        fractional = ~np.isfinite(floats) | (floats != np.floor(floats))
+        if fractional.any():
+            raise ValueError(f"{field} must be an integer, got {floats[fractional][0]}")
+        array = floats.astype(np.int64)
+    else:
+        array = np.asarray(_COUNTS_ADAPTER.validate_python(list(values)), dtype=np.int64)
+    if (array < 0).any():
+        raise ValueError(f"{field} must be non-negative, got {array.min()}")
+    return array
+
+
+@dataclass(frozen=True)
+class PredicateColumn:
+    """
+    Predicates of one column, as arrays.
+
+    Categorical predicates have ``values``, continuous predicates have
+    ``lower`` and ``upper``.
+    """
+
+    values: np.ndarray | None = None
+    lower: np.ndarray | None = None
+    upper: np.ndarray | None = None
+
+    def __post_init__(self) -> None:
+        """Check that the column is either categorical or continuous."""
+        if (self.values is None) == (self.lower is None or self.upper is None):
+            raise ValueError("A predicate column needs either values or lower and upper bounds")
+
+    @property
+    def is_categorical(self) -> bool:
+        """Return True for categorical predicates."""
+        return self.values is not None
+
+    def __len__(self) -> int:
+        """Return the number of predicates."""
+        array = self.values if self.values is not None else self.lower
+        return len(array)  # type: ignore[arg-type]
+
+    def take(self, index: slice | np.ndarray) -> "PredicateColumn":
+        """Return a subset of the predicates."""
+        if self.values is not None:
+            return PredicateColumn(values=self.values[index])
+        return PredicateColumn(lower=self.lower[index], upper=self.upper[index])  # type: ignore[index]
+
+    def iter_dicts(self) -> Iterator[dict[str, Any]]:
+        """Yield the predicates in CSVW-EO JSON format."""
+        if self.values is not None:
+            return ({c.PARTITION_VALUE: v} for v in self.values.tolist())
+        return (
+            {c.LOWER_BOUND: lower, c.UPPER_BOUND: upper}
+            for lower, upper in zip(self.lower.tolist(), self.upper.tolist())  # type: ignore[union-attr]
+        )
+
+    def iter_models(self) -> Iterator["Predicate"]:
+        """Yield the predicates as pydantic models."""
+        from csvw_eo.metadata_structure import (  # noqa: PLC0415
+            CategoricalPredicate,
+            ContinuousPredicate,
+        )
+
+        if self.values is not None:
+            return (CategoricalPredicate(partition_value=v) for v in self.values.tolist())
+        return (
+            ContinuousPredicate(lower_bound=lower, upper_bound=upper)
+            for lower, upper in zip(self.lower.tolist(), self.upper.tolist())  # type: ignore[union-attr]
+        )
+
+    @classmethod
+    def from_dicts(cls, predicates: Sequence[dict[str, Any]]) -> "PredicateColumn":
+        """Build the column from predicates in CSVW-EO JSON format."""
+        if not predicates or c.PARTITION_VALUE in predicates[0]:
+            return cls(values=value_array([p[c.PARTITION_VALUE] for p in predicates]))
+        return cls(
+            lower=bound_array([p[c.LOWER_BOUND] for p in predicates]),
+            upper=bound_array([p[c.UPPER_BOUND] for p in predicates]),
+        )
+
+    def to_arrow(self) -> pa.StructArray:
+        """Convert the predicates to an Arrow struct array."""
+        if self.values is not None:
+            return pa.StructArray.from_arrays([pa.array(self.values)], names=[c.PARTITION_VALUE])
+        return pa.StructArray.from_arrays(
+            [pa.array(self.lower), pa.array(self.upper)], names=[c.LOWER_BOUND, c.UPPER_BOUND]
+        )
+
+    @classmethod
+    def from_arrow(cls, array: pa.StructArray | pa.ChunkedArray) -> "PredicateColumn":
+        """Build the column from an Arrow struct array."""
+        if isinstance(array, pa.ChunkedArray):
+            array = array.combine_chunks()
+        names = [array.type.field(i).name for i in range(array.type.num_fields)]
+        fields = {name: array.field(name) for name in names}
+        if c.PARTITION_VALUE in fields:
+            return cls(values=value_array(fields[c.PARTITION_VALUE].to_pylist()))
+        return cls(
+            lower=bound_array(fields[c.LOWER_BOUND].to_pylist()),
+            upper=bound_array(fields[c.UPPER_BOUND].to_pylist()),
+        )
+
+
+class PartitionTable(Sequence[Any]):
+    """
+    Columnar partitions or public keys of a column or a column group.
+
+    Parameters
+    ----------
+    predicates : PredicateColumn or dict[str, PredicateColumn]
+        Predicates of a single column, or of each column of a group.
+    max_length, max_groups_per_unit, max_contributions : numpy.ndarray, optional
+        Contribution bounds of each partition. Either all or none of them:
+        without bounds, the table holds public keys.
+
+    """
+
+    def __init__(
+        self,
+        predicates: PredicateColumn | dict[str, PredicateColumn],
+        max_length: np.ndarray | None = None,
+        max_groups_per_unit: np.ndarray | None = None,
+        max_contributions: np.ndarray | None = None,
+    ) -> None:
+        """Build the table and check that all arrays have the same length."""
+        self.columns: tuple[str, ...] | None = None
+        if isinstance(predicates, PredicateColumn):
+            self.predicates: tuple[PredicateColumn, ...] = (predicates,)
+        else:
+            self.columns = tuple(predicates)
+            self.predicates = tuple(predicates.values())
+
+        bounds = (max_length, max_groups_per_unit, max_contributions)
+        if any(b is None for b in bounds) and any(b is not None for b in bounds):
+            raise ValueError("Either all or none of the contribution bounds must be given")
+        self.bounds: tuple[np.ndarray, ...] | None = (
+            None if max_length is None else tuple(np.asarray(b, dtype=np.int64) for b in bounds)
+        )
+
+        lengths = {len(p) for p in self.predicates} | {len(b) for b in self.bounds or ()}
+        if len(lengths) > 1:
+            raise ValueError(f"All arrays of a PartitionTable must have the same length, got {lengths}")
+        self._length = lengths.pop() if lengths else 0
+
+    # ------------------------------------------------------------
+    # Properties
+    # ------------------------------------------------------------
+    @property
+    def is_multi_column(self) -> bool:
+        """Return True for partitions of a column group."""
+        return self.columns is not None
+
+    @property
+    def has_bounds(self) -> bool:
+        """Return True for partitions with contribution bounds, False for keys."""
+        return self.bounds is not None
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the arrays (object arrays only count references)."""
+        arrays = [a for p in self.predicates for a in (p.values, p.lower, p.upper) if a is not None]
+        return sum(a.nbytes for a in [*arrays, *(self.bounds or ())])
+
+    # ------------------------------------------------------------
+    # Sequence API
+    # ------------------------------------------------------------
+    def __len__(self) -> int:
+        """Return the number of partitions."""
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...  # noqa: ANN401
+
+    @overload
+    def __getitem__(self, index: slice) -> "PartitionTable": ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """Return one partition as a model, or a slice as a PartitionTable."""
+        if isinstance(index, slice):
+            return self.take(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PartitionTable index out of range")
+        return next(iter(self.take(slice(index, index + 1))))
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the partitions as pydantic models."""
+        from csvw_eo.metadata_structure import (  # noqa: PLC0415
+            MultiColumnKeys,
+            MultiColumnPartition,
+            SingleColumnKey,
+            SingleColumnPartition,
+        )
+
+        predicates = self._iter_predicate_models()
+
+        if self.bounds is None:
+            if self.columns is None:
+                yield from (SingleColumnKey(predicate=pred) for pred in predicates)
+            else:
+                yield from (MultiColumnKeys(predicate=pred) for pred in predicates)
+            return
+
+        partition_cls = SingleColumnPartition if self.columns is None else MultiColumnPartition
+        for pred, max_length, max_groups, max_contrib in zip(predicates, *(b.tolist() for b in self.bounds)):
+            yield partition_cls(
+                predicate=pred,
+                max_length=max_length,
+                max_groups_per_unit=max_groups,
+                max_contributions=max_contrib,
+            )
+
+    def check_models(self) -> None:
+        """
+        Build every partition or key model, one at a time.
+
+        Raises
+        ------
+        ValueError
+            If a field of a partition or a key is invalid.
+
+        """
+        for _model in self:
+            pass
+
+    def _iter_predicate_models(self) -> Iterator[Any]:
+        """Yield the predicate models, or dicts of models for column groups."""
+        if self.columns is None:
+            return self.predicates[0].iter_models()
+        columns = self.columns
+        return (dict(zip(columns, preds)) for preds in zip(*(p.iter_models() for p in self.predicates)))
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another table or with a list of models."""
+        if isinstance(other, PartitionTable):
+            return self.to_dicts() == other.to_dicts()
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a short description of the table."""
+        kind = "partitions" if self.has_bounds else "keys"
+        columns = f", columns={list(self.columns)}" if self.columns is not None else ""
+        return f"PartitionTable({len(self)} {kind}{columns})"
+
+    def take(self, index: slice | np.ndarray) -> "PartitionTable":
+        """Return the subset of partitions selected by a slice, mask or indices."""
+        predicates: PredicateColumn | dict[str, PredicateColumn]
+        if self.columns is None:
+            predicates = self.predicates[0].take(index)
+        else:
+            predicates = {col: p.take(index) for col, p in zip(self.columns, self.predicates)}
+        bounds: list[np.ndarray | None] = (
+            [b[index] for b in self.bounds] if self.bounds is not None else [None, None, None]
+        )
+        return PartitionTable(predicates, *bounds)
+
+    def keys(self) -> "PartitionTable":
+        """Return the public keys of the partitions (the table without bounds)."""
+        predicates = self.predicates[0] if self.columns is None else dict(zip(self.columns, self.predicates))
+        return PartitionTable(predicates)
+
+    # ------------------------------------------------------------
+    # CSVW-EO JSON
+    # ------------------------------------------------------------
+    def iter_dicts(self) -> Iterator[Any]:
+        """
+        Yield the partitions in CSVW-EO JSON format.
+
+        Equivalent to ``(p.to_dict() for p in self)`` without building models.
+        """
+        predicates: Iterator[Any]
+        if self.columns is None:
+            if self.bounds is None and not self.predicates[0].is_categorical:
+                raise TypeError("Expected CategoricalPredicate, got ContinuousPredicate")
+            if self.bounds is None:
+                return (v for v in self.predicates[0].values.tolist())  # type: ignore[union-attr]
+            predicates = self.predicates[0].iter_dicts()
+        else:
+            columns = self.columns
+            predicates = (
+                dict(zip(columns, preds)) for preds in zip(*(p.iter_dicts() for p in self.predicates))
+            )
+
+        if self.bounds is None:
+            return predicates
+
+        return (
+            {
+                "@type": c.PARTITION,
+                c.PREDICATE: pred,
+                c.MAX_LENGTH: max_length,
+                c.MAX_GROUPS: max_groups,
+                c.MAX_CONTRIB: max_contrib,
+            }
+            for pred, max_length, max_groups, max_contrib in zip(
+                predicates, *(b.tolist() for b in self.bounds)
+            )
+        )
+
+    def to_dicts(self) -> list[Any]:
+        """Return the partitions in CSVW-EO JSON format."""
+        return list(self.iter_dicts())
+
+    @classmethod
+    def from_dicts(cls, data: Sequence[Any], multi_column: bool, with_bounds: bool) -> "PartitionTable":
+        """
+        Build a table from partitions or keys in CSVW-EO JSON format.
+
+        Parameters
+        ----------
+        data : list
+            Content of a ``partitions`` (with_bounds) or ``keyValues`` list.
+        multi_column : bool
+            True for the partitions or keys of a column group.
+        with_bounds : bool
+            True for partitions, False for public keys.
+
+        Returns
+        -------
+        PartitionTable
+
+        """
+        raw_predicates = [d[c.PREDICATE] for d in data] if with_bounds else list(data)
+
+        predicates: PredicateColumn | dict[str, PredicateColumn]
+        if multi_column:
+            columns = list(raw_predicates[0]) if raw_predicates else []
+            predicates = {
+                col: PredicateColumn.from_dicts([p[col] for p in raw_predicates]) for col in columns
+            }
+        elif with_bounds:
+            predicates = PredicateColumn.from_dicts(raw_predicates)
+        else:
+            predicates = PredicateColumn(values=value_array(raw_predicates))
+
+        if not with_bounds:
+            return cls(predicates)
+        return cls(
+            predicates,
+            *(count_array([d[field] for d in data], field) for field in BOUND_FIELDS),
+        )
+
+    # ------------------------------------------------------------
+    # Models
+    # ------------------------------------------------------------
+    @classmethod
+    def from_models(
+        cls,
+        items: Sequence["SingleColumnPartition | MultiColumnPartition | SingleColumnKey | MultiColumnKeys"],
+    ) -> "PartitionTable":
+        """
+        Build a table from a list of partition or key models.
+
+        All models must be of the same class. The predicates of a column must
+        be all categorical or all continuous.
+        """
+        if not items:
+            return cls(PredicateColumn(values=value_array([])))
+        if len({type(item) for item in items}) > 1:
+            raise ValueError("All partitions of a PartitionTable must be of the same type")
+        return cls.from_dicts(
+            [item.to_dict() for item in items],
+            multi_column=isinstance(items[0].predicate, dict),
+            with_bounds=hasattr(items[0], "max_length"),
+        )
+
+    # ------------------------------------------------------------
+    # Arrow
+    # ------------------------------------------------------------
+    def to_arrow(self) -> pa.Table:
+        """
+        Convert the table to an Arrow table.
+
+        The predicates are stored in a ``predicate`` struct column (with one
+        struct field per column for column groups), followed by the bound
+        columns for partitions.
+        """
+        if self.columns is None:
+            predicate = self.predicates[0].to_arrow()
+            metadata = None
+        else:
+            predicate = pa.StructArray.from_arrays(
+                [p.to_arrow() for p in self.predicates], names=list(self.columns)
+            )
+            metadata = {ARROW_COLUMNS_KEY: json.dumps(list(self.columns)).encode()}
+
+        arrays = {c.PREDICATE: predicate}
+        for field, bound in zip(BOUND_FIELDS, self.bounds or ()):
+            arrays[field] = pa.array(bound)
+        return pa.table(arrays, metadata=metadata)
+
+    @classmethod
+    def from_arrow(cls, table: pa.Table) -> "PartitionTable":
+        """Build a table from the output of :meth:`to_arrow`."""
+        predicate = table.column(c.PREDICATE).combine_chunks()
+
+        schema_metadata = table.schema.metadata or {}
+        predicates: PredicateColumn | dict[str, PredicateColumn]
+        if ARROW_COLUMNS_KEY in schema_metadata:
+            columns = json.loads(schema_metadata[ARROW_COLUMNS_KEY])
+            predicates = {col: PredicateColumn.from_arrow(predicate.field(col)) for col in columns}
+        else:
+            predicates = PredicateColumn.from_arrow(predicate)
+
+        if c.MAX_LENGTH not in table.column_names:
+            return cls(predicates)
+        return cls(
+            predicates,
+            *(table.column(field).to_numpy().astype(np.int64, copy=False) for field in BOUND_FIELDS),
+        )
+
+    # ------------------------------------------------------------
+    # Pydantic
+    # ------------------------------------------------------------
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: type[Any], handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        """Accept PartitionTable instances as they are in pydantic models."""
+        return core_schema.is_instance_schema(cls)
+
+
+# ============================================================
+# Sidecar files
+# ============================================================
+PARQUET_SUFFIX = ".parquet"
+
+
+def write_partition_table(table: PartitionTable, path: str | Path) -> None:
+    """
+    Write a partition table to a sidecar file.
+
+    Parameters
+    ----------
+    table : PartitionTable
+        Partitions or keys to write.
+    path : str or Path
+        Output file. Parquet if the suffix is ``.parquet``, Arrow IPC
+        (Feather v2) otherwise.
+
+    """
+    arrow_table = table.to_arrow()
+    if Path(path).suffix == PARQUET_SUFFIX:
+        pq.write_table(arrow_table, str(path))
+        return
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, arrow_table.schema) as writer:
+        writer.write_table(arrow_table)
+
+
+def read_partition_table(path: str | Path) -> PartitionTable:
+    """
+    Read a partition table from a memory-mapped sidecar file.
+
+    Parameters
+    ----------
+    path : str or Path
+        File written by :func:`write_partition_table`.
+
+    Returns
+    -------
+    PartitionTable
+
+    """
+    if Path(path).suffix == PARQUET_SUFFIX:
+        arrow_table = pq.read_table(str(path), memory_map=True)
+    else:
+        arrow_table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+    return PartitionTable.from_arrow(arrow_table)
+
+
+class LazyPartitionTable(PartitionTable):
+    """
+    PartitionTable whose arrays are loaded on first access.
+
+    Parameters
+    ----------
+    loader : callable
+        Picklable function returning the PartitionTable, for instance
+        ``functools.partial(read_partition_table, path)``.
+
+    """
+
+    _LOADED_ATTRIBUTES = frozenset({"columns", "predicates", "bounds", "_length"})
+
+    def __init__(self, loader: Callable[[], PartitionTable]) -> None:  # noqa: D107
+        self._loader = loader
+
+    @property
+    def is_loaded(self) -> bool:
+        """Return True once the arrays are loaded."""
+        return "predicates" in self.__dict__
+
+    def load(self) -> PartitionTable:
+        """
+        Load the arrays now, unless they are already loaded.
+
+        Returns
+        -------
+        PartitionTable
+            The table itself.
+
+        Raises
+        ------
+        ValueError
+            If the partitions or keys are invalid.
+
+        """
+        if not self.is_loaded:
+            table = self._loader()
+            for attribute in self._LOADED_ATTRIBUTES:
+                setattr(self, attribute, getattr(table, attribute))
+        return self
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Load the table when one of its arrays is first accessed."""
+        if name not in self._LOADED_ATTRIBUTES or "_loader" not in self.__dict__:
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __repr__(self) -> str:
+        """Do not load the table to describe it."""
+        return super().__repr__() if self.is_loaded else f"LazyPartitionTable({self._loader})"
+
+
+class PartitionSidecar(Sequence[Any]):
+    """
+    Partitions or keys of a CSVW-EO document stored in a sidecar file.
+
+    Stands for the ``partitions`` or ``keyValues`` list of a column or a
+    column group in the metadata dictionary returned by
+    ``csvw_eo.sidecar.read_metadata``. It behaves as the list of CSVW-EO JSON
+    partitions, read from the memory-mapped file on first access only.
+
+    Parameters
+    ----------
+    path : str or Path
+        Sidecar file.
+
+    """
+
+    def __init__(self, path: str | Path) -> None:  # noqa: D107
+        self.path = Path(path)
+        self.table: PartitionTable = LazyPartitionTable(partial(read_partition_table, self.path))
+
+    def __len__(self) -> int:
+        """Return the number of partitions."""
+        return len(self.table)
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...  # noqa: ANN401
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Any]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """Return one partition (or a list for a slice) in CSVW-EO JSON format."""
+        if isinstance(index, slice):
+            return self.table.take(index).to_dicts()
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PartitionSidecar index out of range")
+        return self.table.take(slice(index, index + 1)).to_dicts()[0]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the partitions in CSVW-EO JSON format."""
+        return self.table.iter_dicts()
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the partitions with another sidecar or a list."""
+        if isinstance(other, PartitionSidecar):
+            return self.path == other.path or list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "PartitionSidecar":
+        """Share the read-only sidecar instead of copying it."""
+        return self
+
+    def __repr__(self) -> str:
+        """Return the sidecar path."""
+        return f"PartitionSidecar({str(self.path)!r})"
+
+    def reference(self, base: str | Path) -> dict[str, str]:
+        """Return the CSVW-EO reference to the sidecar, relative to the base directory."""
+        return {"@type": c.SIDECAR_TYPE, c.SIDECAR_URL: self.path.relative_to(base).as_posix()}
@@ -0,0 +1,255 @@
+"""
+Polars schema of CSVW-EO metadata.
+
+Each column gets the narrowest Polars dtype of its datatype (see
+:data:`XSD_POLARS_MAP`): ``unsignedByte`` columns are
+``UInt8``, ``short`` columns ``Int16``, ``date`` columns ``Date``. String
+columns with exhaustive ``keyValues`` (or exhaustive partitions) are
+``Enum``s of their public keys.
+
+:func:`cast_to_schema` casts a LazyFrame to that schema once, ahead of the
+queries, so that OpenDP plans built on it (see
+:func:`csvw_eo.csvw_to_opendp_context.csvw_to_opendp_context`) run on compact,
+correctly typed columns instead of repeating the casts in every plan.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+import pandas as pd
+import polars as pl
+
+from csvw_eo.datatypes import XSD_GROUP_MAP, DataTypes, DataTypesGroups
+from csvw_eo.metadata_structure import ColumnMetadata, TableMetadata
+from csvw_eo.partition_table import PartitionTable
+
+# Narrowest Polars dtype of each datatype. Unbounded XSD integers (integer,
+# positiveInteger, negativeInteger) are Int64, as in pandas.
+XSD_POLARS_MAP: dict[DataTypes, pl.DataType] = {
+    # String
+    DataTypes.STRING: pl.String(),
+    # Boolean
+    DataTypes.BOOLEAN: pl.Boolean(),
+    # Integers
+    DataTypes.INTEGER: pl.Int64(),
+    DataTypes.LONG: pl.Int64(),
+    DataTypes.INT: pl.Int32(),
+    DataTypes.SHORT: pl.Int16(),
+    DataTypes.POSITIVE_INTEGER: pl.Int64(),
+    DataTypes.UNSIGNED_LONG: pl.UInt64(),
+    DataTypes.UNSIGNED_INT: pl.UInt32(),
+    DataTypes.UNSIGNED_SHORT: pl.UInt16(),
+    DataTypes.UNSIGNED_BYTE: pl.UInt8(),
+    DataTypes.NEGATIVE_INTEGER: pl.Int64(),
+    # Floats
+    DataTypes.DECIMAL: pl.Float64(),
+    DataTypes.DOUBLE: pl.Float64(),
+    DataTypes.FLOAT: pl.Float32(),
+    # Datetime
+    DataTypes.DATE: pl.Date(),
+    DataTypes.DATETIME: pl.Datetime("us"),
+    DataTypes.DATETIMESTAMP: pl.Datetime("us", "UTC"),
+    # Duration
+    DataTypes.DURATION: pl.Duration("us"),
+    DataTypes.DAYTIMEDURATION: pl.Duration("us"),
+    DataTypes.YEARMONTHDURATION: pl.Duration("us"),
+}
+
+
+def to_polars_dtype(csvw_type: DataTypes) -> pl.DataType:
+    """Xml datatype to the narrowest Polars dtype (see ``XSD_POLARS_MAP``)."""
+    if not csvw_type:
+        raise ValueError("Missing DataTypes")
+
+    return XSD_POLARS_MAP[DataTypes(csvw_type)]
+
+
+def column_categories(column: ColumnMetadata) -> list[str] | None:
+    """
+    Return the categories of a string column with exhaustive public keys or partitions.
+
+    Parameters
+    ----------
+    column : ColumnMetadata
+        Column metadata.
+
+    Returns
+    -------
+    list of str or None
+        Distinct public key (or partition) values, in metadata order; None if
+        the column is not a string column or its values are not exhaustive.
+
+    """
+    if XSD_GROUP_MAP.get(column.datatype) != DataTypesGroups.STRING:
+        return None
+    items: Sequence[Any]
+    if column.exhaustive_keys and column.public_keys_values:
+        items = column.public_keys_values
+    elif column.exhaustive_partitions and column.partitions:
+        items = column.partitions
+    else:
+        return None
+    table = items if isinstance(items, PartitionTable) else PartitionTable.from_models(items)
+    values = table.predicates[0].values
+    if values is None:
+        return None
+    return list(dict.fromkeys(str(value) for value in values.tolist()))
+
+
+def selected_columns(
+    metadata: TableMetadata | dict[str, Any], columns: Sequence[str] | None = None
+) -> list[ColumnMetadata]:
+    """
+    Return the metadata of some columns, in the requested order.
+
+    Parameters
+    ----------
+    metadata : TableMetadata or dict
+        Table metadata, or CSVW-EO JSON metadata (parsed lazily).
+    columns : sequence of str, optional
+        Column names. All the columns of the metadata by default.
+
+    Returns
+    -------
+    list of ColumnMetadata
+
+    Raises
+    ------
+    ValueError
+        If a requested column is not described in the metadata.
+
+    """
+    if not isinstance(metadata, TableMetadata):
+        metadata = TableMetadata.from_dict(metadata, columnar=True, lazy=True)
+    by_name = {column.name: column for column in metadata.columns}
+    if columns is None:
+        return list(by_name.values())
+    unknown = [name for name in columns if name not in by_name]
+    if unknown:
+        raise ValueError(f"Columns {unknown} are not described in the metadata")
+    return [by_name[name] for name in columns]
+
+
+def to_polars_schema(
+    metadata: TableMetadata | dict[str, Any], columns: Sequence[str] | None = None
+) -> pl.Schema:
+    """
+    Return the Polars schema of the columns of table metadata.
+
+    Parameters
+    ----------
+    metadata : TableMetadata or dict
+        Table metadata, or CSVW-EO JSON metadata.
+    columns : sequence of str, optional
+        Columns of the schema. All the columns of the metadata by default.
+
+    Returns
+    -------
+    polars.Schema
+        Narrowest dtype of each column; Enums for string columns with
+        exhaustive public keys.
+
+    """
+    schema = {}
+    for column in selected_columns(metadata, columns):
+        categories = column_categories(column)
+        schema[column.name] = pl.Enum(categories) if categories else to_polars_dtype(column.datatype)
+    return pl.Schema(schema)
+
+
+def parse_integers(column: pl.Expr, target: pl.DataType, *, strict: bool = True) -> pl.Expr:
+    """
+    Return the expression parsing integers written as strings, exactly.
+
+    A fractional part of zeros (``"1.0"``, as pandas writes nullable
+    integers) is dropped; any other fractional part is invalid. The digits
+    are parsed as integers, never through floats, so values beyond 2**53
+    keep their precision.
+    """
+    return column.str.replace(r"\.0+$", "").cast(target, strict=strict)
+
+
+def parse_durations(series: pl.Series) -> pl.Series:
+    """Parse durations with pandas, which Polars cannot parse from strings."""
+    return pl.Series(series.name, pd.to_timedelta(series.to_pandas())).cast(pl.Duration("us"))
+
+
+def cast_expr(name: str, source: pl.DataType, target: pl.DataType, *, strict: bool = True) -> pl.Expr:  # noqa: PLR0911
+    """
+    Return the expression converting a column from one dtype to another.
+
+    Strings are parsed into dates, datetimes, durations and booleans; integers
+    written as strings are parsed exactly with :func:`parse_integers`. Other
+    dtypes are cast.
+
+    Parameters
+    ----------
+    name : str
+        Column name.
+    source : polars.DataType
+        Current dtype of the column.
+    target : polars.DataType
+        Dtype to convert to.
+    strict : bool, default=True
+        If True, values that cannot be converted raise an error, otherwise
+        they become null.
+
+    Returns
+    -------
+    polars.Expr
+
+    """
+    column = pl.col(name)
+    if source == pl.String:
+        if isinstance(target, pl.Datetime):
+            return column.str.to_datetime(
+                time_unit=target.time_unit, time_zone=target.time_zone, strict=strict
+            )
+        if target == pl.Date:
+            return column.str.to_date(strict=strict)
+        if isinstance(target, pl.Duration):
+            return column.map_batches(parse_durations, return_dtype=pl.Duration("us")).cast(target)
+        if target == pl.Boolean:
+            values = {"true": True, "false": False}
+            if strict:
+                return column.str.to_lowercase().replace_strict(values, return_dtype=pl.Boolean)
+            return column.str.to_lowercase().replace_strict(values, default=None, return_dtype=pl.Boolean)
+        if target.is_integer():
+            return parse_integers(column, target, strict=strict)
+    return column.cast(target, strict=strict)
+
+
+def cast_to_schema(data: pl.LazyFrame, schema: pl.Schema, *, strict: bool = True) -> pl.LazyFrame:
+    """
+    Cast the columns of a LazyFrame to a schema, once.
+
+    Columns that already have their dtype, and columns absent from the
+    schema, are left untouched.
+
+    Parameters
+    ----------
+    data : polars.LazyFrame
+        Dataset.
+    schema : polars.Schema
+        Target schema, usually ``to_polars_schema(metadata)``.
+    strict : bool, default=True
+        If True, values that cannot be converted (for instance strings that
+        are not public keys of an Enum column) raise an error when the frame
+        is collected; otherwise they become null.
+
+    Returns
+    -------
+    polars.LazyFrame
+
+    Examples
+    --------
+    >>> data = cast_to_schema(pl.scan_csv("data.csv"), to_polars_schema(metadata))
+
+    """
+    current = data.collect_schema()
+    casts = [
+        cast_expr(name, current[name], dtype, strict=strict)
+        for name, dtype in schema.items()
+        if name in current and current[name] != dtype
+    ]
+    return data.with_columns(casts) if casts else data
@@ -0,0 +1,184 @@
+"""
+Typed CSV loaders driven by CSVW-EO metadata.
+
+pandas and Polars infer the type of each CSV column from its values, which
+is slow on large files and often wrong: integer columns with missing values
+become floats, dates and booleans stay strings. The metadata already declares
+the datatype of each column.
+
+:func:`read_with_metadata` and :func:`scan_with_metadata` derive an explicit
+schema from the column datatypes (see :func:`csvw_eo.datatypes.to_pandas_dtype`
+and :func:`csvw_eo.polars_schema.to_polars_schema`) and pass it to the CSV
+reader, so that no type is inferred:
+
+- string columns with exhaustive ``keyValues`` (or exhaustive partitions) are
+  read as pandas Categoricals or Polars Enums, with the public keys as
+  categories;
+- date, datetime and boolean columns are parsed by the reader, in bulk;
+- only the requested columns are read.
+
+Columns of the file that the metadata does not describe keep the inferred
+types of the reader.
+"""
+
+from collections.abc import Sequence
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import polars as pl
+
+from csvw_eo.datatypes import XSD_GROUP_MAP, DataTypes, DataTypesGroups, to_pandas_dtype
+from csvw_eo.metadata_structure import TableMetadata
+from csvw_eo.polars_schema import (
+    cast_expr,
+    column_categories,
+    parse_integers,
+    selected_columns,
+    to_polars_schema,
+)
+
+# Largest magnitude up to which float64 represents every integer
+FLOAT_EXACT_LIMIT = 2**53
+
+
+class LoaderEngine(StrEnum):
+    """Library reading the CSV file."""
+
+    PANDAS = "pandas"
+    POLARS = "polars"
+
+
+def scan_with_metadata(
+    path: str | Path,
+    metadata: TableMetadata | dict[str, Any],
+    *,
+    columns: Sequence[str] | None = None,
+    separator: str = ",",
+) -> pl.LazyFrame:
+    """
+    Lazily read a CSV file with the Polars schema derived from its metadata.
+
+    Integer columns are read as strings and parsed exactly: ``1.0`` (as
+    pandas writes nullable integers) reads 1, a non-integral value such as
+    ``3.7`` raises an error. Duration columns are parsed by pandas. Enum
+    columns raise an error on values that are not public keys.
+
+    Parameters
+    ----------
+    path : str or Path
+        CSV file.
+    metadata : TableMetadata or dict
+        Table metadata, or CSVW-EO JSON metadata.
+    columns : sequence of str, optional
+        Columns to read. All the columns of the file by default.
+    separator : str, default=","
+        Field separator.
+
+    Returns
+    -------
+    polars.LazyFrame
+        Frame of the requested columns, typed as ``to_polars_schema``.
+
+    """
+    schema = to_polars_schema(metadata, columns)
+    file_dtypes: dict[str, pl.DataType] = {}
+    casts = []
+    for name, dtype in schema.items():
+        if dtype.is_integer():
+            file_dtypes[name] = pl.String()
+            casts.append(parse_integers(pl.col(name), dtype))
+        elif isinstance(dtype, pl.Duration):
+            file_dtypes[name] = pl.String()
+            casts.append(cast_expr(name, file_dtypes[name], dtype))
+        else:
+            file_dtypes[name] = dtype
+
+    lf = pl.scan_csv(path, schema_overrides=file_dtypes, separator=separator)
+    if columns is not None:
+        lf = lf.select(columns)
+    return lf.with_columns(casts) if casts else lf
+
+
+def read_with_metadata(
+    path: str | Path,
+    metadata: TableMetadata | dict[str, Any],
+    *,
+    engine: LoaderEngine = LoaderEngine.PANDAS,
+    columns: Sequence[str] | None = None,
+    separator: str = ",",
+) -> pd.DataFrame | pl.DataFrame:
+    """
+    Read a CSV file with the dtypes derived from its metadata.
+
+    Parameters
+    ----------
+    path : str or Path
+        CSV file.
+    metadata : TableMetadata or dict
+        Table metadata, or CSVW-EO JSON metadata.
+    engine : LoaderEngine, default="pandas"
+        ``"pandas"`` returns a ``pandas.DataFrame`` with the dtypes of
+        ``to_pandas_dtype``; ``"polars"`` collects :func:`scan_with_metadata`.
+    columns : sequence of str, optional
+        Columns to read. All the columns of the file by default.
+    separator : str, default=","
+        Field separator.
+
+    Returns
+    -------
+    pandas.DataFrame or polars.DataFrame
+        Integer columns keep their exact values, beyond 2**53 too. With
+        pandas, values of categorical columns that are not public keys become
+        missing values.
+
+    Raises
+    ------
+    ValueError
+        If a requested column is not described in the metadata.
+    TypeError
+        With pandas, if an integer column holds a non-integral value
+        (Polars raises an ``InvalidOperationError``).
+
+    """
+    if engine == LoaderEngine.POLARS:
+        return scan_with_metadata(path, metadata, columns=columns, separator=separator).collect()
+
+    dtypes: dict[str, Any] = {}
+    dates, durations, integers = [], [], []
+    for column in selected_columns(metadata, columns):
+        group = XSD_GROUP_MAP.get(column.datatype)
+        categories = column_categories(column)
+        if categories:
+            dtypes[column.name] = pd.CategoricalDtype(categories)
+        elif group == DataTypesGroups.DATETIME:
+            dates.append(column.name)
+        elif group == DataTypesGroups.DURATION:
+            dtypes[column.name] = "string"
+            durations.append(column.name)
+        elif group == DataTypesGroups.INTEGER:
+            # The parser is several times slower on nullable integers than on floats
+            dtypes[column.name] = "float64"
+            integers.append(column.name)
+        else:
+            dtypes[column.name] = to_pandas_dtype(column.datatype)
+
+    df = pd.read_csv(
+        path,
+        sep=separator,
+        usecols=list(columns) if columns is not None else None,
+        dtype=dtypes,
+        parse_dates=dates,
+        date_format="ISO8601",
+    )
+    for name in integers:
+        df[name] = df[name].astype(to_pandas_dtype(DataTypes.INTEGER))
+    # Floats are exact up to 2**53: columns reaching it are read again as integers
+    large = [name for name in integers if (df[name].abs() >= FLOAT_EXACT_LIMIT).any()]
+    if large:
+        exact = pd.read_csv(path, sep=separator, usecols=large, dtype=to_pandas_dtype(DataTypes.INTEGER))
+        df[large] = exact[large]
+    for name in durations:
+        df[name] = pd.to_timedelta(df[name])
+    return df[list(columns)] if columns is not None else df
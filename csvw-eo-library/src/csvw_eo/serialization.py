@@ -0,0 +1,225 @@
+"""
+Streaming JSON serialization of CSVW-EO metadata.
+
+``TableMetadata.to_dict()`` builds the whole document in memory before it is
+encoded, which is slow and memory hungry on metadata with very large
+partition lists. This module encodes a ``TableMetadata`` in one pass instead:
+the lists of columns, column groups, partitions and public keys are produced
+lazily by ``to_dict(collect=...)`` and each element is encoded as soon as it
+is built.
+
+Field values are already native Python types (they are coerced when the
+models are built), so no sanitization pass is needed. The output is identical
+to ``json.dumps(table.to_dict(), indent=indent)``.
+"""
+
+import json
+import math
+from collections.abc import Iterator
+from json.encoder import encode_basestring_ascii
+from types import GeneratorType
+from typing import IO, Any
+
+from csvw_eo.metadata_structure import TableMetadata
+
+# Number of encoded fragments buffered before a write to the file handle
+WRITE_BUFFER_SIZE = 4096
+
+
+def keep_lazy(items: Iterator[Any]) -> Iterator[Any]:
+    """Collector keeping the generators of to_dict as they are."""
+    return items
+
+
+def _is_streamed(obj: Any) -> bool:  # noqa: ANN401
+    """Return True if obj is or contains a lazy list (a generator)."""
+    if isinstance(obj, GeneratorType):
+        return True
+    if isinstance(obj, dict):
+        return any(_is_streamed(v) for v in obj.values())
+    if isinstance(obj, list):
+        return any(_is_streamed(v) for v in obj)
+    return False
+
+
+def _encode_float(value: float) -> str:
+    if math.isnan(value) or math.isinf(value):
+        raise ValueError(f"Out of range float values are not JSON compliant: {value!r}")
+    return float.__repr__(value)
+
+
+def _encode_key(key: Any) -> str:  # noqa: ANN401
+    """Encode a dictionary key following the rules of ``json.dumps``."""
+    if isinstance(key, str):
+        return encode_basestring_ascii(key)
+    if key is True:
+        return '"true"'
+    if key is False:
+        return '"false"'
+    if key is None:
+        return '"null"'
+    if isinstance(key, int):
+        return '"' + int.__repr__(key) + '"'
+    if isinstance(key, float):
+        return '"' + _encode_float(key) + '"'
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def iter_json(obj: Any, indent: int | str | None = None) -> Iterator[str]:  # noqa: ANN401
+    """
+    Encode an object to JSON, generators being encoded as arrays.
+
+    Parameters
+    ----------
+    obj : Any
+        JSON-serializable structure, which may contain generators.
+    indent : int or str, optional
+        Indentation, as in ``json.dumps``.
+
+    Yields
+    ------
+    str
+        Successive fragments of the JSON document.
+
+    Raises
+    ------
+    ValueError
+        If the structure contains NaN or infinite floats.
+    TypeError
+        If the structure contains a value that is not JSON serializable.
+
+    """
+    if isinstance(indent, int):
+        indent = " " * indent
+    item_separator = "," if indent is not None else ", "
+
+    def newline(level: int) -> str:
+        return "" if indent is None else "\n" + indent * level
+
+    def render(value: Any, level: int) -> str:  # noqa: ANN401, PLR0911, PLR0912
+        """Encode a structure without lazy lists in one string."""
+        value_type = type(value)
+        if value_type is str:
+            return encode_basestring_ascii(value)
+        if value_type is float:
+            return _encode_float(value)
+        if value_type is int:
+            return int.__repr__(value)
+        if value_type is dict:
+            if not value:
+                return "{}"
+            separator = item_separator + newline(level + 1)
+            items = separator.join(_encode_key(k) + ": " + render(v, level + 1) for k, v in value.items())
+            return "{" + newline(level + 1) + items + newline(level) + "}"
+        if value_type is list or value_type is tuple:
+            if not value:
+                return "[]"
+            separator = item_separator + newline(level + 1)
+            items = separator.join(render(v, level + 1) for v in value)
+            return "[" + newline(level + 1) + items + newline(level) + "]"
+        if value is None:
+            return "null"
+        if value is True:
+            return "true"
+        if value is False:
+            return "false"
+        # Subclasses of native types (such as StrEnum)
+        if isinstance(value, str):
+            return encode_basestring_ascii(value)
+        if isinstance(value, int):
+            return int.__repr__(value)
+        if isinstance(value, float):
+            return _encode_float(value)
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    # Without indentation, leaves are encoded by the C accelerated encoder
+    compact = json.JSONEncoder(allow_nan=False).encode
+
+    def encode(value: Any, level: int) -> Iterator[str]:  # noqa: ANN401
+        if not _is_streamed(value):
+            yield compact(value) if indent is None else render(value, level)
+            return
+
+        is_dict = isinstance(value, dict)
+        opening, closing = ("{", "}") if is_dict else ("[", "]")
+        items: Iterator[Any] = iter(value.items()) if is_dict else iter(value)
+
+        first = True
+        for item in items:
+            yield (opening if first else item_separator) + newline(level + 1)
+            first = False
+            if is_dict:
+                key, item = item  # noqa: PLW2901
+                yield _encode_key(key) + ": "
+            yield from encode(item, level + 1)
+
+        yield opening + closing if first else newline(level) + closing
+
+    return encode(obj, 0)
+
+
+def iter_table_metadata_json(table: TableMetadata, indent: int | str | None = None) -> Iterator[str]:
+    """
+    Encode table metadata to CSVW-EO JSON in one pass.
+
+    Parameters
+    ----------
+    table : TableMetadata
+        Metadata to serialize.
+    indent : int or str, optional
+        Indentation, as in ``json.dumps``.
+
+    Yields
+    ------
+    str
+        Successive fragments of the JSON document.
+
+    """
+    return iter_json(table.to_dict(collect=keep_lazy), indent=indent)
+
+
+def dumps_table_metadata(table: TableMetadata, indent: int | str | None = None) -> str:
+    """Serialize table metadata to a CSVW-EO JSON string."""
+    return "".join(iter_table_metadata_json(table, indent=indent))
+
+
+def dump_json(obj: Any, fp: IO[str], indent: int | str | None = None) -> None:  # noqa: ANN401
+    """
+    Stream a structure that may contain generators as JSON to a file handle.
+
+    Parameters
+    ----------
+    obj : Any
+        JSON-serializable structure, generators being encoded as arrays.
+    fp : file-like
+        Text file handle open for writing.
+    indent : int or str, optional
+        Indentation, as in ``json.dump``.
+
+    """
+    buffer: list[str] = []
+    for fragment in iter_json(obj, indent=indent):
+        buffer.append(fragment)
+        if len(buffer) >= WRITE_BUFFER_SIZE:
+            fp.write("".join(buffer))
+            buffer.clear()
+    fp.write("".join(buffer))
+
+
+def dump_table_metadata(table: TableMetadata, fp: IO[str], indent: int | str | None = None) -> None:
+    """
+    Stream table metadata as CSVW-EO JSON to a file handle.
+
+    Only one partition or key is held in dict form at a time.
+
+    Parameters
+    ----------
+    table : TableMetadata
+        Metadata to serialize.
+    fp : file-like
+        Text file handle open for writing.
+    indent : int or str, optional
+        Indentation, as in ``json.dump``.
+
+    """
+    dump_json(table.to_dict(collect=keep_lazy), fp, indent=indent)
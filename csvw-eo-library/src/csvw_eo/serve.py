@@ -0,0 +1,328 @@
+"""
+Long-running worker running CSVW-EO jobs from newline-delimited JSON requests.
+
+Each command line tool pays the interpreter start and the imports of pandas,
+Polars, OpenDP, pySHACL and rdflib on every invocation. ``csvw-eo serve``
+starts once and keeps them loaded, with warm caches: metadata documents,
+compiled dummy generation plans (keyed by file and modification time) and
+SHACL validators.
+
+Requests are read one per line, from stdin or from the connections of a
+local Unix socket::
+
+    {"id": 1, "job": "dummy", "args": {"metadata": "meta.json", "output": "dummy.csv", "rows": 1000}}
+
+and run by a bounded thread pool: at most ``max_pending`` jobs are queued,
+reading blocks beyond. One response line is written per request as soon as
+its job finishes, so responses may come out of order::
+
+    {"id": 1, "ok": true, "result": {"output": "dummy.csv", "rows": 1000, "columns": 11}, "seconds": 0.02}
+    {"id": 2, "ok": false, "error": "ValueError: ...", "seconds": 0.0}
+
+Jobs (see :data:`JOBS` for their arguments): ``profile``, ``dummy``,
+``validate``, ``check_constraints``, ``check_data``, ``enforce_bounds``,
+``validate_shacl`` and ``smartnoise``.
+"""
+
+import json
+import os
+import socketserver
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from csvw_eo.check_constraints import check_constraints
+from csvw_eo.check_data import check_data
+from csvw_eo.constants import DatetimeResolution
+from csvw_eo.csvw_to_smartnoise_sql import csvw_to_smartnoise_sql, write_smartnoise_yaml
+from csvw_eo.enforce_bounds import enforce_bounds, scan_data, sink_data
+from csvw_eo.make_dummy_from_metadata import GenerationPlan, compile_generation_plan
+from csvw_eo.make_metadata_from_data import make_metadata_from_data
+from csvw_eo.metadata_stream import read_metadata_headers
+from csvw_eo.sidecar import read_metadata
+from csvw_eo.validate_metadata import validate_metadata
+from csvw_eo.validate_metadata_shacl import validate_metadata_shacl
+
+# Permissions of the Unix socket: read and write for the user of the worker only
+SOCKET_MODE = 0o600
+
+
+# The caches of the jobs are keyed by file and modification time
+def _file_key(path: str | Path) -> tuple[Path, int]:
+    path = Path(path).resolve()
+    return path, path.stat().st_mtime_ns
+
+
+@lru_cache(maxsize=256)
+def _cached_metadata(path: Path, mtime_ns: int) -> dict[str, Any]:  # noqa: ARG001
+    return read_metadata(path)
+
+
+@lru_cache(maxsize=64)
+def _cached_plan(path: Path, mtime_ns: int, datetime_resolution: str, categorical: bool) -> GenerationPlan:
+    return compile_generation_plan(
+        _cached_metadata(path, mtime_ns), DatetimeResolution(datetime_resolution), categorical
+    )
+
+
+def load_metadata(path: str | Path) -> dict[str, Any]:
+    """
+    Read a metadata file, cached until the file changes.
+
+    The document is shared between jobs: it must not be modified.
+    """
+    return _cached_metadata(*_file_key(path))
+
+
+def run_profile(args: dict[str, Any]) -> Any:  # noqa: ANN401
+    """
+    Generate metadata from a CSV file (``make_metadata_from_data``).
+
+    Arguments: ``input`` CSV file, ``privacy_unit``, optional ``output`` file
+    and the keyword arguments of ``make_metadata_from_data``. Returns the
+    metadata, or ``{"output": path}`` when it is written to a file.
+    """
+    args = dict(args)
+    df = pd.read_csv(args.pop("input"))
+    output = args.pop("output", None)
+    metadata = make_metadata_from_data(df, **args)
+    if output is None:
+        return metadata
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2)
+    return {"output": output}
+
+
+def run_dummy(args: dict[str, Any]) -> dict[str, Any]:
+    """
+    Generate a dummy CSV (or Parquet) file from a metadata file.
+
+    Arguments: ``metadata`` file, ``output`` file, optional ``rows`` (100),
+    ``seed`` (0), ``datetime_resolution`` ("day") and ``categorical``
+    (false). The generation plan of each metadata file is compiled once.
+    """
+    plan = _cached_plan(
+        *_file_key(args["metadata"]), args.get("datetime_resolution", "day"), args.get("categorical", False)
+    )
+    df = plan.generate(nb_rows=args.get("rows", 100), seed=args.get("seed", 0))
+    if Path(args["output"]).suffix == ".parquet":
+        df.to_parquet(args["output"], index=False)
+    else:
+        df.to_csv(args["output"], index=False)
+    return {"output": args["output"], "rows": len(df), "columns": len(df.columns)}
+
+
+def run_validate(args: dict[str, Any]) -> dict[str, Any]:
+    """Validate a metadata file against the pydantic model. Arguments: ``metadata`` file."""
+    table = validate_metadata(load_metadata(args["metadata"]), columnar=True)
+    return {"valid": True, "columns": len(table.columns)}
+
+
+def run_check_constraints(args: dict[str, Any]) -> dict[str, Any]:
+    """Check the constraints of a metadata file. Arguments: ``metadata`` file."""
+    report = check_constraints(load_metadata(args["metadata"]))
+    return {"conforms": report.conforms, "violations": len(report), "report": report.text}
+
+
+def run_check_data(args: dict[str, Any]) -> dict[str, Any]:
+    """
+    Check a CSV or Parquet file against its metadata.
+
+    Arguments: ``data`` file, ``metadata`` file and the keyword arguments of
+    ``check_data`` (``chunk_size``, ``max_examples``, ...).
+    """
+    args = dict(args)
+    report = check_data(args.pop("data"), load_metadata(args.pop("metadata")), **args)
+    return {
+        "conforms": report.conforms,
+        "rows": report.rows,
+        "violations": len(report),
+        "report": report.text,
+    }
+
+
+def run_enforce_bounds(args: dict[str, Any]) -> dict[str, Any]:
+    """
+    Clamp, filter and sample a CSV or Parquet file to the bounds of its metadata.
+
+    Arguments: ``data`` file, ``metadata`` file, ``output`` CSV or Parquet
+    file and optional ``seed`` (0).
+    """
+    metadata = load_metadata(args["metadata"])
+    data = scan_data(args["data"], metadata)
+    sink_data(enforce_bounds(data, metadata, args.get("seed", 0)), args["output"])
+    return {"output": args["output"]}
+
+
+def run_validate_shacl(args: dict[str, Any]) -> dict[str, Any]:
+    """
+    Validate a metadata file against SHACL shapes.
+
+    Arguments: ``metadata`` file and ``shacl`` shapes file. The shapes are
+    parsed once per file.
+    """
+    conforms, report = validate_metadata_shacl(Path(args["metadata"]), Path(args["shacl"]))
+    return {"conforms": conforms, "report": report}
+
+
+def run_smartnoise(args: dict[str, Any]) -> Any:  # noqa: ANN401
+    """
+    Convert a metadata file to SmartNoise SQL metadata.
+
+    Arguments: ``metadata`` file, optional ``schema``, ``table`` and
+    ``output`` YAML file, and the table options of
+    ``csvw_to_smartnoise_sql``. Returns the SmartNoise metadata, or
+    ``{"output": path}`` when it is written to a file.
+    """
+    args = dict(args)
+    csvw_meta = read_metadata_headers(args.pop("metadata"))
+    output = args.pop("output", None)
+    snsql_meta = csvw_to_smartnoise_sql(
+        csvw_meta, schema_name=args.pop("schema", ""), table_name=args.pop("table", "df"), **args
+    )
+    if output is None:
+        return snsql_meta
+    write_smartnoise_yaml(snsql_meta, output)
+    return {"output": output}
+
+
+JOBS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "profile": run_profile,
+    "dummy": run_dummy,
+    "validate": run_validate,
+    "check_constraints": run_check_constraints,
+    "check_data": run_check_data,
+    "enforce_bounds": run_enforce_bounds,
+    "validate_shacl": run_validate_shacl,
+    "smartnoise": run_smartnoise,
+}
+
+
+def run_request(line: str) -> dict[str, Any]:
+    """
+    Run the job of one request line and return its response.
+
+    Errors (invalid JSON, unknown job, failing job) are reported in the
+    response, never raised.
+    """
+    start = time.perf_counter()
+    request_id = None
+    try:
+        request = json.loads(line)
+        request_id = request.get("id")
+        if request.get("job") not in JOBS:
+            raise ValueError(f"Unknown job {request.get('job')!r}, expected one of {sorted(JOBS)}")
+        result = JOBS[request["job"]](request.get("args", {}))
+    except Exception as e:
+        return {
+            "id": request_id,
+            "ok": False,
+            "error": f"{type(e).__name__}: {e}",
+            "seconds": time.perf_counter() - start,
+        }
+    return {"id": request_id, "ok": True, "result": result, "seconds": time.perf_counter() - start}
+
+
+class Worker:
+    """
+    Bounded pool running NDJSON job requests.
+
+    Parameters
+    ----------
+    workers : int, optional
+        Number of threads running jobs. Defaults to the number of CPUs.
+    max_pending : int, optional
+        Maximum number of jobs queued or running; reading requests blocks
+        beyond. Defaults to twice the number of workers.
+
+    """
+
+    def __init__(self, workers: int | None = None, max_pending: int | None = None) -> None:
+        """Start the thread pool."""
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.workers
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="csvw-eo-job")
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+
+    def __repr__(self) -> str:
+        """Return a short description of the worker."""
+        return f"Worker(workers={self.workers}, max_pending={self.max_pending})"
+
+    def serve(self, lines: Iterable[str], write: Callable[[str], None]) -> int:
+        """
+        Run the requests of a stream of lines, writing each response as soon as it is ready.
+
+        Parameters
+        ----------
+        lines : iterable of str
+            Request lines; blank lines are skipped.
+        write : callable
+            Called with each response line (newline included), from the
+            worker threads, one at a time.
+
+        Returns
+        -------
+        int
+            Number of requests, once all their responses are written.
+
+        """
+        lock = threading.Lock()
+        futures: list[Future[None]] = []
+
+        # The job writes its own response, so that it is written once its future is done
+        def respond(line: str) -> None:
+            try:
+                response = json.dumps(run_request(line), default=str) + "\n"
+                with lock:
+                    write(response)
+            finally:
+                self._slots.release()
+
+        for line in lines:
+            if not line.strip():
+                continue
+            self._slots.acquire()
+            futures.append(self._executor.submit(respond, line))
+        wait(futures)
+        return len(futures)
+
+    def socket_server(self, path: str | Path) -> socketserver.ThreadingUnixStreamServer:
+        """
+        Return a Unix socket server running the requests of each connection.
+
+        Each connection is a stream of request lines, answered on the same
+        connection; all connections share the pool. Call ``serve_forever()``
+        on the server to start it.
+
+        The socket is created with ``SOCKET_MODE`` permissions (read and write
+        for its owner only), whatever the umask: the jobs read and write files
+        with the permissions of the worker, so only its user may connect.
+        """
+        worker = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                lines = (line.decode("utf-8") for line in self.rfile)
+
+                def write(response: str) -> None:
+                    self.wfile.write(response.encode("utf-8"))
+                    self.wfile.flush()
+
+                worker.serve(lines, write)
+
+        # The umask applies when the socket is bound: a chmod after it would leave a window open
+        umask = os.umask(0o777 & ~SOCKET_MODE)
+        try:
+            return socketserver.ThreadingUnixStreamServer(str(path), Handler)
+        finally:
+            os.umask(umask)
+
+    def close(self) -> None:
+        """Wait for the running jobs and stop the pool."""
+        self._executor.shutdown(wait=True)
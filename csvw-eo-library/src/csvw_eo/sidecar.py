@@ -0,0 +1,187 @@
+"""
+CSVW-EO documents with partitions stored in binary sidecar files.
+
+Large ``partitions`` and ``keyValues`` lists make JSON-LD metadata files slow
+to load and validate. This module writes them to Arrow IPC or Parquet files
+next to the JSON-LD document, which references them as:
+
+    "partitions": {"@type": "PartitionTable", "url": "metadata.column0.partitions.arrow"}
+
+The url is relative to the directory of the JSON-LD document, and must stay
+inside it: absolute urls and urls escaping it with ``..`` are rejected, so a
+document cannot make its reader open arbitrary files.
+
+:func:`read_metadata` returns the metadata dictionary with each reference
+replaced by a ``PartitionSidecar``: a read-only sequence of the partitions,
+read memory-mapped only when a consumer touches it.
+``TableMetadata.from_dict``, ``make_dummy_from_metadata`` and
+``csvw_to_opendp_margins`` accept this dictionary as they accept a plain one.
+"""
+
+import json
+from collections.abc import Iterator
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+from csvw_eo.constants import (
+    ADD_INFO,
+    COL_LIST,
+    KEY_VALUES,
+    PUBLIC_PARTITIONS,
+    SIDECAR_TYPE,
+    SIDECAR_URL,
+    TABLE_SCHEMA,
+)
+from csvw_eo.metadata_structure import ColumnGroupMetadata, ColumnMetadata, TableMetadata
+from csvw_eo.partition_table import (
+    PartitionSidecar,
+    PartitionTable,
+    write_partition_table,
+)
+from csvw_eo.serialization import dump_json, keep_lazy
+
+# Lists shorter than this stay inline in the JSON-LD document
+DEFAULT_SIDECAR_MIN_ROWS = 1000
+
+
+class SidecarFormat(StrEnum):
+    """File format of partition sidecars."""
+
+    ARROW = "arrow"
+    PARQUET = "parquet"
+
+
+def is_sidecar_reference(value: Any) -> bool:  # noqa: ANN401
+    """Return True if a partitions or keyValues entry references a sidecar file."""
+    return isinstance(value, dict) and value.get("@type") == SIDECAR_TYPE
+
+
+def resolve_sidecars(metadata: dict[str, Any], base: str | Path) -> dict[str, Any]:
+    """
+    Replace sidecar references of a metadata dictionary by PartitionSidecars.
+
+    Parameters
+    ----------
+    metadata : dict
+        CSVW-EO metadata structure, modified in place.
+    base : str or Path
+        Directory the sidecar urls are relative to.
+
+    Returns
+    -------
+    dict
+        The metadata structure.
+
+    """
+    for entry in [*metadata[TABLE_SCHEMA][COL_LIST], *metadata.get(ADD_INFO, [])]:
+        resolve_entry_sidecars(entry, base)
+    return metadata
+
+
+def sidecar_path(url: str, base: str | Path) -> Path:
+    """
+    Return the path of a sidecar url, relative to the directory of its document.
+
+    Raises
+    ------
+    ValueError
+        If the url resolves outside ``base`` (absolute url, ``..``, symbolic link).
+
+    """
+    path = Path(base) / url
+    if not path.resolve().is_relative_to(Path(base).resolve()):
+        raise ValueError(f"Sidecar url {url!r} is outside the metadata directory {base}")
+    return path
+
+
+def resolve_entry_sidecars(entry: dict[str, Any], base: str | Path) -> dict[str, Any]:
+    """Replace the sidecar references of a column or column group, in place."""
+    for key in (PUBLIC_PARTITIONS, KEY_VALUES):
+        if is_sidecar_reference(entry.get(key)):
+            entry[key] = PartitionSidecar(sidecar_path(entry[key][SIDECAR_URL], base))
+    return entry
+
+
+def read_metadata(path: str | Path) -> dict[str, Any]:
+    """
+    Read a CSVW-EO JSON-LD document, with lazy sidecar partitions.
+
+    Documents without sidecars are returned as ``json.load`` returns them.
+
+    Parameters
+    ----------
+    path : str or Path
+        JSON-LD metadata file.
+
+    Returns
+    -------
+    dict
+        CSVW-EO metadata structure.
+
+    """
+    path = Path(path)
+    with path.open("r", encoding="utf-8") as f:
+        metadata = json.load(f)
+    return resolve_sidecars(metadata, path.parent)
+
+
+def write_metadata(
+    table: TableMetadata,
+    path: str | Path,
+    sidecar_format: SidecarFormat = SidecarFormat.ARROW,
+    min_rows: int = DEFAULT_SIDECAR_MIN_ROWS,
+    indent: int | str | None = 2,
+) -> list[Path]:
+    """
+    Write table metadata as JSON-LD, with large partition lists in sidecars.
+
+    Parameters
+    ----------
+    table : TableMetadata
+        Metadata to write.
+    path : str or Path
+        Output JSON-LD file. Sidecars are written in the same directory, as
+        ``<stem>.column<i>.<key>.<format>`` and ``<stem>.group<i>.<key>.<format>``.
+    sidecar_format : SidecarFormat, default="arrow"
+        Arrow IPC or Parquet.
+    min_rows : int, default=1000
+        Partitions and key lists with fewer elements stay inline.
+    indent : int or str, optional
+        Indentation of the JSON-LD document.
+
+    Returns
+    -------
+    list[Path]
+        Paths of the written sidecars.
+
+    """
+    path = Path(path)
+    suffix = f".{SidecarFormat(sidecar_format)}"
+    sidecars: list[Path] = []
+
+    def with_sidecars(model: ColumnMetadata | ColumnGroupMetadata, name: str) -> dict[str, Any]:
+        entry = model.to_dict(collect=keep_lazy)
+        for key, items in ((PUBLIC_PARTITIONS, model.partitions), (KEY_VALUES, model.public_keys_values)):
+            if items is None or len(items) < min_rows:
+                continue
+            entry[key].close()  # generator of inline dicts, not needed
+            sidecar_table = items if isinstance(items, PartitionTable) else PartitionTable.from_models(items)
+            sidecar_path = path.parent / f"{path.stem}.{name}.{key}{suffix}"
+            write_partition_table(sidecar_table, sidecar_path)
+            sidecars.append(sidecar_path)
+            entry[key] = {"@type": SIDECAR_TYPE, SIDECAR_URL: sidecar_path.name}
+        return entry
+
+    def iter_entries(models: list[Any], name: str) -> Iterator[dict[str, Any]]:
+        return (with_sidecars(model, f"{name}{i}") for i, model in enumerate(models))
+
+    document = table.model_copy(update={"columns": [], "column_groups": None}).to_dict()
+    document[TABLE_SCHEMA][COL_LIST] = iter_entries(table.columns, "column")
+    if table.column_groups is not None:
+        document[ADD_INFO] = iter_entries(table.column_groups, "group")
+
+    with path.open("w", encoding="utf-8") as f:
+        dump_json(document, f, indent=indent)
+
+    return sidecars
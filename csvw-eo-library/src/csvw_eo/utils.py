@@ -1,10 +1,14 @@
 """Utility files."""
 
+import hashlib
+import json
 import math
+from datetime import date
 from enum import IntEnum
 from typing import Any
 
 import numpy as np
+import pandas as pd
 
 
 def sanitize(obj: dict[str, Any]) -> dict[str, Any]:
@@ -30,6 +34,48 @@ def sanitize(obj: dict[str, Any]) -> dict[str, Any]:
     return obj  # leave everything else unchanged
 
 
+def to_native(value: Any) -> Any:  # noqa: ANN401
+    """
+    Convert a value into JSON/CSVW-EO serializable native types.
+
+    Counterpart of :func:`sanitize` applied to single field values when
+    metadata models are built, so that their serialization needs no second
+    pass. Dictionary keys are converted as well.
+
+    - NumPy scalars → Python scalars
+    - Dates and datetimes → ISO 8601 strings
+    - NaN or Inf → ValueError
+    - Lists, tuples and dictionaries are converted recursively
+    """
+    if isinstance(value, dict):
+        return {to_native(k): to_native(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_native(v) for v in value]
+    if isinstance(value, np.datetime64):
+        value = pd.Timestamp(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        value = value.item()
+
+    if isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
+        raise ValueError("Value in Nan or infinite")
+
+    return value
+
+
+def metadata_fingerprint(metadata: dict[str, Any]) -> str:
+    """
+    Return a stable fingerprint of CSVW-EO JSON metadata.
+
+    The SHA-256 digest of the canonical JSON serialization (sorted keys), so
+    that equal metadata have the same fingerprint whatever the key order.
+    Used as cache key for objects derived from the metadata.
+    """
+    payload = json.dumps(metadata, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
 class ContributionLevel(IntEnum):
     """
     Represents the level at which contribution bounds are applied in CSVW-EO metadata.
@@ -1,14 +1,15 @@
 """Validate metadata file format."""
 
 import argparse
-import json
 from pathlib import Path
 from typing import Any
 
-from csvw_eo.metadata_structure import TableMetadata
+from csvw_eo.constants import COL_LIST, TABLE_SCHEMA
+from csvw_eo.metadata_stream import MetadataEvent, iter_metadata
+from csvw_eo.metadata_structure import ColumnGroupMetadata, ColumnMetadata, TableMetadata
 
 
-def validate_metadata(metadata: dict[str, Any]) -> TableMetadata:
+def validate_metadata(metadata: dict[str, Any], columnar: bool = False, deep: bool = True) -> TableMetadata:
     """
     Validate CSVW-EO metadata against the pydantic model.
 
@@ -16,9 +17,54 @@ def validate_metadata(metadata: dict[str, Any]) -> TableMetadata:
     ----------
     metadata : dict
         CSVW-EO metadata structure.
+    columnar : bool, default=False
+        If True, partitions and public keys are loaded in compact
+        PartitionTables instead of lists of models.
+    deep : bool, default=True
+        If False, partitions and public keys are only parsed and validated
+        when first accessed (see ``TableMetadata.from_dict(lazy=True)``).
 
     """
-    return TableMetadata.from_dict(metadata)
+    return TableMetadata.from_dict(metadata, columnar=columnar, lazy=not deep)
+
+
+def validate_metadata_file(path: str | Path, columnar: bool = False) -> int:
+    """
+    Validate a CSVW-EO metadata file one column at a time.
+
+    The file is streamed (see :mod:`csvw_eo.metadata_stream`): each column
+    and column group is validated and discarded before the next one is
+    decoded, so documents larger than memory can be checked.
+
+    Parameters
+    ----------
+    path : str or Path
+        JSON metadata file.
+    columnar : bool, default=False
+        If True, partitions and public keys are validated as PartitionTables,
+        which is faster and lighter on very large lists.
+
+    Returns
+    -------
+    int
+        Number of validated columns and column groups.
+
+    """
+    fields: dict[str, Any] = {}
+    nb_validated = 0
+    for event, value in iter_metadata(path):
+        if event == MetadataEvent.FIELD:
+            fields[value[0]] = value[1]
+        elif event == MetadataEvent.COLUMN:
+            ColumnMetadata.from_dict(value, columnar)
+            nb_validated += 1
+        elif event == MetadataEvent.COLUMN_GROUP:
+            ColumnGroupMetadata.from_dict(value, columnar)
+            nb_validated += 1
+
+    # Table-level fields, without the columns already validated
+    TableMetadata.from_dict({**fields, TABLE_SCHEMA: {COL_LIST: []}})
+    return nb_validated
 
 
 def main() -> None:
@@ -40,10 +86,7 @@ def main() -> None:
     if not metadata_path.exists():
         raise FileNotFoundError(f"Metadata file not found: {metadata_path}")
 
-    with metadata_path.open("r", encoding="utf-8") as f:
-        metadata = json.load(f)
-
-    validate_metadata(metadata)
+    validate_metadata_file(metadata_path)
 
 
 if __name__ == "__main__":
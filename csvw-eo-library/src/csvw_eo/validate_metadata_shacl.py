@@ -5,6 +5,13 @@ This module validates CSVW-EO metadata files against a SHACL schema
 using the pySHACL engine. The metadata is expected to be in JSON-LD
 format and the SHACL shapes in Turtle format.
 
+JSON-LD contexts are resolved offline, from the contexts bundled with the
+package (see :mod:`csvw_eo.jsonld_context`).
+
+A ``ShaclValidator`` parses and analyses the shapes once, and validates any
+number of documents with them; ``validate_many`` spreads a batch of files
+over a process pool, with one validator per worker.
+
 Requires
 --------
 pyshacl
@@ -12,17 +19,204 @@ rdflib
 """
 
 import argparse
+import logging
+import os
 import sys
+import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
-from pyshacl import validate as shacl_validate
+from pyshacl import Validator
+from pyshacl.graph_abstraction import DataGraph
+from pyshacl.monkey import rdflib_bool_patch, rdflib_bool_unpatch
+from pyshacl.shapes_graph import ShapesGraph
 from rdflib import Graph
 
+from csvw_eo.jsonld_context import metadata_graph
+from csvw_eo.metadata_stream import METADATA_SUFFIXES, metadata_files  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ShaclResult:
+    """SHACL validation result of one metadata file."""
+
+    path: Path
+    conforms: bool
+    report: str
+    seconds: float
+    error: str | None = None  # set if the file could not be validated
+
+
+@dataclass(frozen=True)
+class ShaclBatchResult:
+    """SHACL validation results of a batch of metadata files."""
+
+    results: list[ShaclResult]
+    seconds: float  # wall-clock time of the batch
+
+    @property
+    def conforms(self) -> bool:
+        """Return True if every file conforms."""
+        return all(result.conforms for result in self.results)
+
+    @property
+    def failures(self) -> list[ShaclResult]:
+        """Return the results of the files that do not conform or could not be validated."""
+        return [result for result in self.results if not result.conforms]
+
+    @property
+    def validation_seconds(self) -> float:
+        """Return the sum of the validation times of the files (over all workers)."""
+        return sum(result.seconds for result in self.results)
+
+    def summary(self) -> str:
+        """Return a one-line summary of the batch, with timings."""
+        nb_files = len(self.results)
+        mean = self.validation_seconds / nb_files if nb_files else 0.0
+        return (
+            f"{nb_files} files, {len(self.failures)} failed, {self.seconds:.2f}s wall-clock, "
+            f"{self.validation_seconds:.2f}s validation ({mean * 1000:.1f}ms per file)"
+        )
+
+
+class ShaclValidator:
+    """
+    SHACL validator of CSVW-EO metadata, with the shapes parsed once.
+
+    Parameters
+    ----------
+    shacl_file : str or Path
+        SHACL shapes file in Turtle format.
+    inference : str, default="rdfs"
+        pySHACL pre-inference mode applied to each metadata graph.
+
+    """
+
+    def __init__(self, shacl_file: str | Path, inference: str = "rdfs") -> None:
+        """Parse the shapes and harvest them once."""
+        self.shacl_file = Path(shacl_file)
+        self.inference = inference
+
+        rdflib_bool_patch()  # type: ignore[no-untyped-call]
+        try:
+            self.shacl_graph = Graph().parse(self.shacl_file, format="turtle")
+        finally:
+            rdflib_bool_unpatch()  # type: ignore[no-untyped-call]
+        self._shapes = ShapesGraph(self.shacl_graph, logger=logger)
+        _ = self._shapes.shapes  # harvested once, reused by every validation
+
+    def __repr__(self) -> str:
+        """Return a short description of the validator."""
+        return f"ShaclValidator({str(self.shacl_file)!r}, inference={self.inference!r})"
+
+    def validate(self, metadata: dict[str, Any] | str | Path) -> tuple[bool, str]:
+        """
+        Validate one metadata document.
+
+        Parameters
+        ----------
+        metadata : dict, str or Path
+            JSON-LD metadata, or path of a JSON-LD metadata file.
+
+        Returns
+        -------
+        tuple[bool, str]
+            Whether the metadata conforms, and the textual pySHACL report.
+
+        """
+        data_graph = DataGraph.from_rdflib(metadata_graph(metadata))
+        validator = Validator(
+            data_graph,
+            shacl_graph=self.shacl_graph,
+            options={"inference": self.inference, "inplace": True, "logger": logger},
+        )
+        # pySHACL has no public way to pass a harvested ShapesGraph: its Validator (0.40, pinned in
+        # pyproject.toml) wraps the raw graph in one, unharvested until run(), which is replaced
+        validator.shacl_graph = self._shapes
+        conforms, _, results_text = validator.run()  # type: ignore[no-untyped-call]
+        return bool(conforms), str(results_text)
+
+    def validate_file(self, path: str | Path) -> ShaclResult:
+        """
+        Validate one metadata file, timing it and capturing errors.
+
+        A file that cannot be read or parsed does not conform; the error is
+        reported in ``ShaclResult.error``.
+        """
+        path = Path(path)
+        start = time.perf_counter()
+        try:
+            conforms, report = self.validate(path)
+        except Exception as e:
+            return ShaclResult(path, False, "", time.perf_counter() - start, f"{type(e).__name__}: {e}")
+        return ShaclResult(path, conforms, report, time.perf_counter() - start)
+
+    def validate_many(self, paths: Iterable[str | Path], workers: int | None = None) -> ShaclBatchResult:
+        """
+        Validate a batch of metadata files.
+
+        Parameters
+        ----------
+        paths : iterable of str or Path
+            Metadata files.
+        workers : int, optional
+            Number of worker processes, each with its own validator. Defaults
+            to the number of CPUs; with 1, files are validated in this process.
+
+        Returns
+        -------
+        ShaclBatchResult
+            One result per file, in the order of ``paths``.
+
+        """
+        paths = [Path(path) for path in paths]
+        workers = min(workers or os.cpu_count() or 1, max(len(paths), 1))
+        start = time.perf_counter()
+        if workers == 1:
+            results = [self.validate_file(path) for path in paths]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.shacl_file, self.inference),
+            ) as executor:
+                chunksize = max(1, len(paths) // (4 * workers))
+                results = list(executor.map(_validate_in_worker, paths, chunksize=chunksize))
+        return ShaclBatchResult(results, time.perf_counter() - start)
+
+
+# Validator of each worker process of ShaclValidator.validate_many
+_WORKER_VALIDATOR: ShaclValidator | None = None
+
+
+def _init_worker(shacl_file: Path, inference: str) -> None:
+    global _WORKER_VALIDATOR  # noqa: PLW0603
+    _WORKER_VALIDATOR = ShaclValidator(shacl_file, inference)
+
+
+def _validate_in_worker(path: Path) -> ShaclResult:
+    assert _WORKER_VALIDATOR is not None  # noqa: S101
+    return _WORKER_VALIDATOR.validate_file(path)
+
+
+@lru_cache(maxsize=8)
+def _cached_validator(shacl_file: Path, mtime_ns: int) -> ShaclValidator:  # noqa: ARG001
+    return ShaclValidator(shacl_file)
+
 
 def validate_metadata_shacl(metadata_file: Path, shacl_file: Path) -> tuple[bool, str]:
     """
     Validate CSVW-EO metadata against a SHACL schema.
 
+    The validator of each shapes file is cached (until the file changes),
+    so repeated calls do not parse the shapes again.
+
     Parameters
     ----------
     metadata_file : Path
@@ -38,22 +232,8 @@ def validate_metadata_shacl(metadata_file: Path, shacl_file: Path) -> tuple[bool
         - str : Textual validation report produced by pySHACL.
 
     """
-    data_graph = Graph()
-    data_graph.parse(metadata_file, format="json-ld")
-
-    shacl_graph = Graph()
-    shacl_graph.parse(shacl_file, format="turtle")
-
-    conforms, _, results_text = shacl_validate(
-        data_graph,
-        shacl_graph=shacl_graph,
-        inference="rdfs",
-        abort_on_first=False,
-        meta_shacl=False,
-        debug=False,
-    )
-
-    return conforms, results_text
+    shacl_path = Path(shacl_file).resolve()
+    return _cached_validator(shacl_path, shacl_path.stat().st_mtime_ns).validate(metadata_file)
 
 
 def main() -> None:
@@ -61,15 +241,18 @@ def main() -> None:
     Command-line interface for SHACL validation of CSVW-EO metadata.
 
     This function parses command-line arguments specifying the metadata
-    JSON-LD file and the SHACL shapes file, then runs SHACL validation.
+    JSON-LD file (or a directory of them) and the SHACL shapes file, then
+    runs SHACL validation.
 
     If validation succeeds, a success message is printed. If validation
     fails, the validation report is printed and the program exits with
-    a non-zero status code.
+    a non-zero status code. For a directory, one line is printed per file,
+    followed by the failed reports and a summary with timings.
     """
     parser = argparse.ArgumentParser(description="SHACL validation for CSVW-EO metadata")
-    parser.add_argument("metadata_file", type=str)
+    parser.add_argument("metadata_file", type=str, help="Metadata file, or directory of metadata files")
     parser.add_argument("shacl_file", type=str, help="SHACL TTL file")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for a directory")
     args = parser.parse_args()
 
     metadata_path = Path(args.metadata_file)
@@ -82,12 +265,19 @@ def main() -> None:
         print(f"SHACL file not found: {shacl_path}")  # noqa: T201
         sys.exit(1)
 
-    try:
-        conforms, results_text = validate_metadata_shacl(metadata_path, shacl_path)
-    except ImportError:
-        print("pySHACL not installed. Please install it with `pip install pyshacl`")  # noqa: T201
-        sys.exit(1)
+    if metadata_path.is_dir():
+        batch = ShaclValidator(shacl_path).validate_many(metadata_files(metadata_path), workers=args.workers)
+        for result in batch.results:
+            status = "OK" if result.conforms else "ERROR" if result.error else "FAILED"
+            print(f"{status:<7} {result.path} ({result.seconds:.2f}s)")  # noqa: T201
+        for result in batch.failures:
+            print(f"\n{result.path}:\n{result.error or result.report}")  # noqa: T201
+        print(batch.summary())  # noqa: T201
+        if not batch.conforms:
+            sys.exit(1)
+        return
 
+    conforms, results_text = validate_metadata_shacl(metadata_path, shacl_path)
     if conforms:
         print("SHACL validation SUCCESSFUL")  # noqa: T201
     else:
@@ -0,0 +1,119 @@
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from csvw_eo import constants as c
+from csvw_eo.check_constraints import Severity, check_constraints
+from csvw_eo.metadata_structure import TableMetadata
+
+EXAMPLES = sorted(Path("examples/metadata").glob("*.json-ld"))
+
+
+def interval(lower, upper, max_length=10):
+    return {
+        "@type": "Partition",
+        c.PREDICATE: {c.LOWER_BOUND: lower, c.UPPER_BOUND: upper},
+        c.MAX_LENGTH: max_length,
+        c.MAX_GROUPS: 1,
+        c.MAX_CONTRIB: 1,
+    }
+
+
+@pytest.fixture
+def metadata():
+    return json.loads(
+        Path("examples/metadata/penguin_metadata_fine_levels_column_group_continuous.json-ld").read_text()
+    )
+
+
+def column(metadata, name):
+    return next(col for col in metadata[c.TABLE_SCHEMA][c.COL_LIST] if col[c.COL_NAME] == name)
+
+
+def failures(metadata):
+    return {(v.rule, v.path, v.severity) for v in check_constraints(metadata)}
+
+
+@pytest.mark.parametrize("path", EXAMPLES, ids=lambda p: p.name)
+def test_examples_conform(path):
+    metadata = json.loads(path.read_text())
+    report = check_constraints(metadata)
+    assert report.conforms, report.text
+    assert len(report) == len(check_constraints(TableMetadata.from_dict(metadata)))
+
+
+def test_table_constraints(metadata):
+    del metadata[c.PUBLIC_LENGTH]
+    metadata[c.PRIVACY_UNIT] = "unknown"
+    metadata[c.MAX_CONTRIB] = metadata[c.MAX_LENGTH] + 1
+
+    report = check_constraints(metadata)
+    assert not report.conforms
+    assert failures(metadata) == {
+        ("4.1.1", c.PUBLIC_LENGTH, Severity.VIOLATION),
+        ("4.1.1", c.PRIVACY_UNIT, Severity.VIOLATION),
+        ("4.1.1", c.MAX_CONTRIB, Severity.VIOLATION),
+    }
+    assert report.text.startswith("Validation Report\nConforms: False\nResults (3):")
+    assert "\tFocus Node: Table\n\tResult Path: privacyUnit" in report.text
+
+
+def test_column_partitions(metadata):
+    bill = column(metadata, "bill_length_mm")
+    bill[c.MINIMUM], bill[c.MAXIMUM] = 30.0, 60.0
+    bill[c.PUBLIC_PARTITIONS] = [
+        interval(30.0, 40.0),
+        interval(45.0, 40.0),  # inverted
+        interval(39.0, 50.0),  # overlaps the first and the inverted ones
+        interval(70.0, 80.0),  # outside [minimum, maximum]
+        interval(50.0, 60.0, max_length=10_000),
+    ]
+    bill.pop(c.EXHAUSTIVE_PARTITIONS, None)
+    metadata.pop(c.ADD_INFO)
+
+    report = check_constraints(metadata)
+    found = {(v.focus, v.rule, v.path, v.severity) for v in report}
+    focus = "Column 'bill_length_mm' partition[{}]"
+    assert found == {
+        (focus.format(1), "4.4.1", c.LOWER_BOUND, Severity.VIOLATION),
+        (focus.format(0), "4.4.1", c.UPPER_BOUND, Severity.WARNING),
+        (focus.format(2), "4.4.1", c.UPPER_BOUND, Severity.WARNING),
+        (focus.format(3), "4.2.1", c.LOWER_BOUND, Severity.VIOLATION),
+        (focus.format(4), "4.4.2", c.MAX_LENGTH, Severity.VIOLATION),
+    }
+
+    # Overlapping exhaustive partitions are violations
+    bill[c.EXHAUSTIVE_PARTITIONS] = True
+    assert ("4.8", c.UPPER_BOUND, Severity.VIOLATION) in failures(metadata)
+
+
+def test_categorical_partitions(metadata):
+    species = column(metadata, "species")
+    species[c.PUBLIC_PARTITIONS].append(copy.deepcopy(species[c.PUBLIC_PARTITIONS][0]))
+    species[c.KEY_VALUES].append("Adelie")
+    species[c.EXHAUSTIVE_PARTITIONS] = True
+    assert failures(metadata) >= {
+        ("4.2.1", c.MAX_NUM_PARTITIONS, Severity.VIOLATION),
+        ("4.8", c.PARTITION_VALUE, Severity.VIOLATION),
+    }
+
+    species[c.PUBLIC_PARTITIONS] = [interval(0, 1)]
+    assert ("4.2.1", c.PARTITION_VALUE, Severity.VIOLATION) in failures(metadata)
+
+
+def test_column_group_constraints(metadata):
+    group = metadata[c.ADD_INFO][0]
+    group[c.PUBLIC_PARTITIONS][0][c.PREDICATE]["species"] = {c.PARTITION_VALUE: "Emperor"}
+    group[c.MAX_CONTRIB] = metadata[c.MAX_CONTRIB] + 1
+    assert failures(metadata) == {
+        ("4.3.2", c.PUBLIC_PARTITIONS, Severity.VIOLATION),
+        ("4.3.3", c.MAX_CONTRIB, Severity.VIOLATION),
+    }
+
+    del column(metadata, "bill_length_mm")[c.PUBLIC_PARTITIONS]
+    assert ("4.3.2", c.PUBLIC_PARTITIONS, Severity.VIOLATION) in failures(metadata)
+
+    group[c.COLUMNS_IN_GROUP] = ["species", "beak"]
+    assert failures(metadata) >= {("4.3.1", c.COLUMNS_IN_GROUP, Severity.VIOLATION)}
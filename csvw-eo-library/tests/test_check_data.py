@@ -0,0 +1,134 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from csvw_eo import constants as c
+from csvw_eo.check_data import check_data
+from csvw_eo.datatypes import DataTypes
+
+CSV = Path("examples/penguin_plus.csv")
+METADATA = Path("examples/metadata")
+
+
+def load(name):
+    return json.loads((METADATA / f"penguin_metadata_{name}.json-ld").read_text())
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["table_level", "column_level", "partition_level", "partition_level_column_group", "fine_contrib_levels"],
+)
+def test_generated_metadata_conforms(name):
+    report = check_data(CSV, load(name), chunk_size=100, workers=2)
+    assert report.conforms, report.text
+    assert report.rows == 344
+
+
+@pytest.fixture
+def tampered(tmp_path):
+    df = pd.read_csv(CSV)
+    bad = df.astype({"favourite_number": object})
+    bad.loc[0, "favourite_number"] = "one"
+    bad.loc[1, "bill_length_mm"] = 500
+    bad.loc[2, "species"] = "Emperor"
+    bad.loc[3, "island"] = None
+    # Penguin 5 contributes 12 rows instead of 3
+    bad = pd.concat([bad, *[df[df["penguin_id"] == 5]] * 3])
+    bad.to_csv(tmp_path / "bad.csv", index=False)
+    bad.astype({"favourite_number": str}).to_parquet(tmp_path / "bad.parquet", index=False)
+    return tmp_path
+
+
+def test_value_violations(tampered):
+    report = check_data(tampered / "bad.csv", load("partition_level"), max_examples=1)
+    assert not report.conforms
+    assert report.rows == 353
+    counts = report.counts
+    assert counts[("Column 'favourite_number'", c.DATATYPE)] == 1
+    assert counts[("Column 'bill_length_mm'", c.MAXIMUM)] == 1
+    assert counts[("Column 'species'", c.KEY_VALUES)] == 1
+    assert counts[("Column 'island'", c.REQUIRED)] == 1
+    assert ("Column 'island'", c.NULL_PROP) in counts
+    assert ("Table", c.MAX_LENGTH) in counts
+
+    messages = {(v.focus, v.path): v.message for v in report}
+    assert messages[("Column 'favourite_number'", c.DATATYPE)] == "Row 0: 'one' does not parse as Int64"
+    assert "'Emperor'" in messages[("Column 'species'", c.KEY_VALUES)]
+
+
+def test_contribution_violations(tampered):
+    report = check_data(tampered / "bad.csv", load("partition_level"), max_examples=1)
+    counts = report.counts
+    assert counts[("Table", c.MAX_CONTRIB)] == 1
+    assert counts[("Column 'favourite_number' partition[*]", c.MAX_GROUPS)] == 3
+    assert counts[("Column 'species' partition[*]", c.MAX_LENGTH)] == 1
+    # Only the first violation of each rule is kept
+    assert len([v for v in report if v.focus == "Column 'favourite_number' partition[*]"]) == 2
+    messages = {(v.focus, v.path): v.message for v in report}
+    assert messages[("Table", c.MAX_CONTRIB)] == "Privacy unit '5' contributes 12 rows > maxContributions 3"
+
+
+def test_column_group_contributions(tmp_path):
+    df = pd.read_csv(CSV)
+    rows = df.index[df["penguin_id"] == 5]
+    df.loc[rows, "island"] = ["Biscoe", "Dream", "Torgersen"]
+    df.to_csv(tmp_path / "data.csv", index=False)
+
+    report = check_data(tmp_path / "data.csv", load("partition_level_column_group"))
+    group = "ColumnGroup[0] ['species', 'island'] partition[*]"
+    assert report.counts[(group, c.MAX_CONTRIB)] == 3
+    message = next(v.message for v in report if (v.focus, v.path) == (group, c.MAX_CONTRIB))
+    assert message == "Privacy unit '5' of partition 0 contributes to 3 partitions > maxContributions 1"
+
+
+def test_chunking_does_not_change_the_report(tampered):
+    metadata = load("partition_level")
+    expected = check_data(tampered / "bad.csv", metadata, max_examples=3)
+    for kwargs in (
+        {"chunk_size": 40, "workers": 1, "buckets": 1},
+        {"chunk_size": 7, "workers": 3, "buckets": 5},
+    ):
+        report = check_data(tampered / "bad.csv", metadata, max_examples=3, **kwargs)
+        assert report.counts == expected.counts
+        # Units are reported bucket by bucket
+        assert sorted(map(str, report)) == sorted(map(str, expected))
+    assert (
+        check_data(tampered / "bad.parquet", metadata, max_examples=3, chunk_size=64).counts
+        == expected.counts
+    )
+
+
+def test_datatypes(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("byte,day,flag\n1,2024-01-01,true\n300,2024-02-30,maybe\n2.5,,FALSE\n")
+    metadata = {
+        c.TABLE_SCHEMA: {
+            c.COL_LIST: [
+                {c.COL_NAME: "byte", c.DATATYPE: DataTypes.UNSIGNED_BYTE, c.MINIMUM: 0, c.MAXIMUM: 10},
+                {c.COL_NAME: "day", c.DATATYPE: DataTypes.DATE, c.MINIMUM: "2024-01-01"},
+                {c.COL_NAME: "flag", c.DATATYPE: DataTypes.BOOLEAN},
+                {c.COL_NAME: "missing", c.DATATYPE: DataTypes.STRING},
+            ]
+        }
+    }
+    report = check_data(path, metadata)
+    assert report.counts == {
+        ("Column 'byte'", c.DATATYPE): 2,  # out of range, not an integer
+        ("Column 'day'", c.DATATYPE): 1,
+        ("Column 'flag'", c.DATATYPE): 1,
+        ("Table", c.COL_NAME): 1,
+    }
+
+
+def test_integers_are_exact(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("id\n9007199254740992\n9007199254740993\n3.7\n4.0\n")
+    metadata = {
+        c.TABLE_SCHEMA: {
+            c.COL_LIST: [{c.COL_NAME: "id", c.DATATYPE: DataTypes.LONG, c.MAXIMUM: 2**53}],
+        }
+    }
+    report = check_data(path, metadata)
+    assert report.counts == {("Column 'id'", c.MAXIMUM): 1, ("Column 'id'", c.DATATYPE): 1}
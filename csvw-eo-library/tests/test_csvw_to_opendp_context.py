@@ -14,7 +14,7 @@ from csvw_eo.constants import (  # PRIVACY_ID,
     PRIVACY_UNIT,
     TABLE_SCHEMA,
 )
-from csvw_eo.csvw_to_opendp_context import csvw_to_opendp_context
+from csvw_eo.csvw_to_opendp_context import csvw_to_opendp_context, get_opendp_schema
 
 dp.enable_features("contrib")
 
@@ -62,6 +62,26 @@ def test_epsilon_context(mock_csvw_meta, mock_data):
     assert res.select("len").item() > 0
 
 
+def test_cast_data_context(mock_csvw_meta, mock_data):
+    """Test casting the dataset to the metadata schema, with dtypes supported by OpenDP."""
+    mock_csvw_meta[TABLE_SCHEMA][COL_LIST][1][DATATYPE] = "unsignedByte"
+    mock_csvw_meta[TABLE_SCHEMA][COL_LIST][2][DATATYPE] = "date"
+    schema = get_opendp_schema(mock_csvw_meta)
+    assert schema["age"] == pl.UInt32
+    assert schema["signup_date"] == pl.Date
+
+    context = csvw_to_opendp_context(
+        csvw_meta=mock_csvw_meta,
+        data=mock_data,
+        epsilon=10.0,
+        delta=1e-6,
+        split_evenly_over=1,
+        cast_data=True,
+    )
+    query = context.query().group_by("age").agg(dp.len())
+    assert query.release().collect().schema["age"] == pl.UInt32
+
+
 def test_rho_context(mock_csvw_meta, mock_data):
     """Test OpenDP context creation with rho (Gaussian DP)."""
     context = csvw_to_opendp_context(csvw_meta=mock_csvw_meta, data=mock_data, rho=0.5, split_evenly_over=1)
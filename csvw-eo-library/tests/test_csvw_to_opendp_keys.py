@@ -0,0 +1,77 @@
+import json
+from pathlib import Path
+
+import opendp.prelude as dp
+import polars as pl
+
+from csvw_eo.csvw_to_opendp_context import csvw_to_opendp_context, get_public_keys
+from csvw_eo.csvw_to_opendp_keys import csvw_to_opendp_keys
+from csvw_eo.read_with_metadata import scan_with_metadata
+
+CSV = Path("examples/penguin_plus.csv")
+METADATA = Path("examples/metadata")
+SPECIES = pl.Enum(["Adelie", "Chinstrap", "Gentoo"])
+
+
+def load(name):
+    return json.loads((METADATA / f"penguin_metadata_{name}.json-ld").read_text())
+
+
+def test_key_frames():
+    keys = csvw_to_opendp_keys(load("column_level_column_group"))
+    assert keys[("species",)]["species"].to_list() == ["Adelie", "Chinstrap", "Gentoo"]
+    assert keys[("sex",)].schema == pl.Schema({"sex": pl.Boolean})
+    assert keys[("favourite_number",)].height == 6
+
+    group = keys[("species", "island")]
+    assert group.schema["species"] == SPECIES
+    assert group.rows()[:2] == [("Adelie", "Biscoe"), ("Adelie", "Dream")]
+    assert keys[("species", "island", "favourite_number")].height == 30
+
+
+def test_key_frames_from_partitions():
+    keys = csvw_to_opendp_keys(load("partition_level_column_group"))
+    assert keys[("species", "island")].height == 5
+
+    # Continuous partitions have no enumerable keys
+    assert ("bill_length_mm",) not in csvw_to_opendp_keys(load("partition_level_with_continuous"))
+    assert csvw_to_opendp_keys(load("table_level")) == {}
+
+
+def test_key_frames_cache():
+    metadata = load("column_level_column_group")
+    keys = csvw_to_opendp_keys(metadata)
+    assert csvw_to_opendp_keys(json.loads(json.dumps(metadata))) is keys
+
+    metadata["tableSchema"]["columns"][-1]["keyValues"] = [0, 1]
+    assert csvw_to_opendp_keys(metadata) is not keys
+    assert csvw_to_opendp_keys(metadata)[("favourite_number",)].height == 2
+
+    # An explicit key is trusted, the document is not hashed again
+    keys = csvw_to_opendp_keys(metadata, key=("metadata.json", 1))
+    metadata["tableSchema"]["columns"][-1]["keyValues"] = [0, 1, 2]
+    assert csvw_to_opendp_keys(metadata, key=("metadata.json", 1)) is keys
+    assert csvw_to_opendp_keys(metadata, key=("metadata.json", 2))[("favourite_number",)].height == 3
+
+
+def test_context_public_keys():
+    metadata = load("column_level_column_group")
+    data = scan_with_metadata(CSV, metadata)
+    context = csvw_to_opendp_context(csvw_meta=metadata, data=data, epsilon=1.0, split_evenly_over=2)
+    keys = get_public_keys(metadata, data)[("species", "island")]
+    query = context.query().group_by("species", "island").agg(dp.len()).with_keys(keys)
+    assert query.release().collect().height == 5
+
+    # Keys are typed like the dataset
+    strings = pl.scan_csv(CSV, infer_schema_length=0)
+    public_keys = get_public_keys(metadata, strings)
+    assert public_keys[("species",)].schema == pl.Schema({"species": pl.String})
+    assert public_keys[("favourite_number",)].schema == pl.Schema({"favourite_number": pl.String})
+
+    # or like the dataset cast by the context
+    context = csvw_to_opendp_context(
+        csvw_meta=metadata, data=strings, epsilon=1.0, split_evenly_over=1, cast_data=True
+    )
+    keys = get_public_keys(metadata, strings, cast_data=True)[("species", "island")]
+    query = context.query().group_by("species", "island").agg(dp.len()).with_keys(keys)
+    assert query.release().collect().height == 5
@@ -1,3 +1,6 @@
+import json
+import sys
+
 import pytest
 import yaml
 
@@ -13,7 +16,14 @@ from csvw_eo.constants import (
     REQUIRED,
     TABLE_SCHEMA,
 )
-from csvw_eo.csvw_to_smartnoise_sql import csvw_to_smartnoise_sql
+from csvw_eo.csvw_to_smartnoise_sql import (
+    SmartNoiseTable,
+    csvw_to_smartnoise_sql,
+    csvw_to_smartnoise_sql_batch,
+    directory_tables,
+    main,
+    read_manifest,
+)
 
 
 def mock_csvw_metadata():
@@ -172,3 +182,77 @@ def test_missing_max_contributions_raises():
             schema_name="Schema",
             table_name="Table",
         )
+
+
+@pytest.fixture
+def catalogue_dir(tmp_path):
+    """Directory of three CSVW-EO documents."""
+    for name in ["users", "visits", "orders"]:
+        csvw_meta = mock_csvw_metadata()
+        csvw_meta[MAX_CONTRIB] = len(name)
+        (tmp_path / f"{name}.json-ld").write_text(json.dumps(csvw_meta))
+    return tmp_path
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_directory(catalogue_dir, workers):
+    """Test converting a directory of documents into one catalogue."""
+    tables = directory_tables(catalogue_dir, schema="Shop")
+    assert [table.table for table in tables] == ["orders", "users", "visits"]
+
+    snsql_meta = csvw_to_smartnoise_sql_batch(tables, workers=workers, censor_dims=False)
+    catalogue = snsql_meta[""]["Shop"]
+    assert list(catalogue) == ["orders", "users", "visits"]
+    assert catalogue["visits"]["max_ids"] == 6
+    users = json.loads((catalogue_dir / "users.json-ld").read_text())
+    assert (
+        catalogue["users"]
+        == csvw_to_smartnoise_sql(users, "Shop", "users", censor_dims=False)[""]["Shop"]["users"]
+    )
+
+
+def test_batch_manifest_and_errors(catalogue_dir):
+    """Test manifests, duplicate tables and conversion failures."""
+    manifest = catalogue_dir / "manifest.yaml"
+    manifest.write_text(
+        yaml.safe_dump(
+            [
+                {"input": "users.json-ld", "schema": "Crm", "table": "Users"},
+                {"input": "orders.json-ld", "schema": "Sales"},
+                {"input": "visits.json-ld", "schema": "Sales"},
+            ]
+        )
+    )
+    snsql_meta = csvw_to_smartnoise_sql_batch(read_manifest(manifest), workers=1)
+    assert {schema: list(tables) for schema, tables in snsql_meta[""].items()} == {
+        "Crm": ["Users"],
+        "Sales": ["orders", "visits"],
+    }
+
+    with pytest.raises(ValueError, match="Duplicate SmartNoise table Sales.orders"):
+        csvw_to_smartnoise_sql_batch([SmartNoiseTable(catalogue_dir / "orders.json-ld", "Sales")] * 2)
+
+    (catalogue_dir / "broken.json").write_text(json.dumps({TABLE_SCHEMA: {COL_LIST: []}}))
+    with pytest.raises(ValueError, match="1 tables could not be converted:\n.*broken.json: ValueError"):
+        csvw_to_smartnoise_sql_batch(directory_tables(catalogue_dir), workers=1)
+
+    manifest.write_text(yaml.safe_dump({"input": "users.json-ld"}))
+    with pytest.raises(ValueError, match="must be a list"):
+        read_manifest(manifest)
+
+
+def test_cli_directory(catalogue_dir, tmp_path_factory, monkeypatch):
+    """Test the CLI on a directory."""
+    output = tmp_path_factory.mktemp("out") / "catalogue.yaml"
+    argv = [
+        "csvw_to_smartnoise_sql",
+        "--input",
+        str(catalogue_dir),
+        "--output",
+        str(output),
+        "--workers",
+        "1",
+    ]
+    monkeypatch.setattr(sys, "argv", argv)
+    main()
+    assert list(yaml.safe_load(output.read_text())[""]["MySchema"]) == ["orders", "users", "visits"]
@@ -0,0 +1,106 @@
+import opendp.prelude as dp
+import pandas as pd
+import polars as pl
+import pytest
+
+from csvw_eo.constants import (
+    COL_LIST,
+    COL_NAME,
+    DATATYPE,
+    DEPENDENCY_TYPE,
+    DEPENDS_ON,
+    EXHAUSTIVE_KEYS,
+    KEY_VALUES,
+    MAX_CONTRIB,
+    MAX_LENGTH,
+    MAX_NUM_PARTITIONS,
+    MAXIMUM,
+    MINIMUM,
+    NULL_PROP,
+    ROW_DEP,
+    TABLE_SCHEMA,
+    DependencyType,
+)
+from csvw_eo.csvw_to_opendp_context import csvw_to_opendp_context
+from csvw_eo.datatypes import DataTypes
+from csvw_eo.dummy_lazyframe import dummy_lazyframe, plan_schema
+from csvw_eo.make_dummy_from_metadata import compile_generation_plan
+
+dp.enable_features("contrib")
+
+
+@pytest.fixture
+def metadata():
+    return {
+        MAX_CONTRIB: 1,
+        MAX_LENGTH: 1_000,
+        TABLE_SCHEMA: {
+            COL_LIST: [
+                {COL_NAME: "id", DATATYPE: DataTypes.INTEGER, MINIMUM: 0, MAXIMUM: 20},
+                {
+                    COL_NAME: "colour",
+                    DATATYPE: DataTypes.STRING,
+                    KEY_VALUES: ["red", "blue"],
+                    EXHAUSTIVE_KEYS: True,
+                    MAX_NUM_PARTITIONS: 2,
+                    NULL_PROP: 0.1,
+                },
+                {
+                    COL_NAME: "when",
+                    DATATYPE: DataTypes.DATETIME,
+                    MINIMUM: "2020-01-01",
+                    MAXIMUM: "2021-01-01",
+                },
+            ]
+        },
+    }
+
+
+def test_dummy_lazyframe_matches_chunks(metadata):
+    lf = dummy_lazyframe(metadata, nb_rows=250, seed=2, chunk_size=100)
+    df = lf.collect()
+
+    plan = compile_generation_plan(metadata)
+    expected = pd.concat(plan.iter_chunks(250, chunk_size=100, seed=2), ignore_index=True)
+
+    assert df.shape == (250, 3)
+    assert df.columns == ["id", "colour", "when"]
+    assert df.schema == plan_schema(plan)
+    assert df["colour"].null_count() == 25
+    assert df["id"].to_list() == expected["id"].tolist()
+    assert lf.collect().equals(df)
+
+
+def test_dummy_lazyframe_fixed_dependency(metadata):
+    metadata[TABLE_SCHEMA][COL_LIST][2][ROW_DEP] = [{DEPENDS_ON: "id", DEPENDENCY_TYPE: DependencyType.FIXED}]
+    df = dummy_lazyframe(metadata, nb_rows=1000, chunk_size=100).collect()
+    assert df.group_by("id").agg(pl.col("when").n_unique())["when"].max() == 1
+
+
+def test_dummy_lazyframe_pushdowns(metadata):
+    lf = dummy_lazyframe(metadata, nb_rows=250, seed=2, chunk_size=100)
+    full = lf.collect()
+
+    assert lf.select("colour").collect().columns == ["colour"]
+    assert lf.head(30).collect().equals(full.head(30))
+    filtered = lf.filter(pl.col("id") > 10).select("id").collect()
+    assert filtered.equals(full.filter(pl.col("id") > 10).select("id"))
+
+
+def test_dummy_lazyframe_categorical(metadata):
+    lf = dummy_lazyframe(metadata, nb_rows=10, categorical=True)
+    assert lf.collect_schema()["colour"] == pl.Categorical
+
+
+def test_dummy_lazyframe_invalid_chunk_size(metadata):
+    with pytest.raises(ValueError, match="chunk_size"):
+        dummy_lazyframe(metadata, nb_rows=10, chunk_size=0)
+
+
+def test_dummy_lazyframe_opendp_context(metadata):
+    lf = dummy_lazyframe(metadata, nb_rows=500, chunk_size=128)
+    context = csvw_to_opendp_context(
+        csvw_meta=metadata, data=lf, epsilon=10.0, delta=1e-6, split_evenly_over=1
+    )
+    res = context.query().select(dp.len()).release().collect()
+    assert res.select("len").item() > 0
@@ -0,0 +1,124 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from csvw_eo import constants as c
+from csvw_eo.check_data import check_data
+from csvw_eo.datatypes import DataTypes
+from csvw_eo.enforce_bounds import enforce_bounds, scan_data, sink_data
+
+CSV = Path("examples/penguin_plus.csv")
+METADATA = Path("examples/metadata")
+
+# Rules on the size and the missing values of the table, which sampling cannot enforce
+NOT_ENFORCED = {c.MAX_LENGTH, c.PUBLIC_LENGTH, c.NULL_PROP, c.REQUIRED}
+
+
+def load(name):
+    return json.loads((METADATA / f"penguin_metadata_{name}.json-ld").read_text())
+
+
+@pytest.fixture
+def tampered(tmp_path):
+    df = pd.read_csv(CSV)
+    bad = df.astype({"favourite_number": object})
+    bad.loc[0, "favourite_number"] = "one"
+    bad.loc[1, "bill_length_mm"] = 500
+    bad.loc[2, "species"] = "Emperor"
+    # Penguin 5 contributes 12 rows instead of 3, penguin 6 to every island
+    bad = pd.concat([bad, *[df[df["penguin_id"] == 5]] * 3])
+    rows = bad.index[bad["penguin_id"] == 6]
+    bad.loc[rows, "island"] = ["Biscoe", "Dream", "Torgersen"][: len(rows)]
+    bad.to_csv(tmp_path / "bad.csv", index=False)
+    return tmp_path / "bad.csv"
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "table_level",
+        "column_level",
+        "partition_level",
+        "partition_level_column_group",
+        "fine_contrib_levels",
+        "fine_levels_column_group_continuous",
+    ],
+)
+def test_bounded_data_conforms(name, tampered, tmp_path):
+    metadata = load(name)
+    assert not check_data(tampered, metadata).conforms
+
+    sink_data(enforce_bounds(scan_data(tampered, metadata), metadata), tmp_path / "bounded.csv")
+    report = check_data(tmp_path / "bounded.csv", metadata)
+    assert {path for _, path in report.counts} <= NOT_ENFORCED, report.text
+
+
+def test_conforming_data_is_unchanged():
+    metadata = load("partition_level_column_group")
+    data = scan_data(CSV, metadata)
+    bounded = enforce_bounds(data, metadata, seed=3).collect()
+    assert bounded.equals(data.collect())
+
+
+def test_samples_depend_on_the_seed(tampered):
+    metadata = load("partition_level")
+    data = scan_data(tampered, metadata).collect()
+    first = enforce_bounds(data, metadata, seed=1).collect()
+    assert first.equals(enforce_bounds(data, metadata, seed=1).collect())
+    assert enforce_bounds(data.to_pandas(), metadata, seed=1).collect().equals(first)
+    assert (first["penguin_id"] == 5).sum() == 3
+    samples = {
+        tuple(enforce_bounds(data, metadata, seed=seed).collect()["bill_depth_mm"].to_list())
+        for seed in range(10)
+    }
+    assert len(samples) > 1
+
+
+def test_clamps_and_filters():
+    metadata = {
+        c.TABLE_SCHEMA: {
+            c.COL_LIST: [
+                {c.COL_NAME: "x", c.DATATYPE: DataTypes.INTEGER, c.MINIMUM: 0, c.MAXIMUM: 10},
+                {c.COL_NAME: "day", c.DATATYPE: DataTypes.DATE, c.MAXIMUM: "2024-06-30"},
+                {
+                    c.COL_NAME: "kind",
+                    c.DATATYPE: DataTypes.STRING,
+                    c.KEY_VALUES: ["a", "b"],
+                    c.EXHAUSTIVE_KEYS: True,
+                },
+            ]
+        }
+    }
+    data = pl.DataFrame(
+        {
+            "x": [-5, 5, 50, None],
+            "day": pl.Series(["2024-01-01", "2024-12-31", None, "2024-03-01"]).str.to_date(),
+            "kind": ["a", "b", None, "c"],
+        }
+    )
+    bounded = enforce_bounds(data, metadata).collect()
+    assert bounded["x"].to_list() == [0, 5, 10]
+    assert bounded["day"].cast(pl.String).to_list() == ["2024-01-01", "2024-06-30", None]
+    # Missing keys are kept, keys outside the exhaustive keys are not
+    assert bounded["kind"].to_list() == ["a", "b", None]
+
+
+def test_missing_privacy_unit():
+    metadata = load("table_level")
+    data = pd.read_csv(CSV).drop(columns="penguin_id")
+    with pytest.raises(ValueError, match="penguin_id"):
+        enforce_bounds(data, metadata)
+
+
+def test_parquet(tampered, tmp_path):
+    metadata = load("partition_level")
+    pd.read_csv(tampered).astype({"favourite_number": str}).to_parquet(tmp_path / "bad.parquet", index=False)
+    data = scan_data(tmp_path / "bad.parquet", metadata).with_columns(
+        pl.col("favourite_number").cast(pl.Int64, strict=False)
+    )
+    sink_data(enforce_bounds(data, metadata), tmp_path / "bounded.parquet")
+    report = check_data(tmp_path / "bounded.parquet", metadata)
+    assert {path for _, path in report.counts} <= NOT_ENFORCED, report.text
@@ -21,15 +21,19 @@ from csvw_eo.constants import (
     RANDOM_STRINGS,
     ROW_DEP,
     VALUE_MAP,
+    DatetimeResolution,
     DependencyType,
 )
 from csvw_eo.datatypes import DataTypes
 from csvw_eo.generate_series import (
+    ColumnSampler,
+    DatetimeSampler,
     bigger_series,
     fixed_series,
     mapping_series,
     generate_column_series,
     generate_dataframe,
+    generate_datetime_column,
     get_bounds,
 )
 
@@ -189,6 +193,49 @@ def test_generate_column_series_datetime(rng):
     assert (s >= lower).all() and (s <= upper).all()
 
 
+def test_generate_datetime_column_day_resolution_keeps_time_of_day(rng):
+    col_meta = {
+        DATATYPE: DataTypes.DATETIME,
+        MINIMUM: "2026-01-01T06:30:00",
+        MAXIMUM: "2026-01-05T00:00:00",
+    }
+    s = generate_datetime_column(col_meta, 50, rng)
+    assert (s.dt.hour == 6).all() and (s.dt.minute == 30).all()
+    assert s.max() <= pd.Timestamp(col_meta[MAXIMUM])
+
+
+@pytest.mark.parametrize("resolution", [DatetimeResolution.SECOND, DatetimeResolution.MICROSECOND])
+def test_generate_datetime_column_wide_range_fine_resolution(rng, resolution):
+    col_meta = {
+        DATATYPE: DataTypes.DATETIME,
+        MINIMUM: "1900-01-01",
+        MAXIMUM: "2100-12-31T23:59:59",
+    }
+    sampler = DatetimeSampler.from_metadata(col_meta, resolution)
+    s = sampler.sample(1000, rng)
+    assert pd.api.types.is_datetime64_any_dtype(s)
+    assert (s >= pd.Timestamp(col_meta[MINIMUM])).all()
+    assert (s <= pd.Timestamp(col_meta[MAXIMUM])).all()
+    # intra-day values are produced
+    assert (s.dt.normalize() != s).any()
+
+
+def test_sampler_without_draw_cannot_be_created():
+    class IncompleteSampler(ColumnSampler):
+        @classmethod
+        def from_metadata(cls, col_meta):
+            return cls(pandas_dtype="Int64")
+
+    with pytest.raises(TypeError, match="draw"):
+        IncompleteSampler.from_metadata({})
+
+
+def test_generate_date_column_ignores_fine_resolution(rng):
+    col_meta = {DATATYPE: DataTypes.DATE, MINIMUM: "2020-01-01", MAXIMUM: "2020-12-31"}
+    s = generate_datetime_column(col_meta, 100, rng, DatetimeResolution.MICROSECOND)
+    assert (s.dt.normalize() == s).all()
+
+
 def test_generate_column_series_duration(rng):
     """Test generating a duration column using generate_column_series."""
     col_meta = {
@@ -0,0 +1,66 @@
+import importlib
+import json
+import subprocess
+import sys
+
+import pytest
+
+import csvw_eo
+
+HEAVY = ("opendp", "pyshacl", "rdflib", "polars", "pandas")
+LIGHT_CLI = ("opendp", "pyshacl", "rdflib", "polars")
+
+# Heavy dependencies that each entry point must not import, and its import time budget in
+# seconds. The budgets are coarse (measured: 0.03s for the package, 0.5 to 0.8s for the
+# scripts, which load pandas), to catch a heavy dependency imported again, not to benchmark
+# (see benchmarks/bench_import_time.py).
+ENTRY_POINTS = {
+    "csvw_eo": (HEAVY, 0.5),
+    "csvw_eo.__main__": (HEAVY, 0.5),
+    "csvw_eo.csvw_to_smartnoise_sql": (LIGHT_CLI, 2.5),
+    "csvw_eo.make_dummy_from_metadata": (LIGHT_CLI, 2.5),
+    "csvw_eo.make_metadata_from_data": (LIGHT_CLI, 2.5),
+    "csvw_eo.validate_metadata": (LIGHT_CLI, 2.5),
+    "csvw_eo.validate_metadata_shacl": (("opendp", "polars"), 4.0),
+}
+
+# Imports timed per entry point: the fastest is compared to the budget
+ATTEMPTS = 3
+
+
+def cold_import(module: str) -> tuple[float, list[str]]:
+    """Import a module in a fresh interpreter, returning its time and the heavy modules loaded."""
+    code = (
+        "import json, sys, time; start = time.perf_counter(); "
+        f"import {module}; seconds = time.perf_counter() - start; "
+        f"print(json.dumps([seconds, [m for m in {HEAVY!r} if m in sys.modules]]))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    seconds, loaded = json.loads(output)
+    return seconds, loaded
+
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_entry_point_imports(module):
+    forbidden, budget = ENTRY_POINTS[module]
+    seconds, loaded = cold_import(module)
+    assert not set(loaded) & set(forbidden)
+
+    # A slow machine gets more attempts, not a larger budget
+    for _ in range(ATTEMPTS - 1):
+        if seconds < budget:
+            break
+        seconds = min(seconds, cold_import(module)[0])
+    assert seconds < budget, f"import {module} took {seconds:.2f}s"
+
+
+def test_lazy_names():
+    assert set(csvw_eo.__all__) <= set(dir(csvw_eo))
+    for name in csvw_eo.__all__:
+        assert not isinstance(getattr(csvw_eo, name), type(csvw_eo)), name
+
+    # Submodules do not shadow the functions of the same name
+    importlib.import_module("csvw_eo.validate_metadata")
+    assert callable(csvw_eo.validate_metadata)
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        csvw_eo.missing  # noqa: B018
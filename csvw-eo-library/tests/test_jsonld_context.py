@@ -0,0 +1,135 @@
+import json
+from pathlib import Path
+
+import pytest
+from rdflib import RDF, XSD, Literal, URIRef
+from rdflib.compare import isomorphic
+
+from csvw_eo import constants as c
+from csvw_eo import jsonld_context
+from csvw_eo.jsonld_context import (
+    CSVW_CONTEXT_FILE,
+    CSVW_EO_CONTEXT_FILE,
+    context_file,
+    load_context,
+    metadata_graph,
+)
+from csvw_eo.validate_metadata_shacl import validate_metadata_shacl
+
+CSVW = "http://www.w3.org/ns/csvw#"
+EXAMPLE = Path("examples/metadata/penguin_metadata_partition_level.json-ld")
+
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch):
+    def fetch(*args, **kwargs):
+        raise AssertionError("JSON-LD context fetched from the network")
+
+    monkeypatch.setattr("rdflib.plugins.shared.jsonld.context.source_to_json", fetch)
+
+
+def test_context_file(tmp_path):
+    assert context_file(c.CSVW_CONTEXT) == CSVW_CONTEXT_FILE
+    assert context_file(c.CSVW_SAFE_CONTEXT) == CSVW_EO_CONTEXT_FILE
+    assert context_file("/home/someone/csvw-eo-context.jsonld") == CSVW_EO_CONTEXT_FILE
+    assert Path(c.CSVW_SAFE_CONTEXT).is_file()
+
+    local = tmp_path / "local.jsonld"
+    local.write_text(json.dumps({"@context": {"x": "http://example.org/x"}}))
+    assert context_file("local.jsonld", base=tmp_path) == local.resolve()
+    assert load_context(f"file://{local}")["@context"] == {"x": "http://example.org/x"}
+
+    with pytest.raises(ValueError, match="not available offline"):
+        context_file("https://example.org/context.jsonld")
+    with pytest.raises(ValueError, match="not found"):
+        context_file("missing.jsonld", base=tmp_path)
+
+
+# Terms of the CSVW-EO extension, which the CSVW context does not define
+CSVW_EO_TERMS = {
+    c.COLUMN_GROUP,
+    c.PARTITION,
+    c.COLUMNS_IN_GROUP,
+    c.PUBLIC_PARTITIONS,
+    c.EXHAUSTIVE_PARTITIONS,
+    c.KEY_VALUES,
+    c.EXHAUSTIVE_KEYS,
+    c.INVARIANT_PUBLIC_KEYS,
+    c.MAX_NUM_PARTITIONS,
+    c.PUBLIC_LENGTH,
+    c.PRIVACY_UNIT,
+    c.PRIVACY_ID,
+    c.ADD_INFO,
+    c.MAX_LENGTH,
+    c.MAX_GROUPS,
+    c.MAX_CONTRIB,
+    c.PREDICATE,
+    c.PARTITION_VALUE,
+    c.LOWER_BOUND,
+    c.UPPER_BOUND,
+    c.NULL_PROP,
+    c.ROW_DEP,
+    c.DEPENDS_ON,
+    c.DEPENDENCY_TYPE,
+    c.VALUE_MAP,
+}
+
+
+def used_terms(node, terms):
+    """Collect the keys and ``@type`` values of a metadata document, skipping data values."""
+    if isinstance(node, list):
+        for item in node:
+            used_terms(item, terms)
+    if not isinstance(node, dict):
+        return terms
+    for key, value in node.items():
+        if key == "@type":
+            terms.update(value if isinstance(value, list) else [value])
+        elif not key.startswith("@"):
+            terms.add(key)
+        if key in (c.PREDICATE, c.KEY_VALUES):
+            for predicate in value if isinstance(value, list) else [value]:
+                # Predicates of a column group are keyed by column name
+                grouped = isinstance(predicate, dict) and not set(predicate) & CSVW_EO_TERMS
+                used_terms(list(predicate.values()) if grouped else predicate, terms)
+        elif key != c.VALUE_MAP:
+            used_terms(value, terms)
+    return terms
+
+
+def test_bundled_context_matches_repository():
+    assert CSVW_EO_CONTEXT_FILE.read_bytes() == Path("../csvw-eo-context.jsonld").read_bytes()
+
+
+@pytest.mark.parametrize("path", sorted(Path("examples/metadata").glob("*.json-ld")), ids=lambda p: p.name)
+def test_bundled_csvw_context_covers_examples(path):
+    csvw_terms = set(json.loads(CSVW_CONTEXT_FILE.read_text())["@context"])
+    terms = used_terms(json.loads(path.read_text()), set())
+    assert terms - CSVW_EO_TERMS - csvw_terms == set()
+
+
+def test_metadata_graph_reuses_processed_context():
+    first = metadata_graph(EXAMPLE)
+    hits = jsonld_context._processed_context.cache_info().hits
+    second = metadata_graph(json.loads(EXAMPLE.read_text()))
+    assert jsonld_context._processed_context.cache_info().hits == hits + 1
+    assert isomorphic(first, second)
+
+    assert (None, RDF.type, URIRef(CSVW + "Table")) in first
+    assert (None, URIRef(CSVW + "name"), Literal("species", datatype=XSD.string)) in first
+
+
+def test_inline_contexts():
+    metadata = {
+        "@context": [c.CSVW_CONTEXT, {"ex": "http://example.org/"}],
+        "@type": "Table",
+        "ex:note": "inline",
+    }
+    graph = metadata_graph(metadata)
+    assert (None, URIRef("http://example.org/note"), Literal("inline")) in graph
+
+
+def test_validate_metadata_shacl_offline():
+    conforms, text = validate_metadata_shacl(EXAMPLE, Path("../csvw-eo-constraints.ttl"))
+    assert isinstance(conforms, bool)
+    assert text.startswith("Validation Report")
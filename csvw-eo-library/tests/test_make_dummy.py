@@ -1,5 +1,11 @@
+import json
+import pickle
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 from csvw_eo.constants import (
@@ -7,6 +13,8 @@ from csvw_eo.constants import (
     COL_LIST,
     COL_NAME,
     DATATYPE,
+    DEPENDENCY_TYPE,
+    DEPENDS_ON,
     EXHAUSTIVE_KEYS,
     EXHAUSTIVE_PARTITIONS,
     KEY_VALUES,
@@ -16,9 +24,12 @@ from csvw_eo.constants import (
     MINIMUM,
     PARTITION_VALUE,
     PREDICATE,
+    NULL_PROP,
     PUBLIC_PARTITIONS,
+    ROW_DEP,
     TABLE_SCHEMA,
     UPPER_BOUND,
+    DependencyType,
 )
 from csvw_eo.datatypes import DataTypes
 from csvw_eo.make_dummy_from_metadata import (
@@ -26,7 +37,10 @@ from csvw_eo.make_dummy_from_metadata import (
     _predicate_mask,
     apply_nulls_serie,
     column_group_partitions,
+    compile_generation_plan,
     make_dummy_from_metadata,
+    null_count,
+    null_mask,
 )
 
 
@@ -207,3 +221,156 @@ def test_make_dummy_applies_column_group_partitions():
 
     # Assert filtering happened: only "a" should remain
     assert (df["col1"] == "a").all()
+
+
+@pytest.fixture
+def plan_metadata():
+    return {
+        TABLE_SCHEMA: {
+            COL_LIST: [
+                {COL_NAME: "id", DATATYPE: DataTypes.INTEGER, MINIMUM: 0, MAXIMUM: 20},
+                {
+                    COL_NAME: "colour",
+                    DATATYPE: DataTypes.STRING,
+                    KEY_VALUES: ["red"],
+                    EXHAUSTIVE_KEYS: False,
+                    MAX_NUM_PARTITIONS: 3,
+                    NULL_PROP: 0.2,
+                },
+                {
+                    COL_NAME: "score",
+                    DATATYPE: DataTypes.DOUBLE,
+                    MINIMUM: 0,
+                    MAXIMUM: 10,
+                    ROW_DEP: [{DEPENDS_ON: "id", DEPENDENCY_TYPE: DependencyType.FIXED}],
+                },
+            ]
+        },
+    }
+
+
+def test_generation_plan_matches_make_dummy(plan_metadata):
+    plan = compile_generation_plan(plan_metadata)
+    df_plan = plan.generate(nb_rows=50, seed=3)
+    df_direct = make_dummy_from_metadata(plan_metadata, nb_rows=50, seed=3)
+    pd.testing.assert_frame_equal(df_plan, df_direct)
+    assert list(df_plan.columns) == ["id", "colour", "score"]
+    assert df_plan["colour"].isna().sum() == 10
+
+
+def test_generation_plan_is_reusable_and_picklable(plan_metadata):
+    plan = compile_generation_plan(plan_metadata)
+    first = plan.generate(nb_rows=30, seed=1)
+    second = plan.generate(nb_rows=30, seed=1)
+    pd.testing.assert_frame_equal(first, second)
+
+    restored = pickle.loads(pickle.dumps(plan))
+    pd.testing.assert_frame_equal(restored.generate(nb_rows=30, seed=1), first)
+
+
+def test_generation_plan_does_not_mutate_metadata(plan_metadata):
+    plan = compile_generation_plan(plan_metadata)
+    for seed in range(3):
+        plan.generate(nb_rows=10, seed=seed)
+    make_dummy_from_metadata(plan_metadata, nb_rows=10)
+    assert plan_metadata[TABLE_SCHEMA][COL_LIST][1][KEY_VALUES] == ["red"]
+
+
+def test_generation_plan_fixed_dependency(plan_metadata):
+    df = compile_generation_plan(plan_metadata).generate(nb_rows=200, seed=0)
+    assert (df.groupby("id")["score"].nunique() == 1).all()
+
+
+def test_make_dummy_datetime_resolution():
+    metadata = {
+        TABLE_SCHEMA: {
+            COL_LIST: [
+                {
+                    COL_NAME: "ts",
+                    DATATYPE: DataTypes.DATETIME,
+                    MINIMUM: "2020-01-01",
+                    MAXIMUM: "2020-01-02",
+                }
+            ]
+        }
+    }
+    df_day = make_dummy_from_metadata(metadata, nb_rows=20, seed=0)
+    assert set(df_day["ts"]) <= {pd.Timestamp("2020-01-01"), pd.Timestamp("2020-01-02")}
+
+    df_second = make_dummy_from_metadata(metadata, nb_rows=20, seed=0, datetime_resolution="second")
+    assert df_second["ts"].nunique() > 2
+
+
+def test_null_mask_exact_count(rng):
+    mask = null_mask(1000, 137, rng)
+    assert mask.dtype == bool
+    assert mask.sum() == 137
+    assert null_mask(10, 0, rng).sum() == 0
+
+
+def test_null_count():
+    assert null_count(100, 0) == 0
+    assert null_count(100, 0.001) == 1
+    assert null_count(100, 0.25) == 25
+    assert null_count(0, 0.5) == 0
+
+
+def test_apply_nulls_positional_on_non_default_index(rng):
+    s = pd.Series(np.arange(10), index=np.arange(100, 110), dtype="Int64")
+    out = apply_nulls_serie(s, 0.3, DataTypes.INTEGER, rng)
+    assert out.isna().sum() == 3
+    assert list(out.index) == list(s.index)
+    assert out.dtype == "Int64"
+
+
+def test_generation_plan_iter_chunks_exact_nulls(plan_metadata):
+    plan = compile_generation_plan(plan_metadata)
+    chunks = list(plan.iter_chunks(nb_rows=1000, chunk_size=300, seed=5))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+
+    df = pd.concat(chunks, ignore_index=True)
+    assert df["colour"].isna().sum() == null_count(1000, 0.2)
+    assert df["id"].notna().all()
+    assert list(df.columns) == ["id", "colour", "score"]
+
+
+def test_generation_plan_iter_chunks_fixed_dependency(plan_metadata):
+    chunks = compile_generation_plan(plan_metadata).iter_chunks(nb_rows=1000, chunk_size=100, seed=0)
+    df = pd.concat(chunks, ignore_index=True)
+    assert (df.groupby("id")["score"].nunique() == 1).all()
+
+
+def test_generation_plan_iter_chunks_reproducible(plan_metadata):
+    plan = compile_generation_plan(plan_metadata)
+    first = pd.concat(plan.iter_chunks(nb_rows=100, chunk_size=30, seed=1))
+    second = pd.concat(plan.iter_chunks(nb_rows=100, chunk_size=30, seed=1))
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_make_dummy_categorical_strings(plan_metadata):
+    df = make_dummy_from_metadata(plan_metadata, nb_rows=200, seed=0, categorical=True)
+    assert isinstance(df["colour"].dtype, pd.CategoricalDtype)
+    assert list(df["colour"].cat.categories) == ["red", "a", "b"]
+    assert df["colour"].isna().sum() == 40
+    assert set(df["colour"].dropna()) <= {"red", "a", "b"}
+
+
+def test_make_dummy_categorical_mapping_dependency():
+    metadata = json.loads(
+        Path("examples/metadata/penguin_metadata_fine_levels_column_group_continuous.json-ld").read_text()
+    )
+    df = make_dummy_from_metadata(metadata, nb_rows=100, seed=0, categorical=True)
+    # species is generated from island through a mapping dependency
+    assert isinstance(df["species"].dtype, pd.CategoricalDtype)
+    assert list(df["species"].cat.categories) == ["Adelie", "Chinstrap", "Gentoo"]
+    assert df["species"].notna().all()
+
+
+def test_make_dummy_categorical_parquet_stays_dictionary_encoded(plan_metadata, tmp_path):
+    df = make_dummy_from_metadata(plan_metadata, nb_rows=50, seed=0, categorical=True)
+    assert pa.types.is_dictionary(pa.Table.from_pandas(df).schema.field("colour").type)
+
+    path = tmp_path / "dummy.parquet"
+    df.to_parquet(path, index=False)
+    assert pa.types.is_dictionary(pq.read_table(path).schema.field("colour").type)
+    assert isinstance(pd.read_parquet(path)["colour"].dtype, pd.CategoricalDtype)
@@ -0,0 +1,143 @@
+import io
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+
+from csvw_eo import constants as c
+from csvw_eo.csvw_to_smartnoise_sql import csvw_to_smartnoise_sql
+from csvw_eo.make_metadata_from_data import build_table_metadata
+from csvw_eo.metadata_stream import (
+    MetadataEvent,
+    iter_metadata,
+    iter_metadata_events,
+    read_metadata_headers,
+)
+from csvw_eo.partition_table import PartitionSidecar
+from csvw_eo.sidecar import write_metadata
+from csvw_eo.validate_metadata import validate_metadata_file
+
+
+@pytest.fixture
+def table():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "id": rng.integers(0, 20, 200),
+            "colour": rng.choice(["red", "blue", "green"], 200),
+            "size": rng.uniform(0, 10, 200),
+        }
+    )
+    return build_table_metadata(
+        df,
+        privacy_unit="id",
+        continuous_partitions={"size": [0, 5, 10]},
+        column_groups=[["colour", "size"]],
+        default_contributions_level="partition",
+    )
+
+
+@pytest.fixture
+def metadata(table):
+    return json.loads(json.dumps(table.to_dict()))
+
+
+def rebuild(events):
+    metadata, schema = {}, {c.COL_LIST: []}
+    for event, value in events:
+        if event == MetadataEvent.FIELD:
+            metadata[value[0]] = value[1]
+        elif event == MetadataEvent.SCHEMA_FIELD:
+            schema[value[0]] = value[1]
+        elif event == MetadataEvent.COLUMN:
+            schema[c.COL_LIST].append(value)
+        else:
+            metadata.setdefault(c.ADD_INFO, []).append(value)
+    metadata[c.TABLE_SCHEMA] = schema
+    return metadata
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_events_rebuild_document(metadata, chunk_size, indent):
+    metadata[c.TABLE_SCHEMA]["primaryKey"] = "id"
+    fp = io.StringIO(json.dumps(metadata, indent=indent))
+    events = list(iter_metadata_events(fp, chunk_size=chunk_size))
+
+    kinds = [event for event, _ in events]
+    assert kinds.count(MetadataEvent.COLUMN) == len(metadata[c.TABLE_SCHEMA][c.COL_LIST])
+    assert kinds.count(MetadataEvent.COLUMN_GROUP) == 1
+    assert rebuild(events) == metadata
+
+
+def test_numbers_across_chunks():
+    fp = io.StringIO('{"maxContributions": 123456789, "x": [1.5e10, -0.25]}')
+    events = list(iter_metadata_events(fp, chunk_size=3))
+    assert events == [
+        (MetadataEvent.FIELD, (c.MAX_CONTRIB, 123456789)),
+        (MetadataEvent.FIELD, ("x", [1.5e10, -0.25])),
+    ]
+
+
+@pytest.mark.parametrize("document", ['{"a": 1', '{"a": 1} x', "[1, 2]", '{"a" 1}', '{"a": 1 "b": 2}'])
+def test_invalid_documents(document):
+    with pytest.raises(ValueError):
+        list(iter_metadata_events(io.StringIO(document), chunk_size=2))
+
+
+class CountingReader(io.StringIO):
+    def __init__(self, text):
+        super().__init__(text)
+        self.read_chars = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.read_chars += len(data)
+        return data
+
+
+def test_syntax_error_fails_without_reading_the_rest():
+    padding = json.dumps([{"predicate": {"partitionValue": str(i)}} for i in range(100_000)])
+    fp = CountingReader('{"tableSchema": {"columns": [{"name": "a",, "x": 1}], "pad": ' + padding + "}}")
+    with pytest.raises(ValueError):
+        list(iter_metadata_events(fp, chunk_size=1024))
+    assert fp.read_chars < 10_000
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 20))
+def test_tokens_across_chunks(chunk_size):
+    value = [True, False, None, 'a\u00e9"b', -1.5e-3, "x" * 40, {"k": -123456789}]
+    document = json.dumps({"x": value, "y": float("-inf")})
+    events = list(iter_metadata_events(io.StringIO(document), chunk_size=chunk_size))
+    assert events == [(MetadataEvent.FIELD, ("x", value)), (MetadataEvent.FIELD, ("y", float("-inf")))]
+
+
+def test_iter_metadata_resolves_sidecars(tmp_path, table):
+    path = tmp_path / "metadata.json"
+    write_metadata(table, path, min_rows=1)
+    columns = [value for event, value in iter_metadata(path) if event == MetadataEvent.COLUMN]
+    assert isinstance(columns[1][c.PUBLIC_PARTITIONS], PartitionSidecar)
+
+
+def test_read_metadata_headers(tmp_path, metadata):
+    path = tmp_path / "metadata.json"
+    path.write_text(json.dumps(metadata), encoding="utf-8")
+
+    headers = read_metadata_headers(path)
+    assert all(c.PUBLIC_PARTITIONS not in col for col in headers[c.TABLE_SCHEMA][c.COL_LIST])
+    assert all(c.KEY_VALUES not in group for group in headers[c.ADD_INFO])
+    assert csvw_to_smartnoise_sql(headers) == csvw_to_smartnoise_sql(metadata)
+
+
+def test_validate_metadata_file(tmp_path, metadata):
+    path = tmp_path / "metadata.json"
+    path.write_text(json.dumps(metadata), encoding="utf-8")
+    assert validate_metadata_file(path) == len(metadata[c.TABLE_SCHEMA][c.COL_LIST]) + 1
+    assert validate_metadata_file(path, columnar=True) == validate_metadata_file(path)
+
+    metadata[c.TABLE_SCHEMA][c.COL_LIST][1][c.DATATYPE] = "not a datatype"
+    path.write_text(json.dumps(metadata), encoding="utf-8")
+    with pytest.raises(ValidationError):
+        validate_metadata_file(path)
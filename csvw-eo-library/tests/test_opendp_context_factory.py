@@ -0,0 +1,101 @@
+import json
+from pathlib import Path
+
+import opendp.prelude as dp
+import polars as pl
+import pytest
+
+from csvw_eo.opendp_context_factory import LRUCache, OpenDPContextFactory
+from csvw_eo.read_with_metadata import scan_with_metadata
+
+CSV = Path("examples/penguin_plus.csv")
+
+
+@pytest.fixture
+def metadata():
+    return json.loads(
+        Path("examples/metadata/penguin_metadata_column_level_column_group.json-ld").read_text()
+    )
+
+
+def test_factory_reuses_compiled_parts(metadata):
+    factory = OpenDPContextFactory()
+    first = factory.create(metadata, scan_with_metadata(CSV, metadata), epsilon=1.0, split_evenly_over=2)
+    second = factory.create(metadata, scan_with_metadata(CSV, metadata), epsilon=1.0, split_evenly_over=2)
+    assert second.accountant is first.accountant
+
+    info = factory.cache_info()
+    assert (info["metadata"].hits, info["metadata"].misses) == (1, 1)
+    assert info["compositor"].hit_rate == 0.5
+
+    # Each context has its own budget
+    first.query().select(dp.len()).release()
+    first.query().select(dp.len()).release()
+    with pytest.raises(ValueError, match="exhausted"):
+        first.query()
+    assert len(second.remaining_privacy_loss()) == 2
+
+    keys = factory.public_keys(metadata, scan_with_metadata(CSV, metadata))[("species", "island")]
+    assert (
+        second.query().group_by("species", "island").agg(dp.len()).with_keys(keys).release().collect().height
+        == 5
+    )
+
+
+def test_factory_cache_keys(metadata):
+    factory = OpenDPContextFactory()
+    data = scan_with_metadata(CSV, metadata)
+    factory.create(metadata, data, epsilon=1.0, split_evenly_over=1)
+    factory.create(metadata, data, epsilon=0.5, split_evenly_over=1)  # new budget
+    factory.create(metadata, pl.scan_csv(CSV), epsilon=1.0, split_evenly_over=1)  # new schema
+    factory.create(metadata, pl.scan_csv(CSV), epsilon=1.0, split_evenly_over=1, cast_data=True)
+    info = factory.cache_info()
+    assert info["metadata"].misses == 1
+    assert (info["compositor"].hits, info["compositor"].misses) == (1, 3)
+
+    metadata["maxContributions"] = 2
+    factory.create(metadata, data, epsilon=1.0, split_evenly_over=1)
+    assert factory.cache_info()["metadata"].misses == 2
+
+    with pytest.raises(ValueError, match="Specify only one"):
+        factory.create(metadata, data, epsilon=1.0, rho=0.1)
+    del metadata["maxContributions"]
+    with pytest.raises(ValueError, match="max_contributions"):
+        factory.create(metadata, data, epsilon=1.0)
+
+
+def test_factory_explicit_key(metadata, monkeypatch):
+    fingerprints = []
+    monkeypatch.setattr(
+        "csvw_eo.opendp_context_factory.metadata_fingerprint", lambda meta: fingerprints.append(meta) or "x"
+    )
+    factory = OpenDPContextFactory()
+    data = pl.scan_csv(CSV, infer_schema_length=0)
+    for _ in range(3):
+        factory.create(
+            metadata, data, key=("metadata.json", 1), epsilon=1.0, split_evenly_over=1, cast_data=True
+        )
+    assert not fingerprints
+    assert factory.cache_info()["metadata"].hits == 2
+
+    keys = factory.public_keys(metadata, data, key=("metadata.json", 1), cast_data=True)
+    assert keys[("species",)].schema == pl.Schema({"species": pl.Enum(["Adelie", "Chinstrap", "Gentoo"])})
+    assert factory.public_keys(metadata, data, key=("metadata.json", 1))[("species",)].dtypes == [pl.String]
+
+    # A new key (the file was modified) compiles the metadata again
+    factory.create(metadata, data, key=("metadata.json", 2), epsilon=1.0, split_evenly_over=1)
+    assert factory.cache_info()["metadata"].misses == 2
+    assert not fingerprints
+
+
+def test_lru_cache():
+    cache = LRUCache(maxsize=2)
+    for key in ["a", "b", "a", "c", "b"]:
+        cache.get_or_create(key, lambda key=key: key.upper())
+    info = cache.info()
+    assert (info.hits, info.misses, info.evictions, info.size) == (1, 4, 2, 2)
+
+    cache.clear()
+    assert cache.info().hit_rate == 0.0
+    with pytest.raises(ValueError, match="maxsize"):
+        LRUCache(maxsize=0)
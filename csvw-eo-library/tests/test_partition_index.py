@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from csvw_eo import constants as c
+from csvw_eo.make_dummy_from_metadata import _predicate_mask, filter_group_partitions
+from csvw_eo.make_metadata_from_data import build_table_metadata
+from csvw_eo.metadata_structure import TableMetadata
+from csvw_eo.partition_index import NO_PARTITION, IntervalClosed, PartitionIndex
+
+
+def interval(lower, upper):
+    return {c.LOWER_BOUND: lower, c.UPPER_BOUND: upper}
+
+
+@pytest.fixture
+def group_predicates():
+    return [
+        {"a": {c.PARTITION_VALUE: "x"}, "b": interval(0, 5)},
+        {"a": {c.PARTITION_VALUE: "y"}, "b": interval(5, 10)},
+        {"a": {c.PARTITION_VALUE: "x"}, "b": interval(5, 10)},
+        {"a": {c.PARTITION_VALUE: "x"}, "b": interval(0, 5)},
+    ]
+
+
+def test_assign_group(group_predicates):
+    df = pd.DataFrame({"a": ["x", "y", "x", "y", "z", "x", None], "b": [1, 7, 5, 2, 1, 10, 1]})
+
+    left = PartitionIndex(group_predicates)
+    np.testing.assert_array_equal(left.assign(df), [0, 1, 2, -1, -1, -1, -1])
+
+    both = PartitionIndex(group_predicates, closed=IntervalClosed.BOTH)
+    np.testing.assert_array_equal(both.assign(df), [0, 1, 2, -1, -1, 2, -1])
+    np.testing.assert_array_equal(both.assign(df.astype({"a": "category"})), both.assign(df))
+    assert len(both) == 4
+
+
+def test_assign_single_column():
+    index = PartitionIndex.from_partitions(["a", "b", None], column="col")
+    np.testing.assert_array_equal(index.assign(pd.Series(["b", "c", None, "a"])), [1, -1, 2, 0])
+
+    numbers = PartitionIndex.from_partitions([1, 2, 3], column="n")
+    np.testing.assert_array_equal(numbers.contains(pd.Series([3.0, 4.0, 1.0])), [True, False, True])
+
+    empty = PartitionIndex([])
+    assert (empty.assign(pd.Series([1, 2])) == NO_PARTITION).all()
+
+
+def test_assign_datetimes():
+    index = PartitionIndex.from_partitions(
+        [
+            interval("2024-01-01T00:00:00", "2025-01-01T00:00:00"),
+            interval("2025-01-01T00:00:00", "2026-01-01T00:00:00"),
+        ],
+        column="t",
+    )
+    dates = pd.Series(pd.to_datetime(["2024-03-01", "2025-01-01", "2023-01-01", None]))
+    np.testing.assert_array_equal(index.assign(dates), [0, 1, -1, -1])
+
+
+def test_unbounded_intervals():
+    index = PartitionIndex.from_partitions([interval(None, 0), interval(0, None)], column="x")
+    np.testing.assert_array_equal(index.assign(pd.Series([-1e9, 0.0, 1e9, np.nan])), [0, 1, 1, -1])
+
+
+@pytest.mark.parametrize(
+    "predicates",
+    [
+        [{"b": interval(0, 5)}, {"b": interval(4, 10)}],
+        [{"b": interval(0, 5)}, {"b": {c.PARTITION_VALUE: 7}}],
+        [{"a": {c.PARTITION_VALUE: "x"}}, {"b": {c.PARTITION_VALUE: "x"}}],
+    ],
+)
+def test_invalid_indexes(predicates):
+    with pytest.raises(ValueError):
+        PartitionIndex(predicates)
+
+
+def test_index_from_table_metadata():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "id": rng.integers(0, 50, 500),
+            "colour": rng.choice(["red", "blue", "green"], 500),
+            "size": rng.uniform(0, 10, 500),
+        }
+    )
+    table = build_table_metadata(
+        df,
+        privacy_unit="id",
+        continuous_partitions={"size": [0, 2.5, 5, 10]},
+        column_groups=[["colour", "size"]],
+        default_contributions_level="partition",
+    )
+
+    group = table.partition_index(["colour", "size"])
+    partitions = table.column_groups[0].partitions
+    assigned = group.assign(df)
+    assert (assigned >= 0).all()
+    for partition_id in np.unique(assigned):
+        predicate = partitions[partition_id].to_dict()[c.PREDICATE]
+        rows = df[assigned == partition_id]
+        assert _predicate_mask(rows, predicate).all()
+        assert partitions[partition_id].max_length == len(rows)
+
+    lengths = np.bincount(table.partition_index("colour").assign(df["colour"]))
+    assert sorted(lengths) == sorted(p.max_length for p in table.columns[1].partitions)
+
+    columnar = TableMetadata.from_dict(table.to_dict(), lazy=True)
+    np.testing.assert_array_equal(columnar.partition_index(["colour", "size"]).assign(df), assigned)
+
+    with pytest.raises(ValueError, match="No column"):
+        table.partition_index("missing")
+
+
+def test_dummy_filter_with_overlapping_intervals():
+    df = pd.DataFrame({"b": [1, 4, 6, 12]})
+    predicates = [{"b": interval(0, 5)}, {"b": interval(4, 10)}]
+    filtered = filter_group_partitions(df, [predicates])
+    pd.testing.assert_frame_equal(filtered, pd.DataFrame({"b": [1, 4, 6]}))
+
+
+def test_shared_edge_of_closed_intervals():
+    predicates = [
+        {"a": {c.PARTITION_VALUE: "x"}, "b": interval(0, 10)},
+        {"a": {c.PARTITION_VALUE: "y"}, "b": interval(10, 20)},
+        {"a": {c.PARTITION_VALUE: "y"}, "b": interval(20, 30)},
+    ]
+    df = pd.DataFrame({"a": ["x", "y", "x", "y", "x"], "b": [10.0, 10.0, 20.0, 20.0, 0.0]})
+
+    both = PartitionIndex(predicates, closed=IntervalClosed.BOTH)
+    # The edge goes to the upper interval, or to the lower one if the upper one has no partition
+    np.testing.assert_array_equal(both.assign(df), [0, 1, -1, 2, 0])
+    np.testing.assert_array_equal(PartitionIndex(predicates).assign(df), [-1, 1, -1, 2, 0])
+
+    expected = np.any([_predicate_mask(df, predicate) for predicate in predicates], axis=0)
+    np.testing.assert_array_equal(both.contains(df), expected)
+    pd.testing.assert_frame_equal(
+        filter_group_partitions(df, [predicates]), df[expected].reset_index(drop=True)
+    )
@@ -0,0 +1,283 @@
+import numpy as np
+import pytest
+
+from csvw_eo import constants as c
+from csvw_eo.datatypes import DataTypes
+from csvw_eo.metadata_structure import (
+    CategoricalPredicate,
+    ColumnMetadata,
+    ContinuousPredicate,
+    MultiColumnKeys,
+    MultiColumnPartition,
+    SingleColumnKey,
+    SingleColumnPartition,
+    TableMetadata,
+    full_partition_to_key_single,
+)
+from csvw_eo.partition_table import LazyPartitionTable, PartitionTable, PredicateColumn
+from csvw_eo.validate_metadata import validate_metadata
+
+
+@pytest.fixture
+def metadata():
+    return {
+        c.PRIVACY_UNIT: "id",
+        c.MAX_CONTRIB: 3,
+        c.TABLE_SCHEMA: {
+            c.COL_LIST: [
+                {
+                    c.COL_NAME: "colour",
+                    c.DATATYPE: DataTypes.STRING,
+                    c.KEY_VALUES: ["red", "blue", None],
+                    c.PUBLIC_PARTITIONS: [
+                        {
+                            "@type": c.PARTITION,
+                            c.PREDICATE: {c.PARTITION_VALUE: "red"},
+                            c.MAX_LENGTH: 10,
+                            c.MAX_GROUPS: 2,
+                            c.MAX_CONTRIB: 1,
+                        },
+                        {
+                            "@type": c.PARTITION,
+                            c.PREDICATE: {c.PARTITION_VALUE: "blue"},
+                            c.MAX_LENGTH: 5,
+                            c.MAX_GROUPS: 1,
+                            c.MAX_CONTRIB: 1,
+                        },
+                    ],
+                },
+                {
+                    c.COL_NAME: "size",
+                    c.DATATYPE: DataTypes.DOUBLE,
+                    c.PUBLIC_PARTITIONS: [
+                        {
+                            "@type": c.PARTITION,
+                            c.PREDICATE: {c.LOWER_BOUND: 0, c.UPPER_BOUND: 5.5},
+                            c.MAX_LENGTH: 3,
+                            c.MAX_GROUPS: 1,
+                            c.MAX_CONTRIB: 1,
+                        }
+                    ],
+                },
+                {
+                    c.COL_NAME: "when",
+                    c.DATATYPE: DataTypes.DATETIME,
+                    c.PUBLIC_PARTITIONS: [
+                        {
+                            "@type": c.PARTITION,
+                            c.PREDICATE: {
+                                c.LOWER_BOUND: "2024-01-01T00:00:00",
+                                c.UPPER_BOUND: "2025-01-01T00:00:00",
+                            },
+                            c.MAX_LENGTH: 3,
+                            c.MAX_GROUPS: 1,
+                            c.MAX_CONTRIB: 1,
+                        }
+                    ],
+                },
+            ]
+        },
+        c.ADD_INFO: [
+            {
+                c.COLUMNS_IN_GROUP: ["colour", "size"],
+                c.KEY_VALUES: [
+                    {"colour": {c.PARTITION_VALUE: "red"}, "size": {c.LOWER_BOUND: 0.0, c.UPPER_BOUND: 5.5}},
+                    {"colour": {c.PARTITION_VALUE: "blue"}, "size": {c.LOWER_BOUND: 0.0, c.UPPER_BOUND: 5.5}},
+                ],
+                c.PUBLIC_PARTITIONS: [
+                    {
+                        "@type": c.PARTITION,
+                        c.PREDICATE: {
+                            "colour": {c.PARTITION_VALUE: "red"},
+                            "size": {c.LOWER_BOUND: 0.0, c.UPPER_BOUND: 5.5},
+                        },
+                        c.MAX_LENGTH: 4,
+                        c.MAX_GROUPS: 1,
+                        c.MAX_CONTRIB: 2,
+                    }
+                ],
+            }
+        ],
+    }
+
+
+def test_columnar_round_trip(metadata):
+    reference = validate_metadata(metadata)
+    table = validate_metadata(metadata, columnar=True)
+
+    colour = table.columns[0]
+    assert isinstance(colour.partitions, PartitionTable)
+    assert isinstance(colour.public_keys_values, PartitionTable)
+    assert isinstance(table.column_groups[0].partitions, PartitionTable)
+    assert table.to_dict() == reference.to_dict()
+    assert TableMetadata.from_dict(table.to_dict(), columnar=True).to_dict() == reference.to_dict()
+
+
+def test_sequence_api(metadata):
+    reference = validate_metadata(metadata)
+    table = validate_metadata(metadata, columnar=True)
+
+    for ref_col, col in zip(reference.columns, table.columns):
+        assert list(col.partitions) == ref_col.partitions
+        assert col.partitions == ref_col.partitions
+        assert len(col.partitions) == len(ref_col.partitions)
+
+    partitions = table.columns[0].partitions
+    assert partitions[1] == reference.columns[0].partitions[1]
+    assert partitions[-1] == partitions[1]
+    assert isinstance(partitions[0], SingleColumnPartition)
+    assert isinstance(partitions[:1], PartitionTable)
+    assert len(partitions[:1]) == 1
+    with pytest.raises(IndexError):
+        partitions[2]
+
+    group = table.column_groups[0]
+    assert isinstance(group.partitions[0], MultiColumnPartition)
+    assert isinstance(group.public_keys_values[0], MultiColumnKeys)
+    assert isinstance(table.columns[0].public_keys_values[2], SingleColumnKey)
+    assert table.columns[0].public_keys_values[2].predicate.partition_value is None
+
+
+def test_typed_arrays(metadata):
+    table = validate_metadata(metadata, columnar=True)
+    size = table.columns[1].partitions.predicates[0]
+    assert size.lower.dtype == np.float64
+    assert size.lower.tolist() == [0.0]
+    assert table.columns[0].partitions.bounds[0].dtype == np.int64
+
+    ints = PartitionTable(PredicateColumn(values=np.array([1, 2, 3])))
+    assert ints.to_dicts() == [1, 2, 3]
+    assert all(type(v) is int for v in ints.to_dicts())
+
+
+def test_from_models_and_keys():
+    partitions = [
+        SingleColumnPartition(
+            predicate=CategoricalPredicate(partition_value=v),
+            max_length=3,
+            max_groups_per_unit=1,
+            max_contributions=1,
+        )
+        for v in ["a", "b"]
+    ]
+    table = PartitionTable.from_models(partitions)
+    assert table.has_bounds
+    assert not table.is_multi_column
+    assert table.to_dicts() == [p.to_dict() for p in partitions]
+
+    keys = full_partition_to_key_single(table)
+    assert isinstance(keys, PartitionTable)
+    assert keys.to_dicts() == ["a", "b"]
+
+    column = ColumnMetadata(name="x", datatype=DataTypes.STRING, partitions=table, public_keys_values=keys)
+    assert column.to_dict()[c.KEY_VALUES] == ["a", "b"]
+
+
+def test_continuous_single_keys_rejected():
+    table = PartitionTable(PredicateColumn(lower=np.array([0.0]), upper=np.array([1.0])))
+    assert isinstance(next(iter(table)).predicate, ContinuousPredicate)
+    with pytest.raises(TypeError):
+        table.to_dicts()
+
+
+def test_arrow_round_trip(metadata):
+    table = validate_metadata(metadata, columnar=True)
+    tables = [
+        *(col.partitions for col in table.columns),
+        table.columns[0].public_keys_values,
+        table.column_groups[0].partitions,
+        table.column_groups[0].public_keys_values,
+    ]
+    for partitions in tables:
+        restored = PartitionTable.from_arrow(partitions.to_arrow())
+        assert restored.to_dicts() == partitions.to_dicts()
+        assert restored.columns == partitions.columns
+
+
+def test_invalid_tables():
+    with pytest.raises(ValueError, match="same length"):
+        PartitionTable(PredicateColumn(values=np.array(["a"])), np.ones(2), np.ones(2), np.ones(2))
+    with pytest.raises(ValueError, match="all or none"):
+        PartitionTable(PredicateColumn(values=np.array(["a"])), max_length=np.ones(1))
+    with pytest.raises(ValueError, match="Nan or infinite"):
+        PartitionTable.from_dicts(
+            [
+                {
+                    c.PREDICATE: {c.LOWER_BOUND: float("nan"), c.UPPER_BOUND: 1.0},
+                    c.MAX_LENGTH: 1,
+                    c.MAX_GROUPS: 1,
+                    c.MAX_CONTRIB: 1,
+                }
+            ],
+            multi_column=False,
+            with_bounds=True,
+        )
+
+
+@pytest.mark.parametrize("bound", [3.7, -1, "many", None])
+def test_invalid_bounds(metadata, bound):
+    metadata[c.TABLE_SCHEMA][c.COL_LIST][0][c.PUBLIC_PARTITIONS][0][c.MAX_LENGTH] = bound
+    with pytest.raises(ValueError):
+        validate_metadata(metadata)
+    with pytest.raises(ValueError):
+        validate_metadata(metadata, columnar=True)
+
+
+def test_integral_float_bounds(metadata):
+    metadata[c.TABLE_SCHEMA][c.COL_LIST][0][c.PUBLIC_PARTITIONS][0][c.MAX_LENGTH] = 10.0
+    table = validate_metadata(metadata, columnar=True)
+    assert table.columns[0].partitions.bounds[0].tolist() == [10, 5]
+    assert validate_metadata(metadata).columns[0].partitions[0].max_length == 10
+
+
+def test_lazy_from_dict(metadata):
+    reference = validate_metadata(metadata)
+    table = TableMetadata.from_dict(metadata, lazy=True)
+
+    colour = table.columns[0]
+    assert colour.datatype == DataTypes.STRING
+    assert isinstance(colour.partitions, LazyPartitionTable)
+    assert not colour.partitions.is_loaded
+    assert not table.column_groups[0].public_keys_values.is_loaded
+
+    assert colour.partitions[0] == reference.columns[0].partitions[0]
+    assert colour.partitions.is_loaded
+    assert table.validate_partitions() is table
+    assert table.to_dict() == reference.to_dict()
+    assert validate_metadata(metadata, deep=False).to_dict() == reference.to_dict()
+
+
+def test_validate_partitions_loads_lazy_tables(metadata):
+    table = TableMetadata.from_dict(metadata, lazy=True)
+    lazy = [table.columns[0].partitions, table.column_groups[0].public_keys_values]
+    assert table.validate_partitions(deep=False) is table
+    assert all(items.is_loaded for items in lazy)
+    assert lazy[0].load() is lazy[0]
+
+
+def test_lazy_validation_errors(metadata):
+    partition = metadata[c.TABLE_SCHEMA][c.COL_LIST][0][c.PUBLIC_PARTITIONS][0]
+    partition[c.MAX_LENGTH] = "many"
+    table = TableMetadata.from_dict(metadata, lazy=True)
+    with pytest.raises(ValueError):
+        table.validate_partitions(deep=False)
+
+    partition[c.MAX_LENGTH] = 10
+    size = metadata[c.TABLE_SCHEMA][c.COL_LIST][1][c.PUBLIC_PARTITIONS][0]
+    size[c.PREDICATE][c.LOWER_BOUND] = [0]
+    table = TableMetadata.from_dict(metadata, lazy=True)
+    table.validate_partitions(deep=False)
+    with pytest.raises(ValueError):
+        table.validate_partitions(deep=True)
+
+
+@pytest.mark.parametrize("bound", [3.7, -1])
+def test_all_paths_reject_invalid_bounds(metadata, bound):
+    metadata[c.ADD_INFO][0][c.PUBLIC_PARTITIONS][0][c.MAX_CONTRIB] = bound
+    with pytest.raises(ValueError):
+        TableMetadata.from_dict(metadata)
+    with pytest.raises(ValueError):
+        TableMetadata.from_dict(metadata, columnar=True)
+    for deep in (True, False):
+        with pytest.raises(ValueError):
+            TableMetadata.from_dict(metadata, lazy=True).validate_partitions(deep=deep)
@@ -0,0 +1,93 @@
+import json
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from csvw_eo import constants as c
+from csvw_eo.datatypes import DataTypes
+from csvw_eo.polars_schema import cast_expr, cast_to_schema, to_polars_dtype, to_polars_schema
+
+CSV = Path("examples/penguin_plus.csv")
+
+
+@pytest.fixture
+def metadata():
+    metadata = json.loads(
+        Path("examples/metadata/penguin_metadata_table_with_keys_level.json-ld").read_text()
+    )
+    narrow = {"flipper_length_mm": DataTypes.UNSIGNED_SHORT, "timestamp": DataTypes.DATE}
+    for column in metadata[c.TABLE_SCHEMA][c.COL_LIST]:
+        column[c.DATATYPE] = narrow.get(column[c.COL_NAME], column[c.DATATYPE])
+    return metadata
+
+
+def test_to_polars_schema(metadata):
+    schema = to_polars_schema(metadata)
+    assert schema["species"] == pl.Enum(["Adelie", "Chinstrap", "Gentoo"])
+    assert schema["flipper_length_mm"] == pl.UInt16
+    assert schema["timestamp"] == pl.Date
+    assert schema["favourite_number"] == pl.Int64  # integer keys are not Enums
+    assert to_polars_schema(metadata, ["sex", "species"]).names() == ["sex", "species"]
+
+    metadata[c.TABLE_SCHEMA][c.COL_LIST][0][c.EXHAUSTIVE_KEYS] = False
+    assert to_polars_schema(metadata)["species"] == pl.String
+
+
+def test_cast_to_schema(metadata):
+    schema = to_polars_schema(metadata)
+    strings = pl.scan_csv(CSV, infer_schema_length=0)
+    typed = cast_to_schema(strings, schema).collect()
+    assert typed.schema == schema
+    assert typed.estimated_size() < strings.collect().estimated_size()
+
+    inferred = pl.read_csv(CSV)
+    assert typed["bill_length_mm"].equals(inferred["bill_length_mm"])
+    assert typed["sex"].equals(inferred["sex"])
+
+    # Already typed columns are left as they are
+    plan = cast_to_schema(typed.lazy(), schema)
+    assert plan.explain() == typed.lazy().explain()
+
+
+def test_cast_to_schema_strict(metadata):
+    schema = to_polars_schema(metadata, ["species"])
+    data = pl.LazyFrame({"species": ["Adelie", "Emperor"]})
+    with pytest.raises(pl.exceptions.InvalidOperationError):
+        cast_to_schema(data, schema).collect()
+    assert cast_to_schema(data, schema, strict=False).collect()["species"].to_list() == ["Adelie", None]
+
+
+def test_cast_integers_exactly():
+    data = pl.DataFrame({"id": ["9007199254740993", "9007199254740992", "1.0", None]})
+    ids = data.select(cast_expr("id", pl.String, pl.Int64))["id"]
+    assert ids.to_list() == [2**53 + 1, 2**53, 1, None]
+
+    data = pl.DataFrame({"id": ["3.7", "300"]})
+    with pytest.raises(pl.exceptions.InvalidOperationError):
+        data.select(cast_expr("id", pl.String, pl.Int64))
+    lenient = data.select(cast_expr("id", pl.String, pl.UInt8, strict=False))
+    assert lenient["id"].to_list() == [None, None]
+
+
+@pytest.mark.parametrize(
+    "datatype,expected",
+    [
+        (DataTypes.UNSIGNED_BYTE, pl.UInt8),
+        (DataTypes.SHORT, pl.Int16),
+        (DataTypes.INT, pl.Int32),
+        (DataTypes.POSITIVE_INTEGER, pl.Int64),
+        (DataTypes.FLOAT, pl.Float32),
+        (DataTypes.DATE, pl.Date),
+        (DataTypes.DATETIMESTAMP, pl.Datetime("us", "UTC")),
+        ("string", pl.String),
+    ],
+)
+def test_to_polars_dtype(datatype, expected):
+    assert to_polars_dtype(datatype) == expected
+
+
+def test_to_polars_dtype_all_datatypes():
+    assert all(isinstance(to_polars_dtype(datatype), pl.DataType) for datatype in DataTypes)
+    with pytest.raises(ValueError, match="Missing"):
+        to_polars_dtype("")
@@ -0,0 +1,111 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from csvw_eo import constants as c
+from csvw_eo.datatypes import DataTypes
+from csvw_eo.polars_schema import to_polars_schema
+from csvw_eo.read_with_metadata import read_with_metadata, scan_with_metadata
+
+CSV = Path("examples/penguin_plus.csv")
+
+
+@pytest.fixture
+def metadata():
+    return json.loads(Path("examples/metadata/penguin_metadata_table_with_keys_level.json-ld").read_text())
+
+
+def test_read_pandas(metadata):
+    df = read_with_metadata(CSV, metadata)
+    assert isinstance(df.dtypes["species"], pd.CategoricalDtype)
+    assert list(df.dtypes["species"].categories) == ["Adelie", "Chinstrap", "Gentoo"]
+    assert df.dtypes["flipper_length_mm"] == "Int64"  # written as floats with missing values
+    assert df.dtypes["sex"] == "boolean"
+    assert pd.api.types.is_datetime64_any_dtype(df.dtypes["timestamp_with_time"])
+
+    inferred = pd.read_csv(CSV)
+    assert df.memory_usage(deep=True).sum() < inferred.memory_usage(deep=True).sum()
+    pd.testing.assert_series_equal(df["bill_length_mm"], inferred["bill_length_mm"])
+    assert (df["species"].astype(str) == inferred["species"]).all()
+
+
+def test_read_polars(metadata):
+    df = read_with_metadata(CSV, metadata, engine="polars")
+    assert df.schema == to_polars_schema(metadata)
+    assert df.schema["island"] == pl.Enum(["Biscoe", "Dream", "Torgersen"])
+    assert df.schema["body_mass_g"] == pl.Int64
+
+    expected = read_with_metadata(CSV, metadata)
+    assert (
+        df["body_mass_g"].to_list()
+        == expected["body_mass_g"].astype(object).where(expected["body_mass_g"].notna(), None).to_list()
+    )
+    assert df["timestamp_with_time"].cast(pl.String).to_list()[:2] == [
+        "2025-04-13 15:04:00.000000",
+        "2025-12-15 18:15:26.000000",
+    ]
+
+
+@pytest.mark.parametrize("engine", ["pandas", "polars"])
+def test_projection(metadata, engine):
+    columns = ["sex", "species"]
+    df = read_with_metadata(CSV, metadata, engine=engine, columns=columns)
+    assert list(df.columns) == columns
+    assert len(df) == len(pd.read_csv(CSV))
+
+    with pytest.raises(ValueError, match="not described"):
+        read_with_metadata(CSV, metadata, engine=engine, columns=["beak"])
+
+
+def test_scan_projection_pushdown(metadata):
+    plan = scan_with_metadata(CSV, metadata, columns=["species"]).explain()
+    assert "PROJECT 1/11 COLUMNS" in plan
+
+
+def test_durations(tmp_path):
+    path = tmp_path / "durations.csv"
+    path.write_text("id,wait\n1,1 days 02:00:00\n2,\n3,0 days 00:30:00\n")
+    metadata = {
+        c.TABLE_SCHEMA: {c.COL_LIST: [{c.COL_NAME: "wait", c.DATATYPE: DataTypes.DURATION}]},
+    }
+    durations = read_with_metadata(path, metadata, columns=["wait"])["wait"]
+    assert durations.tolist()[::2] == [pd.Timedelta(hours=26), pd.Timedelta(minutes=30)]
+    assert durations.isna().sum() == 1
+
+    durations = read_with_metadata(path, metadata, engine="polars", columns=["wait"])["wait"]
+    assert durations.dtype == pl.Duration("us")
+    assert durations.to_list()[::2] == [pd.Timedelta(hours=26), pd.Timedelta(minutes=30)]
+    assert durations.null_count() == 1
+
+
+@pytest.fixture
+def integer_metadata():
+    return {
+        c.TABLE_SCHEMA: {
+            c.COL_LIST: [
+                {c.COL_NAME: "id", c.DATATYPE: DataTypes.LONG},
+                {c.COL_NAME: "count", c.DATATYPE: DataTypes.INTEGER},
+            ]
+        }
+    }
+
+
+@pytest.mark.parametrize("engine", ["pandas", "polars"])
+def test_integers_are_exact(tmp_path, integer_metadata, engine):
+    path = tmp_path / "data.csv"
+    path.write_text("id,count\n9007199254740993,1\n9007199254740992,2.0\n,\n")
+    df = read_with_metadata(path, integer_metadata, engine=engine)
+    ids = df["id"].to_list() if engine == "polars" else df["id"].astype(object).to_list()
+    assert ids[:2] == [9007199254740993, 9007199254740992]
+    assert df["count"][1] == 2
+
+
+@pytest.mark.parametrize("engine", ["pandas", "polars"])
+def test_non_integral_integers_raise(tmp_path, integer_metadata, engine):
+    path = tmp_path / "data.csv"
+    path.write_text("id,count\n1,3.7\n")
+    with pytest.raises((TypeError, pl.exceptions.InvalidOperationError)):
+        read_with_metadata(path, integer_metadata, engine=engine)
@@ -1,7 +1,8 @@
+import numpy as np
 import pandas as pd
 import pytest
 
-from csvw_eo.assert_same_structure import assert_same_structure
+from csvw_eo.assert_same_structure import SAMPLE_BLOCKS, assert_same_structure, assert_same_structure_files
 
 
 def test_assert_same_structure():
@@ -73,3 +74,105 @@ def test_assert_same_structure_check_categories_false():
 
     # check_categories=False disables subset check
     assert_same_structure(df1, df2, check_categories=False)
+
+
+STRUCTURE_PAIRS = [
+    ({"name": ["Alice", "Bob", "Charlie"], "age": [25, 30, 35]}, {"name": ["Bob", "Alice"], "age": [3, 4]}),
+    ({"a": [1], "b": [2]}, {"b": [2], "a": [1]}),
+    ({"x": [1, 2, 3]}, {"x": ["a", "b", "c"]}),
+    ({"x": [1, 2, 3]}, {"x": [1, None, 3]}),
+    ({"x": [1, None, 3]}, {"x": [1, 2, 3]}),
+    ({"x": [1.5, 2.0]}, {"x": [1, 2]}),
+    ({"x": [-1, 5]}, {"x": [1, 5]}),
+    ({"color": ["red", "green", "blue"]}, {"color": ["red", "yellow"]}),
+    ({"flag": [True, False, None]}, {"flag": [False, None, True]}),
+    ({"day": ["2024-01-01", "2024-02-01"]}, {"day": ["2024-01-01T10:00:00", "2024-02-01 11:00"]}),
+    ({"level": [1.0, 2.0, 3.0]}, {"level": [1, 2, 4]}),
+]
+
+
+@pytest.mark.parametrize(("original", "dummy"), STRUCTURE_PAIRS)
+def test_assert_same_structure_files_matches_dataframes(tmp_path, original, dummy):
+    pd.DataFrame(original).to_csv(tmp_path / "original.csv", index=False)
+    pd.DataFrame(dummy).to_csv(tmp_path / "dummy.csv", index=False)
+    df1 = pd.read_csv(tmp_path / "original.csv", parse_dates=True)
+    df2 = pd.read_csv(tmp_path / "dummy.csv", parse_dates=True)
+
+    # The same outcome; the dummy fails fast on categories, so the first mismatch reported may differ
+    try:
+        assert_same_structure(df1, df2)
+        mismatch = False
+    except AssertionError:
+        mismatch = True
+
+    if not mismatch:
+        report = assert_same_structure_files(tmp_path / "original.csv", tmp_path / "dummy.csv")
+        assert (report.original_rows, report.dummy_rows) == (len(df1), len(df2))
+        assert not report.sampled
+    else:
+        with pytest.raises(AssertionError, match=r"Column"):
+            assert_same_structure_files(tmp_path / "original.csv", tmp_path / "dummy.csv")
+
+
+def test_assert_same_structure_files_chunks(tmp_path):
+    rng = np.random.default_rng(0)
+    original = pd.DataFrame(
+        {
+            "species": rng.choice(["Adelie", "Gentoo"], 5000),
+            "mass": rng.integers(1, 100, 5000),
+            "length": rng.normal(size=5000),
+        }
+    )
+    original.loc[4999, "length"] = None
+    original.to_csv(tmp_path / "original.csv", index=False)
+    dummy = original.sample(frac=1, random_state=0)
+    dummy.to_csv(tmp_path / "dummy.csv", index=False)
+
+    report = assert_same_structure_files(tmp_path / "original.csv", tmp_path / "dummy.csv", chunk_size=100)
+    assert report.original_rows == report.dummy_rows == 5000
+    assert report.unchecked_categories == []
+
+    # A value outside the categories of the original, at the end of the dummy
+    dummy.loc[len(dummy)] = ["Chinstrap", 1, 0.5]
+    dummy.to_csv(tmp_path / "dummy.csv", index=False)
+    with pytest.raises(AssertionError, match=r"Column 'species' dummy values \{'Chinstrap'\} are not subset"):
+        assert_same_structure_files(tmp_path / "original.csv", tmp_path / "dummy.csv", chunk_size=100)
+
+    # Too many distinct values to keep: the categories are not checked
+    pd.DataFrame({"name": [f"n{i}" for i in range(30)]}).to_csv(tmp_path / "names.csv", index=False)
+    report = assert_same_structure_files(tmp_path / "names.csv", tmp_path / "names.csv", max_distinct=20)
+    assert report.unchecked_categories == ["name"]
+
+    with pytest.raises(ValueError, match="max_distinct"):
+        assert_same_structure_files(tmp_path / "original.csv", tmp_path / "dummy.csv", max_distinct=5)
+
+
+def test_assert_same_structure_files_sample(tmp_path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {"species": rng.choice(["Adelie", "Gentoo"], 100_000), "mass": rng.integers(1, 9, 100_000)}
+    )
+    df.to_csv(tmp_path / "original.csv", index=False)
+    df.head(1000).to_csv(tmp_path / "dummy.csv", index=False)
+
+    report = assert_same_structure_files(tmp_path / "original.csv", tmp_path / "dummy.csv", sample=2000)
+    assert report.sampled
+    assert 1000 < report.original_rows < 5000
+    assert report.dummy_rows == 1000  # small file, read whole
+    assert report.dummy_blocks is None
+    assert report.missed_proportion(report.dummy_blocks) == 0.0
+
+    # The blocks, not the rows, are the independent draws of the sample
+    assert 50 < report.original_blocks <= SAMPLE_BLOCKS
+    assert report.missed_proportion(report.original_blocks) == pytest.approx(
+        1 - 0.05 ** (1 / report.original_blocks)
+    )
+    assert report.missed_proportion(report.original_blocks) > 0.02
+    assert "Sampled comparison" in report.text
+    assert "long lines" in report.text
+
+    # The same sample for the same seed
+    again = assert_same_structure_files(tmp_path / "original.csv", tmp_path / "dummy.csv", sample=2000)
+    assert again.original_rows == report.original_rows
+
+    assert not assert_same_structure_files(tmp_path / "dummy.csv", tmp_path / "dummy.csv").sampled
@@ -0,0 +1,100 @@
+import io
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+
+from csvw_eo import constants as c
+from csvw_eo.datatypes import DataTypes
+from csvw_eo.make_metadata_from_data import build_table_metadata, make_metadata_from_data
+from csvw_eo.metadata_structure import (
+    CategoricalPredicate,
+    ColumnMetadata,
+    Dependency,
+    TableMetadata,
+)
+from csvw_eo.serialization import dump_table_metadata, dumps_table_metadata, iter_json
+
+
+@pytest.fixture
+def table():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "id": rng.integers(0, 20, 200),
+            "colour": rng.choice(["red", "blue", "green"], 200),
+            "size": rng.uniform(0, 10, 200),
+            "when": pd.to_datetime("2024-01-01") + pd.to_timedelta(rng.integers(0, 300, 200), unit="D"),
+        }
+    )
+    return build_table_metadata(
+        df,
+        privacy_unit="id",
+        continuous_partitions={"size": [0, 5, 10]},
+        column_groups=[["colour", "size"]],
+        default_contributions_level="partition",
+    )
+
+
+@pytest.mark.parametrize("indent", [None, 0, 2, "\t"])
+def test_dumps_matches_json_dumps(table, indent):
+    assert dumps_table_metadata(table, indent=indent) == json.dumps(table.to_dict(), indent=indent)
+
+
+def test_dumps_columnar_table(table):
+    columnar = TableMetadata.from_dict(table.to_dict(), columnar=True)
+    assert dumps_table_metadata(columnar, indent=2) == json.dumps(table.to_dict(), indent=2)
+
+
+def test_dump_to_file_handle(table):
+    fp = io.StringIO()
+    dump_table_metadata(table, fp, indent=2)
+    assert fp.getvalue() == json.dumps(table.to_dict(), indent=2)
+
+
+def test_make_metadata_is_native(table):
+    # to_dict output needs no sanitization: it is json serializable as is
+    metadata = table.to_dict()
+    json.dumps(metadata)
+    assert type(metadata[c.MAX_CONTRIB]) is int
+    assert all(type(k) is str for k in metadata[c.TABLE_SCHEMA][c.COL_LIST][1][c.KEY_VALUES])
+
+
+def test_make_metadata_from_data_wrapper():
+    df = pd.DataFrame({"id": [1, 1, 2], "x": [1.0, 2.0, 3.0]})
+    assert make_metadata_from_data(df, privacy_unit="id") == build_table_metadata(df, "id").to_dict()
+
+
+def test_native_coercion_at_construction():
+    column = ColumnMetadata(name="x", datatype=DataTypes.INTEGER, minimum=np.int64(1), maximum=np.int64(5))
+    assert type(column.minimum) is int
+    assert type(CategoricalPredicate(partition_value=np.str_("a")).partition_value) is str
+
+    dep = Dependency(
+        depends_on="y",
+        dependency_type=c.DependencyType.MAPPING,
+        value_map={np.int64(1): [np.float64(2.0)]},
+    )
+    assert dep.value_map == {1: [2.0]}
+    assert ColumnMetadata(
+        name="t", datatype=DataTypes.DATETIME, minimum=np.datetime64("2024-01-02")
+    ).minimum == ("2024-01-02T00:00:00")
+    assert type(next(iter(dep.value_map))) is int
+
+    with pytest.raises(ValidationError, match="Nan or infinite"):
+        ColumnMetadata(name="x", datatype=DataTypes.DOUBLE, minimum=np.nan)
+
+
+def test_iter_json_streams_generators():
+    data = {"a": (i for i in range(3)), "b": {"c": (x for x in [])}, "d": [1.5, None, True]}
+    assert "".join(iter_json(data, indent=2)) == json.dumps(
+        {"a": [0, 1, 2], "b": {"c": []}, "d": [1.5, None, True]}, indent=2
+    )
+    with pytest.raises(ValueError, match="not JSON compliant"):
+        "".join(iter_json({"a": (x for x in [float("inf")])}))
+
+
+def test_empty_table():
+    assert dumps_table_metadata(TableMetadata()) == json.dumps(TableMetadata().to_dict())
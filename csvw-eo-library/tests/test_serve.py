@@ -0,0 +1,115 @@
+import json
+import os
+import socket
+import stat
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from csvw_eo import serve
+from csvw_eo.__main__ import main
+from csvw_eo.serve import SOCKET_MODE, Worker, run_request
+
+CSV = "examples/penguin_plus.csv"
+METADATA = "examples/metadata/penguin_metadata_column_level.json-ld"
+
+
+def request(request_id, job, **args):
+    return json.dumps({"id": request_id, "job": job, "args": args}) + "\n"
+
+
+def run(lines, **kwargs):
+    responses = []
+    worker = Worker(**kwargs)
+    try:
+        assert worker.serve(lines, responses.append) == len([line for line in lines if line.strip()])
+    finally:
+        worker.close()
+    return {response["id"]: response for response in map(json.loads, responses)}
+
+
+def test_serve_jobs(tmp_path):
+    lines = [
+        request(1, "dummy", metadata=METADATA, output=str(tmp_path / "dummy.csv"), rows=20),
+        request(2, "validate", metadata=METADATA),
+        request(3, "smartnoise", metadata=METADATA, schema="Zoo", table="Penguins"),
+        request(4, "check_constraints", metadata=METADATA),
+        request(5, "enforce_bounds", data=CSV, metadata=METADATA, output=str(tmp_path / "bounded.csv")),
+        "\n",
+    ]
+    responses = run(lines, workers=2, max_pending=1)
+    assert all(response["ok"] for response in responses.values()), responses
+
+    assert responses[1]["result"] == {"output": str(tmp_path / "dummy.csv"), "rows": 20, "columns": 11}
+    assert len(pd.read_csv(tmp_path / "dummy.csv")) == 20
+    assert responses[2]["result"] == {"valid": True, "columns": 11}
+    assert responses[3]["result"][""]["Zoo"]["Penguins"]["rows"] == 344
+    assert responses[4]["result"]["conforms"]
+    assert len(pd.read_csv(tmp_path / "bounded.csv")) == 344
+
+
+def test_serve_errors(tmp_path):
+    lines = [
+        "not json\n",
+        request(1, "unknown"),
+        request(2, "validate", metadata=str(tmp_path / "missing.json")),
+        request(3, "validate", metadata=METADATA),
+    ]
+    responses = run(lines)
+    assert not responses[None]["ok"]
+    assert "Unknown job 'unknown'" in responses[1]["error"]
+    assert responses[2]["error"].startswith("FileNotFoundError")
+    assert responses[3]["ok"]
+
+
+def test_plan_cache(tmp_path):
+    metadata = tmp_path / "metadata.json"
+    metadata.write_text(Path(METADATA).read_text())
+    serve._cached_plan.cache_clear()
+
+    for seed in range(3):
+        response = run_request(
+            request(seed, "dummy", metadata=str(metadata), output=str(tmp_path / "d.csv"), seed=seed)
+        )
+        assert response["ok"]
+    assert serve._cached_plan.cache_info().misses == 1
+    assert serve._cached_plan.cache_info().hits == 2
+
+    # A modified file is compiled again
+    metadata.write_text(metadata.read_text())
+    stat = metadata.stat()
+    os.utime(metadata, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert run_request(request(4, "dummy", metadata=str(metadata), output=str(tmp_path / "d.csv")))["ok"]
+    assert serve._cached_plan.cache_info().misses == 2
+
+
+def test_socket_server(tmp_path):
+    path = tmp_path / "worker.sock"
+    worker = Worker(workers=2)
+    server = worker.socket_server(path)
+    assert stat.S_IMODE(path.stat().st_mode) == SOCKET_MODE
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(path))
+            client.sendall((request(1, "validate", metadata=METADATA) + request(2, "unknown")).encode())
+            client.shutdown(socket.SHUT_WR)
+            with client.makefile("r", encoding="utf-8") as f:
+                responses = {response["id"]: response for response in map(json.loads, f)}
+    finally:
+        server.shutdown()
+        server.server_close()
+        worker.close()
+    assert responses[1]["ok"]
+    assert not responses[2]["ok"]
+
+
+@pytest.mark.parametrize("command", ["dummy", "validate"])
+def test_main_help(command, monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["csvw-eo", command, "--help"])
+    with pytest.raises(SystemExit):
+        main()
+    assert f"csvw-eo {command}" in capsys.readouterr().out
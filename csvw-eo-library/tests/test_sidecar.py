@@ -0,0 +1,110 @@
+import copy
+import json
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from csvw_eo import constants as c
+from csvw_eo.csvw_to_opendp_margins import csvw_to_opendp_margins
+from csvw_eo.make_dummy_from_metadata import make_dummy_from_metadata
+from csvw_eo.make_metadata_from_data import build_table_metadata
+from csvw_eo.metadata_structure import TableMetadata
+from csvw_eo.partition_table import LazyPartitionTable, PartitionSidecar
+from csvw_eo.sidecar import SidecarFormat, read_metadata, write_metadata
+
+
+@pytest.fixture
+def table():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "id": rng.integers(0, 20, 200),
+            "colour": rng.choice(["red", "blue", "green"], 200),
+            "size": rng.uniform(0, 10, 200),
+        }
+    )
+    return build_table_metadata(
+        df,
+        privacy_unit="id",
+        continuous_partitions={"size": [0, 5, 10]},
+        column_groups=[["colour", "size"]],
+        default_contributions_level="partition",
+        with_dependencies=False,
+    )
+
+
+@pytest.mark.parametrize("sidecar_format", list(SidecarFormat))
+def test_round_trip(tmp_path, table, sidecar_format):
+    path = tmp_path / "metadata.json"
+    sidecars = write_metadata(table, path, sidecar_format=sidecar_format, min_rows=1)
+    assert sidecars
+    assert all(p.exists() and p.suffix == f".{sidecar_format}" for p in sidecars)
+
+    document = json.loads(path.read_text(encoding="utf-8"))
+    colour = document[c.TABLE_SCHEMA][c.COL_LIST][1]
+    assert colour[c.PUBLIC_PARTITIONS] == {
+        "@type": c.SIDECAR_TYPE,
+        c.SIDECAR_URL: "metadata.column1.partitions." + sidecar_format,
+    }
+
+    metadata = read_metadata(path)
+    assert isinstance(metadata[c.TABLE_SCHEMA][c.COL_LIST][1][c.PUBLIC_PARTITIONS], PartitionSidecar)
+    assert TableMetadata.from_dict(metadata).to_dict() == table.to_dict()
+
+
+@pytest.mark.parametrize("url", ["../outside.arrow", "/etc/passwd", "sub/../../outside.arrow"])
+def test_sidecar_outside_the_metadata_directory(tmp_path, table, url):
+    path = tmp_path / "metadata" / "metadata.json"
+    path.parent.mkdir()
+    write_metadata(table, path, min_rows=1)
+    document = json.loads(path.read_text(encoding="utf-8"))
+    document[c.TABLE_SCHEMA][c.COL_LIST][1][c.PUBLIC_PARTITIONS][c.SIDECAR_URL] = url
+    path.write_text(json.dumps(document), encoding="utf-8")
+    with pytest.raises(ValueError, match="outside the metadata directory"):
+        read_metadata(path)
+
+
+def test_loaded_lazily(tmp_path, table):
+    path = tmp_path / "metadata.json"
+    write_metadata(table, path, min_rows=1)
+    metadata = read_metadata(path)
+    sidecar = metadata[c.TABLE_SCHEMA][c.COL_LIST][1][c.PUBLIC_PARTITIONS]
+
+    csvw_to_opendp_margins(metadata)
+    restored = TableMetadata.from_dict(metadata)
+    partitions = restored.columns[1].partitions
+    assert isinstance(partitions, LazyPartitionTable)
+    assert not partitions.is_loaded
+    assert not sidecar.table.is_loaded
+
+    assert len(partitions) == len(table.columns[1].partitions)
+    assert partitions.is_loaded
+
+
+def test_dummy_from_sidecar(tmp_path, table):
+    path = tmp_path / "metadata.json"
+    write_metadata(table, path, sidecar_format=SidecarFormat.PARQUET, min_rows=1)
+
+    expected = make_dummy_from_metadata(table.to_dict(), nb_rows=50, seed=3)
+    pd.testing.assert_frame_equal(make_dummy_from_metadata(read_metadata(path), nb_rows=50, seed=3), expected)
+
+
+def test_min_rows_keeps_small_lists_inline(tmp_path, table):
+    path = tmp_path / "metadata.json"
+    assert write_metadata(table, path) == []
+    expected = json.loads(json.dumps(table.to_dict()))
+    assert json.loads(path.read_text(encoding="utf-8")) == expected
+    assert read_metadata(path) == expected
+
+
+def test_sidecar_copy_and_pickle(tmp_path, table):
+    path = tmp_path / "metadata.json"
+    write_metadata(table, path, min_rows=1)
+    sidecar = read_metadata(path)[c.TABLE_SCHEMA][c.COL_LIST][1][c.PUBLIC_PARTITIONS]
+
+    assert copy.deepcopy(sidecar) is sidecar
+    restored = pickle.loads(pickle.dumps(sidecar))
+    assert list(restored) == list(sidecar)
+    assert list(sidecar) == table.to_dict()[c.TABLE_SCHEMA][c.COL_LIST][1][c.PUBLIC_PARTITIONS]
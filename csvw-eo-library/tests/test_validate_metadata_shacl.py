@@ -1,10 +1,13 @@
 import json
+import shutil
+from pathlib import Path
 
 import pytest
+from pyshacl.shapes_graph import ShapesGraph
 
 from csvw_eo import constants as c
 from csvw_eo.datatypes import DataTypes
-from csvw_eo.validate_metadata_shacl import validate_metadata_shacl
+from csvw_eo.validate_metadata_shacl import ShaclValidator, metadata_files, validate_metadata_shacl
 
 
 @pytest.fixture(scope="session")
@@ -42,3 +45,53 @@ def test_validate_metadata_minimal(shacl_path, metadata_dir):
     with open(path, "w", encoding="utf-8") as f:
         json.dump(metadata, f)
     validate_metadata_shacl(path, shacl_path)
+
+
+@pytest.fixture(scope="session")
+def batch_dir(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("batch")
+    for path in sorted(Path("examples/metadata").glob("*.json-ld"))[:3]:
+        shutil.copy(path, directory / path.name)
+    (directory / "broken.json").write_text("{not json", encoding="utf-8")
+    (directory / "notes.txt").write_text("ignored", encoding="utf-8")
+    return directory
+
+
+def test_shacl_validator_matches_function(shacl_path, batch_dir):
+    validator = ShaclValidator(shacl_path)
+    for path in metadata_files(batch_dir)[1:]:
+        assert validator.validate(path) == validate_metadata_shacl(path, shacl_path)
+        assert validator.validate(json.loads(path.read_text())) == validator.validate(path)
+
+
+def test_shacl_validator_harvests_shapes_once(shacl_path, batch_dir, monkeypatch):
+    harvests = []
+    build = ShapesGraph._build_node_shape_cache
+
+    def counted(shapes):
+        harvests.append(shapes)
+        build(shapes)
+
+    monkeypatch.setattr(ShapesGraph, "_build_node_shape_cache", counted)
+    validator = ShaclValidator(shacl_path)
+    for path in metadata_files(batch_dir)[1:]:
+        validator.validate(path)
+    # The validations use the shapes harvested by the validator, not shapes of their own
+    assert harvests == [validator._shapes]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_many(shacl_path, batch_dir, workers):
+    paths = metadata_files(batch_dir)
+    assert [p.name for p in paths][0] == "broken.json"
+    assert all(p.suffix != ".txt" for p in paths)
+
+    batch = ShaclValidator(shacl_path).validate_many(paths, workers=workers)
+    assert [result.path for result in batch.results] == paths
+    broken = batch.results[0]
+    assert not broken.conforms
+    assert broken.error.startswith("JSONDecodeError")
+    assert all(result.error is None and result.report for result in batch.results[1:])
+    assert broken in batch.failures
+    assert not batch.conforms
+    assert batch.summary().startswith(f"{len(paths)} files, {len(batch.failures)} failed")
@@ -0,0 +1,166 @@
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from csvw_eo import constants as c
+from csvw_eo.check_constraints import _Checker, check_constraints
+from csvw_eo.validation_session import ValidationSession, diff_metadata
+
+
+@pytest.fixture
+def metadata():
+    return json.loads(
+        Path("examples/metadata/penguin_metadata_fine_levels_column_group_continuous.json-ld").read_text()
+    )
+
+
+def column(metadata, name):
+    return next(col for col in metadata[c.TABLE_SCHEMA][c.COL_LIST] if col[c.COL_NAME] == name)
+
+
+@pytest.fixture
+def checked(monkeypatch):
+    """Names of the columns and groups checked by the constraint checker."""
+    names = []
+    check_column, check_group = _Checker.check_column, _Checker.check_group
+
+    def count_column(self, col):
+        names.append(col.name)
+        check_column(self, col)
+
+    def count_group(self, group, focus):
+        names.append(tuple(group.columns))
+        check_group(self, group, focus)
+
+    monkeypatch.setattr(_Checker, "check_column", count_column)
+    monkeypatch.setattr(_Checker, "check_group", count_group)
+    return names
+
+
+def edits():
+    """Successive edits of the metadata, each with the same report as a full check."""
+
+    def widen_bill(m):
+        column(m, "bill_length_mm")[c.MAXIMUM] = 70.0
+
+    def invert_partition(m):
+        predicate = column(m, "bill_length_mm")[c.PUBLIC_PARTITIONS][0][c.PREDICATE]
+        predicate[c.LOWER_BOUND], predicate[c.UPPER_BOUND] = (
+            predicate[c.UPPER_BOUND],
+            predicate[c.LOWER_BOUND],
+        )
+
+    def drop_species_partitions(m):
+        del column(m, "species")[c.PUBLIC_PARTITIONS]
+
+    def lower_table_contributions(m):
+        m[c.MAX_CONTRIB] = 1
+
+    def rename_island(m):
+        column(m, "island")[c.COL_NAME] = "isle"
+
+    def add_group(m):
+        m[c.ADD_INFO].append({"@type": "ColumnGroup", c.COLUMNS_IN_GROUP: ["isle", "sex"]})
+
+    def remove_groups(m):
+        del m[c.ADD_INFO]
+
+    return [
+        widen_bill,
+        invert_partition,
+        drop_species_partitions,
+        lower_table_contributions,
+        rename_island,
+        add_group,
+        remove_groups,
+    ]
+
+
+def test_session_matches_full_check(metadata):
+    session = ValidationSession()
+    assert session.validate(metadata).violations == check_constraints(metadata).violations
+
+    for edit in edits():
+        edit(metadata)
+        report = session.validate(metadata)
+        assert report.violations == check_constraints(metadata).violations, edit.__name__
+        assert report.conforms == check_constraints(metadata).conforms
+
+
+def test_session_checks_changed_nodes(metadata, checked):
+    session = ValidationSession()
+    session.validate(metadata)
+    nb_nodes = len(metadata[c.TABLE_SCHEMA][c.COL_LIST]) + len(metadata[c.ADD_INFO])
+    assert len(checked) == nb_nodes
+
+    checked.clear()
+    assert session.validate(metadata).conforms
+    assert session.last_diff.empty
+    assert checked == []
+
+    # A column and the groups that contain it
+    column(metadata, "bill_length_mm")[c.MAXIMUM] = 70.0
+    session.validate(metadata)
+    assert session.last_diff.changed_columns == ("bill_length_mm",)
+    assert checked == ["bill_length_mm"] + [
+        tuple(group[c.COLUMNS_IN_GROUP])
+        for group in metadata[c.ADD_INFO]
+        if "bill_length_mm" in group[c.COLUMNS_IN_GROUP]
+    ]
+
+    # Declared edits: other columns are not compared
+    checked.clear()
+    column(metadata, "sex")[c.NULL_PROP] = 0.5
+    session.validate(metadata, changed_columns=["sex"])
+    assert session.last_diff.changed_columns == ("sex",)
+    assert checked == ["sex"]
+
+    # Table fields that columns do not inherit
+    checked.clear()
+    metadata[c.PUBLIC_LENGTH] = 10
+    session.validate(metadata)
+    assert session.last_diff.table_changed
+    assert not session.last_diff.inherited_changed
+    assert checked == []
+
+    # Table bounds inherited by every column and group
+    metadata[c.MAX_LENGTH] += 1
+    session.validate(metadata)
+    assert len(checked) == nb_nodes
+
+
+def test_session_keeps_last_valid_version(metadata):
+    session = ValidationSession()
+    session.validate(metadata)
+    reference = copy.deepcopy(metadata)
+
+    column(metadata, "species")[c.DATATYPE] = "not a datatype"
+    with pytest.raises(ValueError):
+        session.validate(metadata)
+
+    column(metadata, "species")[c.DATATYPE] = column(reference, "species")[c.DATATYPE]
+    assert session.validate(metadata).conforms
+    assert session.last_diff.empty
+
+
+def test_diff_metadata(metadata):
+    new = copy.deepcopy(metadata)
+    column(new, "island")[c.COL_NAME] = "isle"
+    column(new, "sex")[c.NULL_PROP] = 0.5
+    new[c.ADD_INFO][0][c.MAX_LENGTH] = 1
+
+    diff = diff_metadata(metadata, new)
+    assert diff.added_columns == ("isle",)
+    assert diff.removed_columns == ("island",)
+    assert diff.changed_columns == ("sex",)
+    assert diff.changed_groups == (0,)
+    assert diff.removed_groups == 0
+    assert not diff.table_changed
+
+    del new[c.ADD_INFO]
+    assert diff_metadata(metadata, new).removed_groups == 1
+    assert diff_metadata(None, new).added_columns == tuple(
+        col[c.COL_NAME] for col in new[c.TABLE_SCHEMA][c.COL_LIST]
+    )